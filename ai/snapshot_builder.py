@@ -7,6 +7,10 @@ Builds structured snapshots containing:
 - Regime state
 - Guardrails summary
 - Recent trigger signals
+
+Price, 1h/24h change and volatility missing from the universe rows are read
+from the cycle's feature store (the values the trigger scan computed), not
+recomputed here.
 """
 
 import logging
@@ -26,6 +30,7 @@ def build_ai_snapshot(
     guardrails: dict[str, Any],
     triggers: list[dict[str, Any]],
     metadata: dict[str, Any] | None = None,
+    features: Any = None,
 ) -> dict[str, Any]:
     """
     Build complete market snapshot for AI trader.
@@ -38,6 +43,7 @@ def build_ai_snapshot(
         guardrails: Risk guardrails summary
         triggers: Recent trigger signals
         metadata: Optional metadata (cycle_num, timestamp, etc.)
+        features: Optional FeatureStore for filling per-symbol summaries
         
     Returns:
         Structured snapshot dict ready for LLM
@@ -45,7 +51,7 @@ def build_ai_snapshot(
     snapshot = {
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "regime": regime,
-        "universe": _format_universe(universe_snapshot),
+        "universe": _format_universe(universe_snapshot, features),
         "positions": _format_positions(positions),
         "positions_count": len(positions),
         "available_capital_usd": available_capital_usd,
@@ -59,7 +65,21 @@ def build_ai_snapshot(
     return snapshot
 
 
-def _format_universe(universe: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def _feature_summary(features: Any, symbol: str) -> dict[str, float]:
+    """Price, 1h/24h change and volatility from the symbol's 1h feature frame, if bound."""
+    frame = features.lookup(symbol, "1h") if features is not None else None
+    if frame is None:
+        return {}
+    summary = {
+        "price": frame.get("close"),
+        "change_1h_pct": frame.get("change_pct", bars=1),
+        "change_24h_pct": frame.get("change_pct", bars=24),
+        "volatility": frame.get("volatility_pct"),
+    }
+    return {key: value for key, value in summary.items() if value is not None}
+
+
+def _format_universe(universe: list[dict[str, Any]], features: Any = None) -> list[dict[str, Any]]:
     """
     Format universe data for AI consumption.
     
@@ -71,14 +91,16 @@ def _format_universe(universe: list[dict[str, Any]]) -> list[dict[str, Any]]:
     formatted = []
     
     for u in universe:
+        symbol = u.get("symbol", "UNKNOWN")
+        derived = _feature_summary(features, symbol)
         formatted.append({
-            "symbol": u.get("symbol", "UNKNOWN"),
-            "price": u.get("price", 0.0),
+            "symbol": symbol,
+            "price": u.get("price") or derived.get("price", 0.0),
             "volume_24h": u.get("volume_24h", 0.0),
             "spread_pct": u.get("spread_pct", 0.0),
-            "change_1h_pct": u.get("change_1h_pct", 0.0),
-            "change_24h_pct": u.get("change_24h_pct", 0.0),
-            "volatility": u.get("volatility", 0.0),
+            "change_1h_pct": u.get("change_1h_pct") or derived.get("change_1h_pct", 0.0),
+            "change_24h_pct": u.get("change_24h_pct") or derived.get("change_24h_pct", 0.0),
+            "volatility": u.get("volatility") or derived.get("volatility", 0.0),
             "tier": u.get("tier", "UNKNOWN"),
         })
     
@@ -62,8 +62,9 @@ class AiTraderAgent:
         portfolio: PortfolioState,
         guardrails: Dict[str, Any],
         metadata: Optional[Dict[str, Any]] = None,
+        features: Optional[Any] = None,
     ) -> List[TradeProposal]:
-        """Call the LLM and convert allocations to TradeProposals."""
+        """Call the LLM and convert allocations to TradeProposals (features: cycle's FeatureStore)."""
 
         if not self.enabled or not self._client:
             return []
@@ -74,7 +75,7 @@ class AiTraderAgent:
             logger.warning("AiTraderAgent skipped: NAV<=0")
             return []
 
-        snapshot = self._build_snapshot(universe, portfolio, triggers, guardrails, metadata)
+        snapshot = self._build_snapshot(universe, portfolio, triggers, guardrails, metadata, features)
 
         try:
             decisions = self._client.get_decisions(
@@ -108,6 +109,7 @@ class AiTraderAgent:
         triggers: List[TriggerSignal],
         guardrails: Dict[str, Any],
         metadata: Optional[Dict[str, Any]],
+        features: Optional[Any] = None,
     ) -> Dict[str, Any]:
         guardrails = guardrails or {}
         available_capital = max(
@@ -122,6 +124,7 @@ class AiTraderAgent:
             guardrails=guardrails,
             triggers=self._format_triggers(triggers),
             metadata=metadata or {},
+            features=features,
         )
 
     def _format_universe(self, universe: UniverseSnapshot) -> List[Dict[str, Any]]:
@@ -11,18 +11,21 @@ Compatible with MockExchange for realistic backtesting.
 
 import time
 import requests
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 from pathlib import Path
 import logging
 
+from core.candle_resampler import can_resample, granularity_seconds, resample
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
-    """OHLCV candle"""
+    """OHLCV candle (CandleSeries.from_candles turns a list into columns)"""
     timestamp: datetime
     open: float
     high: float
@@ -221,7 +224,8 @@ class DataLoader:
         self,
         source: str = "api",
         data_dir: Optional[Path] = None,
-        api_base_url: str = "https://api.exchange.coinbase.com"
+        api_base_url: str = "https://api.exchange.coinbase.com",
+        base_granularity: Optional[str] = None
     ):
         """
         Initialize data loader.
@@ -230,6 +234,8 @@ class DataLoader:
             source: "api", "csv", or "parquet"
             data_dir: Directory for CSV/Parquet files
             api_base_url: Coinbase API endpoint
+            base_granularity: Load only this granularity (e.g. "FIVE_MINUTE")
+                and resample coarser get_candles requests from it locally
         """
         self.source = source
         self.data_dir = Path(data_dir) if data_dir else Path("data/backtest")
@@ -238,6 +244,12 @@ class DataLoader:
         # In-memory cache for fast lookups
         self._cache: Dict[str, List[Candle]] = {}
         
+        # Local resampling: (symbol, seconds) -> (base length, base starts, bar starts, bars)
+        self._base_seconds = granularity_seconds(base_granularity) if base_granularity else None
+        if base_granularity and self._base_seconds is None:
+            raise ValueError(f"Unknown base granularity: {base_granularity}")
+        self._resampled: Dict[Tuple[str, int], Tuple[int, List[int], List[int], List[Candle]]] = {}
+        
         # API loader for live fetching
         if source == "api":
             self._api_loader = HistoricalDataLoader(api_base_url)
@@ -345,6 +357,9 @@ class DataLoader:
         }
         granularity_seconds = granularity_map.get(granularity, 900)
         
+        if self._base_seconds and can_resample(self._base_seconds, granularity_seconds):
+            return self._get_resampled_candles(symbol, start, end, granularity_seconds)
+        
         # Load if not cached
         if symbol not in self._cache:
             self.load_range([symbol], start, end, granularity_seconds)
@@ -369,6 +384,61 @@ class DataLoader:
         
         return filtered
     
+    def _get_resampled_candles(
+        self,
+        symbol: str,
+        start: datetime,
+        end: datetime,
+        target_seconds: int
+    ) -> List[Candle]:
+        """
+        Bars of target_seconds built from the base series.
+        
+        Bars whose base candles all start at or before `end` come from a
+        per-symbol resampled series (rebuilt only when the base series grows);
+        the bar containing `end` is aggregated from the base candles up to
+        `end` so a backtest never sees data from the future.
+        """
+        if symbol not in self._cache:
+            self.load_range([symbol], start, end, self._base_seconds)
+        base = self._cache.get(symbol, [])
+        if not base:
+            return []
+        
+        naive = base[0].timestamp.tzinfo is None
+        
+        def epoch(ts: datetime) -> int:
+            return int((ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts).timestamp())
+        
+        def stamp(seconds: int) -> datetime:
+            ts = datetime.fromtimestamp(seconds, tz=timezone.utc)
+            return ts.replace(tzinfo=None) if naive else ts
+        
+        key = (symbol, target_seconds)
+        cached = self._resampled.get(key)
+        if cached is None or cached[0] != len(base):
+            base_starts = [epoch(c.timestamp) for c in base]
+            bars = resample(zip(base_starts, base), target_seconds, stamp)
+            cached = (len(base), base_starts, [b for b, _ in bars], [bar for _, bar in bars])
+            self._resampled[key] = cached
+        _, base_starts, starts, bars = cached
+        
+        start_s, end_s = epoch(start), epoch(end)
+        last_bucket = end_s - end_s % target_seconds
+        if last_bucket + target_seconds - self._base_seconds <= end_s:
+            last_bucket += target_seconds  # bar containing end is already complete
+        
+        lo = bisect_right(starts, start_s - 1)
+        hi = bisect_right(starts, last_bucket - 1)
+        result = bars[lo:hi]
+        
+        if last_bucket <= end_s and last_bucket >= start_s:
+            i = bisect_right(base_starts, last_bucket - 1)
+            j = bisect_right(base_starts, end_s)
+            members = list(zip(base_starts[i:j], base[i:j]))
+            result.extend(bar for _, bar in resample(members, target_seconds, stamp))
+        return result
+    
     # Internal loaders
     
     def _load_from_api(
@@ -10,13 +10,14 @@ Pattern: Jesse-style backtest + Freqtrade-style metrics
 import json
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import logging
 
+from core.candles import CandleSeries
 from core.universe import UniverseManager
 from core.triggers import TriggerEngine, TriggerSignal
-from core.regime import RegimeDetector
+from core.regime import IncrementalRegimeDetector
 from strategy.rules_engine import RulesEngine, TradeProposal
 from core.risk import RiskEngine, PortfolioState
 from backtest.slippage_model import SlippageModel, SlippageConfig
@@ -27,6 +28,11 @@ from core.cost_model import get_cost_model
 logger = logging.getLogger(__name__)
 
 
+def _utc_epoch(ts: datetime) -> int:
+    """Epoch seconds of a backtest time; naive times are UTC (DataLoader convention)."""
+    return int((ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts).timestamp())
+
+
 class DataLoaderAdapter:
     """
     Adapter to wrap callable data_loader functions for MockExchange compatibility.
@@ -232,7 +238,8 @@ class BacktestEngine:
         logger.info("Universe cache TTL extended to 24h for backtest performance")
         
         self.trigger_engine = TriggerEngine()
-        self.regime_detector = RegimeDetector()
+        self.regime_detector = IncrementalRegimeDetector()
+        self._regime_synced_at: Optional[datetime] = None
         self.rules_engine = RulesEngine(config={})
         self.risk_engine = RiskEngine(self.policy_config, universe_manager=self.universe_mgr)
         
@@ -406,23 +413,32 @@ class BacktestEngine:
     
     def _detect_regime(self, current_time: datetime, data_loader) -> str:
         """Detect market regime from BTC"""
-        # Get BTC data for last 7 days
-        lookback_start = current_time - timedelta(days=7)
+        # The detector keeps rolling state: after warm-up only the candles
+        # since the previous step (plus overlap to resume from) are loaded
+        detector = self.regime_detector
+        interval = timedelta(seconds=detector.interval_seconds)
+        previous = self._regime_synced_at
+        if previous is not None and previous < current_time:
+            lookback_start = previous - 2 * interval
+        else:
+            lookback_start = current_time - detector.max_bars * interval
+        self._regime_synced_at = current_time
         btc_data = data_loader(["BTC-USD"], lookback_start, current_time)
         btc_candles = btc_data.get("BTC-USD", [])
         
-        if not btc_candles or len(btc_candles) < 24:
+        if not btc_candles:
             logger.warning("Insufficient BTC data for regime detection, defaulting to chop")
             return "chop"
         
-        regime_signal = self.regime_detector.detect(btc_candles, lookback_days=7)
+        regime_signal = self.regime_detector.detect(
+            CandleSeries.from_candles(btc_candles, symbol="BTC-USD"), lookback_days=7
+        )
         return regime_signal.regime
     
     def _simulate_triggers(self, universe, current_time: datetime, data_loader, regime: str) -> List[TriggerSignal]:
         """Simulate trigger detection with historical data"""
-        from core.exchange_coinbase import OHLCV
-        
         triggers = []
+        now_epoch = _utc_epoch(current_time)
         
         for asset in universe.get_all_eligible():
             # Get historical candles for this asset
@@ -437,20 +453,12 @@ class BacktestEngine:
             if not candles_data or len(candles_data) < 24:
                 continue
             
-            # Convert to OHLCV format expected by trigger engine
-            candles = [
-                OHLCV(
-                    symbol=asset.symbol,
-                    timestamp=c.timestamp,
-                    open=c.open,
-                    high=c.high,
-                    low=c.low,
-                    close=c.close,
-                    volume=c.volume
-                )
-                for c in candles_data
-                if c.timestamp <= current_time  # Only past data
-            ]
+            # Columnar series for the trigger engine, cut at current_time (only past data)
+            # Epochs taken explicitly: naive times are UTC here, while from_candles
+            # would read them as local time
+            candles = CandleSeries.from_entries(
+                asset.symbol, [(_utc_epoch(c.timestamp), c) for c in candles_data], timezone.utc
+            ).until(now_epoch)
             
             if not candles:
                 continue
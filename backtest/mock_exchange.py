@@ -9,12 +9,14 @@ Pattern: Jesse-style simulation with realistic costs via CostModel.
 
 import uuid
 import random
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 import logging
 
-from core.exchange_coinbase import Quote, OHLCV
+from core.candle_resampler import INTERVAL_GRANULARITY, granularity_seconds
+from core.candles import CandleSeries
+from core.exchange_coinbase import Quote
 from core.cost_model import get_cost_model, CostModel
 from backtest.data_loader import DataLoader
 
@@ -73,7 +75,7 @@ class MockExchange:
     - get_accounts() -> List[dict]
     - place_order(...) -> dict
     - cancel_order(order_id) -> dict
-    - get_candles(...) -> List[OHLCV]
+    - get_candles(...) / get_ohlcv(...) -> CandleSeries
     
     Simulation features:
     - Maker/taker fills based on price action
@@ -134,11 +136,12 @@ class MockExchange:
             if order.is_expired(self.current_time):
                 self._cancel_order_internal(order.order_id, reason="ttl_expired")
     
-    def get_quote(self, product_id: str) -> Quote:
+    def get_quote(self, product_id: str, caller: Optional[str] = None) -> Quote:
         """
         Get current quote for symbol.
         
-        Uses most recent candle from data_loader.
+        Uses most recent candle from data_loader. ``caller`` (the live quote
+        cache's metrics label) is accepted for interface parity and ignored.
         """
         candle = self.data_loader.get_latest_candle(product_id, self.current_time)
         
@@ -190,9 +193,17 @@ class MockExchange:
         start: datetime,
         end: datetime,
         granularity: str = "ONE_MINUTE"
-    ) -> List[OHLCV]:
+    ) -> CandleSeries:
         """Get historical candles"""
-        return self.data_loader.get_candles(product_id, start, end, granularity)
+        candles = self.data_loader.get_candles(product_id, start, end, granularity)
+        return CandleSeries.from_candles(candles, symbol=product_id)
+
+    def get_ohlcv(self, symbol: str, interval: str = "1h", limit: int = 100) -> CandleSeries:
+        """Newest `limit` candles up to the simulation clock (CoinbaseExchange.get_ohlcv)."""
+        seconds = granularity_seconds(interval) or 3600
+        start = self.current_time - timedelta(seconds=seconds * limit)
+        candles = self.get_candles(symbol, start, self.current_time, INTERVAL_GRANULARITY.get(interval, interval))
+        return candles[-limit:]
     
     def place_order(
         self,
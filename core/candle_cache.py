@@ -0,0 +1,317 @@
+"""
+247trader-v2 Core: Candle Cache
+
+Per-symbol, per-granularity ring buffer of OHLCV candles kept by the
+exchange layer so repeated get_ohlcv calls only download what changed.
+
+After a warm-up load, get_ohlcv asks for candles starting at the last stored
+candle (which is still open and gets replaced) instead of re-fetching the
+whole window. Series for symbols that leave the universe are evicted, and the
+buffers can be persisted to a JSON file so restarts start warm.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from core.candle_resampler import INTERVAL_GRANULARITY, can_resample, granularity_seconds
+from infra.config_fields import apply_fields
+
+logger = logging.getLogger(__name__)
+
+SeriesKey = Tuple[str, str]          # (symbol, granularity)
+Entry = Tuple[int, Any]              # (candle start epoch, candle)
+
+PERSIST_VERSION = 1
+
+
+@dataclass
+class CandleCacheConfig:
+    """Candle cache settings (app.yaml exchange.candle_cache)."""
+    enabled: bool = True
+    max_candles: int = 300                    # Per series; Coinbase returns at most 300
+    persist_path: Optional[str] = None        # JSON file; None keeps the cache in memory
+    persist_interval_seconds: float = 300.0   # Minimum spacing between periodic saves
+    refresh_seconds: float = 10.0             # Serve a series refreshed this recently without a request
+    # Target granularity -> base granularity built locally, e.g. {"ONE_HOUR": "FIVE_MINUTE"}
+    resample_from: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "CandleCacheConfig":
+        config = apply_fields(cls(), data, "exchange.candle_cache",
+                              non_negative=("persist_interval_seconds", "refresh_seconds"))
+        if not data:
+            return config
+
+        persist_path = data.get("persist_path")
+        config.persist_path = str(persist_path) if persist_path else None
+
+        for target, base in (data.get("resample_from") or {}).items():
+            target_seconds, base_seconds = granularity_seconds(str(target)), granularity_seconds(str(base))
+            if target_seconds is None or base_seconds is None or not can_resample(base_seconds, target_seconds):
+                logger.warning("Ignoring candle_cache.resample_from %s <- %s: not a whole multiple", target, base)
+                continue
+            config.resample_from[INTERVAL_GRANULARITY.get(target, target)] = INTERVAL_GRANULARITY.get(base, base)
+
+        return config
+
+
+class _Series:
+    """Time-ordered candles for one (symbol, granularity)."""
+
+    __slots__ = ("entries", "covered_from", "refreshed_at")
+
+    def __init__(self, max_candles: int):
+        self.entries: Deque[Entry] = deque(maxlen=max_candles)
+        # Start of the window known to be complete (missing candles inside it
+        # mean no trades, not missing data)
+        self.covered_from: Optional[int] = None
+        self.refreshed_at: Optional[float] = None   # time.monotonic() of the last fetch
+
+    @property
+    def last_start(self) -> Optional[int]:
+        return self.entries[-1][0] if self.entries else None
+
+    def merge(self, entries: List[Entry]) -> None:
+        for start, candle in entries:
+            last = self.last_start
+            if last is None or start > last:
+                if len(self.entries) == self.entries.maxlen and self.covered_from is not None:
+                    # Ring buffer drops the oldest candle; coverage starts after it
+                    self.covered_from = max(self.covered_from, self.entries[0][0] + 1)
+                self.entries.append((start, candle))
+                continue
+            # Revision of a stored candle (normally the still-open last one)
+            for i in range(len(self.entries) - 1, -1, -1):
+                existing = self.entries[i][0]
+                if existing == start:
+                    self.entries[i] = (start, candle)
+                    break
+                if existing < start:
+                    break
+
+
+class CandleCache:
+    """
+    Thread-safe store of recent candles keyed by (symbol, granularity).
+
+    Usage:
+        cache = CandleCache(CandleCacheConfig(persist_path="data/candles.json"))
+        since = cache.delta_start("BTC-USD", "ONE_HOUR", window_start, now, 3600)
+        # since is None -> full fetch + cache.store(..., covered_from=window_start)
+        # otherwise     -> fetch [since, now] + cache.store(...)
+        candles = cache.get("BTC-USD", "ONE_HOUR", 168)
+    """
+
+    def __init__(self, config: Optional[CandleCacheConfig] = None):
+        self.config = config or CandleCacheConfig()
+        self._series: Dict[SeriesKey, _Series] = {}
+        self._lock = threading.Lock()
+        self._last_persist = time.monotonic()
+        self._dirty = False
+        self._stats = {"full_fetches": 0, "delta_fetches": 0, "evicted": 0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._series)
+
+    def fresh(self, symbol: str, granularity: str, window_start: int) -> bool:
+        """True when the series covers window_start and was fetched within refresh_seconds."""
+        with self._lock:
+            series = self._series.get((symbol, granularity))
+            if series is None or series.refreshed_at is None or series.covered_from is None:
+                return False
+            if series.covered_from > window_start:
+                return False
+            return time.monotonic() - series.refreshed_at < self.config.refresh_seconds
+
+    def delta_start(
+        self,
+        symbol: str,
+        granularity: str,
+        window_start: int,
+        now: int,
+        duration: int,
+        max_gap: int = 300,
+    ) -> Optional[int]:
+        """
+        Start epoch for an incremental fetch, or None when a full load is needed.
+
+        A delta is possible once the cached series covers window_start and the
+        gap since the last candle fits in one request (max_gap candles).
+        """
+        with self._lock:
+            series = self._series.get((symbol, granularity))
+            if series is None or series.last_start is None or series.covered_from is None:
+                return None
+            if series.covered_from > window_start:
+                return None
+            if (now - series.last_start) // duration >= max_gap:
+                return None
+            return series.last_start
+
+    def store(
+        self,
+        symbol: str,
+        granularity: str,
+        entries: Iterable[Entry],
+        covered_from: Optional[int] = None,
+        capacity: int = 0,
+    ) -> None:
+        """
+        Merge fetched candles into the series.
+
+        Args:
+            entries: (start_epoch, candle) pairs in any order
+            covered_from: Window start of a full fetch (replaces the series);
+                None for a delta fetch
+            capacity: Candles to retain when a full fetch needs more than
+                max_candles (e.g. a base series for resampling)
+        """
+        ordered = sorted(entries, key=lambda e: e[0])
+        key = (symbol, granularity)
+        with self._lock:
+            series = self._series.get(key)
+            if covered_from is not None or series is None:
+                series = _Series(max(self.config.max_candles, capacity))
+                series.covered_from = covered_from
+                self._series[key] = series
+                self._stats["full_fetches"] += 1
+            else:
+                self._stats["delta_fetches"] += 1
+            series.merge(ordered)
+            series.refreshed_at = time.monotonic()
+            self._dirty = True
+
+    def get(self, symbol: str, granularity: str, limit: int) -> List[Any]:
+        """Newest `limit` candles, oldest first."""
+        return [candle for _, candle in self.entries(symbol, granularity, limit)]
+
+    def entries(self, symbol: str, granularity: str, limit: int) -> List[Entry]:
+        """Newest `limit` (start_epoch, candle) entries, oldest first."""
+        if limit <= 0:
+            return []
+        with self._lock:
+            series = self._series.get((symbol, granularity))
+            if series is None:
+                return []
+            skip = max(len(series.entries) - limit, 0)
+            return list(islice(series.entries, skip, None))
+
+    def retain(self, symbols: Iterable[str]) -> int:
+        """Evict every series whose symbol is not in symbols. Returns series dropped."""
+        keep = set(symbols)
+        with self._lock:
+            stale = [key for key in self._series if key[0] not in keep]
+            for key in stale:
+                del self._series[key]
+            if stale:
+                self._dirty = True
+                self._stats["evicted"] += len(stale)
+        if stale:
+            logger.debug("Evicted %d candle series: %s", len(stale), sorted({k[0] for k in stale}))
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["series"] = len(self._series)
+            stats["candles"] = sum(len(s.entries) for s in self._series.values())
+        return stats
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self, build: Callable[[str, int, List[float]], Any]) -> int:
+        """
+        Restore series from persist_path.
+
+        Args:
+            build: Turns (symbol, start_epoch, [open, high, low, close, volume])
+                into a candle object
+
+        Returns:
+            Number of series restored (0 when disabled, missing or unreadable)
+        """
+        if not self.config.persist_path:
+            return 0
+        path = Path(self.config.persist_path)
+        if not path.exists():
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != PERSIST_VERSION:
+                logger.warning("Ignoring candle cache %s: unsupported version %r", path, payload.get("version"))
+                return 0
+            restored: Dict[SeriesKey, _Series] = {}
+            for item in payload.get("series", []):
+                symbol, granularity = item["symbol"], item["granularity"]
+                series = _Series(max(self.config.max_candles, len(item["candles"])))
+                series.merge([(int(row[0]), build(symbol, int(row[0]), row[1:6])) for row in item["candles"]])
+                if series.entries:
+                    covered = item.get("covered_from")
+                    series.covered_from = int(covered) if covered is not None else None
+                    restored[(symbol, granularity)] = series
+        except Exception as exc:
+            logger.warning("Failed to load candle cache %s: %s", path, exc)
+            return 0
+
+        with self._lock:
+            self._series.update(restored)
+        logger.info("Loaded %d candle series from %s", len(restored), path)
+        return len(restored)
+
+    def save(self) -> bool:
+        """Write all series to persist_path atomically. Returns True when written."""
+        if not self.config.persist_path:
+            return False
+        path = Path(self.config.persist_path)
+        with self._lock:
+            payload = {
+                "version": PERSIST_VERSION,
+                "saved_at": datetime.now().isoformat(),
+                "series": [
+                    {
+                        "symbol": symbol,
+                        "granularity": granularity,
+                        "covered_from": series.covered_from,
+                        "candles": [
+                            [start, c.open, c.high, c.low, c.close, c.volume]
+                            for start, c in series.entries
+                        ],
+                    }
+                    for (symbol, granularity), series in self._series.items()
+                ],
+            }
+            self._dirty = False
+            self._last_persist = time.monotonic()
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".candles_", suffix=".json.tmp")
+            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except Exception as exc:
+            logger.warning("Failed to persist candle cache %s: %s", path, exc)
+            return False
+        return True
+
+    def maybe_save(self) -> bool:
+        """Save when something changed and persist_interval_seconds has elapsed."""
+        if not self.config.persist_path or not self._dirty:
+            return False
+        if time.monotonic() - self._last_persist < self.config.persist_interval_seconds:
+            return False
+        return self.save()
@@ -0,0 +1,200 @@
+"""
+247trader-v2 Core: Candle Resampler
+
+Builds higher timeframes (15m, 1h, 1d, ...) from one base candle series
+locally instead of requesting each granularity from the exchange.
+
+Candles are handled as (start_epoch, candle) entries, the same shape the
+candle cache stores, so bucketing never depends on whether a candle's
+datetime is naive-local, naive-UTC or aware. Buckets are aligned to the
+epoch (UTC), matching Coinbase's own candle boundaries.
+
+Aggregation per bucket: open of the first base candle, max high, min low,
+close of the last base candle, summed volume. The newest bar is partial until
+a base candle ending at the bucket boundary has been seen.
+"""
+
+import logging
+from collections import deque
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Entry = Tuple[int, Any]   # (candle start epoch, candle)
+
+GRANULARITY_SECONDS = {
+    "ONE_MINUTE": 60,
+    "FIVE_MINUTE": 300,
+    "FIFTEEN_MINUTE": 900,
+    "THIRTY_MINUTE": 1800,
+    "ONE_HOUR": 3600,
+    "TWO_HOUR": 7200,
+    "SIX_HOUR": 21600,
+    "ONE_DAY": 86400,
+}
+
+INTERVAL_GRANULARITY = {
+    "1m": "ONE_MINUTE",
+    "5m": "FIVE_MINUTE",
+    "15m": "FIFTEEN_MINUTE",
+    "30m": "THIRTY_MINUTE",
+    "1h": "ONE_HOUR",
+    "2h": "TWO_HOUR",
+    "6h": "SIX_HOUR",
+    "1d": "ONE_DAY",
+}
+
+
+def granularity_seconds(interval: str) -> Optional[int]:
+    """Seconds per candle for a shorthand ("1h") or Coinbase name ("ONE_HOUR")."""
+    return GRANULARITY_SECONDS.get(INTERVAL_GRANULARITY.get(interval, interval))
+
+
+def can_resample(base_seconds: int, target_seconds: int) -> bool:
+    return 0 < base_seconds < target_seconds and target_seconds % base_seconds == 0
+
+
+def aggregate(members: Sequence[Entry], bucket: int, stamp: Callable[[int], datetime]) -> Any:
+    """Collapse time-ordered base entries into one bar starting at bucket."""
+    first = members[0][1]
+    return replace(
+        first,
+        timestamp=stamp(bucket),
+        open=first.open,
+        high=max(c.high for _, c in members),
+        low=min(c.low for _, c in members),
+        close=members[-1][1].close,
+        volume=sum(c.volume for _, c in members),
+    )
+
+
+def resample(
+    entries: Iterable[Entry],
+    target_seconds: int,
+    stamp: Callable[[int], datetime] = datetime.fromtimestamp,
+) -> List[Entry]:
+    """
+    One-shot resample of time-ordered base entries.
+
+    Returns:
+        (bucket_start, bar) entries, oldest first. Bars keep the type (and any
+        extra fields such as symbol) of the base candles.
+    """
+    bars: List[Entry] = []
+    members: List[Entry] = []
+    bucket: Optional[int] = None
+    for start, candle in entries:
+        b = start - start % target_seconds
+        if b != bucket:
+            if members:
+                assert bucket is not None
+                bars.append((bucket, aggregate(members, bucket, stamp)))
+            bucket, members = b, []
+        members.append((start, candle))
+    if members:
+        assert bucket is not None
+        bars.append((bucket, aggregate(members, bucket, stamp)))
+    return bars
+
+
+class CandleResampler:
+    """
+    Incrementally maintained higher-timeframe series.
+
+    update() accepts the whole base series (or just its tail) each time; only
+    base candles at or after the previous bucket are looked at, so a cycle that
+    adds one base candle costs O(bucket size). The base candles of the last two
+    buckets are kept so revisions of the still-open base candle - including the
+    one that closes the previous bucket - are folded in.
+
+    Usage:
+        hourly = CandleResampler(target_seconds=3600, base_seconds=300)
+        hourly.update(five_minute_entries)
+        hourly.bars(168)
+    """
+
+    OPEN_BUCKETS = 2
+
+    def __init__(
+        self,
+        target_seconds: int,
+        base_seconds: int,
+        max_bars: int = 300,
+        stamp: Callable[[int], datetime] = datetime.fromtimestamp,
+    ):
+        if not can_resample(base_seconds, target_seconds):
+            raise ValueError(
+                f"Cannot resample {base_seconds}s candles into {target_seconds}s bars"
+            )
+        self.target_seconds = target_seconds
+        self.base_seconds = base_seconds
+        self.stamp = stamp
+        self._bars: Deque[Entry] = deque(maxlen=max_bars)
+        self._members: Dict[int, Dict[int, Any]] = {}   # bucket -> {base start: candle}
+        self._last_base_start: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._bars)
+
+    def update(self, entries: Sequence[Entry]) -> int:
+        """
+        Fold time-ordered base entries in. Returns the number of bars touched.
+        """
+        floor = min(self._members) if self._members else None
+        i = len(entries)
+        if floor is not None:
+            while i > 0 and entries[i - 1][0] >= floor:
+                i -= 1
+        else:
+            i = 0
+
+        touched: List[int] = []
+        for start, candle in entries[i:]:
+            bucket = start - start % self.target_seconds
+            if self._bars and bucket < self._bars[-1][0] and bucket not in self._members:
+                continue  # Revision of a bar that is already final
+            members = self._members.get(bucket)
+            if members is None:
+                members = self._members[bucket] = {}
+            members[start] = candle
+            if not touched or touched[-1] != bucket:
+                touched.append(bucket)
+            if self._last_base_start is None or start > self._last_base_start:
+                self._last_base_start = start
+
+        for bucket in touched:
+            ordered = sorted(self._members[bucket].items())
+            self._put(bucket, aggregate(ordered, bucket, self.stamp))
+
+        for bucket in sorted(self._members)[:-self.OPEN_BUCKETS]:
+            del self._members[bucket]
+        return len(touched)
+
+    def _put(self, bucket: int, bar: Any) -> None:
+        bars = self._bars
+        if not bars or bucket > bars[-1][0]:
+            bars.append((bucket, bar))
+            return
+        for offset in range(1, min(len(bars), self.OPEN_BUCKETS) + 1):
+            if bars[-offset][0] == bucket:
+                bars[-offset] = (bucket, bar)
+                return
+
+    def last_bar_complete(self) -> bool:
+        """True once the newest bar's final base candle has been seen."""
+        if not self._bars or self._last_base_start is None:
+            return False
+        bucket_end = self._bars[-1][0] + self.target_seconds
+        return self._last_base_start + self.base_seconds >= bucket_end
+
+    def entries(self, limit: int, complete_only: bool = False) -> List[Entry]:
+        """Newest `limit` (bucket_start, bar) entries, oldest first."""
+        bars = list(self._bars)
+        if complete_only and bars and not self.last_bar_complete():
+            bars.pop()
+        return bars[-limit:] if limit > 0 else []
+
+    def bars(self, limit: int, complete_only: bool = False) -> List[Any]:
+        return [bar for _, bar in self.entries(limit, complete_only)]
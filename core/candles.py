@@ -0,0 +1,212 @@
+"""
+247trader-v2 Core: Candles
+
+Candle types shared by the exchange, trigger, regime, signal and backtest
+layers.
+
+OHLCV is one candle. CandleSeries is a whole series stored as a struct of
+arrays: int64 start epochs plus float64 open/high/low/close/volume columns,
+48 bytes per candle instead of a dataclass, a datetime and five float
+objects. Slicing a series returns a view over the same buffers (memoryview,
+no copy), and indexing or iterating builds OHLCV rows on demand, so code
+written against List[OHLCV] keeps working while columnar code
+(core.indicators, core.indicator_state) reads the arrays directly.
+
+Timestamps: rows of a series built from naive datetimes get naive local
+datetimes back (datetime.fromtimestamp, as the exchange layer creates them);
+a series built from aware datetimes keeps their timezone.
+"""
+
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+Column = Union[array, memoryview]
+
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = (attrgetter(f) for f in ("open", "high", "low", "close", "volume"))
+
+
+@dataclass(slots=True)
+class OHLCV:
+    """Candlestick data"""
+    symbol: str
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+def candle_epoch(candle: Any) -> Optional[int]:
+    """Start of a candle in epoch seconds, or None when it carries no timestamp."""
+    timestamp = getattr(candle, "timestamp", None)
+    if not isinstance(timestamp, datetime):
+        return None
+    return int(timestamp.timestamp())
+
+
+def column(candles: Sequence[Any], field: str) -> Sequence[float]:
+    """One field of candles: the stored column of a columnar series, else read per candle."""
+    values = getattr(candles, field, None)
+    if isinstance(values, (array, memoryview)):
+        return values
+    return [getattr(candle, field) for candle in candles]
+
+
+def _view(column: Column, typecode: str) -> memoryview:
+    if isinstance(column, memoryview):
+        return column
+    if not isinstance(column, array):
+        column = array(typecode, column)
+    return memoryview(column)
+
+
+class CandleSeries(Sequence):
+    """
+    Columnar candle series (oldest first).
+
+    Usage:
+        series = CandleSeries.from_candles(candles)        # List[OHLCV] / backtest Candles
+        series.close[-1], series.epochs[-1]                 # column reads, no row objects
+        window = series[-168:]                              # zero-copy view
+        window[-1].timestamp                                # OHLCV row built on demand
+    """
+
+    __slots__ = ("symbol", "tz", "epochs", "open", "high", "low", "close", "volume")
+
+    def __init__(self, symbol: str, epochs: Column, open: Column, high: Column, low: Column,
+                 close: Column, volume: Column, tz: Optional[tzinfo] = None):
+        self.symbol = symbol
+        self.tz = tz
+        self.epochs = _view(epochs, "q")
+        self.open = _view(open, "d")
+        self.high = _view(high, "d")
+        self.low = _view(low, "d")
+        self.close = _view(close, "d")
+        self.volume = _view(volume, "d")
+        if not (len(self.epochs) == len(self.open) == len(self.high) == len(self.low)
+                == len(self.close) == len(self.volume)):
+            raise ValueError("CandleSeries columns must have the same length")
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls, symbol: str = "", tz: Optional[tzinfo] = None) -> "CandleSeries":
+        return cls(symbol, array("q"), array("d"), array("d"), array("d"), array("d"), array("d"), tz)
+
+    @classmethod
+    def from_entries(cls, symbol: str, entries: Sequence[Tuple[int, Any]],
+                     tz: Optional[tzinfo] = None) -> "CandleSeries":
+        """Series from (start_epoch, candle) entries, the shape the candle cache stores."""
+        candles = [candle for _, candle in entries]
+        return cls(
+            symbol,
+            array("q", [start for start, _ in entries]),
+            array("d", map(_OPEN, candles)),
+            array("d", map(_HIGH, candles)),
+            array("d", map(_LOW, candles)),
+            array("d", map(_CLOSE, candles)),
+            array("d", map(_VOLUME, candles)),
+            tz,
+        )
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[Any], symbol: Optional[str] = None) -> "CandleSeries":
+        """
+        Series from candle objects with a datetime `timestamp` and OHLCV fields.
+
+        Returns candles unchanged when it already is a CandleSeries.
+
+        Raises:
+            ValueError: A candle has no datetime timestamp
+        """
+        if isinstance(candles, CandleSeries):
+            return candles
+        candles = list(candles)
+        if symbol is None:
+            symbol = getattr(candles[0], "symbol", "") if candles else ""
+        tz = candles[0].timestamp.tzinfo if candles and isinstance(candles[0].timestamp, datetime) else None
+        entries = []
+        for candle in candles:
+            epoch = candle_epoch(candle)
+            if epoch is None:
+                raise ValueError(f"Candle without a datetime timestamp: {candle!r}")
+            entries.append((epoch, candle))
+        return cls.from_entries(symbol, entries, tz)
+
+    # ------------------------------------------------------------------
+    # Sequence protocol (legacy List[OHLCV] callers)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    @overload
+    def __getitem__(self, index: int) -> OHLCV: ...
+    @overload
+    def __getitem__(self, index: slice) -> "CandleSeries": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CandleSeries(
+                self.symbol, self.epochs[index], self.open[index], self.high[index],
+                self.low[index], self.close[index], self.volume[index], self.tz,
+            )
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[OHLCV]:
+        for i in range(len(self.epochs)):
+            yield self.row(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CandleSeries):
+            return (self.symbol == other.symbol and len(self) == len(other)
+                    and all(a == b for a, b in zip(self._columns(), other._columns())))
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None   # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CandleSeries({self.symbol!r}, {len(self)} candles)"
+
+    def row(self, index: int) -> OHLCV:
+        """Candle at index as an OHLCV object (built on demand)."""
+        return OHLCV(
+            symbol=self.symbol,
+            timestamp=self.timestamp(index),
+            open=self.open[index],
+            high=self.high[index],
+            low=self.low[index],
+            close=self.close[index],
+            volume=self.volume[index],
+        )
+
+    def to_list(self) -> List[OHLCV]:
+        return list(self)
+
+    # ------------------------------------------------------------------
+    # Column helpers
+    # ------------------------------------------------------------------
+
+    def timestamp(self, index: int) -> datetime:
+        return datetime.fromtimestamp(self.epochs[index], self.tz)
+
+    def until(self, epoch: int) -> "CandleSeries":
+        """View of the candles starting at or before epoch (no lookahead)."""
+        return self[:bisect_right(self.epochs, epoch)]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns this series spans."""
+        return sum(column.nbytes for column in self._columns())
+
+    def _columns(self) -> Tuple[memoryview, ...]:
+        return self.epochs, self.open, self.high, self.low, self.close, self.volume
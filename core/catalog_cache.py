@@ -0,0 +1,159 @@
+"""
+247trader-v2 Core: Catalog Cache
+
+On-disk copy of the slow-to-rebuild reference data a cycle needs before it
+can trade: the product catalog (ids, status, price/size increments, min
+notionals - everything get_product_spec derives from) and the last universe
+snapshot.
+
+Each section carries its own saved_at so it can age out independently.
+Restored data is served immediately and refreshed in the background, so a
+restart does not pay for product discovery and a full universe build before
+its first cycle.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from infra.config_fields import apply_fields
+
+logger = logging.getLogger(__name__)
+
+PERSIST_VERSION = 1
+
+
+@dataclass
+class CatalogCacheConfig:
+    """Catalog cache settings (app.yaml exchange.catalog_cache)."""
+    enabled: bool = True
+    persist_path: Optional[str] = None           # JSON file; None disables the warm start
+    products_max_age_seconds: float = 86400.0    # Older product catalogs are not restored
+    universe_max_age_seconds: float = 3600.0     # Older universe snapshots are not restored
+    refresh_in_background: bool = True           # Serve restored data while fetching fresh data
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "CatalogCacheConfig":
+        config = apply_fields(cls(), data, "exchange.catalog_cache",
+                              non_negative=("products_max_age_seconds", "universe_max_age_seconds"))
+        persist_path = (data or {}).get("persist_path")
+        config.persist_path = str(persist_path) if persist_path else None
+        return config
+
+
+class CatalogCache:
+    """
+    Versioned on-disk cache of the product catalog and the last universe snapshot.
+
+    Usage:
+        cache = CatalogCache(CatalogCacheConfig(persist_path="data/catalog_cache.json"))
+        cache.load()
+        restored = cache.products()        # (products, saved_at epoch) or None
+        cache.store_products(products)     # after a fresh list_public_products
+        cache.store_universe(snapshot_dict)
+    """
+
+    def __init__(self, config: Optional[CatalogCacheConfig] = None):
+        self.config = config or CatalogCacheConfig()
+        self._sections: Dict[str, Tuple[Any, float]] = {}   # name -> (data, saved_at epoch)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled and bool(self.config.persist_path)
+
+    def products(self) -> Optional[Tuple[List[dict], float]]:
+        """Restored or last stored product catalog and its save time."""
+        return self._section("products", self.config.products_max_age_seconds)
+
+    def universe(self) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Restored or last stored universe snapshot (as a dict) and its save time."""
+        return self._section("universe", self.config.universe_max_age_seconds)
+
+    def store_products(self, products: List[dict]) -> bool:
+        if not products:
+            return False
+        return self._store("products", list(products))
+
+    def store_universe(self, snapshot: Dict[str, Any]) -> bool:
+        return self._store("universe", snapshot)
+
+    def _section(self, name: str, max_age: float) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            entry = self._sections.get(name)
+        if entry is None or time.time() - entry[1] > max_age:
+            return None
+        return entry
+
+    def _store(self, name: str, data: Any) -> bool:
+        if not self.enabled:
+            return False
+        with self._lock:
+            self._sections[name] = (data, time.time())
+        return self.save()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> int:
+        """
+        Restore sections from persist_path.
+
+        Returns:
+            Number of sections restored (0 when disabled, missing, unreadable
+            or written by another version)
+        """
+        if not self.enabled:
+            return 0
+        path = Path(self.config.persist_path)
+        if not path.exists():
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != PERSIST_VERSION:
+                logger.warning("Ignoring catalog cache %s: unsupported version %r", path, payload.get("version"))
+                return 0
+            restored = {
+                name: (section["data"], float(section["saved_at"]))
+                for name, section in (payload.get("sections") or {}).items()
+            }
+        except Exception as exc:
+            logger.warning("Failed to load catalog cache %s: %s", path, exc)
+            return 0
+
+        with self._lock:
+            self._sections.update(restored)
+        logger.info("Loaded catalog cache %s (%s)", path, ", ".join(sorted(restored)) or "empty")
+        return len(restored)
+
+    def save(self) -> bool:
+        """Write all sections to persist_path atomically. Returns True when written."""
+        if not self.enabled:
+            return False
+        path = Path(self.config.persist_path)
+        with self._lock:
+            payload = {
+                "version": PERSIST_VERSION,
+                "sections": {
+                    name: {"saved_at": saved_at, "data": data}
+                    for name, (data, saved_at) in self._sections.items()
+                },
+            }
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".catalog_", suffix=".json.tmp")
+                with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(temp_path, path)
+            except Exception as exc:
+                logger.warning("Failed to persist catalog cache %s: %s", path, exc)
+                return False
+        return True
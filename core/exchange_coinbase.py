@@ -6,37 +6,39 @@ Ported from v1 with HMAC authentication and full market data + execution support
 """
 
 import os
+import random
 import time
 import json
-import hashlib
-import hmac
 import uuid
-import secrets
 from collections import deque
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import logging
+import threading
 import requests
 from requests import exceptions as requests_exceptions
 from urllib.parse import urlencode
 
+from core.candle_cache import CandleCache, CandleCacheConfig
+from core.candles import OHLCV, CandleSeries
+from core.candle_resampler import GRANULARITY_SECONDS, INTERVAL_GRANULARITY, CandleResampler
+from core.order_book import OrderBook
+from core.quote_cache import UNLABELED, QuoteCache, QuoteCacheConfig
 from core.rate_limiter import RateLimiter
+from infra.fanout import FanoutConfig, FanoutExecutor, FetchResult
+from infra.http_transport import ConnectionUsage, HttpPoolConfig, PooledHttpTransport
+from infra.request_signing import JWT_AVAILABLE, HmacSigner, JwtSigner
 
 if TYPE_CHECKING:  # pragma: no cover
     from infra.metrics import MetricsRecorder
     from infra.latency_tracker import LatencyTracker
 
-try:
-    import jwt
-    from cryptography.hazmat.primitives import serialization
-    JWT_AVAILABLE = True
-except ImportError:
-    JWT_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
 CB_BASE = "https://api.coinbase.com/api/v3/brokerage"
+MAX_CANDLES_PER_REQUEST = 300  # Coinbase candles endpoint limit
+PRODUCTS_CACHE_SECONDS = 300  # list_public_products refresh window
 
 
 @dataclass
@@ -66,18 +68,16 @@ class OrderbookSnapshot:
     bid_levels: int
     ask_levels: int
     timestamp: datetime
+    # Full L2 book behind the summary (None for heuristic snapshots)
+    book: Optional[OrderBook] = field(default=None, repr=False, compare=False)
 
 
-@dataclass
-class OHLCV:
-    """Candlestick data"""
-    symbol: str
-    timestamp: datetime
-    open: float
-    high: float
-    low: float
-    close: float
-    volume: float
+class FillList(list):
+    """
+    list_fills result. truncated is True when fills may be missing: the page
+    limit stopped pagination with more pages pending, or a request failed.
+    """
+    truncated: bool = False
 
 
 class CoinbaseExchange:
@@ -143,6 +143,11 @@ class CoinbaseExchange:
             self._mode = "pem"
             logger.info("Using Cloud API authentication (JWT/ES256) with PEM key")
 
+        # Cached signing key / reusable auth tokens (see _signer)
+        self._auth_signer = None
+        self._auth_creds = None
+        self._auth_lock = threading.Lock()
+
         # Per-endpoint rate limiting (NEW: replaces legacy channel-based tracking)
         alert_threshold = 0.8  # Alert at 80% utilization
         self.rate_limiter = RateLimiter(alert_threshold=alert_threshold)
@@ -153,10 +158,32 @@ class CoinbaseExchange:
         self._rate_limit_targets = {"public": None, "private": None}
         self._rate_usage = {"public": deque(), "private": deque()}
         self._rate_utilization = {"public": 0.0, "private": 0.0}
+        self._legacy_lock = threading.Lock()
+
+        # Pooled keep-alive transport (reconfigured from app.yaml via configure_http)
+        self._http = PooledHttpTransport()
 
-        # Cache for products
+        # Bounded worker pool for per-symbol fan-out (see fetch_many)
+        self._fanout = FanoutExecutor(name="cb-fanout")
+
+        # Optional streaming top-of-book cache (see attach_market_data_feed)
+        self._market_data = None
+
+        # Short-lived REST quote/orderbook cache with single-flight (see get_quote)
+        self._quote_cache = QuoteCache(on_lookup=self._record_quote_cache_lookup)
+
+        # Incremental OHLCV buffers (see get_ohlcv / configure_candle_cache)
+        self._candles: Optional[CandleCache] = CandleCache()
+        self._resamplers: Dict[Tuple[str, str], CandleResampler] = {}
+        self._resampler_lock = threading.Lock()
+
+        # Cache for products (optionally persisted, see attach_catalog_cache)
         self._products_cache = None
         self._products_cache_time = None
+        self._catalog = None
+        self._products_restored = False
+        self._products_lock = threading.Lock()
+        self._products_refresh: Optional[threading.Thread] = None
 
         # Track convert compatibility per currency pair to avoid repeated failures
         self._convert_support_cache: Dict[Tuple[str, str], bool] = {}
@@ -177,12 +204,15 @@ class CoinbaseExchange:
         # Use new per-endpoint limiter (wait=True ensures compliance)
         self.rate_limiter.acquire(endpoint, is_private=is_private, wait=True)
 
-        # Legacy tracking (backward compatibility)
-        last = self._last_call.get(endpoint, 0)
-        elapsed = time.time() - last
-        if elapsed < self._min_interval:
-            time.sleep(self._min_interval - elapsed)
-        self._last_call[endpoint] = time.time()
+        # Legacy spacing (backward compatibility). Claim the next slot under the
+        # lock and sleep outside it so concurrent callers queue instead of
+        # all reading the same _last_call.
+        with self._legacy_lock:
+            now = time.time()
+            slot = max(now, self._last_call.get(endpoint, 0) + self._min_interval)
+            self._last_call[endpoint] = slot
+        if slot > now:
+            time.sleep(slot - now)
 
     def configure_rate_limits(self, rate_cfg: Optional[Dict[str, Any]]) -> None:
         """
@@ -236,6 +266,103 @@ class CoinbaseExchange:
             else:
                 self._rate_limit_targets[channel] = parsed if parsed > 0 else None
 
+    def configure_http(self, http_cfg: Optional[Dict[str, Any]]) -> None:
+        """
+        Configure the pooled HTTP transport from config.
+
+        Args:
+            http_cfg: Dict with keys (all optional):
+                - 'pool_connections': number of host pools kept alive (default: 4)
+                - 'pool_maxsize': keep-alive connections per host (default: 16)
+                - 'pool_block': block when the host pool is exhausted (default: False)
+                - 'connect_timeout' / 'read_timeout' / 'private_read_timeout' /
+                  'public_api_read_timeout': seconds
+                - 'tls_session_reuse': resume TLS sessions on new connections (default: True)
+                - 'warmup', 'warmup_connections', 'warmup_timeout', 'warmup_urls'
+        """
+        config = HttpPoolConfig.from_dict(http_cfg)
+        previous = self._http
+        self._http = PooledHttpTransport(config)
+        previous.close()
+        logger.info(
+            "Configured HTTP pool: pool_connections=%d pool_maxsize=%d block=%s timeouts=(%.2fs, %.1fs/%.1fs)",
+            config.pool_connections,
+            config.pool_maxsize,
+            config.pool_block,
+            config.connect_timeout,
+            config.read_timeout,
+            config.private_read_timeout,
+        )
+
+    def configure_fanout(self, fanout_cfg: Optional[Dict[str, Any]]) -> None:
+        """
+        Configure the fan-out worker pool used by fetch_many.
+
+        Args:
+            fanout_cfg: Dict with keys (all optional):
+                - 'max_workers': concurrent requests in flight (default: 8)
+                - 'timeout_seconds': batch deadline, null to disable (default: 30)
+        """
+        config = FanoutConfig.from_dict(fanout_cfg)
+        previous = self._fanout
+        self._fanout = FanoutExecutor(config, name="cb-fanout")
+        previous.shutdown()
+        logger.info(
+            "Configured fan-out pool: max_workers=%d timeout=%s",
+            config.max_workers,
+            config.timeout_seconds,
+        )
+
+    def configure_quote_cache(self, cache_cfg: Optional[Dict[str, Any]]) -> None:
+        """
+        Configure the REST quote/orderbook cache.
+
+        Args:
+            cache_cfg: Dict with keys (all optional):
+                - 'enabled': share quotes/books between callers (default: True)
+                - 'max_age_seconds': reuse window, 0 = single-flight only (default: 2)
+        """
+        config = QuoteCacheConfig.from_dict(cache_cfg)
+        self._quote_cache = QuoteCache(config, on_lookup=self._record_quote_cache_lookup)
+        logger.info(
+            "Configured quote cache: enabled=%s max_age=%.1fs",
+            config.enabled,
+            config.max_age_seconds,
+        )
+
+    def invalidate_quotes(self, symbol: Optional[str] = None) -> int:
+        """Force the next get_quote/get_orderbook for symbol (or all symbols) to hit the API."""
+        return self._quote_cache.invalidate(symbol)
+
+    def quote_cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-caller hits/misses/coalesced waits for the quote cache."""
+        return self._quote_cache.stats()
+
+    def attach_market_data_feed(self, feed) -> None:
+        """
+        Serve get_quote from a streaming top-of-book cache while it is fresh.
+
+        Args:
+            feed: MarketDataFeed (or None to detach); its get_quote returns
+                None when the cached book is stale, which falls back to REST
+        """
+        self._market_data = feed
+
+    def warm_up_connections(self) -> int:
+        """
+        Open keep-alive connections before the first cycle (best effort).
+
+        Returns:
+            Number of warm-up requests that completed (0 when disabled)
+        """
+        if not self._http.config.warmup:
+            return 0
+        return self._http.warm_up()
+
+    def http_pool_snapshot(self) -> Dict[str, Any]:
+        """Cumulative pool hit/miss and handshake counts for the HTTP transport."""
+        return self._http.stats().to_dict()
+
     def rate_limit_snapshot(self) -> Dict[str, Any]:
         """
         Get comprehensive rate limit snapshot.
@@ -288,16 +415,17 @@ class CoinbaseExchange:
             violated: Whether this call resulted in 429 response
         """
         # Legacy channel tracking (backward compatibility)
-        queue = self._rate_usage[channel]
-        now = time.monotonic()
-        queue.append(now)
-        cutoff = now - 1.0
-        while queue and queue[0] < cutoff:
-            queue.popleft()
-
         limit = self._rate_limit_targets.get(channel)
-        usage = (len(queue) / limit) if limit else 0.0
-        self._rate_utilization[channel] = usage
+        with self._legacy_lock:
+            queue = self._rate_usage[channel]
+            now = time.monotonic()
+            queue.append(now)
+            cutoff = now - 1.0
+            while queue and queue[0] < cutoff:
+                queue.popleft()
+
+            usage = (len(queue) / limit) if limit else 0.0
+            self._rate_utilization[channel] = usage
         violation = violated or (limit is not None and usage >= 1.0)
         if self.metrics:
             self.metrics.record_rate_limit_usage(channel, usage, violated=violation)
@@ -307,20 +435,36 @@ class CoinbaseExchange:
             is_private = (channel == "private")
             self.rate_limiter.record(endpoint, is_private=is_private, violated=violated)
 
-    def _record_api_metrics(self, endpoint: str, channel: str, duration: float, status: str) -> None:
+    def _record_quote_cache_lookup(self, kind: str, caller: str, outcome: str) -> None:
         if self.metrics:
-            self.metrics.record_api_call(endpoint, channel, duration, status)
+            self.metrics.record_quote_cache_lookup(kind, caller, outcome)
+
+    def _record_api_metrics(self, endpoint: str, channel: str, duration: float, status: str,
+                            usage: Optional[ConnectionUsage] = None) -> None:
+        if self.metrics:
+            if usage is not None and usage.pool_requests:
+                self.metrics.record_api_call(
+                    endpoint,
+                    channel,
+                    duration,
+                    status,
+                    pool_hit=usage.pool_hit,
+                    handshakes=usage.tls_handshakes,
+                    resumed_handshakes=usage.tls_resumed,
+                )
+            else:
+                self.metrics.record_api_call(endpoint, channel, duration, status)
         if self.latency_tracker:
             # Record latency with operation name that includes endpoint
             operation = f"api_{endpoint}"
             self.latency_tracker.record(operation, duration * 1000.0, {"channel": channel, "status": status})
 
     def _public_get(self, url: str, *, params: Optional[Dict[str, Any]] = None,
-                    timeout: float = 10.0, label: str = "public_get") -> requests.Response:
+                    timeout: Optional[float] = None, label: str = "public_get") -> requests.Response:
         start = time.perf_counter()
         status_label = "success"
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            response = self._http.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as exc:
@@ -333,41 +477,33 @@ class CoinbaseExchange:
             duration = time.perf_counter() - start
             endpoint_name = label.replace("/", "_").replace("-", "_")
             self._record_rate_usage("public", endpoint=endpoint_name, violated=False)
-            self._record_api_metrics(label, "public", duration, status_label)
+            self._record_api_metrics(label, "public", duration, status_label, self._http.last_usage())
+
+    def _signer(self):
+        """Signer for the current credentials (built once, rebuilt if they change)."""
+        creds = (self._mode, self.api_key, self._pem if self._mode == "pem" else self.api_secret)
+        signer = self._auth_signer
+        if signer is None or self._auth_creds != creds:
+            with self._auth_lock:
+                if self._auth_signer is None or self._auth_creds != creds:
+                    if self._mode == "pem":
+                        self._auth_signer = JwtSigner(self.api_key, self._pem)
+                    else:
+                        self._auth_signer = HmacSigner(self.api_key, self.api_secret)
+                    self._auth_creds = creds
+                signer = self._auth_signer
+        return signer
 
     def _build_jwt(self, method: str, path: str) -> str:
-        """Build JWT token for Cloud API authentication (ES256)"""
+        """Build JWT token for Cloud API authentication (ES256), reused per path while fresh"""
         if not JWT_AVAILABLE:
             raise ImportError("PyJWT and cryptography required for Cloud API. Run: pip install PyJWT cryptography")
 
         if not self.api_key or not self._pem:
             raise ValueError("API key and private key required for JWT authentication")
 
-        try:
-            private_key_bytes = self._pem.encode("utf-8")
-            private_key = serialization.load_pem_private_key(private_key_bytes, password=None)
-        except Exception as e:
-            raise ValueError(f"Failed to load private key: {e}")
-
         # Format URI for JWT: "METHOD api.coinbase.com/api/v3/brokerage/endpoint"
-        uri = f"{method.upper()} api.coinbase.com{path}"
-
-        jwt_data = {
-            "sub": self.api_key,
-            "iss": "cdp",  # Coinbase Developer Platform
-            "nbf": int(time.time()),
-            "exp": int(time.time()) + 120,  # 2 minute expiry
-            "uri": uri,
-        }
-
-        jwt_token = jwt.encode(
-            jwt_data,
-            private_key,
-            algorithm="ES256",
-            headers={"kid": self.api_key, "nonce": secrets.token_hex()},
-        )
-
-        return jwt_token
+        return self._signer().token(method, path)
 
     def _headers(self, method: str, path: str, body: Optional[dict] = None) -> dict:
         """Generate signed headers for authenticated requests"""
@@ -378,21 +514,8 @@ class CoinbaseExchange:
             if not self.api_key or not self.api_secret:
                 raise ValueError("COINBASE_API_KEY and COINBASE_API_SECRET required for authenticated requests")
 
-            ts = str(int(time.time()))
             body_str = json.dumps(body) if body else ""
-            prehash = ts + method.upper() + path + body_str
-
-            sig = hmac.new(
-                self.api_secret.encode(),
-                prehash.encode(),
-                hashlib.sha256
-            ).hexdigest()
-
-            headers.update({
-                "CB-ACCESS-KEY": self.api_key,
-                "CB-ACCESS-SIGN": sig,
-                "CB-ACCESS-TIMESTAMP": ts,
-            })
+            headers.update(self._signer().headers(method, path, body_str))
             return headers
 
         elif self._mode == "pem":
@@ -406,20 +529,29 @@ class CoinbaseExchange:
         else:
             raise NotImplementedError(f"Unknown authentication mode: {self._mode}")
 
-    def _req(self, method: str, endpoint: str, body: Optional[dict] = None,
-             authenticated: bool = True, max_retries: int = 3,
-             query: Optional[Dict[str, object]] = None) -> dict:
+    def websocket_auth(self, channel: str, product_ids: Optional[List[str]] = None) -> Dict[str, str]:
         """
-        Make HTTP request to Coinbase API with exponential backoff.
+        Auth fields to merge into an authenticated WebSocket subscribe message.
 
-        Retries on:
-        - 429 (rate limit)
-        - 5xx (server errors)
-        - Network errors (timeout, connection)
-
-        Does NOT retry on:
-        - 4xx (except 429) - client errors like 400, 401, 403
+        Cloud keys send a uri-less JWT; legacy keys sign timestamp + channel +
+        comma-joined product ids.
         """
+        if not self.api_key:
+            raise ValueError("API credentials required for authenticated WebSocket channels")
+        if self._mode == "pem":
+            return {"jwt": self._signer().websocket_token()}
+        if self._mode == "hmac":
+            return self._signer().websocket_fields(channel, product_ids or [])
+        raise NotImplementedError(f"Unknown authentication mode: {self._mode}")
+
+    def signing_stats(self) -> Dict[str, int]:
+        """Signatures computed vs reused by the active signer."""
+        signer = self._auth_signer
+        return signer.stats() if signer is not None else {"signed": 0, "reused": 0, "cached": 0}
+
+    def _request_target(self, endpoint: str,
+                        query: Optional[Dict[str, object]] = None) -> Tuple[str, str]:
+        """(url, path_for_auth) for an API endpoint plus optional query params."""
         endpoint_with_query = endpoint
 
         if query:
@@ -443,7 +575,33 @@ class CoinbaseExchange:
             # HMAC: sign with full query string
             path_for_auth = f"/api/v3/brokerage{endpoint_with_query}"
 
-        url = CB_BASE + endpoint_with_query
+        return CB_BASE + endpoint_with_query, path_for_auth
+
+    @staticmethod
+    def _retry_backoff(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
+        """
+        Exponential backoff with full jitter (REQ-CB1).
+
+        Full jitter formula (AWS best practice): random(0, min(cap, base * 2^attempt)).
+        This prevents thundering herd by spreading retries across full backoff window.
+        """
+        return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+    def _req(self, method: str, endpoint: str, body: Optional[dict] = None,
+             authenticated: bool = True, max_retries: int = 3,
+             query: Optional[Dict[str, object]] = None) -> dict:
+        """
+        Make HTTP request to Coinbase API with exponential backoff.
+
+        Retries on:
+        - 429 (rate limit)
+        - 5xx (server errors)
+        - Network errors (timeout, connection)
+
+        Does NOT retry on:
+        - 4xx (except 429) - client errors like 400, 401, 403
+        """
+        url, path_for_auth = self._request_target(endpoint, query)
 
         last_exception = None
         channel = "private" if authenticated else "public"
@@ -461,12 +619,13 @@ class CoinbaseExchange:
                 else:
                     headers = {"Content-Type": "application/json"}
 
-                response = requests.request(
+                response = self._http.request(
                     method,
                     url,
                     headers=headers,
                     json=body,
-                    timeout=20
+                    timeout=self._http.config.private_read_timeout if authenticated
+                    else self._http.config.public_api_read_timeout,
                 )
                 response.raise_for_status()
                 payload = response.json()
@@ -508,20 +667,13 @@ class CoinbaseExchange:
                 # Extract endpoint name from call_label for per-endpoint tracking
                 endpoint_name = call_label.replace("/", "_").replace("-", "_")
                 self._record_rate_usage(channel, endpoint=endpoint_name, violated=rate_limited)
-                self._record_api_metrics(call_label, channel, duration, status_label)
+                self._record_api_metrics(call_label, channel, duration, status_label, self._http.last_usage())
 
             if succeeded:
                 return payload
 
-            # Exponential backoff with full jitter if not last attempt (REQ-CB1)
-            # Full jitter formula (AWS best practice): random(0, min(cap, base * 2^attempt))
-            # This prevents thundering herd by spreading retries across full backoff window
             if attempt < max_retries - 1:
-                import random
-                base_delay = 1.0  # Base delay in seconds
-                max_delay = 30.0  # Cap at 30 seconds
-                exp_backoff = min(max_delay, base_delay * (2 ** attempt))
-                backoff = random.uniform(0, exp_backoff)  # Full jitter: 0 to exp_backoff
+                backoff = self._retry_backoff(attempt)
                 logger.info(f"Retrying in {backoff:.1f}s (full jitter, attempt {attempt + 1}/{max_retries})...")
                 time.sleep(backoff)
 
@@ -532,13 +684,26 @@ class CoinbaseExchange:
         else:
             raise Exception(f"Request to {endpoint} failed after {max_retries} attempts")
 
-    def get_quote(self, symbol: str) -> Quote:
+    def get_quote(self, symbol: str, caller: str = UNLABELED) -> Quote:
         """
         Get real-time quote for symbol using Coinbase public ticker endpoint.
         Falls back to product info if ticker data is incomplete.
 
         Returns a Quote with bid/ask/mid/spread and 24h volume.
+        Served from the streaming feed when one is attached and fresh;
+        otherwise REST results are shared through the quote cache (see
+        configure_quote_cache / invalidate_quotes). ``caller`` labels the
+        lookup in quote_cache_stats().
         """
+        feed = self._market_data
+        if feed is not None:
+            streamed = feed.get_quote(symbol)
+            if streamed is not None:
+                return streamed
+
+        return self._quote_cache.get("quote", symbol, lambda: self._fetch_quote(symbol), caller=caller)
+
+    def _fetch_quote(self, symbol: str) -> Quote:
         self._rate_limit("get_quote", is_private=False)
         logger.debug(f"Fetching quote for {symbol}")
 
@@ -548,38 +713,56 @@ class CoinbaseExchange:
         # 1) Try public ticker for best bid/ask and last trade
         try:
             url = f"https://api.coinbase.com/api/v3/brokerage/market/products/{symbol}/ticker"
-            r = requests.get(url, params={"limit": 1}, timeout=8)
+            r = self._http.get(url, params={"limit": 1})
             r.raise_for_status()
-            data = r.json() or {}
-
-            # Normalize possible key names
-            bb = data.get("best_bid") or data.get("best_bid_price") or data.get("bid")
-            ba = data.get("best_ask") or data.get("best_ask_price") or data.get("ask")
-            lp = data.get("price") or data.get("last") or data.get("last_price")
-            # CRITICAL: Use quote-denominated volume (USD), not base volume (BTC/ETH/etc)
-            vol = data.get("approximate_quote_24h_volume") or data.get("quote_volume_24h") or data.get("volume_24h")
-
-            if bb: best_bid = float(bb)
-            if ba: best_ask = float(ba)
-            if lp: last = float(lp)
-            if vol: volume_24h = float(vol)
+            best_bid, best_ask, last, volume_24h = self._parse_ticker(r.json())
         except Exception as e:
             logger.warning(f"ticker fetch failed for {symbol}: {e}")
 
         # 2) If volume or prices missing, load product as fallback
+        product = None
         if not volume_24h or not (best_bid and best_ask):
             try:
                 products = self.get_products([symbol])
-                if products:
-                    p = products[0]
-                    if not last:
-                        last = float(p.get("price") or 0)
-                    if not volume_24h:
-                        # CRITICAL: Use quote-denominated volume (USD), not base volume
-                        volume_24h = float(p.get("approximate_quote_24h_volume") or p.get("quote_volume_24h") or p.get("volume_24h") or 0)
+                product = products[0] if products else None
             except Exception as e:
                 logger.warning(f"product fallback failed for {symbol}: {e}")
 
+        return self._complete_quote(symbol, best_bid, best_ask, last, volume_24h, product)
+
+    @staticmethod
+    def _parse_ticker(data: Optional[dict]) -> Tuple[float, float, float, float]:
+        """(best_bid, best_ask, last, quote_volume_24h) from a ticker payload; 0.0 where missing."""
+        data = data or {}
+        best_bid = best_ask = last = volume_24h = 0.0
+
+        # Normalize possible key names
+        bb = data.get("best_bid") or data.get("best_bid_price") or data.get("bid")
+        ba = data.get("best_ask") or data.get("best_ask_price") or data.get("ask")
+        lp = data.get("price") or data.get("last") or data.get("last_price")
+        # CRITICAL: Use quote-denominated volume (USD), not base volume (BTC/ETH/etc)
+        vol = data.get("approximate_quote_24h_volume") or data.get("quote_volume_24h") or data.get("volume_24h")
+
+        if bb: best_bid = float(bb)
+        if ba: best_ask = float(ba)
+        if lp: last = float(lp)
+        if vol: volume_24h = float(vol)
+        return best_bid, best_ask, last, volume_24h
+
+    @classmethod
+    def _complete_quote(cls, symbol: str, best_bid: float, best_ask: float, last: float,
+                        volume_24h: float, product: Optional[dict] = None) -> Quote:
+        """Fill ticker gaps from the product record and derive missing bid/ask."""
+        if product:
+            try:
+                if not last:
+                    last = float(product.get("price") or 0)
+                if not volume_24h:
+                    # CRITICAL: Use quote-denominated volume (USD), not base volume
+                    volume_24h = float(product.get("approximate_quote_24h_volume") or product.get("quote_volume_24h") or product.get("volume_24h") or 0)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"product fallback failed for {symbol}: {e}")
+
         # 3) Derive missing bid/ask from last if necessary
         if (not best_bid or not best_ask) and last > 0:
             # Assume a tight spread if we lack explicit bid/ask
@@ -590,13 +773,17 @@ class CoinbaseExchange:
         if best_bid <= 0 or best_ask <= 0:
             raise ValueError(f"No liquidity for {symbol}: bid={best_bid}, ask={best_ask}, last={last}")
 
-        mid = (best_bid + best_ask) / 2.0
-        spread_bps = (best_ask - best_bid) / mid * 10000.0 if mid > 0 else 0.0
+        return cls._build_quote(symbol, best_bid, best_ask, last, volume_24h)
+
+    @staticmethod
+    def _build_quote(symbol: str, bid: float, ask: float, last: float, volume_24h: float) -> Quote:
+        mid = (bid + ask) / 2.0
+        spread_bps = (ask - bid) / mid * 10000.0 if mid > 0 else 0.0
 
         return Quote(
             symbol=symbol,
-            bid=best_bid,
-            ask=best_ask,
+            bid=bid,
+            ask=ask,
             mid=mid,
             spread_bps=spread_bps,
             last=last or mid,
@@ -604,20 +791,156 @@ class CoinbaseExchange:
             timestamp=datetime.now(timezone.utc)
         )
 
-    def get_orderbook(self, symbol: str, depth_levels: int = 50) -> OrderbookSnapshot:
+    def get_best_bid_ask(self, product_ids: List[str]) -> Dict[str, Tuple[float, float]]:
+        """
+        Get top of book for many products in a single request.
+
+        Uses the authenticated batch endpoint /best_bid_ask?product_ids=...
+
+        Args:
+            product_ids: Products to fetch (one request; chunking is the caller's job)
+
+        Returns:
+            Dict mapping product_id -> (best_bid, best_ask); products without
+            a two-sided book are omitted
+        """
+        if not product_ids:
+            return {}
+
+        self._rate_limit("get_best_bid_ask", is_private=True)
+        resp = self._req("GET", "/best_bid_ask", query={"product_ids": list(product_ids)}, authenticated=True)
+
+        books: Dict[str, Tuple[float, float]] = {}
+        for book in resp.get("pricebooks", []) or []:
+            pid = book.get("product_id")
+            bids = book.get("bids") or []
+            asks = book.get("asks") or []
+            if not pid or not bids or not asks:
+                continue
+            try:
+                bid = float(bids[0].get("price") or 0)
+                ask = float(asks[0].get("price") or 0)
+            except (TypeError, ValueError, AttributeError):
+                continue
+            if bid > 0 and ask > 0:
+                books[pid] = (bid, ask)
+        return books
+
+    def get_quotes_bulk(self, symbols: Optional[List[str]] = None, chunk_size: int = 100,
+                        fallback: bool = True) -> Dict[str, Quote]:
+        """
+        Get quotes for many symbols with a constant number of requests.
+
+        Combines the public product list (last price + 24h quote volume) with the
+        batch best-bid-ask endpoint, one request of each per ``chunk_size``
+        symbols. Symbols the batch path cannot price (no credentials, empty
+        book, no product stats) fall back to per-symbol ``get_quote`` when
+        ``fallback`` is True.
+
+        Args:
+            symbols: Symbols to quote (None = all tradeable USD symbols)
+            chunk_size: Max product ids per batch request
+            fallback: Use get_quote for symbols missing from the batch responses
+
+        Returns:
+            Dict mapping symbol -> Quote (symbols that could not be priced are omitted)
+        """
+        if symbols is None:
+            symbols = self.get_symbols()
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+
+        quotes: Dict[str, Quote] = {}
+        feed = self._market_data
+        if feed is not None:
+            for symbol in symbols:
+                streamed = feed.get_quote(symbol)
+                if streamed is not None:
+                    quotes[symbol] = streamed
+            symbols = [s for s in symbols if s not in quotes]
+            if not symbols:
+                return quotes
+
+        chunk_size = max(1, int(chunk_size))
+        chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+
+        products: Dict[str, dict] = {}
+        for chunk in chunks:
+            for product in self.list_public_products(limit=len(chunk), product_ids=chunk):
+                products[product["product_id"]] = product
+
+        books: Dict[str, Tuple[float, float]] = {}
+        if self.api_key and self.api_secret:
+            for chunk in chunks:
+                try:
+                    books.update(self.get_best_bid_ask(chunk))
+                except Exception as e:
+                    logger.warning(f"best_bid_ask batch failed for {len(chunk)} symbols: {e}")
+
+        missing: List[str] = []
+        for symbol in symbols:
+            book = books.get(symbol)
+            product = products.get(symbol)
+            if not book or product is None:
+                # No 24h stats means volume would read as 0 and liquidity
+                # filters would drop the symbol; price it per-symbol instead
+                missing.append(symbol)
+                continue
+            try:
+                last = float(product.get("price") or 0)
+                volume_24h = float(product.get("volume_24h") or 0)
+            except (TypeError, ValueError):
+                last, volume_24h = 0.0, 0.0
+            quotes[symbol] = self._build_quote(symbol, book[0], book[1], last, volume_24h)
+            self._quote_cache.put("quote", symbol, quotes[symbol])
+
+        if missing and fallback:
+            logger.debug(f"Bulk quotes: {len(missing)}/{len(symbols)} symbols need per-symbol fallback")
+            for symbol in missing:
+                try:
+                    quotes[symbol] = self.get_quote(symbol, caller="CoinbaseExchange.get_quotes_bulk")
+                except Exception as e:
+                    logger.warning(f"Failed to fetch ticker for {symbol}: {e}")
+
+        logger.debug(
+            f"Bulk quotes: {len(quotes)}/{len(symbols)} priced "
+            f"({len(chunks)} product + {len(chunks) if books else 0} book requests, {len(missing)} fallbacks)"
+        )
+        return quotes
+
+    def get_orderbook(self, symbol: str, depth_levels: int = 50, caller: str = UNLABELED) -> OrderbookSnapshot:
         """
         Get orderbook depth snapshot using Coinbase market book if available.
         Falls back to heuristic based on 24h volume when book is unavailable.
 
         Depth is computed within ±20bps of mid to match policy "min_depth_20bps_usd".
+        The parsed L2 book is attached as ``snapshot.book`` for VWAP/impact
+        queries; a fresh streamed book is used instead of REST when available.
 
         Args:
             symbol: e.g. "BTC-USD"
             depth_levels: Number of levels to fetch (best-effort; 50-100 typical)
+            caller: Metrics label for quote_cache_stats()
 
         Returns:
             OrderbookSnapshot with depth metrics
         """
+        feed = self._market_data
+        if feed is not None:
+            streamed = feed.get_order_book(symbol)
+            if streamed is not None:
+                return self._snapshot_from_book(streamed)
+
+        return self._quote_cache.get(
+            "orderbook",
+            (symbol, depth_levels),
+            lambda: self._fetch_orderbook(symbol, depth_levels),
+            symbol=symbol,
+            caller=caller,
+        )
+
+    def _fetch_orderbook(self, symbol: str, depth_levels: int) -> OrderbookSnapshot:
         self._rate_limit("get_orderbook", is_private=False)
         logger.debug(f"Fetching orderbook for {symbol}")
 
@@ -626,83 +949,70 @@ class CoinbaseExchange:
             # API: /api/v3/brokerage/market/product_book?product_id=BTC-USD&limit=100
             url = "https://api.coinbase.com/api/v3/brokerage/market/product_book"
             params = {"product_id": symbol, "limit": max(1, min(depth_levels, 100))}
-            r = requests.get(url, params=params, timeout=10)
+            r = self._http.get(url, params=params)
             r.raise_for_status()
-            data = r.json() or {}
-
-            # Response may wrap levels under a 'pricebook' object
-            pricebook = data.get("pricebook") or {}
-            bids = pricebook.get("bids") if pricebook else data.get("bids") or []
-            asks = pricebook.get("asks") if pricebook else data.get("asks") or []
-
-            if not bids or not asks:
-                raise ValueError("Empty book")
-
-            # Prices and sizes may be strings; normalize
-            def _norm(side):
-                out = []
-                for lvl in side:
-                    p = float(lvl.get("price") or lvl.get("px") or 0)
-                    s = float(lvl.get("size") or lvl.get("qty") or 0)
-                    out.append((p, s))
-                return out
-
-            bids_n = _norm(bids)
-            asks_n = _norm(asks)
-
-            best_bid = bids_n[0][0]
-            best_ask = asks_n[0][0]
-            if best_bid <= 0 or best_ask <= 0:
-                raise ValueError("Invalid top of book")
-
-            mid = (best_bid + best_ask) / 2.0
-            band = 0.002  # 20 bps
-            max_buy_px = mid * (1 + band)
-            min_sell_px = mid * (1 - band)
-
-            # Sum USD depth within the price band (price * base_size)
-            bid_depth_usd = 0.0
-            for px, sz in bids_n:
-                if px < min_sell_px:
-                    break
-                bid_depth_usd += px * sz
-
-            ask_depth_usd = 0.0
-            for px, sz in asks_n:
-                if px > max_buy_px:
-                    break
-                ask_depth_usd += px * sz
-
-            total_depth_usd = bid_depth_usd + ask_depth_usd
-
-            return OrderbookSnapshot(
-                symbol=symbol,
-                bid_depth_usd=bid_depth_usd,
-                ask_depth_usd=ask_depth_usd,
-                total_depth_usd=total_depth_usd,
-                bid_levels=len(bids_n),
-                ask_levels=len(asks_n),
-                timestamp=datetime.now(timezone.utc)
-            )
+            return self._snapshot_from_book(self._book_from_payload(symbol, r.json()))
 
         except Exception as e:
             logger.warning(f"product_book fetch failed for {symbol}: {e}; using heuristic depth")
+            return self._heuristic_snapshot(self.get_quote(symbol, caller="CoinbaseExchange.get_orderbook"))
+
+    @staticmethod
+    def _book_from_payload(symbol: str, data: Optional[dict]) -> OrderBook:
+        """Parse a product_book response; raises ValueError for empty/crossed books."""
+        data = data or {}
+
+        # Response may wrap levels under a 'pricebook' object
+        pricebook = data.get("pricebook") or {}
+        bids = pricebook.get("bids") if pricebook else data.get("bids") or []
+        asks = pricebook.get("asks") if pricebook else data.get("asks") or []
+
+        if not bids or not asks:
+            raise ValueError("Empty book")
+
+        # Prices and sizes may be strings; normalize
+        def _norm(side):
+            for lvl in side:
+                yield (float(lvl.get("price") or lvl.get("px") or 0),
+                       float(lvl.get("size") or lvl.get("qty") or 0))
+
+        book = OrderBook.from_levels(symbol, _norm(bids), _norm(asks))
+        if not book.is_two_sided():
+            raise ValueError("Invalid top of book")
+        return book
+
+    @staticmethod
+    def _heuristic_snapshot(quote: Quote) -> OrderbookSnapshot:
+        """Depth estimate from 24h volume when no book is available."""
+        estimated_depth_usd = quote.volume_24h * 0.0005  # 0.05% of 24h volume (less conservative)
+        return OrderbookSnapshot(
+            symbol=quote.symbol,
+            bid_depth_usd=estimated_depth_usd / 2,
+            ask_depth_usd=estimated_depth_usd / 2,
+            total_depth_usd=estimated_depth_usd,
+            bid_levels=0,
+            ask_levels=0,
+            timestamp=datetime.now(timezone.utc)
+        )
 
-            # Fallback heuristic from 24h volume
-            quote = self.get_quote(symbol)
-            estimated_depth_usd = quote.volume_24h * 0.0005  # 0.05% of 24h volume (less conservative)
-            return OrderbookSnapshot(
-                symbol=symbol,
-                bid_depth_usd=estimated_depth_usd / 2,
-                ask_depth_usd=estimated_depth_usd / 2,
-                total_depth_usd=estimated_depth_usd,
-                bid_levels=0,
-                ask_levels=0,
-                timestamp=datetime.now(timezone.utc)
-            )
+    @staticmethod
+    def _snapshot_from_book(book: OrderBook, band_bps: float = 20.0) -> OrderbookSnapshot:
+        """Summarize an L2 book as depth within ±band_bps of mid (policy min_depth_20bps_usd)."""
+        bid_depth_usd = book.depth_usd("bid", band_bps)
+        ask_depth_usd = book.depth_usd("ask", band_bps)
+        return OrderbookSnapshot(
+            symbol=book.symbol,
+            bid_depth_usd=bid_depth_usd,
+            ask_depth_usd=ask_depth_usd,
+            total_depth_usd=bid_depth_usd + ask_depth_usd,
+            bid_levels=book.bid_levels,
+            ask_levels=book.ask_levels,
+            timestamp=datetime.now(timezone.utc),
+            book=book,
+        )
 
     def get_ohlcv(self, symbol: str, interval: str = "1h", 
-                   limit: int = 100) -> List[OHLCV]:
+                   limit: int = 100) -> CandleSeries:
         """
         Get historical OHLCV candlesticks from Coinbase.
 
@@ -714,69 +1024,277 @@ class CoinbaseExchange:
             limit: Number of candles (max 300)
 
         Returns:
-            List of OHLCV candles (oldest to newest)
+            CandleSeries (oldest to newest); indexing/iterating yields OHLCV rows
         """
-        self._rate_limit("get_ohlcv", is_private=False)
+        granularity = INTERVAL_GRANULARITY.get(interval, interval)
+        count = min(limit, MAX_CANDLES_PER_REQUEST)
 
-        # Map shorthand intervals to Coinbase granularity
-        interval_map = {
-            "1m": "ONE_MINUTE",
-            "5m": "FIVE_MINUTE",
-            "15m": "FIFTEEN_MINUTE",
-            "30m": "THIRTY_MINUTE",
-            "1h": "ONE_HOUR",
-            "2h": "TWO_HOUR",
-            "6h": "SIX_HOUR",
-            "1d": "ONE_DAY"
-        }
-        granularity = interval_map.get(interval, interval)
+        # Timeframes configured in candle_cache.resample_from are built locally
+        # from a cached base series instead of being requested
+        if self._candles is not None:
+            base_granularity = self._candles.config.resample_from.get(granularity)
+            if base_granularity:
+                return self._get_resampled_ohlcv(symbol, granularity, base_granularity, count)
 
-        # Calculate time range (Coinbase requires start/end)
-        end = int(time.time())
+        entries, _ = self._load_candles(symbol, granularity, count)
+        return CandleSeries.from_entries(symbol, entries)
 
-        # Duration in seconds per candle
-        duration_map = {
-            "ONE_MINUTE": 60,
-            "FIVE_MINUTE": 300,
-            "FIFTEEN_MINUTE": 900,
-            "THIRTY_MINUTE": 1800,
-            "ONE_HOUR": 3600,
-            "TWO_HOUR": 7200,
-            "SIX_HOUR": 21600,
-            "ONE_DAY": 86400
-        }
-        duration = duration_map.get(granularity, 3600)
-        start = end - (duration * min(limit, 300))  # Coinbase max is 300
+    def _load_candles(self, symbol: str, granularity: str,
+                      count: int) -> Tuple[List[Tuple[int, OHLCV]], bool]:
+        """
+        Newest `count` candles as (start_epoch, candle) entries, oldest first.
+
+        With the candle cache enabled, a warm series is served as-is when it was
+        refreshed within refresh_seconds, and otherwise only candles from the
+        last stored (still-open) one onwards are requested. Full loads larger
+        than one request are paginated.
 
-        logger.debug(f"Fetching OHLCV for {symbol} ({granularity}, limit={limit})")
+        Returns:
+            (entries, reloaded) - reloaded is True when the whole window was
+            fetched (or nothing could be loaded), False for cached/delta results
+        """
+        cached, since, ranges, window_start = self._plan_candles(symbol, granularity, count)
+        if cached is not None:
+            return cached, False
 
         try:
-            result = self._req(
-                "GET",
-                f"/products/{symbol}/candles?start={start}&end={end}&granularity={granularity}",
-                authenticated=True  # Requires authentication
+            entries = []
+            for start, end in ranges:
+                entries.extend(self._request_candles(symbol, granularity, start, end))
+        except Exception as e:
+            return self._candle_fetch_failed(symbol, granularity, count, since, e)
+
+        return self._store_candles(symbol, granularity, count, entries, since, window_start)
+
+    def _plan_candles(self, symbol: str, granularity: str, count: int
+                      ) -> Tuple[Optional[List[Tuple[int, OHLCV]]], Optional[int], List[Tuple[int, int]], int]:
+        """
+        Decide how _load_candles satisfies a request.
+
+        Returns:
+            (cached, since, ranges, window_start) - cached entries when the
+            series is fresh (nothing to request); otherwise the delta start
+            (None for a full load) and the (start, end) request ranges
+        """
+        duration = GRANULARITY_SECONDS.get(granularity, 3600)
+
+        # Calculate time range (Coinbase requires start/end)
+        end = int(time.time())
+        window_start = end - duration * count
+
+        cache = self._candles
+        since = None
+        if cache is not None:
+            if cache.fresh(symbol, granularity, window_start):
+                return cache.entries(symbol, granularity, count), None, [], window_start
+            since = cache.delta_start(
+                symbol, granularity, window_start, end, duration, max_gap=MAX_CANDLES_PER_REQUEST
             )
 
-            candles = []
-            for candle in result.get("candles", []):
-                # Coinbase returns: [timestamp, low, high, open, close, volume]
-                candles.append(OHLCV(
-                    symbol=symbol,
-                    timestamp=datetime.fromtimestamp(int(candle["start"])),
-                    open=float(candle["open"]),
-                    high=float(candle["high"]),
-                    low=float(candle["low"]),
-                    close=float(candle["close"]),
-                    volume=float(candle["volume"])
-                ))
-
-            # Sort oldest to newest
-            candles.sort(key=lambda c: c.timestamp)
-            return candles
+        logger.debug(
+            f"Fetching OHLCV for {symbol} ({granularity}, limit={count}"
+            f"{', delta' if since is not None else ''})"
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to fetch OHLCV for {symbol}: {e}")
-            return []
+        if since is not None:
+            return None, since, [(since, end)], window_start
+
+        # Full loads larger than one request are paginated (newest first)
+        ranges = []
+        chunk_end = end
+        while chunk_end > window_start:
+            chunk_start = max(window_start, chunk_end - duration * MAX_CANDLES_PER_REQUEST)
+            ranges.append((chunk_start, chunk_end))
+            chunk_end = chunk_start
+        return None, None, ranges, window_start
+
+    def _candle_fetch_failed(self, symbol: str, granularity: str, count: int,
+                             since: Optional[int], error: Exception) -> Tuple[List[Tuple[int, OHLCV]], bool]:
+        if since is not None:
+            logger.warning(f"Failed to refresh OHLCV for {symbol}, serving cached candles: {error}")
+            return self._candles.entries(symbol, granularity, count), False
+        logger.error(f"Failed to fetch OHLCV for {symbol}: {error}")
+        return [], True
+
+    def _store_candles(self, symbol: str, granularity: str, count: int,
+                       entries: List[Tuple[int, OHLCV]], since: Optional[int],
+                       window_start: int) -> Tuple[List[Tuple[int, OHLCV]], bool]:
+        """Merge fetched entries into the cache and return the newest `count`."""
+        cache = self._candles
+        if cache is None:
+            # Sort oldest to newest (page boundaries may repeat a candle)
+            return sorted(dict(entries).items()), True
+
+        cache.store(
+            symbol,
+            granularity,
+            entries,
+            covered_from=None if since is not None else window_start,
+            capacity=count,
+        )
+        return cache.entries(symbol, granularity, count), since is None
+
+    def _request_candles(self, symbol: str, granularity: str,
+                         start: int, end: int) -> List[Tuple[int, OHLCV]]:
+        self._rate_limit("get_ohlcv", is_private=False)
+        result = self._req(
+            "GET",
+            f"/products/{symbol}/candles?start={start}&end={end}&granularity={granularity}",
+            authenticated=True  # Requires authentication
+        )
+        return self._candle_entries(symbol, result)
+
+    @classmethod
+    def _candle_entries(cls, symbol: str, result: dict) -> List[Tuple[int, OHLCV]]:
+        # Coinbase returns: [timestamp, low, high, open, close, volume]
+        return [
+            (int(candle["start"]), cls._parse_candle(symbol, candle))
+            for candle in result.get("candles", [])
+        ]
+
+    def _get_resampled_ohlcv(self, symbol: str, granularity: str,
+                             base_granularity: str, count: int) -> CandleSeries:
+        """Build `count` bars of granularity from the cached base series."""
+        ratio = GRANULARITY_SECONDS[granularity] // GRANULARITY_SECONDS[base_granularity]
+
+        # One extra bucket so the oldest returned bar is complete
+        entries, reloaded = self._load_candles(symbol, base_granularity, (count + 1) * ratio)
+        return self._resample_bars(symbol, granularity, base_granularity, count, entries, reloaded)
+
+    def _resample_bars(self, symbol: str, granularity: str, base_granularity: str, count: int,
+                       entries: List[Tuple[int, OHLCV]], reloaded: bool) -> CandleSeries:
+        target_seconds = GRANULARITY_SECONDS[granularity]
+        base_seconds = GRANULARITY_SECONDS[base_granularity]
+        key = (symbol, granularity)
+        with self._resampler_lock:
+            resampler = self._resamplers.get(key)
+            if resampler is None or reloaded:
+                resampler = CandleResampler(target_seconds, base_seconds, max_bars=MAX_CANDLES_PER_REQUEST + 1)
+                self._resamplers[key] = resampler
+            resampler.update(entries)
+            return CandleSeries.from_entries(symbol, resampler.entries(count))
+
+    @staticmethod
+    def _parse_candle(symbol: str, candle: Dict[str, Any]) -> OHLCV:
+        return OHLCV(
+            symbol=symbol,
+            timestamp=datetime.fromtimestamp(int(candle["start"])),
+            open=float(candle["open"]),
+            high=float(candle["high"]),
+            low=float(candle["low"]),
+            close=float(candle["close"]),
+            volume=float(candle["volume"])
+        )
+
+    @staticmethod
+    def _candle_from_row(symbol: str, start: int, values: List[float]) -> OHLCV:
+        """Rebuild a persisted candle ([open, high, low, close, volume])."""
+        open_, high, low, close, volume = (float(v) for v in values)
+        return OHLCV(
+            symbol=symbol,
+            timestamp=datetime.fromtimestamp(start),
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+        )
+
+    def configure_candle_cache(self, cache_cfg: Optional[Dict[str, Any]]) -> None:
+        """
+        Configure the incremental OHLCV cache used by get_ohlcv.
+
+        Args:
+            cache_cfg: Dict with keys (all optional):
+                - 'enabled': keep per-symbol candle buffers (default: True)
+                - 'max_candles': candles retained per series (default: 300)
+                - 'persist_path': JSON file for warm restarts (default: none)
+                - 'persist_interval_seconds': min spacing of periodic saves (default: 300)
+                - 'refresh_seconds': serve a series this fresh without a request (default: 10)
+                - 'resample_from': {target: base} intervals built locally, e.g. {"1h": "5m"}
+        """
+        config = CandleCacheConfig.from_dict(cache_cfg)
+        if not config.enabled:
+            self._candles = None
+            logger.info("Candle cache disabled")
+            return
+        self._candles = CandleCache(config)
+        with self._resampler_lock:
+            self._resamplers.clear()
+        restored = self._candles.load(self._candle_from_row)
+        logger.info(
+            "Configured candle cache: max_candles=%d persist_path=%s restored_series=%d resample_from=%s",
+            config.max_candles,
+            config.persist_path,
+            restored,
+            config.resample_from or "none",
+        )
+
+    def retain_candles(self, symbols) -> int:
+        """Drop cached candle series for symbols no longer tracked."""
+        if self._candles is None:
+            return 0
+        keep = set(symbols)
+        with self._resampler_lock:
+            for key in [k for k in self._resamplers if k[0] not in keep]:
+                del self._resamplers[key]
+        return self._candles.retain(keep)
+
+    def persist_candles(self, force: bool = False) -> bool:
+        """Save the candle cache (periodic unless force) when persistence is configured."""
+        if self._candles is None:
+            return False
+        return self._candles.save() if force else self._candles.maybe_save()
+
+    _FETCH_KINDS = {
+        "quote": "get_quote",
+        "orderbook": "get_orderbook",
+        "ohlcv": "get_ohlcv",
+    }
+    # Kinds served through the quote cache (their getters take caller=)
+    _CACHED_KINDS = frozenset({"quote", "orderbook"})
+
+    def fetch_many(self, kind: str, symbols: List[str], *,
+                   timeout: Optional[float] = None, caller: str = UNLABELED,
+                   **params: Any) -> List[FetchResult]:
+        """
+        Fetch one kind of market data for many symbols concurrently.
+
+        Requests run on the bounded fan-out pool; each call still goes through
+        _rate_limit, so per-endpoint quotas are honoured and workers queue for
+        tokens rather than bursting past them.
+
+        Args:
+            kind: "quote", "orderbook" or "ohlcv"
+            symbols: Products to fetch, e.g. ["BTC-USD", "ETH-USD"]
+            timeout: Batch deadline in seconds (default from configure_fanout)
+            caller: Metrics label for quote_cache_stats() (quote/orderbook)
+            **params: Extra keyword arguments for the underlying getter
+                (e.g. interval="1h", limit=168 for ohlcv)
+
+        Returns:
+            One FetchResult per symbol, in input order. Failures are captured
+            on the result (result.error) and never abort the batch.
+        """
+        method_name = self._FETCH_KINDS.get(kind)
+        if method_name is None:
+            raise ValueError(f"Unknown fetch kind '{kind}' (expected one of {sorted(self._FETCH_KINDS)})")
+
+        getter = getattr(self, method_name)
+        if kind in self._CACHED_KINDS:
+            params = dict(params, caller=caller)
+        start = time.perf_counter()
+        results = self._fanout.map(lambda symbol: getter(symbol, **params), symbols, timeout=timeout)
+
+        failed = sum(1 for r in results if not r.ok)
+        logger.debug(
+            "fetch_many(%s): %d symbols in %.0fms (%d failed)",
+            kind,
+            len(results),
+            (time.perf_counter() - start) * 1000,
+            failed,
+        )
+        return results
 
     def get_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Quote]:
         """
@@ -794,14 +1312,7 @@ class CoinbaseExchange:
 
         logger.debug(f"Fetching tickers for {len(symbols)} symbols")
 
-        tickers = {}
-        for symbol in symbols:
-            try:
-                tickers[symbol] = self.get_quote(symbol)
-            except Exception as e:
-                logger.warning(f"Failed to fetch ticker for {symbol}: {e}")
-
-        return tickers
+        return self.get_quotes_bulk(symbols)
 
     def get_symbols(self) -> List[str]:
         """
@@ -813,14 +1324,11 @@ class CoinbaseExchange:
         logger.debug("Fetching available symbols from cache")
 
         # Use cached products list (refreshed every 5 min)
-        if not self._products_cache or not self._products_cache_time or (time.time() - self._products_cache_time) > 300:
-            self._rate_limit("list_symbols", is_private=False)
-            self._products_cache = self.list_public_products(limit=250)
-            self._products_cache_time = time.time()
+        products = self._product_catalog(rate_limit_endpoint="list_symbols")
 
         # Filter for USD pairs that are tradeable
         usd_symbols = []
-        for p in self._products_cache:
+        for p in products:
             product_id = p.get("product_id", "")
             status = p.get("status", "")
 
@@ -880,12 +1388,14 @@ class CoinbaseExchange:
 
         return filtered
 
-    def list_public_products(self, limit: int = 250) -> List[dict]:
+    def list_public_products(self, limit: int = 250,
+                             product_ids: Optional[List[str]] = None) -> List[dict]:
         """
         List all public products (market data).
 
         Args:
             limit: Max products to return (1-250)
+            product_ids: Optional filter; returns only these products (one request)
 
         Returns:
             List of product dicts with price, volume, status
@@ -893,8 +1403,11 @@ class CoinbaseExchange:
         self._rate_limit("list_products", is_private=False)
 
         url = "https://api.coinbase.com/api/v3/brokerage/market/products"
+        params: Dict[str, Any] = {"limit": max(1, min(limit, 250))}
+        if product_ids:
+            params["product_ids"] = list(product_ids)
         try:
-            r = requests.get(url, params={"limit": max(1, min(limit, 250))}, timeout=20)
+            r = self._http.get(url, params=params)
             r.raise_for_status()
             data = r.json() or {}
             items = data.get("products", [])
@@ -928,14 +1441,76 @@ class CoinbaseExchange:
     def get_product_metadata(self, product_id: str) -> dict:
         """Return cached product metadata (increments, status, etc.)."""
         # Refresh cache if empty or >5 minutes old
-        if not self._products_cache or not self._products_cache_time or (time.time() - self._products_cache_time) > 300:
-            self._products_cache = self.list_public_products(limit=250)
-            self._products_cache_time = time.time()
-        for p in self._products_cache:
+        for p in self._product_catalog():
             if p.get("product_id") == product_id:
                 return p
         return {}
 
+    def attach_catalog_cache(self, cache) -> None:
+        """
+        Persist the product catalog (and so every product spec) to cache.
+
+        Args:
+            cache: CatalogCache (or None to detach); its restored catalog is
+                used right away, and once it is past the 5 minute refresh
+                window it keeps being served while a background thread
+                fetches a fresh one
+        """
+        self._catalog = cache
+        restored = cache.products() if cache is not None else None
+        if not restored:
+            return
+        with self._products_lock:
+            if self._products_cache:
+                return
+            self._products_cache, self._products_cache_time = restored
+            self._products_restored = True
+        logger.info(
+            "Restored %d products from catalog cache (age %.0fs)",
+            len(restored[0]),
+            time.time() - restored[1],
+        )
+
+    def _product_catalog(self, rate_limit_endpoint: Optional[str] = None) -> List[dict]:
+        """Product list from list_public_products, cached for PRODUCTS_CACHE_SECONDS."""
+        with self._products_lock:
+            products = self._products_cache
+            cached_at = self._products_cache_time
+            if products and cached_at and time.time() - cached_at <= PRODUCTS_CACHE_SECONDS:
+                return products
+            background = (
+                products
+                and self._products_restored
+                and getattr(self._catalog, "config", None) is not None
+                and self._catalog.config.refresh_in_background
+            )
+            if background:
+                if self._products_refresh is None or not self._products_refresh.is_alive():
+                    self._products_refresh = threading.Thread(
+                        target=self._refresh_products,
+                        args=(rate_limit_endpoint,),
+                        name="cb-catalog-refresh",
+                        daemon=True,
+                    )
+                    self._products_refresh.start()
+                return products
+        return self._refresh_products(rate_limit_endpoint)
+
+    def _refresh_products(self, rate_limit_endpoint: Optional[str] = None) -> List[dict]:
+        if rate_limit_endpoint:
+            self._rate_limit(rate_limit_endpoint, is_private=False)
+        products = self.list_public_products(limit=250)
+        with self._products_lock:
+            if not products and self._products_restored:
+                # Keep serving the restored catalog rather than an empty one
+                return self._products_cache
+            self._products_cache = products
+            self._products_cache_time = time.time()
+            self._products_restored = False
+        if products and self._catalog is not None:
+            self._catalog.store_products(products)
+        return products
+
     def has_product(self, product_id: str) -> bool:
         """Return True if the given product_id is currently tradeable."""
         metadata = self.get_product_metadata(product_id)
@@ -995,7 +1570,7 @@ class CoinbaseExchange:
             return self._round_price(px, price_inc)
 
         if side_up == "SELL":
-            quote = self.get_quote(product_id)
+            quote = self.get_quote(product_id, caller="CoinbaseExchange.preview_order")
             if quote.mid <= 0:
                 raise ValueError(f"Invalid price for {product_id} in preview")
             raw_base_size = quote_size_usd / quote.mid
@@ -1158,18 +1733,21 @@ class CoinbaseExchange:
             return None
 
     def list_fills(self, order_id: Optional[str] = None, product_id: Optional[str] = None,
-                  limit: int = 100, start_time: Optional[datetime] = None) -> List[dict]:
+                  limit: int = 100, start_time: Optional[datetime] = None,
+                  max_pages: int = 1, end_time: Optional[datetime] = None) -> FillList:
         """
         List order fills (completed trades).
 
         Args:
             order_id: Filter by specific order ID
             product_id: Filter by trading pair (e.g., "BTC-USD")
-            limit: Max fills to return (1-1000, default 100)
+            limit: Max fills per page (1-1000, default 100)
             start_time: Only return fills after this time
+            max_pages: Follow pagination cursors for up to this many pages
+            end_time: Only return fills before this time
 
         Returns:
-            List of fill dicts with:
+            FillList (newest first; .truncated when fills may be missing) of fill dicts with:
                 - entry_id: Fill ID
                 - trade_id: Trade ID
                 - order_id: Order ID
@@ -1187,33 +1765,29 @@ class CoinbaseExchange:
         """
         if self.read_only and not self.api_key:
             logger.info("READ_ONLY: would list fills")
-            return []
+            return FillList()
 
         try:
             self._rate_limit("list_fills", is_private=True)
 
-            # Build query parameters
-            query_params = {}
-            if order_id:
-                query_params["order_ids"] = order_id
-                if product_id:
-                    logger.debug(
-                        "list_fills: dropping redundant product_id=%s filter for order %s",
-                        product_id,
-                        order_id,
-                    )
-            elif product_id:
-                query_params["product_id"] = product_id
-            if limit:
-                query_params["limit"] = min(max(1, limit), 1000)
-            if start_time:
-                # Coinbase expects RFC3339 format
-                query_params["start_sequence_timestamp"] = start_time.isoformat()
+            query_params = self._fills_query(order_id, product_id, limit, start_time, end_time)
 
             # CRITICAL FIX: Use correct endpoint path /orders/historical/fills
             resp = self._req("GET", "/orders/historical/fills", query=query_params, authenticated=True)
 
-            fills = resp.get("fills", [])
+            fills = FillList(resp.get("fills", []) or [])
+            pages = 1
+            cursor = resp.get("cursor")
+            while cursor and resp.get("fills") and pages < max_pages:
+                self._rate_limit("list_fills", is_private=True)
+                resp = self._req("GET", "/orders/historical/fills",
+                                 query={**query_params, "cursor": cursor}, authenticated=True)
+                fills.extend(resp.get("fills", []) or [])
+                cursor = resp.get("cursor")
+                pages += 1
+            fills.truncated = bool(cursor and resp.get("fills"))
+            if fills.truncated and max_pages > 1:
+                logger.warning("list_fills: stopped after %d pages with more fills pending", pages)
             logger.debug(f"Retrieved {len(fills)} fills" + (f" for order {order_id}" if order_id else ""))
             return fills
 
@@ -1234,9 +1808,12 @@ class CoinbaseExchange:
                         retry_params["limit"] = min(max(1, limit), 1000)
                     if start_time:
                         retry_params["start_sequence_timestamp"] = start_time.isoformat()
+                    if end_time:
+                        retry_params["end_sequence_timestamp"] = end_time.isoformat()
                     self._rate_limit("list_fills", is_private=True)
                     resp = self._req("GET", "/orders/historical/fills", query=retry_params, authenticated=True)
-                    fills = resp.get("fills", [])
+                    fills = FillList(resp.get("fills", []) or [])
+                    fills.truncated = bool(resp.get("cursor") and fills)
                     logger.debug(
                         "Retrieved %d fills after retry for order %s",
                         len(fills),
@@ -1245,13 +1822,45 @@ class CoinbaseExchange:
                     return fills
                 except Exception as retry_exc:  # pragma: no cover - defensive
                     logger.warning("list_fills retry failed for %s: %s", order_id, retry_exc)
-                    return []
+                    return self._failed_fills()
 
             logger.warning("list_fills HTTP %s: %s", exc.response.status_code if exc.response else "?", exc)
-            return []
+            return self._failed_fills()
         except Exception as e:
             logger.warning(f"list_fills failed: {e}")
-            return []
+            return self._failed_fills()
+
+    @staticmethod
+    def _failed_fills() -> FillList:
+        """Empty list_fills result that does not claim the window had no fills."""
+        fills = FillList()
+        fills.truncated = True
+        return fills
+
+    @staticmethod
+    def _fills_query(order_id: Optional[str], product_id: Optional[str],
+                     limit: int, start_time: Optional[datetime],
+                     end_time: Optional[datetime] = None) -> Dict[str, object]:
+        """Query parameters for /orders/historical/fills (see list_fills)."""
+        query_params: Dict[str, object] = {}
+        if order_id:
+            query_params["order_ids"] = order_id
+            if product_id:
+                logger.debug(
+                    "list_fills: dropping redundant product_id=%s filter for order %s",
+                    product_id,
+                    order_id,
+                )
+        elif product_id:
+            query_params["product_id"] = product_id
+        if limit:
+            query_params["limit"] = min(max(1, limit), 1000)
+        if start_time:
+            # Coinbase expects RFC3339 format
+            query_params["start_sequence_timestamp"] = start_time.isoformat()
+        if end_time:
+            query_params["end_sequence_timestamp"] = end_time.isoformat()
+        return query_params
 
     def _round_to_increment(self, qty: float, increment: Optional[str], product_id: str) -> str:
         """Round quantity down to exchange-defined base increment."""
@@ -1317,8 +1926,27 @@ class CoinbaseExchange:
 
         self._rate_limit("place_order", is_private=True)
 
+        quote = (self.get_quote(product_id, caller="CoinbaseExchange.place_order")
+                 if self._order_needs_quote(side, order_type) else None)
+        body = self._order_body(product_id, side, quote_size_usd, client_order_id,
+                                order_type, maker_cushion_ticks, quote)
+        return self._req("POST", "/orders", body, authenticated=True)
+
+    @staticmethod
+    def _order_needs_quote(side: str, order_type: str) -> bool:
+        """Limit orders price off the book; market sells size in base units."""
+        return order_type == "limit_post_only" or side.upper() == "SELL"
+
+    def _order_body(self, product_id: str, side: str, quote_size_usd: float,
+                    client_order_id: Optional[str], order_type: str,
+                    maker_cushion_ticks: int, quote: Optional[Quote]) -> dict:
+        """
+        Build the /orders request body (see place_order).
+
+        quote is required when _order_needs_quote(side, order_type) is True.
+        Product increments come from the cached product metadata.
+        """
         if order_type == "limit_post_only":
-            quote = self.get_quote(product_id)
             if quote.bid <= 0 or quote.ask <= 0:
                 raise ValueError(f"No liquidity for {product_id}: bid={quote.bid}, ask={quote.ask}")
 
@@ -1380,7 +2008,6 @@ class CoinbaseExchange:
             side_up = side.upper()
             if side_up == "SELL":
                 # SELL must be in base_size
-                quote = self.get_quote(product_id)
                 if quote.mid <= 0:
                     raise ValueError(f"Invalid price for {product_id}")
                 metadata = self.get_product_metadata(product_id)
@@ -1415,7 +2042,7 @@ class CoinbaseExchange:
                 }
                 logger.warning(f"PLACING MARKET ORDER: {side} {quote_size_usd} USD of {product_id}")
 
-        return self._req("POST", "/orders", body, authenticated=True)
+        return body
 
     # ========== Convert API (Crypto-to-Crypto) ==========
 
@@ -0,0 +1,626 @@
+"""
+247trader-v2 Core: Async Exchange Connector (Coinbase)
+
+asyncio counterpart of CoinbaseExchange for I/O-bound fan-out.
+
+The sync connector sleeps on the calling thread for rate limiting and retry
+backoff, so one slow endpoint stalls everything behind it. AsyncCoinbaseExchange
+exposes the same read/order surface (get_quote, get_orderbook, get_ohlcv,
+list_open_orders, list_fills, place_order, cancel_orders, fetch_many) as
+coroutines: token-bucket waits and jittered retry backoff are awaited, so
+hundreds of reads can be in flight on one thread.
+
+It wraps a CoinbaseExchange rather than re-implementing it: credentials and
+request signing, per-endpoint quotas, the quote and candle caches, the
+streaming feed, product metadata and payload parsing are all shared, so both
+connectors see the same state and can be used side by side.
+
+CoinbaseExchangeFacade runs the async connector on a private event loop thread
+and exposes blocking methods with the sync signatures, delegating everything
+else to the wrapped CoinbaseExchange; TradingLoop and ExecutionEngine can use
+it in place of CoinbaseExchange and move to the coroutine API call by call.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Hashable, List, Optional, Tuple
+
+from core.candle_resampler import GRANULARITY_SECONDS, INTERVAL_GRANULARITY
+from core.candles import CandleSeries
+from core.exchange_coinbase import (
+    MAX_CANDLES_PER_REQUEST,
+    OHLCV,
+    CoinbaseExchange,
+    FillList,
+    OrderbookSnapshot,
+    Quote,
+)
+from core.quote_cache import UNLABELED
+from infra.async_http import AsyncHttpClient, AsyncHttpConfig, AsyncHttpError
+from infra.config_fields import apply_fields
+from infra.fanout import FetchResult
+
+logger = logging.getLogger(__name__)
+
+TICKER_URL = "https://api.coinbase.com/api/v3/brokerage/market/products/{symbol}/ticker"
+PRODUCT_BOOK_URL = "https://api.coinbase.com/api/v3/brokerage/market/product_book"
+
+_OPEN_STATUSES = ("OPEN", "PENDING", "ACTIVE")
+_NETWORK_ERRORS = (ConnectionError, TimeoutError, asyncio.TimeoutError, OSError, EOFError)
+
+
+@dataclass
+class AsyncIoConfig:
+    """Async connector settings (app.yaml exchange.async_io)."""
+    enabled: bool = False
+    max_connections: int = 64   # Keep-alive connections to api.coinbase.com; more requests queue
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "AsyncIoConfig":
+        return apply_fields(cls(), data, "exchange.async_io")
+
+
+class AsyncCoinbaseExchange:
+    """
+    Coroutine API over a shared CoinbaseExchange.
+
+    Usage:
+        exchange = AsyncCoinbaseExchange(CoinbaseExchange(read_only=True))
+        quotes = await asyncio.gather(*(exchange.get_quote(s) for s in symbols))
+        results = await exchange.fetch_many("ohlcv", symbols, interval="1h", limit=168)
+    """
+
+    _FETCH_KINDS = CoinbaseExchange._FETCH_KINDS
+
+    def __init__(self, exchange: Optional[CoinbaseExchange] = None,
+                 client: Optional[AsyncHttpClient] = None,
+                 max_connections: int = 64):
+        """
+        Args:
+            exchange: Sync connector whose credentials, quotas and caches are
+                shared (default: a new read-only CoinbaseExchange)
+            client: HTTP client (default: keep-alive client using the sync
+                transport's timeouts)
+            max_connections: Connection cap for the default client
+        """
+        self.exchange = exchange or CoinbaseExchange(read_only=True)
+        if client is None:
+            http_cfg = self.exchange._http.config
+            client = AsyncHttpClient(AsyncHttpConfig(
+                max_connections_per_host=max_connections,
+                connect_timeout=http_cfg.connect_timeout,
+                read_timeout=http_cfg.read_timeout,
+            ))
+        self.http = client
+        # Per-loop single-flight futures: (kind, key) -> (symbol, future)
+        self._in_flight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Hashable], Tuple[Hashable, asyncio.Future]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def read_only(self) -> bool:
+        return self.exchange.read_only
+
+    # ========== Transport ==========
+
+    async def _rate_limit(self, endpoint: str, is_private: bool = False) -> None:
+        """Per-endpoint token bucket shared with the sync connector, awaited instead of slept."""
+        await self.exchange.rate_limiter.acquire_async(endpoint, is_private=is_private)
+
+    async def _public_get(self, url: str, *, params: Optional[Dict[str, Any]] = None,
+                          label: str = "public_get") -> Any:
+        start = time.perf_counter()
+        status_label = "success"
+        try:
+            response = await self.http.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+        except AsyncHttpError as exc:
+            status_label = f"http_{exc.status_code}"
+            raise
+        except Exception:
+            status_label = "error"
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            endpoint_name = label.replace("/", "_").replace("-", "_")
+            self.exchange._record_rate_usage("public", endpoint=endpoint_name, violated=False)
+            self.exchange._record_api_metrics(label, "public", duration, status_label, None)
+
+    async def _req(self, method: str, endpoint: str, body: Optional[dict] = None,
+                   authenticated: bool = True, max_retries: int = 3,
+                   query: Optional[Dict[str, object]] = None) -> dict:
+        """
+        Coroutine form of CoinbaseExchange._req (same retry rules).
+
+        Retries 429, 5xx and network errors with full-jitter exponential
+        backoff, awaited so other requests keep running; never retries other
+        4xx responses.
+        """
+        exchange = self.exchange
+        url, path_for_auth = exchange._request_target(endpoint, query)
+
+        last_exception: Optional[BaseException] = None
+        channel = "private" if authenticated else "public"
+        call_label = endpoint.strip("/") or "root"
+        http_cfg = exchange._http.config
+        timeout = http_cfg.private_read_timeout if authenticated else http_cfg.public_api_read_timeout
+
+        for attempt in range(max_retries):
+            start_time = time.perf_counter()
+            status_label = "success"
+            rate_limited = False
+            try:
+                if authenticated:
+                    headers = exchange._headers(method, path_for_auth, body)
+                else:
+                    headers = {"Content-Type": "application/json"}
+
+                response = await self.http.request(method, url, headers=headers, json=body, timeout=timeout)
+                response.raise_for_status()
+                return response.json()
+
+            except AsyncHttpError as e:
+                status_code = e.status_code
+                status_label = f"http_{status_code}"
+                rate_limited = status_code == 429
+
+                if 400 <= status_code < 500 and status_code != 429:
+                    if status_code == 404:
+                        logger.debug(f"Coinbase API 404: {endpoint} - {e.response.text}")
+                    else:
+                        logger.error(f"Coinbase API client error: {status_code} - {e.response.text}")
+                    raise
+
+                if status_code == 429:
+                    logger.warning(f"Rate limited (429) on {endpoint}, attempt {attempt + 1}/{max_retries}")
+                else:
+                    logger.warning(f"Server error ({status_code}) on {endpoint}, attempt {attempt + 1}/{max_retries}")
+                last_exception = e
+
+            except _NETWORK_ERRORS as e:
+                logger.warning(f"Network error on {endpoint}: {e}, attempt {attempt + 1}/{max_retries}")
+                last_exception = e
+                status_label = "network_error"
+
+            except Exception as e:
+                logger.error(f"Request failed: {e}")
+                status_label = type(e).__name__
+                raise
+            finally:
+                duration = time.perf_counter() - start_time
+                endpoint_name = call_label.replace("/", "_").replace("-", "_")
+                exchange._record_rate_usage(channel, endpoint=endpoint_name, violated=rate_limited)
+                exchange._record_api_metrics(call_label, channel, duration, status_label, None)
+
+            if attempt < max_retries - 1:
+                backoff = exchange._retry_backoff(attempt)
+                logger.info(f"Retrying in {backoff:.1f}s (full jitter, attempt {attempt + 1}/{max_retries})...")
+                await asyncio.sleep(backoff)
+
+        logger.error(f"All {max_retries} retries exhausted for {endpoint}")
+        if last_exception:
+            raise last_exception
+        raise Exception(f"Request to {endpoint} failed after {max_retries} attempts")
+
+    async def _single_flight(self, kind: str, key: Hashable,
+                             fetch: Callable[[], Awaitable[Any]],
+                             symbol: Optional[Hashable] = None,
+                             caller: str = UNLABELED) -> Any:
+        """
+        Serve kind/key from the shared quote cache, or fetch it once for all
+        concurrent awaiters on this loop (see QuoteCache.get for the sync form).
+        """
+        cache = self.exchange._quote_cache
+        if not cache.config.enabled:
+            return await fetch()
+
+        symbol = symbol if symbol is not None else key
+        found, value = cache.peek(kind, key)
+        if found:
+            cache.record(kind, caller, "hit")
+            return value
+
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.setdefault(loop, {})
+        cache_key = (kind, key)
+        pending = in_flight.get(cache_key)
+        if pending is not None:
+            cache.record(kind, caller, "coalesced")
+            return await asyncio.shield(pending[1])
+
+        cache.record(kind, caller, "miss")
+        token = cache.token(symbol)
+        future = loop.create_future()
+        # Retrieve the exception even when nobody joined, to keep the loop quiet
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        in_flight[cache_key] = (symbol, future)
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            cache.put(kind, key, value, symbol=symbol, token=token)
+            future.set_result(value)
+            return value
+        finally:
+            if in_flight.get(cache_key, (None, None))[1] is future:
+                del in_flight[cache_key]
+
+    def invalidate_quotes(self, symbol: Optional[str] = None) -> int:
+        """Drop cached quotes/books (all when symbol is None); in-flight fetches are not joined or stored."""
+        for in_flight in list(self._in_flight.values()):
+            for cache_key, (owner, _) in list(in_flight.items()):
+                if symbol is None or owner == symbol:
+                    in_flight.pop(cache_key, None)
+        return self.exchange.invalidate_quotes(symbol)
+
+    # ========== Market data ==========
+
+    async def get_quote(self, symbol: str, caller: str = UNLABELED) -> Quote:
+        """Async CoinbaseExchange.get_quote (streaming feed first, then the shared cache)."""
+        feed = self.exchange._market_data
+        if feed is not None:
+            streamed = feed.get_quote(symbol)
+            if streamed is not None:
+                return streamed
+
+        return await self._single_flight("quote", symbol, lambda: self._fetch_quote(symbol), caller=caller)
+
+    async def _fetch_quote(self, symbol: str) -> Quote:
+        await self._rate_limit("get_quote", is_private=False)
+        logger.debug(f"Fetching quote for {symbol}")
+
+        best_bid = best_ask = last = volume_24h = 0.0
+        try:
+            data = await self._public_get(TICKER_URL.format(symbol=symbol), params={"limit": 1}, label="ticker")
+            best_bid, best_ask, last, volume_24h = self.exchange._parse_ticker(data)
+        except Exception as e:
+            logger.warning(f"ticker fetch failed for {symbol}: {e}")
+
+        product = None
+        if not volume_24h or not (best_bid and best_ask):
+            try:
+                # Product metadata is cached by the sync connector; a refresh runs off-loop
+                products = await asyncio.to_thread(self.exchange.get_products, [symbol])
+                product = products[0] if products else None
+            except Exception as e:
+                logger.warning(f"product fallback failed for {symbol}: {e}")
+
+        return self.exchange._complete_quote(symbol, best_bid, best_ask, last, volume_24h, product)
+
+    async def get_orderbook(self, symbol: str, depth_levels: int = 50,
+                            caller: str = UNLABELED) -> OrderbookSnapshot:
+        """Async CoinbaseExchange.get_orderbook (heuristic depth when the book is unavailable)."""
+        feed = self.exchange._market_data
+        if feed is not None:
+            streamed = feed.get_order_book(symbol)
+            if streamed is not None:
+                return self.exchange._snapshot_from_book(streamed)
+
+        return await self._single_flight(
+            "orderbook",
+            (symbol, depth_levels),
+            lambda: self._fetch_orderbook(symbol, depth_levels),
+            symbol=symbol,
+            caller=caller,
+        )
+
+    async def _fetch_orderbook(self, symbol: str, depth_levels: int) -> OrderbookSnapshot:
+        await self._rate_limit("get_orderbook", is_private=False)
+        logger.debug(f"Fetching orderbook for {symbol}")
+
+        try:
+            params = {"product_id": symbol, "limit": max(1, min(depth_levels, 100))}
+            data = await self._public_get(PRODUCT_BOOK_URL, params=params, label="product_book")
+            return self.exchange._snapshot_from_book(self.exchange._book_from_payload(symbol, data))
+        except Exception as e:
+            logger.warning(f"product_book fetch failed for {symbol}: {e}; using heuristic depth")
+            return self.exchange._heuristic_snapshot(
+                await self.get_quote(symbol, caller="CoinbaseExchange.get_orderbook"))
+
+    async def get_ohlcv(self, symbol: str, interval: str = "1h", limit: int = 100) -> CandleSeries:
+        """Async CoinbaseExchange.get_ohlcv; shares the candle cache and local resampling."""
+        exchange = self.exchange
+        granularity = INTERVAL_GRANULARITY.get(interval, interval)
+        count = min(limit, MAX_CANDLES_PER_REQUEST)
+
+        if exchange._candles is not None:
+            base_granularity = exchange._candles.config.resample_from.get(granularity)
+            if base_granularity:
+                ratio = GRANULARITY_SECONDS[granularity] // GRANULARITY_SECONDS[base_granularity]
+                entries, reloaded = await self._load_candles(symbol, base_granularity, (count + 1) * ratio)
+                return exchange._resample_bars(symbol, granularity, base_granularity, count, entries, reloaded)
+
+        entries, _ = await self._load_candles(symbol, granularity, count)
+        return CandleSeries.from_entries(symbol, entries)
+
+    async def _load_candles(self, symbol: str, granularity: str,
+                            count: int) -> Tuple[List[Tuple[int, OHLCV]], bool]:
+        """CoinbaseExchange._load_candles with the pages of a full load requested concurrently."""
+        exchange = self.exchange
+        cached, since, ranges, window_start = exchange._plan_candles(symbol, granularity, count)
+        if cached is not None:
+            return cached, False
+
+        try:
+            pages = await asyncio.gather(
+                *(self._request_candles(symbol, granularity, start, end) for start, end in ranges)
+            )
+        except Exception as e:
+            return exchange._candle_fetch_failed(symbol, granularity, count, since, e)
+
+        entries = [entry for page in pages for entry in page]
+        return exchange._store_candles(symbol, granularity, count, entries, since, window_start)
+
+    async def _request_candles(self, symbol: str, granularity: str,
+                               start: int, end: int) -> List[Tuple[int, OHLCV]]:
+        await self._rate_limit("get_ohlcv", is_private=False)
+        result = await self._req(
+            "GET",
+            f"/products/{symbol}/candles?start={start}&end={end}&granularity={granularity}",
+            authenticated=True,
+        )
+        return self.exchange._candle_entries(symbol, result)
+
+    async def fetch_many(self, kind: str, symbols: List[str], *,
+                         timeout: Optional[float] = None, caller: str = UNLABELED,
+                         **params: Any) -> List[FetchResult]:
+        """
+        Fetch one kind of market data for many symbols concurrently on this loop.
+
+        Same contract as CoinbaseExchange.fetch_many: one FetchResult per
+        symbol in input order, failures captured per symbol, and symbols still
+        pending at the deadline reported as TimeoutError.
+        """
+        method_name = self._FETCH_KINDS.get(kind)
+        if method_name is None:
+            raise ValueError(f"Unknown fetch kind '{kind}' (expected one of {sorted(self._FETCH_KINDS)})")
+        getter = getattr(self, method_name)
+        if kind in self.exchange._CACHED_KINDS:
+            params = dict(params, caller=caller)
+        symbols = list(symbols)
+        if not symbols:
+            return []
+
+        async def _one(symbol: str) -> FetchResult:
+            begin = time.perf_counter()
+            try:
+                value = await getter(symbol, **params)
+            except Exception as exc:  # isolate per-symbol failures
+                return FetchResult(symbol, error=exc, duration=time.perf_counter() - begin)
+            return FetchResult(symbol, value=value, duration=time.perf_counter() - begin)
+
+        deadline = self.exchange._fanout.config.timeout_seconds if timeout is None else timeout
+        start = time.perf_counter()
+        tasks = [asyncio.ensure_future(_one(symbol)) for symbol in symbols]
+        _, pending = await asyncio.wait(tasks, timeout=deadline)
+
+        results: List[FetchResult] = []
+        for symbol, task in zip(symbols, tasks):
+            if task in pending:
+                task.cancel()
+                results.append(FetchResult(
+                    symbol,
+                    error=TimeoutError(f"{symbol}: fan-out deadline of {deadline}s exceeded"),
+                    duration=deadline or 0.0,
+                ))
+            else:
+                results.append(task.result())
+
+        if pending:
+            logger.warning("Async fan-out timed out for %d/%d symbols", len(pending), len(symbols))
+        logger.debug(
+            "fetch_many(%s, async): %d symbols in %.0fms (%d failed)",
+            kind,
+            len(results),
+            (time.perf_counter() - start) * 1000,
+            sum(1 for r in results if not r.ok),
+        )
+        return results
+
+    # ========== Orders ==========
+
+    async def list_open_orders(self, product_id: Optional[str] = None, limit: int = 100) -> List[dict]:
+        """Async CoinbaseExchange.list_open_orders (best-effort; [] on failure)."""
+        if self.read_only and not self.exchange.api_key:
+            logger.info("READ_ONLY: would list open orders")
+            return []
+        try:
+            await self._rate_limit("list_orders", is_private=True)
+            query_params: Dict[str, object] = {"order_status": "OPEN", "limit": max(1, min(limit, 100))}
+            if product_id:
+                query_params["product_id"] = product_id
+            resp = await self._req("GET", "/orders/historical/batch", query=query_params, authenticated=True)
+            return [o for o in resp.get("orders", []) if o.get("status") in _OPEN_STATUSES]
+        except AsyncHttpError as e:
+            if e.status_code != 404:
+                logger.warning(f"list_open_orders failed: {e}")
+                return []
+            logger.debug("list_open_orders: primary endpoint 404, trying fallback...")
+            try:
+                resp = await self._req("GET", "/orders/historical/batch", query={"limit": limit}, authenticated=True)
+                open_orders = [o for o in resp.get("orders", []) if o.get("status") in _OPEN_STATUSES]
+                if open_orders:
+                    logger.info(f"Found {len(open_orders)} open orders via fallback")
+                return open_orders
+            except Exception as e2:
+                logger.debug(f"list_open_orders fallback also failed: {e2}")
+                return []
+        except Exception as e:
+            logger.warning(f"list_open_orders failed: {e}")
+            return []
+
+    async def list_fills(self, order_id: Optional[str] = None, product_id: Optional[str] = None,
+                         limit: int = 100, start_time: Optional[datetime] = None,
+                         max_pages: int = 1, end_time: Optional[datetime] = None) -> FillList:
+        """Async CoinbaseExchange.list_fills (empty and truncated on failure)."""
+        if self.read_only and not self.exchange.api_key:
+            logger.info("READ_ONLY: would list fills")
+            return FillList()
+        try:
+            await self._rate_limit("list_fills", is_private=True)
+            query_params = self.exchange._fills_query(order_id, product_id, limit, start_time, end_time)
+            resp = await self._req("GET", "/orders/historical/fills", query=query_params, authenticated=True)
+            fills = FillList(resp.get("fills", []) or [])
+            pages = 1
+            cursor = resp.get("cursor")
+            while cursor and resp.get("fills") and pages < max_pages:
+                await self._rate_limit("list_fills", is_private=True)
+                resp = await self._req("GET", "/orders/historical/fills",
+                                       query={**query_params, "cursor": cursor}, authenticated=True)
+                fills.extend(resp.get("fills", []) or [])
+                cursor = resp.get("cursor")
+                pages += 1
+            fills.truncated = bool(cursor and resp.get("fills"))
+            if fills.truncated and max_pages > 1:
+                logger.warning("list_fills: stopped after %d pages with more fills pending", pages)
+            logger.debug(f"Retrieved {len(fills)} fills" + (f" for order {order_id}" if order_id else ""))
+            return fills
+        except AsyncHttpError as exc:
+            logger.warning("list_fills HTTP %s: %s", exc.status_code, exc)
+            return self.exchange._failed_fills()
+        except Exception as e:
+            logger.warning(f"list_fills failed: {e}")
+            return self.exchange._failed_fills()
+
+    async def place_order(self, product_id: str, side: str, quote_size_usd: float,
+                          client_order_id: Optional[str] = None,
+                          order_type: str = "market",
+                          maker_cushion_ticks: int = 1) -> dict:
+        """Async CoinbaseExchange.place_order (same order bodies and validation)."""
+        if self.read_only:
+            raise ValueError("Cannot place orders in READ_ONLY mode")
+
+        await self._rate_limit("place_order", is_private=True)
+
+        exchange = self.exchange
+        quote = (await self.get_quote(product_id, caller="CoinbaseExchange.place_order")
+                 if exchange._order_needs_quote(side, order_type) else None)
+        # Increments come from cached product metadata; a cold cache refreshes off-loop
+        body = await asyncio.to_thread(
+            exchange._order_body, product_id, side, quote_size_usd, client_order_id,
+            order_type, maker_cushion_ticks, quote,
+        )
+        return await self._req("POST", "/orders", body, authenticated=True)
+
+    async def cancel_orders(self, order_ids: List[str]) -> dict:
+        """Async CoinbaseExchange.cancel_orders."""
+        if self.read_only:
+            logger.info(f"READ_ONLY: would batch cancel {len(order_ids)} orders")
+            return {"success": False, "read_only": True}
+        try:
+            await self._rate_limit("cancel_orders", is_private=True)
+            resp = await self._req("POST", "/orders/batch_cancel", {"order_ids": order_ids}, authenticated=True)
+            results = resp.get("results", [])
+            success_count = sum(1 for r in results if r.get("success"))
+            failure_count = len(results) - success_count
+            logger.info(f"Batch cancel: {success_count} succeeded, {failure_count} failed out of {len(order_ids)} requested")
+            return resp
+        except Exception as e:
+            logger.error(f"Batch cancel failed: {e}")
+            return {"success": False, "error": str(e), "order_ids": order_ids}
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+
+class CoinbaseExchangeFacade:
+    """
+    Blocking CoinbaseExchange-compatible wrapper around AsyncCoinbaseExchange.
+
+    The async connector runs on a private event loop thread. The migrated
+    methods below submit coroutines to it and wait for the result, so calls
+    from many threads share one set of connections and rate-limit queues;
+    every other attribute is served by the wrapped CoinbaseExchange.
+
+    Usage:
+        exchange = CoinbaseExchangeFacade(AsyncCoinbaseExchange(CoinbaseExchange()))
+        quote = exchange.get_quote("BTC-USD")           # runs on the I/O loop
+        spec = exchange.get_product_spec("BTC-USD")     # sync connector
+        exchange.close()
+    """
+
+    def __init__(self, async_exchange: AsyncCoinbaseExchange):
+        self.async_exchange = async_exchange
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="cb-async-io", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _call(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("CoinbaseExchangeFacade called from its own event loop; await the async method")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    @property
+    def exchange(self) -> CoinbaseExchange:
+        return self.async_exchange.exchange
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined on the facade
+        if name in ("async_exchange", "_loop", "_thread"):
+            raise AttributeError(name)
+        return getattr(self.async_exchange.exchange, name)
+
+    def get_quote(self, symbol: str, caller: str = UNLABELED) -> Quote:
+        return self._call(self.async_exchange.get_quote(symbol, caller))
+
+    def get_orderbook(self, symbol: str, depth_levels: int = 50, caller: str = UNLABELED) -> OrderbookSnapshot:
+        return self._call(self.async_exchange.get_orderbook(symbol, depth_levels, caller))
+
+    def get_ohlcv(self, symbol: str, interval: str = "1h", limit: int = 100) -> CandleSeries:
+        return self._call(self.async_exchange.get_ohlcv(symbol, interval, limit))
+
+    def fetch_many(self, kind: str, symbols: List[str], *,
+                   timeout: Optional[float] = None, caller: str = UNLABELED,
+                   **params: Any) -> List[FetchResult]:
+        return self._call(self.async_exchange.fetch_many(kind, symbols, timeout=timeout, caller=caller, **params))
+
+    def list_open_orders(self, product_id: Optional[str] = None, limit: int = 100) -> List[dict]:
+        return self._call(self.async_exchange.list_open_orders(product_id, limit))
+
+    def list_fills(self, order_id: Optional[str] = None, product_id: Optional[str] = None,
+                   limit: int = 100, start_time: Optional[datetime] = None,
+                   max_pages: int = 1, end_time: Optional[datetime] = None) -> FillList:
+        return self._call(self.async_exchange.list_fills(order_id, product_id, limit, start_time, max_pages,
+                                                         end_time))
+
+    def place_order(self, product_id: str, side: str, quote_size_usd: float,
+                    client_order_id: Optional[str] = None,
+                    order_type: str = "market",
+                    maker_cushion_ticks: int = 1) -> dict:
+        return self._call(self.async_exchange.place_order(
+            product_id, side, quote_size_usd, client_order_id, order_type, maker_cushion_ticks
+        ))
+
+    def cancel_orders(self, order_ids: List[str]) -> dict:
+        return self._call(self.async_exchange.cancel_orders(order_ids))
+
+    def invalidate_quotes(self, symbol: Optional[str] = None) -> int:
+        return self.async_exchange.invalidate_quotes(symbol)
+
+    def close(self) -> None:
+        """Close pooled connections and stop the loop thread."""
+        if not self._thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.async_exchange.aclose(), self._loop).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Async connector close failed: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
@@ -9,9 +9,10 @@ submissions on network retries.
 """
 
 import hashlib
+import threading
 import time
 from decimal import Decimal, InvalidOperation, ROUND_DOWN
-from typing import Any, Dict, List, Optional, Tuple, Set
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 import logging
@@ -21,6 +22,11 @@ from requests import exceptions as requests_exceptions
 
 from core.exchange_coinbase import CoinbaseExchange, get_exchange
 from core.exceptions import CriticalDataUnavailable
+from core.market_data_feed import quote_freshness_error
+from core.order_book import FillEstimate, OrderBook
+from core.order_dispatch import OrderDispatchConfig, OrderDispatcher, QuoteReservations
+from core.fill_ingest import FillIngestConfig, FillIngester, fill_key
+from core.order_events import OrderEventStream, OrderUpdate, await_order
 from infra.state_store import StateStore
 from core.order_state import get_order_state_machine, OrderStatus, OrderState
 from analytics.trade_log import TradeRecord
@@ -28,6 +34,9 @@ from core.shadow_execution import ShadowExecutionLogger, create_shadow_order
 
 logger = logging.getLogger(__name__)
 
+# Pair selections a BUY retries when concurrent orders claim its quote balance
+BUY_RESERVATION_ATTEMPTS = 3
+
 
 @dataclass
 class ExecutionResult:
@@ -43,6 +52,7 @@ class ExecutionResult:
     route: str  # "market_ioc" | "limit_post" | "dry_run"
     error: Optional[str] = None
     timestamp: datetime = None
+    ack_latency_seconds: Optional[float] = None  # decision → exchange ack (or simulated result)
 
     def __post_init__(self):
         if self.timestamp is None:
@@ -82,9 +92,14 @@ class ExecutionEngine:
     - Slippage protection
     """
 
+    # Cycle's MarketDataContext. Orders are always priced from live exchange
+    # reads; invalidations are mirrored here so later stages of the cycle
+    # do not reuse what execution refreshed.
+    market_data = None
+
     def __init__(self, mode: str = "DRY_RUN", exchange: Optional[CoinbaseExchange] = None,
                  policy: Optional[Dict] = None, state_store: Optional[StateStore] = None,
-                 alert_service=None, risk_engine=None):
+                 alert_service=None, risk_engine=None, metrics=None):
         """
         Initialize execution engine.
 
@@ -95,6 +110,7 @@ class ExecutionEngine:
             policy: Policy configuration dict (optional, for reading limits)
             alert_service: AlertService for operational notifications
             risk_engine: RiskEngine instance (for cooldowns/spacing via TradeLimits)
+            metrics: MetricsRecorder for per-order decision-to-ack latency
         """
         self.mode = mode.upper()
         self.exchange = exchange or get_exchange()
@@ -102,6 +118,7 @@ class ExecutionEngine:
         self.state_store = state_store
         self.alert_service = alert_service
         self.risk_engine = risk_engine
+        self.metrics = metrics
         self.order_state_machine = get_order_state_machine()
 
         # Import Prometheus exporter (will be None if not initialized)
@@ -203,6 +220,22 @@ class ExecutionEngine:
         self.taker_prefer_ioc = bool(execution_config.get("prefer_ioc", True))
         self.taker_slippage_bps_per_tier = execution_config.get("taker_max_slippage_bps", {}) or {}
 
+        # Concurrent batch dispatch (execute_batch) and the quote holds it relies on
+        self.dispatcher = OrderDispatcher(OrderDispatchConfig.from_dict(execution_config.get("dispatch")))
+        self.quote_reservations = QuoteReservations()
+        self._dispatch_local = threading.local()
+
+        # User channel stream (attach_order_events); REST polling when None
+        self.order_events: Optional[OrderEventStream] = None
+        self._last_rest_reconcile: Optional[float] = None
+
+        # reconcile_fills pulls only fills past the persisted high-water mark
+        self.fill_ingester = FillIngester(
+            exchange,
+            state_store,
+            FillIngestConfig.from_dict(execution_config.get("fill_reconcile")),
+        )
+
         # Track last failure by symbol to avoid retry spam
         self._last_fail = {}
 
@@ -269,6 +302,14 @@ class ExecutionEngine:
             # Default to Tier 3 budget (most permissive) if tier unknown
             return self.slippage_budget_t3_bps
 
+    def _invalidate_quote(self, symbol: str) -> None:
+        """Drop the exchange's cached quote/book for symbol so the next read is live."""
+        invalidate = getattr(self.exchange, "invalidate_quotes", None)
+        if callable(invalidate):
+            invalidate(symbol)
+        if self.market_data is not None:
+            self.market_data.invalidate(symbol)
+
     def _validate_quote_freshness(self, quote, symbol: str) -> Optional[str]:
         """
         Validate quote timestamp is fresh enough for trading decisions.
@@ -280,33 +321,10 @@ class ExecutionEngine:
         Returns:
             Error string if stale, None if fresh
         """
-        if quote is None:
-            return f"Quote is None for {symbol}"
-
-        if not hasattr(quote, 'timestamp') or quote.timestamp is None:
-            return f"Quote missing timestamp for {symbol}"
-
-        now = datetime.now(timezone.utc)
-
-        # Ensure quote timestamp is timezone-aware
-        quote_ts = quote.timestamp
-        if quote_ts.tzinfo is None:
-            # Assume UTC if naive
-            quote_ts = quote_ts.replace(tzinfo=timezone.utc)
-
-        age_seconds = (now - quote_ts).total_seconds()
-
-        if age_seconds > self.max_quote_age_seconds:
-            return (f"Quote too stale for {symbol}: {age_seconds:.1f}s old "
-                   f"(max: {self.max_quote_age_seconds}s)")
-
-        if age_seconds < 0:
-            # Future timestamp - clock skew issue
-            return (f"Quote timestamp in future for {symbol}: {age_seconds:.1f}s ahead "
-                   f"(possible clock skew)")
-
-        logger.debug(f"Quote freshness OK for {symbol}: {age_seconds:.1f}s old")
-        return None
+        error = quote_freshness_error(quote, symbol, self.max_quote_age_seconds)
+        if error is None:
+            logger.debug(f"Quote freshness OK for {symbol}")
+        return error
 
     def _quantize_price(self, price: float, increment: str, cushion_ticks: int = 0) -> str:
         """
@@ -931,7 +949,7 @@ class ExecutionEngine:
                     # Convert crypto (BTC, ETH, etc.) to USD
                     try:
                         pair = f"{quote}-USD"
-                        quote_obj = self.exchange.get_quote(pair)
+                        quote_obj = self.exchange.get_quote(pair, caller="ExecutionEngine.adjust_proposals_to_capital")
                         usd_value = balance * quote_obj.mid
                         available_capital += usd_value
                         logger.debug(f"Converted {balance:.6f} {quote} to ${usd_value:.2f} USD")
@@ -1052,7 +1070,7 @@ class ExecutionEngine:
                 try:
                     # Try direct USD pair first
                     pair = f"{currency}-USD"
-                    quote = self.exchange.get_quote(pair)
+                    quote = self.exchange.get_quote(pair, caller="ExecutionEngine.get_liquidation_candidates")
                     value_usd = balance * quote.mid
 
                     if value_usd >= min_value_usd:
@@ -1082,7 +1100,7 @@ class ExecutionEngine:
                     # Try USDC pair as fallback
                     try:
                         pair = f"{currency}-USDC"
-                        quote = self.exchange.get_quote(pair)
+                        quote = self.exchange.get_quote(pair, caller="ExecutionEngine.get_liquidation_candidates")
                         value_usd = balance * quote.mid
 
                         if value_usd >= min_value_usd:
@@ -1433,7 +1451,7 @@ class ExecutionEngine:
                     try:
                         # Try direct USD pair first
                         quote_pair = f"{quote}-USD"
-                        quote_obj = self.exchange.get_quote(quote_pair)
+                        quote_obj = self.exchange.get_quote(quote_pair, caller="ExecutionEngine._find_best_trading_pair")
                         # Validate quote freshness
                         staleness_error = self._validate_quote_freshness(quote_obj, quote_pair)
                         if staleness_error:
@@ -1445,7 +1463,7 @@ class ExecutionEngine:
                         # Try USDC pair as fallback
                         try:
                             quote_pair = f"{quote}-USDC"
-                            quote_obj = self.exchange.get_quote(quote_pair)
+                            quote_obj = self.exchange.get_quote(quote_pair, caller="ExecutionEngine._find_best_trading_pair")
                             # Validate quote freshness
                             staleness_error = self._validate_quote_freshness(quote_obj, quote_pair)
                             if staleness_error:
@@ -1457,11 +1475,19 @@ class ExecutionEngine:
                             logger.debug(f"  Could not get USD value for {quote}: {e}")
                             continue
 
+                # Net out notional held by in-flight orders on this quote
+                held_usd = self.quote_reservations.reserved(quote)
+                if held_usd > 0 and balance_usd > 0:
+                    net_usd = max(balance_usd - held_usd, 0.0)
+                    logger.debug(f"  {quote}: ${held_usd:.2f} held by in-flight orders, ${net_usd:.2f} free")
+                    balance = balance * net_usd / balance_usd
+                    balance_usd = net_usd
+
                 # Check if trading pair exists
                 pair = f"{base_symbol}-{quote}"
                 try:
                     # Try to get a quote to verify pair exists
-                    self.exchange.get_quote(pair)
+                    self.exchange.get_quote(pair, caller="ExecutionEngine._find_best_trading_pair")
 
                     # Check if we have enough balance (prefer full balance, but track best option)
                     if balance_usd >= size_usd:
@@ -1498,12 +1524,12 @@ class ExecutionEngine:
                     else:
                         try:
                             pair = f"{currency}-USD"
-                            quote_obj = self.exchange.get_quote(pair)
+                            quote_obj = self.exchange.get_quote(pair, caller="ExecutionEngine._find_best_trading_pair")
                             value_usd = balance * quote_obj.mid
                         except Exception:
                             try:
                                 pair = f"{currency}-USDC"
-                                quote_obj = self.exchange.get_quote(pair)
+                                quote_obj = self.exchange.get_quote(pair, caller="ExecutionEngine._find_best_trading_pair")
                                 value_usd = balance * quote_obj.mid
                             except Exception:
                                 continue
@@ -1528,6 +1554,17 @@ class ExecutionEngine:
             logger.error(f"Error finding trading pair: {e}")
             raise CriticalDataUnavailable("accounts:find_best_pair", e) from e
 
+    @staticmethod
+    def _estimate_book_fill(orderbook, side: str, size_usd: float) -> Optional[FillEstimate]:
+        """Walk the snapshot's L2 book for size_usd; None without a book or if it is too thin."""
+        book = getattr(orderbook, "book", None)
+        if not isinstance(book, OrderBook):
+            return None
+        fill = book.estimate_fill("buy" if side.upper() == "BUY" else "sell", size_usd)
+        if fill is None or not fill.complete:
+            return None
+        return fill
+
     def preview_order(self, symbol: str, side: str, size_usd: float, skip_liquidity_checks: bool = False) -> Dict:
         """
         Preview an order without placing it.
@@ -1548,7 +1585,7 @@ class ExecutionEngine:
 
         try:
             # Get quote for slippage estimate
-            quote = self.exchange.get_quote(symbol)
+            quote = self.exchange.get_quote(symbol, caller="ExecutionEngine.preview_order")
 
             # Validate quote freshness
             staleness_error = self._validate_quote_freshness(quote, symbol)
@@ -1558,6 +1595,7 @@ class ExecutionEngine:
                     "error": staleness_error
                 }
 
+            orderbook = None
             if not skip_liquidity_checks:
                 # Check spread
                 if quote.spread_bps > self.max_spread_bps:
@@ -1568,7 +1606,7 @@ class ExecutionEngine:
 
                 # Check orderbook depth (critical for LIVE mode)
                 try:
-                    orderbook = self.exchange.get_orderbook(symbol, depth_levels=20)
+                    orderbook = self.exchange.get_orderbook(symbol, depth_levels=20, caller="ExecutionEngine.preview_order")
 
                     if side.upper() == "BUY":
                         depth_available_usd = orderbook.ask_depth_usd
@@ -1605,6 +1643,11 @@ class ExecutionEngine:
             estimated_fees = self.estimate_fee(size_usd, is_maker=is_maker)
             estimated_slippage_bps = quote.spread_bps / 2
 
+            # With the L2 book from the depth check, price the order's size too
+            book_fill = self._estimate_book_fill(orderbook, side, size_usd)
+            if book_fill is not None:
+                estimated_slippage_bps = max(estimated_slippage_bps, book_fill.slippage_bps)
+
             # If not DRY_RUN and auth available, call real preview API
             if self.mode != "DRY_RUN" and self.exchange.api_key:
                 try:
@@ -1626,6 +1669,8 @@ class ExecutionEngine:
                 "estimated_fees": estimated_fees,
                 "estimated_slippage_bps": estimated_slippage_bps,
                 "spread_bps": quote.spread_bps,
+                "book_vwap": book_fill.vwap if book_fill else None,
+                "book_levels_consumed": book_fill.levels_consumed if book_fill else None,
             }
 
         except Exception as e:
@@ -1641,7 +1686,8 @@ class ExecutionEngine:
                 bypass_slippage_budget: bool = False,
                 bypass_failed_order_cooldown: bool = False,
                 confidence: Optional[float] = None,
-                exit_reason: Optional[str] = None) -> ExecutionResult:
+                exit_reason: Optional[str] = None,
+                decided_at: Optional[float] = None) -> ExecutionResult:
         """
         Execute a trade.
 
@@ -1653,10 +1699,51 @@ class ExecutionEngine:
             max_slippage_bps: Optional slippage limit (overrides default)
             bypass_slippage_budget: Skip tier slippage+fee budget enforcement (for forced purges)
             bypass_failed_order_cooldown: Ignore recent failure cooldown gate (for safety purges)
+            decided_at: time.monotonic() of the trade decision (defaults to now);
+                ack latency on the result is measured from here
 
         Returns:
             ExecutionResult with fill details
         """
+        local = self._dispatch_local
+        started = decided_at if decided_at is not None else time.monotonic()
+        local.acked_at = None
+        local.reservation = None
+        try:
+            result = self._execute(
+                symbol, side, size_usd, client_order_id, max_slippage_bps, force_order_type,
+                skip_liquidity_checks, tier, bypass_slippage_budget, bypass_failed_order_cooldown,
+                confidence, exit_reason,
+            )
+        finally:
+            if local.reservation is not None:
+                self.quote_reservations.release(*local.reservation)
+                local.reservation = None
+
+        if result.order_id or result.success:
+            acked_at = local.acked_at or time.monotonic()
+            result.ack_latency_seconds = max(acked_at - started, 0.0)
+            if self.metrics is not None:
+                self.metrics.record_order_ack_latency(self.mode, result.side or side, result.ack_latency_seconds)
+        return result
+
+    def _mark_acked(self) -> None:
+        """Record when the exchange acknowledged the current thread's order."""
+        local = getattr(self, "_dispatch_local", None)
+        if local is not None and getattr(local, "acked_at", None) is None:
+            local.acked_at = time.monotonic()
+
+    def _execute(self, symbol: str, side: str, size_usd: float,
+                 client_order_id: Optional[str],
+                 max_slippage_bps: Optional[float],
+                 force_order_type: Optional[str],
+                 skip_liquidity_checks: bool,
+                 tier: Optional[int],
+                 bypass_slippage_budget: bool,
+                 bypass_failed_order_cooldown: bool,
+                 confidence: Optional[float],
+                 exit_reason: Optional[str]) -> ExecutionResult:
+        """Route a trade by mode; see execute()."""
         # Early validation: LIVE mode requires read_only=false
         if self.mode == "LIVE" and self.exchange.read_only:
             logger.error("LIVE mode execution attempted with read_only=true exchange")
@@ -1689,8 +1776,16 @@ class ExecutionEngine:
         # For BUY orders, find best trading pair based on available balance (LIVE mode only)
         # PAPER mode doesn't need balance checks - it uses simulated execution
         if side.upper() == "BUY" and self.mode == "LIVE":
-            pair_info = self._find_best_trading_pair(base_symbol, size_usd)
-            if pair_info:
+            # Select the pair without the reservation lock (it fetches quotes and
+            # may convert quote currency), then commit the hold atomically; a BUY
+            # that lost its balance to a concurrent order re-selects
+            requested_usd = size_usd
+            for attempt in range(1, BUY_RESERVATION_ATTEMPTS + 1):
+                size_usd = requested_usd
+                held_seen = self.quote_reservations.snapshot()
+                pair_info = self._find_best_trading_pair(base_symbol, size_usd)
+                if not pair_info:
+                    break
                 symbol = pair_info[0]  # Use the found trading pair
                 quote_currency = pair_info[0].split('-')[1]  # Extract quote (USDC, USD, etc.)
                 available_balance = pair_info[2]  # Raw balance in quote currency
@@ -1721,8 +1816,31 @@ class ExecutionEngine:
                     except Exception as e:
                         logger.warning(f"Auto-convert to {top_pref} skipped/failed: {e}")
 
-                logger.info(f"Using trading pair: {symbol} with ${size_usd:.2f}")
+                if self.quote_reservations.try_reserve(
+                    quote_currency, size_usd, held_seen.get(quote_currency, 0.0)
+                ):
+                    self._dispatch_local.reservation = (quote_currency, size_usd)
+                    logger.info(f"Using trading pair: {symbol} with ${size_usd:.2f}")
+                    break
+                logger.info(
+                    f"{quote_currency} balance claimed by a concurrent order; "
+                    f"re-selecting pair for {base_symbol} (attempt {attempt}/{BUY_RESERVATION_ATTEMPTS})"
+                )
             else:
+                return ExecutionResult(
+                    success=False,
+                    order_id=None,
+                    symbol=symbol,
+                    side=side,
+                    filled_size=0.0,
+                    filled_price=0.0,
+                    fees=0.0,
+                    slippage_bps=0.0,
+                    route="failed",
+                    error=f"Quote balance for {base_symbol} kept being claimed by concurrent orders"
+                )
+
+            if not pair_info:
                 # No direct pair found - try two-step conversion
                 logger.warning(f"No direct trading pair found for {base_symbol}")
                 logger.warning(f"Two-step conversion (holdings → USDC → {base_symbol}) not yet fully automated")
@@ -1832,7 +1950,7 @@ class ExecutionEngine:
 
         try:
             # Fetch live quote to show what price would be
-            quote = self.exchange.get_quote(symbol)
+            quote = self.exchange.get_quote(symbol, caller="ExecutionEngine._execute_shadow")
 
             # Check quote freshness
             freshness_error = self._validate_quote_freshness(quote, symbol)
@@ -2012,7 +2130,7 @@ class ExecutionEngine:
 
         try:
             # Get live quote
-            quote = self.exchange.get_quote(symbol)
+            quote = self.exchange.get_quote(symbol, caller="ExecutionEngine._execute_paper")
 
             # Transition to OPEN (simulated submission)
             self.order_state_machine.transition(
@@ -2130,7 +2248,9 @@ class ExecutionEngine:
             quote = None
             current_price = 0.0
             try:
-                quote = self.exchange.get_quote(symbol)
+                # Price live orders off a fresh quote, not one shared earlier in the cycle
+                self._invalidate_quote(symbol)
+                quote = self.exchange.get_quote(symbol, caller="ExecutionEngine._execute_live")
                 staleness_error = self._validate_quote_freshness(quote, symbol)
                 if staleness_error:
                     logger.warning("Stale quote rejected in _execute_live: %s", staleness_error)
@@ -2308,7 +2428,8 @@ class ExecutionEngine:
                 if use_maker:
                     if ttl_quote is None:
                         try:
-                            ttl_quote = self.exchange.get_quote(symbol)
+                            self._invalidate_quote(symbol)  # Retry reprices after the book moved
+                            ttl_quote = self.exchange.get_quote(symbol, caller="ExecutionEngine._execute_live")
                         except Exception as ttl_exc:
                             ttl_quote = quote
                             logger.debug("Maker TTL quote fetch failed for %s: %s", symbol, ttl_exc)
@@ -2505,6 +2626,8 @@ class ExecutionEngine:
                 logger.debug("Order response: %s", result)
 
                 order_id = result.get("order_id") or result.get("success_response", {}).get("order_id")
+                if order_id:
+                    self._mark_acked()
                 status = (
                     result.get("status")
                     or result.get("success_response", {}).get("status")
@@ -2574,29 +2697,25 @@ class ExecutionEngine:
                 filled_size, filled_price, fees, filled_value = self._summarize_fills(fills, product_metadata)
 
                 if not fills and order_type == "market" and order_id:
-                    logger.info("Market order placed, polling for status then fills: %s", order_id)
+                    logger.info("Market order placed, waiting for status then fills: %s", order_id)
                     try:
-                        max_attempts = 10
-                        poll_interval = 0.5
                         terminal_states = {"FILLED", "CANCELLED", "EXPIRED", "FAILED"}
-                        for attempt in range(max_attempts):
-                            time.sleep(poll_interval)
-                            order_status = self.exchange.get_order_status(order_id)
-                            if not order_status:
-                                logger.warning("Attempt %d: No order status for %s", attempt + 1, order_id)
-                                continue
-                            status = order_status.get("status", "UNKNOWN")
-                            filled_size_so_far = float(order_status.get("filled_size", 0))
+                        order_status = self._await_order(
+                            order_id,
+                            timeout=5.0,
+                            done=lambda snap: snap.get("status") in terminal_states,
+                            poll_interval=0.5,
+                        )
+                        status_now = (order_status or {}).get("status", "UNKNOWN")
+                        if status_now in terminal_states:
+                            logger.info("Order %s reached terminal state: %s", order_id, status_now)
+                        else:
                             logger.debug(
-                                "Attempt %d: order %s status=%s filled_size=%.6f",
-                                attempt + 1,
+                                "Order %s not terminal after wait: status=%s filled_size=%s",
                                 order_id,
-                                status,
-                                filled_size_so_far,
+                                status_now,
+                                (order_status or {}).get("filled_size", 0),
                             )
-                            if status in terminal_states:
-                                logger.info("Order %s reached terminal state: %s", order_id, status)
-                                break
                         time.sleep(0.2)
                         fills = self.exchange.list_fills(order_id=order_id) or []
                         logger.info("Retrieved %d fills for order %s", len(fills), order_id)
@@ -3335,12 +3454,25 @@ class ExecutionEngine:
         # Purge expired entries from recently-canceled cache
         self._purge_expired_recently_canceled()
 
-        # Fetch open orders from exchange
-        try:
-            remote_orders = self.exchange.list_open_orders()
-        except Exception as exc:
-            logger.debug("Open order fetch failed during reconciliation: %s", exc)
-            return  # Early exit if fetch fails
+        # Open orders from the user channel while it is healthy; REST on a
+        # slower watchdog interval or whenever the stream cannot vouch for them
+        stream = self.order_events
+        streamed = None
+        now_mono = time.monotonic()
+        if stream is not None and self._last_rest_reconcile is not None and (
+            now_mono - self._last_rest_reconcile < stream.config.reconcile_rest_interval_seconds
+        ):
+            streamed = stream.open_orders()
+
+        if streamed is not None:
+            remote_orders = streamed
+        else:
+            try:
+                remote_orders = self.exchange.list_open_orders()
+            except Exception as exc:
+                logger.debug("Open order fetch failed during reconciliation: %s", exc)
+                return  # Early exit if fetch fails
+            self._last_rest_reconcile = now_mono
 
         # Filter out orders that were recently canceled (Coinbase eventual consistency)
         filtered_remote_orders = []
@@ -3829,7 +3961,7 @@ class ExecutionEngine:
         fees: float,
         ttl_seconds: int,
     ) -> PostOnlyTTLResult:
-        """Poll order status and cancel if maker order exceeds TTL."""
+        """Wait for a fill or terminal status and cancel if maker order exceeds TTL."""
 
         if ttl_seconds <= 0 or not order_id:
             return PostOnlyTTLResult(triggered=False)
@@ -3850,7 +3982,6 @@ class ExecutionEngine:
             return PostOnlyTTLResult(triggered=False)
 
         poll_interval = max(0.2, min(ttl_seconds / 5.0, 1.0))
-        start = time.monotonic()
         last_error: Optional[str] = None
         latest_status = status_upper or "OPEN"
         latest_fills = initial_fills or []
@@ -3858,36 +3989,45 @@ class ExecutionEngine:
         latest_price = filled_price
         latest_fees = fees
 
-        while (time.monotonic() - start) < ttl_seconds:
+        def _resolved(snap: Dict[str, Any]) -> bool:
             try:
-                snapshot = self.exchange.get_order_status(order_id)
-            except Exception as exc:  # pragma: no cover - defensive
-                last_error = str(exc)
-                logger.debug("TTL poll failed for %s: %s", order_id, exc)
-                break
+                size = float(snap.get("filled_size") or 0.0)
+            except (TypeError, ValueError):
+                size = 0.0
+            return (snap.get("status") or "").upper() in terminal_states or size > 0
 
-            if snapshot:
-                latest_status = (snapshot.get("status") or latest_status or "OPEN").upper()
-                try:
-                    latest_size = float(snapshot.get("filled_size", latest_size) or latest_size)
-                except (TypeError, ValueError):
-                    latest_size = latest_size
-
-                if latest_status in terminal_states or latest_size > 0:
-                    fills = self.exchange.list_fills(order_id=order_id) or latest_fills
-                    size, price, total_fees, total_quote = self._summarize_fills(fills)
-                    return PostOnlyTTLResult(
-                        triggered=True,
-                        canceled=False,
-                        status=latest_status,
-                        fills=fills,
-                        filled_size=size,
-                        filled_price=price,
-                        filled_value=total_quote,
-                        fees=total_fees,
-                    )
+        try:
+            snapshot = self._await_order(
+                order_id,
+                timeout=ttl_seconds,
+                done=_resolved,
+                poll_interval=poll_interval,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            last_error = str(exc)
+            logger.debug("TTL poll failed for %s: %s", order_id, exc)
+            snapshot = None
 
-            time.sleep(poll_interval)
+        if snapshot:
+            latest_status = (snapshot.get("status") or latest_status or "OPEN").upper()
+            try:
+                latest_size = float(snapshot.get("filled_size", latest_size) or latest_size)
+            except (TypeError, ValueError):
+                latest_size = latest_size
+
+            if latest_status in terminal_states or latest_size > 0:
+                fills = self.exchange.list_fills(order_id=order_id) or latest_fills
+                size, price, total_fees, total_quote = self._summarize_fills(fills)
+                return PostOnlyTTLResult(
+                    triggered=True,
+                    canceled=False,
+                    status=latest_status,
+                    fills=fills,
+                    filled_size=size,
+                    filled_price=price,
+                    filled_value=total_quote,
+                    fees=total_fees,
+                )
 
         # TTL expired without terminal state; cancel to avoid resting risk
         backoffs = list(self.cancel_retry_backoff_ms) if self.cancel_retry_backoff_ms else [250, 500, 1000]
@@ -4138,53 +4278,202 @@ class ExecutionEngine:
         
         return True  # State update successful
 
+    _BATCH_ORDER_KEYS = (
+        "client_order_id", "max_slippage_bps", "force_order_type", "skip_liquidity_checks", "tier",
+        "bypass_slippage_budget", "bypass_failed_order_cooldown", "confidence", "exit_reason",
+    )
+
     def execute_batch(self, orders: List[Dict]) -> List[ExecutionResult]:
         """
-        Execute multiple orders sequentially.
+        Execute multiple orders, concurrently across different assets.
+
+        Orders for the same base asset run in batch order; BUYs hold their
+        quote notional so parallel orders cannot overspend a balance. A failed
+        order marked ``critical`` stops everything after it. An order whose
+        execute() raises becomes a failed result (route "failed").
 
         Args:
             orders: List of order dicts with keys: symbol, side, size_usd
+                (optionally critical and any execute() keyword, e.g. tier)
 
         Returns:
-            List of ExecutionResults
+            List of ExecutionResults in batch order
+
+        Raises:
+            CriticalDataUnavailable: after every lane has finished
         """
-        results = []
-        for order in orders:
-            result = self.execute(
+        def run(order: Dict, decided_at: float) -> ExecutionResult:
+            extra = {key: order[key] for key in self._BATCH_ORDER_KEYS if key in order}
+            return self.execute(
                 symbol=order["symbol"],
                 side=order["side"],
                 size_usd=order["size_usd"],
-                client_order_id=order.get("client_order_id"),
-                max_slippage_bps=order.get("max_slippage_bps")
+                decided_at=decided_at,
+                **extra,
             )
-            results.append(result)
 
-            # Stop on first failure if critical
-            if not result.success and order.get("critical", False):
-                logger.warning("Critical order failed, stopping batch execution")
-                break
+        def failed(order: Dict, exc: Exception) -> ExecutionResult:
+            if isinstance(exc, CriticalDataUnavailable):
+                raise exc
+            return ExecutionResult(
+                success=False,
+                order_id=None,
+                symbol=order.get("symbol"),
+                side=order.get("side"),
+                filled_size=0.0,
+                filled_price=0.0,
+                fees=0.0,
+                slippage_bps=0.0,
+                route="failed",
+                error=str(exc),
+            )
+
+        return self.dispatcher.dispatch(orders, run, on_error=failed)
+
+    def shutdown(self) -> None:
+        """Stop the batch dispatch worker pool."""
+        self.dispatcher.shutdown()
+
+    # ===== User channel order events =====
+    def attach_order_events(self, stream: Optional[OrderEventStream]) -> None:
+        """
+        Track orders from the user channel stream.
+
+        Updates are applied to OrderStateMachine and StateStore on the stream
+        thread as they arrive; order waits block on the stream and keep REST
+        only as a watchdog. Pass None to go back to pure REST polling.
+        """
+        if stream is not None and stream is not self.order_events:
+            stream.add_listener(self._apply_order_update)
+        self.order_events = stream
+
+    def _await_order(
+        self,
+        order_id: str,
+        *,
+        timeout: float,
+        done: Callable[[Dict[str, Any]], bool],
+        poll_interval: float,
+    ) -> Optional[Dict[str, Any]]:
+        """Wait for an order status matching done (stream first, get_order_status as watchdog)."""
+        return await_order(
+            self.order_events,
+            order_id,
+            lambda: self.exchange.get_order_status(order_id),
+            timeout=timeout,
+            done=done,
+            poll_interval=poll_interval,
+        )
+
+    def _apply_order_update(self, update: OrderUpdate) -> None:
+        """Map one user channel update onto OrderStateMachine and StateStore."""
+        client_id = update.client_order_id
+        tracked = self.order_state_machine.get_order(client_id) if client_id else None
+        resolved = self._map_exchange_status(update.status)
 
-        return results
+        if tracked is not None:
+            if not update.terminal and OrderStatus(tracked.status) == OrderStatus.NEW:
+                self.order_state_machine.transition(client_id, OrderStatus.OPEN, order_id=update.order_id)
+            if update.filled_size > 0 and update.filled_size >= tracked.filled_size:
+                self.order_state_machine.update_fill(
+                    client_id,
+                    filled_size=update.filled_size,
+                    filled_value=update.filled_value,
+                    fees=update.total_fees,
+                )
+            if update.terminal and resolved is not None and not tracked.is_terminal():
+                self.order_state_machine.transition(
+                    client_id,
+                    resolved,
+                    order_id=update.order_id,
+                    allow_override=True,
+                )
+
+        if not update.terminal:
+            return
+
+        key = self._order_key(client_id, update.order_id)
+        if key and self.state_store and resolved is not None:
+            details = {
+                "order_id": update.order_id,
+                "client_order_id": client_id,
+                "product_id": update.product_id,
+                "symbol": update.product_id,
+                "side": (update.side or "").lower() or None,
+                "filled_size": update.filled_size,
+                "filled_value": update.filled_value,
+                "fees": update.total_fees,
+                "status": resolved.value,
+                "source": "user_stream",
+            }
+            self._close_order_in_state_store(key, resolved.value, details)
+        self._clear_pending_marker(
+            update.product_id,
+            update.side,
+            client_order_id=client_id,
+            order_id=update.order_id,
+        )
 
     # ===== Fill reconciliation =====
+    def _fill_metrics(self, fill: Dict[str, Any]) -> Tuple[float, float, float, float]:
+        """Base size, average price, fees and quote notional of one fill (raw-field fallbacks)."""
+        base_size, avg_price, fees_value, quote_value = self._summarize_fills([fill])
+
+        raw_size = fill.get("size")
+        if base_size <= 0 and raw_size is not None:
+            try:
+                base_size = float(raw_size)
+            except (TypeError, ValueError):
+                base_size = 0.0
+
+        raw_price = fill.get("price") or fill.get("average_price")
+        if avg_price <= 0 and raw_price is not None:
+            try:
+                avg_price = float(raw_price)
+            except (TypeError, ValueError):
+                avg_price = 0.0
+
+        raw_quote = fill.get("size_in_quote") or fill.get("quote_size") or fill.get("filled_value")
+        if quote_value <= 0 and raw_quote is not None:
+            try:
+                quote_value = float(raw_quote)
+            except (TypeError, ValueError):
+                quote_value = 0.0
+
+        if base_size > 0 and avg_price <= 0 and quote_value > 0:
+            avg_price = quote_value / base_size
+
+        if quote_value <= 0 and base_size > 0 and avg_price > 0:
+            quote_value = base_size * avg_price
+
+        if fees_value <= 0:
+            try:
+                fees_value = float(fill.get("commission", 0.0) or 0.0)
+            except (TypeError, ValueError):
+                fees_value = 0.0
+
+        return base_size, avg_price, fees_value, quote_value
+
     def reconcile_fills(self, lookback_minutes: int = 60) -> Dict[str, Any]:
         """
         Poll fills from exchange and reconcile with order states and positions.
 
         Strategy:
-        1. Fetch recent fills from exchange (lookback window)
+        1. Fetch fills past the high-water mark (FillIngester; paginated,
+           already-applied fills skipped), bounded by the lookback window
         2. Match fills to tracked orders in OrderStateMachine
         3. Update fill details (filled_size, fees, prices)
         4. Transition orders to appropriate states (PARTIAL_FILL, FILLED)
         5. Update StateStore with fill details
-        6. Return reconciliation summary
+        6. Advance the high-water mark and return reconciliation summary
 
         Args:
-            lookback_minutes: How far back to query fills (default: 60 minutes)
+            lookback_minutes: Furthest back to query fills (default: 60 minutes)
 
         Returns:
             Dict with:
-                - fills_processed: int
+                - fills_processed: int (new fills applied)
+                - fills_skipped: int (already applied in an earlier call)
                 - orders_updated: int
                 - total_fees: float
                 - fills_by_symbol: Dict[str, int]
@@ -4194,17 +4483,16 @@ class ExecutionEngine:
             return {"fills_processed": 0, "orders_updated": 0, "total_fees": 0.0}
 
         try:
-            # Calculate lookback time
-            start_time = datetime.now(timezone.utc) - timedelta(minutes=lookback_minutes)
-
-            # Fetch fills from exchange
-            fills = self.exchange.list_fills(limit=1000, start_time=start_time)
+            # Fetch only fills not applied yet
+            fills, fills_skipped = self.fill_ingester.fetch(lookback_minutes)
 
             if not fills:
-                logger.debug("No fills to reconcile")
-                return {"fills_processed": 0, "orders_updated": 0, "total_fees": 0.0}
+                logger.debug("No new fills to reconcile")
+                self.fill_ingester.commit(fills)   # closes or narrows a truncated window
+                return {"fills_processed": 0, "orders_updated": 0, "total_fees": 0.0,
+                        "fills_skipped": fills_skipped}
 
-            logger.info(f"Reconciling {len(fills)} fills from last {lookback_minutes} minutes")
+            logger.info(f"Reconciling {len(fills)} new fills ({fills_skipped} already applied)")
 
             # Track reconciliation stats
             fills_processed = 0
@@ -4214,49 +4502,23 @@ class ExecutionEngine:
             unmatched_fills = []
 
             for fill in fills:
-                fills_processed += 1
-
                 # Extract fill details
                 order_id = fill.get("order_id")
                 product_id = fill.get("product_id", "")
                 side = (fill.get("side", "") or "").upper()
                 trade_time = fill.get("trade_time", "")
 
-                # Extract robust fill metrics (handles quote-sized market orders)
-                base_size, avg_price, fees_value, quote_value = self._summarize_fills([fill])
-
-                raw_size = fill.get("size")
-                if base_size <= 0 and raw_size is not None:
-                    try:
-                        base_size = float(raw_size)
-                    except (TypeError, ValueError):
-                        base_size = 0.0
-
-                raw_price = fill.get("price") or fill.get("average_price")
-                if avg_price <= 0 and raw_price is not None:
-                    try:
-                        avg_price = float(raw_price)
-                    except (TypeError, ValueError):
-                        avg_price = 0.0
-
-                raw_quote = fill.get("size_in_quote") or fill.get("quote_size") or fill.get("filled_value")
-                if quote_value <= 0 and raw_quote is not None:
-                    try:
-                        quote_value = float(raw_quote)
-                    except (TypeError, ValueError):
-                        quote_value = 0.0
-
-                if base_size > 0 and avg_price <= 0 and quote_value > 0:
-                    avg_price = quote_value / base_size
-
-                if quote_value <= 0 and base_size > 0 and avg_price > 0:
-                    quote_value = base_size * avg_price
+                # Find matching order in state machine (fills carry the exchange order_id)
+                order_state = self.order_state_machine.get_order_by_exchange_id(order_id)
+                if order_state is not None and order_state.fills:
+                    key = fill_key(fill)
+                    if any(fill_key(seen) == key for seen in order_state.fills):
+                        # Replayed fill (e.g. after a lost cursor): already in the totals and PnL
+                        fills_skipped += 1
+                        continue
 
-                if fees_value <= 0:
-                    try:
-                        fees_value = float(fill.get("commission", 0.0) or 0.0)
-                    except (TypeError, ValueError):
-                        fees_value = 0.0
+                fills_processed += 1
+                base_size, avg_price, fees_value, quote_value = self._fill_metrics(fill)
 
                 # Track fees
                 total_fees += fees_value
@@ -4310,39 +4572,34 @@ class ExecutionEngine:
                         logger.debug(f"Could not record fill for PnL tracking: {e}")
                         # Continue processing other fills
 
-                # Find matching order in state machine
-                # We need to search by order_id since fills use exchange order_id
-                matching_order = None
-                for client_id, order_state in self.order_state_machine.orders.items():
-                    if order_state.order_id == order_id:
-                        matching_order = (client_id, order_state)
-                        break
-
-                if not matching_order:
+                if order_state is None:
                     logger.debug(f"No tracked order for fill: {order_id} ({product_id})")
                     unmatched_fills.append(fill)
                     continue
 
-                client_id, order_state = matching_order
+                client_id = order_state.client_order_id
                 orders_updated.add(client_id)
 
-                # Calculate fill value from extracted metrics
-                fill_value = base_size * avg_price if base_size > 0 and avg_price > 0 else 0.0
-
-                # Update order state with fill details
-                current_filled = order_state.filled_size or 0.0
-                current_filled_value = order_state.filled_value or 0.0
-                current_fees = order_state.fees or 0.0
-
-                new_filled_size = current_filled + base_size
-                new_filled_value = current_filled_value + fill_value
-                new_fees = current_fees + fees_value
-
                 # Store fill in order state
                 if not hasattr(order_state, 'fills') or order_state.fills is None:
                     order_state.fills = []
                 order_state.fills.append(fill)
 
+                # Totals are cumulative: the user channel sets them from the order
+                # snapshot, which may already include this fill, so take the larger
+                # of that and the sum of the distinct fills seen for the order
+                fills_size = fills_value = fills_fees = 0.0
+                for seen in order_state.fills:
+                    seen_size, seen_price, seen_fees, _ = self._fill_metrics(seen)
+                    if seen_size > 0 and seen_price > 0:
+                        fills_size += seen_size
+                        fills_value += seen_size * seen_price
+                    fills_fees += seen_fees
+
+                new_filled_size = max(order_state.filled_size or 0.0, fills_size)
+                new_filled_value = max(order_state.filled_value or 0.0, fills_value)
+                new_fees = max(order_state.fees or 0.0, fills_fees)
+
                 # Update fill totals
                 self.order_state_machine.update_fill(
                     client_order_id=client_id,
@@ -4389,6 +4646,8 @@ class ExecutionEngine:
                                 }
                             )
 
+            self.fill_ingester.commit(fills)
+
             # Get PnL metrics
             realized_pnl_usd = 0.0
             open_positions = 0
@@ -4402,6 +4661,7 @@ class ExecutionEngine:
 
             summary = {
                 "fills_processed": fills_processed,
+                "fills_skipped": fills_skipped,
                 "orders_updated": len(orders_updated),
                 "total_fees": total_fees,
                 "fills_by_symbol": fills_by_symbol,
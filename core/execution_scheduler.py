@@ -0,0 +1,400 @@
+"""
+247trader-v2 Core: Background Execution Scheduler
+
+Owns long-running parent orders (TWAP liquidations, iceberg and post-only
+ladders) so they no longer run inline in TradingLoop.run_cycle.
+
+- Each parent runs as a job on a small worker pool; parents for different
+  symbols advance concurrently, and at most one parent per symbol is active.
+- Jobs receive a ParentContext: they report progress (filled notional,
+  slices, working child order) through it and check ``ctx.stopping``
+  between slices. Progress is persisted in StateStore under
+  ``parent_orders`` and archived to ``recent_parent_orders`` when done.
+- cancel_all() stops every parent and cancels their working child orders
+  directly, so a kill switch does not wait for a slice to time out. While
+  parents are active a monitor timer evaluates ``halt_check`` (the kill
+  switch) and triggers cancel_all on its own.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from infra.config_fields import apply_fields
+
+logger = logging.getLogger(__name__)
+
+ACTIVE = "working"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELED = "canceled"
+
+
+@dataclass
+class ExecutionSchedulerConfig:
+    """Scheduler settings (config/policy.yaml → execution.scheduler)."""
+
+    enabled: bool = False
+    max_workers: int = 4
+    cancel_timeout_seconds: float = 5.0
+    halt_check_seconds: float = 1.0
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> "ExecutionSchedulerConfig":
+        return apply_fields(cls(), raw, "execution.scheduler")
+
+
+@dataclass
+class ParentOrder:
+    """Progress of one parent order as persisted in StateStore."""
+
+    parent_id: str
+    kind: str
+    symbol: str
+    side: str
+    target_usd: float
+    filled_usd: float = 0.0
+    filled_units: float = 0.0
+    fees: float = 0.0
+    slices: int = 0
+    status: str = ACTIVE
+    working_order_id: Optional[str] = None
+    working_product_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    updated_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ParentContext:
+    """Handle a parent job uses to report progress and observe cancellation."""
+
+    def __init__(self, scheduler: "ExecutionScheduler", parent: ParentOrder):
+        self._scheduler = scheduler
+        self.parent = parent
+        self.stop_event = threading.Event()
+
+    @property
+    def stopping(self) -> bool:
+        return self.stop_event.is_set()
+
+    def sleep(self, seconds: float) -> bool:
+        """Wait between slices; returns True if the parent was canceled meanwhile."""
+        return self.stop_event.wait(max(0.0, seconds))
+
+    def set_working(self, order_id: Optional[str], product_id: Optional[str] = None) -> None:
+        """Record (or clear, with None) the child order currently resting on the book."""
+        with self._scheduler._lock:
+            self.parent.working_order_id = order_id
+            self.parent.working_product_id = product_id if order_id else None
+        self._scheduler._persist(self.parent)
+
+    def report(self, *, filled_usd: float, filled_units: float, fees: float, slices: int) -> None:
+        """Record cumulative progress after a slice."""
+        with self._scheduler._lock:
+            self.parent.filled_usd = filled_usd
+            self.parent.filled_units = filled_units
+            self.parent.fees = fees
+            self.parent.slices = slices
+        self._scheduler._persist(self.parent)
+
+
+class ExecutionScheduler:
+    """
+    Runs parent-order jobs in the background.
+
+    Usage:
+        scheduler = ExecutionScheduler(config, state_store=store, cancel_order=exchange.cancel_order,
+                                       halt_check=kill_switch_active)
+        parent = scheduler.submit("twap", "BAD-USD", "SELL", 150.0, job, on_done=record_outcome)
+        ...
+        scheduler.cancel_all("kill_switch")   # stops parents, cancels working children
+    """
+
+    def __init__(
+        self,
+        config: Optional[ExecutionSchedulerConfig] = None,
+        *,
+        state_store=None,
+        cancel_order: Optional[Callable[[str], Any]] = None,
+        halt_check: Optional[Callable[[], bool]] = None,
+    ):
+        self.config = config or ExecutionSchedulerConfig()
+        self.state_store = state_store
+        self._cancel_order = cancel_order
+        self._halt_check = halt_check
+        self._lock = threading.RLock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._active: Dict[str, ParentContext] = {}      # symbol -> context
+        self._futures: Dict[str, Future] = {}             # parent_id -> future
+        self._monitor: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {"submitted": 0, "rejected": 0, COMPLETED: 0, FAILED: 0, CANCELED: 0, "halts": 0}
+        self._close_interrupted_parents()
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        kind: str,
+        symbol: str,
+        side: str,
+        target_usd: float,
+        job: Callable[[ParentContext], bool],
+        on_done: Optional[Callable[[ParentOrder, bool], None]] = None,
+    ) -> Optional[ParentOrder]:
+        """
+        Start a parent order in the background.
+
+        Args:
+            job: Callable(ctx) returning True on success; runs on a worker thread
+            on_done: Callable(parent, success), called on the worker thread
+
+        Returns:
+            The new ParentOrder, or None if this symbol already has an active
+            parent or the scheduler is shut down
+        """
+        with self._lock:
+            if self._closed or symbol in self._active:
+                self._stats["rejected"] += 1
+                return None
+            parent = ParentOrder(
+                parent_id=f"{kind}_{uuid.uuid4().hex[:12]}",
+                kind=kind,
+                symbol=symbol,
+                side=side.upper(),
+                target_usd=float(target_usd),
+            )
+            ctx = ParentContext(self, parent)
+            self._active[symbol] = ctx
+            self._stats["submitted"] += 1
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix="exec-scheduler",
+                )
+            self._persist(parent)
+            self._futures[parent.parent_id] = self._pool.submit(self._run, ctx, job, on_done)
+            self._ensure_monitor()
+
+        logger.info("Scheduled %s parent %s: %s %s ~$%.2f", kind, parent.parent_id, side.upper(), symbol, target_usd)
+        return parent
+
+    def is_active(self, symbol: str) -> bool:
+        with self._lock:
+            return symbol in self._active
+
+    def active(self) -> List[ParentOrder]:
+        with self._lock:
+            return [ctx.parent for ctx in self._active.values()]
+
+    def remaining_usd(self, side: str = "SELL") -> float:
+        """Notional active parents on side still have to work (target minus filled)."""
+        side = side.upper()
+        with self._lock:
+            return sum(
+                max(0.0, ctx.parent.target_usd - ctx.parent.filled_usd)
+                for ctx in self._active.values()
+                if ctx.parent.side == side
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, active=len(self._active))
+
+    def _run(self, ctx: ParentContext, job: Callable[[ParentContext], bool],
+             on_done: Optional[Callable[[ParentOrder, bool], None]]) -> bool:
+        parent = ctx.parent
+        success = False
+        try:
+            success = bool(job(ctx))
+        except Exception as exc:
+            logger.error("Parent %s (%s) failed: %s", parent.parent_id, parent.symbol, exc, exc_info=True)
+            parent.error = str(exc)
+
+        with self._lock:
+            parent.working_order_id = None
+            parent.working_product_id = None
+            if ctx.stopping and not success:
+                parent.status = CANCELED
+            else:
+                parent.status = COMPLETED if success else FAILED
+            self._stats[parent.status] += 1
+            self._active.pop(parent.symbol, None)
+            self._futures.pop(parent.parent_id, None)
+        self._archive(parent)
+        logger.info(
+            "Parent %s %s: %s ~$%.2f of $%.2f in %d slices",
+            parent.parent_id,
+            parent.status,
+            parent.symbol,
+            parent.filled_usd,
+            parent.target_usd,
+            parent.slices,
+        )
+
+        if on_done is not None:
+            try:
+                on_done(parent, success)
+            except Exception as exc:
+                logger.warning("Parent %s completion callback failed: %s", parent.parent_id, exc)
+        return success
+
+    # ------------------------------------------------------------------
+    # Cancellation
+    # ------------------------------------------------------------------
+
+    def cancel_all(self, reason: str, timeout: Optional[float] = None) -> Dict[str, int]:
+        """
+        Stop every active parent and cancel its working child order.
+
+        Child cancels are sent from the calling thread straight away; the
+        call then waits up to ``timeout`` (default cancel_timeout_seconds)
+        for the jobs to unwind.
+        """
+        with self._lock:
+            contexts = list(self._active.values())
+            futures = list(self._futures.values())
+            for ctx in contexts:
+                ctx.stop_event.set()
+            working = [
+                (ctx.parent.parent_id, ctx.parent.working_order_id)
+                for ctx in contexts
+                if ctx.parent.working_order_id
+            ]
+
+        summary = {"parents": len(contexts), "children_canceled": 0, "cancel_errors": 0, "unfinished": 0}
+        if not contexts:
+            return summary
+        logger.warning("Canceling %d parent order(s): %s", len(contexts), reason)
+
+        for parent_id, order_id in working:
+            if self._cancel_order is None:
+                break
+            if self._cancel_child(parent_id, order_id):
+                summary["cancel_errors"] += 1
+            else:
+                summary["children_canceled"] += 1
+
+        limit = self.config.cancel_timeout_seconds if timeout is None else timeout
+        _, pending = wait(futures, timeout=max(0.0, limit))
+        summary["unfinished"] = len(pending)
+        if pending:
+            logger.warning("%d parent order(s) still unwinding after %.1fs", len(pending), limit)
+        return summary
+
+    def shutdown(self, reason: str = "shutdown") -> Dict[str, int]:
+        """Cancel all parents and release the worker pool."""
+        with self._lock:
+            self._closed = True
+        summary = self.cancel_all(reason)
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        return summary
+
+    def _ensure_monitor(self) -> None:
+        # Caller holds self._lock
+        if self._halt_check is None or (self._monitor and self._monitor.is_alive()):
+            return
+        self._monitor = threading.Thread(target=self._watch_halt, name="exec-scheduler-halt", daemon=True)
+        self._monitor.start()
+
+    def _watch_halt(self) -> None:
+        while True:
+            time.sleep(self.config.halt_check_seconds)
+            with self._lock:
+                if not self._active:
+                    self._monitor = None
+                    return
+            try:
+                halted = bool(self._halt_check())
+            except Exception as exc:
+                logger.debug("Scheduler halt check failed: %s", exc)
+                continue
+            if halted:
+                with self._lock:
+                    self._stats["halts"] += 1
+                self.cancel_all("halt")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _persist(self, parent: ParentOrder) -> None:
+        if self.state_store is None:
+            return
+        with self._lock:
+            parent.updated_at = datetime.now(timezone.utc).isoformat()
+            payload = parent.to_dict()
+        try:
+            self.state_store.record_parent_order(parent.parent_id, payload)
+        except Exception as exc:
+            logger.debug("Parent order persist failed for %s: %s", parent.parent_id, exc)
+
+    def _archive(self, parent: ParentOrder) -> None:
+        if self.state_store is None:
+            return
+        with self._lock:
+            parent.updated_at = datetime.now(timezone.utc).isoformat()
+            payload = parent.to_dict()
+        try:
+            self.state_store.close_parent_order(parent.parent_id, status=parent.status, details=payload)
+        except Exception as exc:
+            logger.debug("Parent order archive failed for %s: %s", parent.parent_id, exc)
+
+    def _close_interrupted_parents(self) -> None:
+        """
+        Archive parents a previous process left active (their jobs died with it).
+
+        A child order such a parent left resting is canceled first, so it
+        cannot fill after the parent is gone; if the cancel fails the archived
+        entry carries child_cancel_error and open-order reconciliation picks
+        the order up from the exchange.
+        """
+        if self.state_store is None:
+            return
+        try:
+            leftover = dict(self.state_store.load().get("parent_orders") or {})
+        except Exception as exc:
+            logger.debug("Interrupted parent cleanup failed: %s", exc)
+            return
+
+        for parent_id, entry in leftover.items():
+            details: Dict[str, Any] = {"working_order_id": None, "working_product_id": None}
+            order_id = entry.get("working_order_id") if isinstance(entry, dict) else None
+            if order_id:
+                error = self._cancel_child(parent_id, order_id)
+                details["interrupted_child_order_id"] = order_id
+                if error:
+                    details["child_cancel_error"] = error
+            try:
+                self.state_store.close_parent_order(parent_id, status="interrupted", details=details)
+            except Exception as exc:
+                logger.debug("Interrupted parent cleanup failed for %s: %s", parent_id, exc)
+        if leftover:
+            logger.warning("Archived %d parent order(s) interrupted by a restart", len(leftover))
+
+    def _cancel_child(self, parent_id: str, order_id: str) -> Optional[str]:
+        """Cancel a working child order; returns an error message on failure."""
+        if self._cancel_order is None:
+            return "no cancel_order callback"
+        try:
+            result = self._cancel_order(order_id)
+        except Exception as exc:
+            logger.warning("Cancel of child %s (parent %s) failed: %s", order_id, parent_id, exc)
+            return str(exc)
+        if isinstance(result, dict) and result.get("success") is False:
+            logger.warning("Cancel of child %s (parent %s) rejected: %s", order_id, parent_id, result)
+            return str(result.get("error") or "cancel rejected")
+        return None
@@ -0,0 +1,365 @@
+"""
+247trader-v2 Core: Feature Store
+
+Derived market features (returns, volatility, ATR, volume ratios, ...) for
+one trading cycle, computed lazily and at most once per
+(symbol, timeframe, feature, params).
+
+Features are declared once in FEATURES with the features they depend on
+(registration rejects unknown dependencies, so the graph stays acyclic).
+Reads made while computing another feature are dependency reads: they are
+not counted as consumer requests, and their compute time is kept out of the
+dependent feature's. A FeatureFrame holds the candles of one
+(symbol, timeframe) and memoizes every feature read on it. A producer that already has a value (TriggerEngine
+and its streaming IndicatorState) hands it over with provide() instead of
+having it recomputed.
+
+The cycle's MarketDataContext owns the store (market_data.features), so the
+trigger scan, signals, rules sizing and the AI snapshot all read the same
+values. report() gives hit ratios and compute time per feature.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from core import indicators
+from core.indicator_state import IndicatorParams, IndicatorState
+from core.indicators import as_columns
+
+logger = logging.getLogger(__name__)
+
+# Bars per year by candle interval, for annualizing return volatility
+PERIODS_PER_YEAR: Dict[str, float] = {
+    "1m": 365 * 24 * 60,
+    "5m": 365 * 24 * 12,
+    "15m": 365 * 24 * 4,
+    "30m": 365 * 24 * 2,
+    "1h": 365 * 24,
+    "2h": 365 * 12,
+    "6h": 365 * 4,
+    "1d": 365,
+}
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """A named feature: how to compute it and what it is computed from."""
+    name: str
+    compute: Callable[..., Any]
+    depends_on: Tuple[str, ...] = ()
+    description: str = ""
+
+
+FEATURES: Dict[str, FeatureSpec] = {}
+
+
+def feature(name: str, depends_on: Iterable[str] = (), registry: Optional[Dict[str, FeatureSpec]] = None):
+    """
+    Register compute(frame, **params) as feature `name`.
+
+    Dependencies must already be registered, which keeps the graph acyclic.
+    """
+    target = FEATURES if registry is None else registry
+    deps = tuple(depends_on)
+    if name in target:
+        raise ValueError(f"Feature '{name}' already registered")
+    unknown = [dep for dep in deps if dep not in target]
+    if unknown:
+        raise ValueError(f"Feature '{name}' depends on unregistered {unknown}")
+
+    def register(compute: Callable[..., Any]) -> Callable[..., Any]:
+        target[name] = FeatureSpec(name, compute, deps, (compute.__doc__ or "").strip())
+        return compute
+
+    return register
+
+
+def dependencies(name: str, registry: Optional[Dict[str, FeatureSpec]] = None) -> List[str]:
+    """Everything `name` is computed from, dependencies before dependents."""
+    target = FEATURES if registry is None else registry
+    ordered: List[str] = []
+
+    def visit(current: str) -> None:
+        for dep in target[current].depends_on:
+            if dep not in ordered:
+                visit(dep)
+                ordered.append(dep)
+
+    visit(name)
+    return ordered
+
+
+def volatility_pct_from_view(view: IndicatorState, timeframe: str = "1h") -> float:
+    """
+    Annualized volatility (%) of simple returns over the view's window.
+
+    50.0 with fewer than 24 bars or no returns; capped at 200.0.
+    """
+    if view.count < 24:
+        return 50.0
+    std = view.returns_std()
+    if std is None:
+        return 50.0
+    annualized = std * math.sqrt(PERIODS_PER_YEAR.get(timeframe, PERIODS_PER_YEAR["1h"])) * 100
+    return min(annualized, 200.0)
+
+
+# ----------------------------------------------------------------------
+# Built-in features
+# ----------------------------------------------------------------------
+
+@feature("columns")
+def _columns(frame: "FeatureFrame"):
+    """Struct-of-arrays view of the candles."""
+    return as_columns(frame.candles)
+
+
+@feature("indicators")
+def _indicators(frame: "FeatureFrame"):
+    """Indicator state at the newest candle (TriggerEngine provides its streaming one)."""
+    return IndicatorState.from_candles(IndicatorParams(), frame.candles)
+
+
+@feature("close", depends_on=("columns",))
+def _close(frame: "FeatureFrame") -> Optional[float]:
+    """Newest close."""
+    closes = frame.get("columns").close
+    return closes[-1] if len(closes) else None
+
+
+@feature("change_pct", depends_on=("columns",))
+def _change_pct(frame: "FeatureFrame", bars: int = 1) -> Optional[float]:
+    """% change of the newest close vs `bars` candles earlier."""
+    closes = frame.get("columns").close
+    if len(closes) <= bars or closes[-1 - bars] <= 0:
+        return None
+    return (closes[-1] - closes[-1 - bars]) / closes[-1 - bars] * 100.0
+
+
+@feature("returns_std", depends_on=("columns",))
+def _returns_std(frame: "FeatureFrame", bars: int = 23) -> Optional[float]:
+    """Population std of the last `bars` simple returns."""
+    return indicators.returns_std(frame.get("columns").close, bars)
+
+
+@feature("volatility_pct", depends_on=("indicators",))
+def _volatility_pct(frame: "FeatureFrame") -> float:
+    """Annualized % volatility of returns over the indicator window (trigger sizing input)."""
+    return volatility_pct_from_view(frame.get("indicators"), frame.timeframe)
+
+
+@feature("atr_pct", depends_on=("columns",))
+def _atr_pct(frame: "FeatureFrame", period: int = 14) -> float:
+    """ATR as % of the newest close; 0.0 without period+1 candles."""
+    cols = frame.get("columns")
+    if len(cols) < period + 1:
+        return 0.0
+    tail = slice(-(period + 1), None)
+    value = indicators.atr_pct(cols.high[tail], cols.low[tail], cols.close[tail], period)[-1]
+    return 0.0 if math.isnan(value) else float(value)
+
+
+@feature("volume_sum", depends_on=("columns",))
+def _volume_sum(frame: "FeatureFrame", bars: int = 24) -> float:
+    """Volume of the last `bars` candles."""
+    return sum(frame.get("columns").volume[-bars:])
+
+
+@feature("close_mean", depends_on=("columns",))
+def _close_mean(frame: "FeatureFrame", bars: int = 24) -> float:
+    """Mean close of the last `bars` candles."""
+    return sum(frame.get("columns").close[-bars:]) / float(bars)
+
+
+@feature("volume_ratio", depends_on=("volume_sum",))
+def _volume_ratio(frame: "FeatureFrame", recent: int = 1, baseline: int = 24) -> Optional[float]:
+    """Average volume of the last `recent` candles over that of the last `baseline`."""
+    average = frame.get("volume_sum", bars=baseline) / float(baseline)
+    if average <= 0:
+        return None
+    return frame.get("volume_sum", bars=recent) / (average * recent)
+
+
+# ----------------------------------------------------------------------
+# Frames and the per-cycle store
+# ----------------------------------------------------------------------
+
+# Per-thread stack of nested computations: a feature read while another is
+# being computed is a dependency, not a consumer read, and its compute time
+# is taken out of the outer feature's
+_computing = threading.local()
+
+
+def _compute_stack() -> List[float]:
+    stack = getattr(_computing, "stack", None)
+    if stack is None:
+        stack = _computing.stack = []
+    return stack
+
+
+class FeatureFrame:
+    """Memoized features of one (symbol, timeframe) candle series."""
+
+    def __init__(self, store: "FeatureStore", symbol: Optional[str], timeframe: str, candles: Sequence[Any]):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.candles = candles
+        self._store = store
+        self._values: Dict[Hashable, Any] = {}
+        self._lock = threading.RLock()
+
+    def get(self, name: str, **params: Any) -> Any:
+        """Feature value, computed on first read."""
+        key = (name, tuple(sorted(params.items())))
+        stack = _compute_stack()
+        nested = bool(stack)
+        with self._lock:
+            if key in self._values:
+                if not nested:
+                    self._store._count(name, request=True, hit=True)
+                return self._values[key]
+            spec = self._store.registry.get(name)
+            if spec is None:
+                raise KeyError(f"Unknown feature '{name}'")
+
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                value = spec.compute(self, **params)
+            finally:
+                elapsed = time.perf_counter() - start
+                inner = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+            self._store._count(name, request=not nested, hit=False, seconds=elapsed - inner)
+            self._values[key] = value
+            return value
+
+    __getitem__ = get
+
+    def provide(self, name: str, value: Any, **params: Any) -> None:
+        """Seed a feature with a value the caller already computed."""
+        with self._lock:
+            self._values[(name, tuple(sorted(params.items())))] = value
+
+    def same_data(self, candles: Sequence[Any]) -> bool:
+        """Whether candles is this frame's series (same object, or same length and newest bar)."""
+        if candles is self.candles:
+            return True
+        if len(candles) != len(self.candles) or not len(candles):
+            return False
+        newest, ours = candles[-1], self.candles[-1]
+        return (getattr(newest, "timestamp", None) == getattr(ours, "timestamp", None)
+                and getattr(newest, "close", None) == getattr(ours, "close", None))
+
+
+class FeatureStore:
+    """
+    Per-cycle feature memo, keyed by (symbol, timeframe).
+
+    Usage:
+        frame = market_data.features.frame("BTC-USD", "1h", candles)
+        vol = frame.get("volatility_pct")
+        ratio = market_data.features.get("BTC-USD", "volume_ratio", recent=4, baseline=96)
+    """
+
+    def __init__(self, cycle_id: Optional[str] = None, registry: Optional[Dict[str, FeatureSpec]] = None):
+        self.cycle_id = cycle_id
+        self.registry = FEATURES if registry is None else registry
+        self._frames: Dict[Tuple[Optional[str], str], FeatureFrame] = {}
+        self._by_candles: Dict[int, FeatureFrame] = {}
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "hits": 0, "computed": 0, "seconds": 0.0}
+        )
+
+    def frame(self, symbol: Optional[str], timeframe: str, candles: Sequence[Any]) -> FeatureFrame:
+        """
+        The frame for symbol/timeframe, replaced when candles carry different data.
+
+        A frame first opened for the same candle object without a symbol
+        (e.g. from strength(candles)) is adopted rather than recomputed.
+        """
+        key = (symbol, timeframe)
+        with self._lock:
+            current = self._frames.get(key) if symbol is not None else None
+            if current is not None and current.same_data(candles):
+                return current
+            anonymous = self._by_candles.get(id(candles))
+            if (anonymous is not None and anonymous.candles is candles
+                    and anonymous.timeframe == timeframe and anonymous.symbol in (None, symbol)):
+                frame = anonymous
+                frame.symbol = frame.symbol or symbol
+            else:
+                frame = FeatureFrame(self, symbol, timeframe, candles)
+            if current is not None:
+                self._by_candles.pop(id(current.candles), None)
+            if symbol is not None:
+                self._frames[key] = frame
+            self._by_candles[id(candles)] = frame
+            return frame
+
+    def frame_for(self, candles: Sequence[Any]) -> Optional[FeatureFrame]:
+        """Frame already bound to this exact candle object, if any."""
+        with self._lock:
+            frame = self._by_candles.get(id(candles))
+        return frame if frame is not None and frame.candles is candles else None
+
+    def lookup(self, symbol: str, timeframe: str = "1h") -> Optional[FeatureFrame]:
+        with self._lock:
+            return self._frames.get((symbol, timeframe))
+
+    def get(self, symbol: str, name: str, timeframe: str = "1h", **params: Any) -> Any:
+        """Feature for a symbol whose candles were bound this cycle; None when they weren't."""
+        frame = self.lookup(symbol, timeframe)
+        return frame.get(name, **params) if frame is not None else None
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    # ------------------------------------------------------------------
+
+    def _count(self, name: str, request: bool, hit: bool, seconds: float = 0.0) -> None:
+        with self._lock:
+            counts = self._counts[name]
+            if request:
+                counts["requests"] += 1
+                counts["hits"] += hit
+            if not hit:
+                counts["computed"] += 1
+                counts["seconds"] += seconds
+
+    def report(self) -> Dict[str, Any]:
+        """Reads, hits, computations and compute seconds this cycle, per feature and overall."""
+        with self._lock:
+            by_feature = {name: dict(counts) for name, counts in self._counts.items()}
+            frames = len(self._frames)
+        for counts in by_feature.values():
+            counts["hit_ratio"] = counts["hits"] / counts["requests"] if counts["requests"] else 0.0
+        requests = sum(c["requests"] for c in by_feature.values())
+        hits = sum(c["hits"] for c in by_feature.values())
+        return {
+            "cycle_id": self.cycle_id,
+            "frames": frames,
+            "requests": requests,
+            "hits": hits,
+            "computed": sum(c["computed"] for c in by_feature.values()),
+            "hit_ratio": hits / requests if requests else 0.0,
+            "compute_seconds": sum(c["seconds"] for c in by_feature.values()),
+            "by_feature": by_feature,
+        }
+
+    def summary(self) -> str:
+        report = self.report()
+        slowest = sorted(report["by_feature"].items(), key=lambda item: item[1]["seconds"], reverse=True)[:3]
+        top = ", ".join(f"{name}={c['seconds'] * 1000:.1f}ms" for name, c in slowest)
+        return (
+            f"Features: {report['frames']} series, {report['requests']} reads, "
+            f"{report['hit_ratio']:.0%} hit, {report['computed']} computed in "
+            f"{report['compute_seconds'] * 1000:.1f}ms ({top or 'none'})"
+        )
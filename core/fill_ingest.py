@@ -0,0 +1,255 @@
+"""
+247trader-v2 Core: Incremental Fill Ingestion
+
+Feeds ExecutionEngine.reconcile_fills with only the fills it has not applied
+yet, instead of the whole lookback window on every call.
+
+- A durable high-water mark (sequence timestamp + trade_id of the newest
+  applied fill) is kept in StateStore under ``fill_cursor``. Each poll asks
+  /orders/historical/fills from just before that mark (``overlap_seconds``
+  to absorb late-visible fills) and follows pagination cursors.
+- Fills inside the overlap are skipped via a compact seen-set of trade ids,
+  pruned as the mark advances.
+- fetch() returns the new fills oldest first; the caller applies them and
+  then calls commit(), so a crash between the two re-delivers rather than
+  drops fills.
+- When list_fills reports a truncated result (page limit hit, newest pages
+  first, or a failed request), the mark stays put and the oldest fetched
+  fill bounds the next query (``gap_end``), which pages back into the
+  missing span; the mark moves past the gap only once it is read in full.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from infra.config_fields import apply_fields
+
+logger = logging.getLogger(__name__)
+
+_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+
+@dataclass
+class FillIngestConfig:
+    """Fill polling settings (config/policy.yaml → execution.fill_reconcile)."""
+
+    page_limit: int = 1000
+    max_pages: int = 20
+    overlap_seconds: float = 60.0
+    max_seen: int = 5000
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> "FillIngestConfig":
+        cfg = apply_fields(cls(), raw, "execution.fill_reconcile", non_negative=("overlap_seconds",))
+        cfg.page_limit = min(cfg.page_limit, 1000)
+        return cfg
+
+
+@dataclass
+class FillCursor:
+    """High-water mark of applied fills and the trade ids seen near it."""
+
+    sequence_timestamp: Optional[float] = None   # epoch seconds
+    trade_id: Optional[str] = None
+    seen: Dict[str, float] = field(default_factory=dict)   # fill key -> epoch seconds
+    gap_end: Optional[float] = None   # fills between the mark and this time not read yet
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sequence_timestamp": self.sequence_timestamp,
+            "trade_id": self.trade_id,
+            "seen": dict(self.seen),
+            "gap_end": self.gap_end,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> "FillCursor":
+        if not isinstance(raw, dict):
+            return cls()
+        try:
+            mark = raw.get("sequence_timestamp")
+            seen = raw.get("seen") or {}
+            gap_end = raw.get("gap_end")
+            return cls(
+                sequence_timestamp=float(mark) if mark is not None else None,
+                trade_id=raw.get("trade_id"),
+                seen={str(key): float(ts) for key, ts in seen.items()} if isinstance(seen, dict) else {},
+                gap_end=float(gap_end) if gap_end is not None else None,
+            )
+        except (TypeError, ValueError, AttributeError):
+            logger.warning("Ignoring malformed fill cursor in state")
+            return cls()
+
+
+def fill_key(fill: Dict[str, Any]) -> str:
+    """Stable identity of a fill (trade_id; composite fallback for partial payloads)."""
+    key = fill.get("trade_id") or fill.get("entry_id")
+    if key:
+        return str(key)
+    return ":".join(
+        str(fill.get(name) or "")
+        for name in ("order_id", "sequence_timestamp", "trade_time", "size", "price")
+    )
+
+
+def fill_timestamp(fill: Dict[str, Any]) -> Optional[float]:
+    """Epoch seconds of a fill's sequence timestamp (trade_time as fallback)."""
+    raw = fill.get("sequence_timestamp") or fill.get("trade_time")
+    if not raw or not isinstance(raw, str):
+        return None
+    text = _FRACTION.sub(r"\1", raw.replace("Z", "+00:00"))
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class FillIngester:
+    """
+    Polls fills incrementally from a persisted high-water mark.
+
+    Usage:
+        ingester = FillIngester(exchange, state_store, FillIngestConfig())
+        fills, skipped = ingester.fetch(lookback_minutes=5)
+        for fill in fills:
+            apply(fill)
+        ingester.commit(fills)
+    """
+
+    def __init__(self, exchange, state_store=None, config: Optional[FillIngestConfig] = None):
+        self.exchange = exchange
+        self.state_store = state_store
+        self.config = config or FillIngestConfig()
+        self._cursor: Optional[FillCursor] = None
+        # (truncated, oldest fetched fill) of the last fetch, for commit()
+        self._fetched: Optional[Tuple[bool, Optional[float]]] = None
+        self._stats = {"polls": 0, "fetched": 0, "new": 0, "skipped": 0, "truncated": 0}
+
+    @property
+    def cursor(self) -> FillCursor:
+        if self._cursor is None:
+            raw = None
+            if self.state_store is not None:
+                try:
+                    raw = self.state_store.load().get("fill_cursor")
+                except Exception as exc:
+                    logger.debug("Fill cursor load failed: %s", exc)
+            self._cursor = FillCursor.from_dict(raw)
+        return self._cursor
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def start_time(self, lookback_minutes: float) -> datetime:
+        """Query start: just before the high-water mark, never beyond the lookback."""
+        floor = datetime.now(timezone.utc) - timedelta(minutes=lookback_minutes)
+        mark = self.cursor.sequence_timestamp
+        if mark is None:
+            return floor
+        resume = datetime.fromtimestamp(mark - self.config.overlap_seconds, tz=timezone.utc)
+        return max(floor, resume)
+
+    def fetch(self, lookback_minutes: float) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch fills not applied yet.
+
+        Returns:
+            (new fills oldest first, number of already-applied fills skipped)
+        """
+        start = self.start_time(lookback_minutes)
+        cursor = self.cursor
+        end = datetime.fromtimestamp(cursor.gap_end, tz=timezone.utc) if cursor.gap_end is not None else None
+        result = self.exchange.list_fills(
+            limit=self.config.page_limit,
+            start_time=start,
+            max_pages=self.config.max_pages,
+            end_time=end,
+        )
+        truncated = bool(getattr(result, "truncated", False))
+        fills = result or []
+
+        floor = start.timestamp()
+        fresh: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        skipped = 0
+        oldest: Optional[float] = None
+        for fill in fills:
+            key = fill_key(fill)
+            ts = fill_timestamp(fill)
+            if ts is not None and (oldest is None or ts < oldest):
+                oldest = ts
+            if key in cursor.seen or key in fresh:
+                skipped += 1
+                continue
+            if ts is not None and cursor.sequence_timestamp is not None and ts < floor:
+                skipped += 1
+                continue
+            fresh[key] = (ts if ts is not None else floor, fill)
+
+        ordered = [fill for _, fill in sorted(fresh.values(), key=lambda item: item[0])]
+        self._fetched = (truncated, oldest)
+        self._stats["polls"] += 1
+        self._stats["fetched"] += len(fills)
+        self._stats["new"] += len(ordered)
+        self._stats["skipped"] += skipped
+        self._stats["truncated"] += int(truncated)
+        if skipped:
+            logger.debug("Fill ingest: %d new, %d already applied", len(ordered), skipped)
+        return ordered, skipped
+
+    def commit(self, fills: List[Dict[str, Any]]) -> None:
+        """
+        Record applied fills and persist the cursor.
+
+        After a complete fetch the high-water mark advances past every applied
+        fill. After a truncated one it stays put, and gap_end moves to the
+        oldest fetched fill so the next fetch reads the span still missing.
+        """
+        truncated, oldest = self._fetched or (False, None)
+        self._fetched = None
+        cursor = self.cursor
+        if not fills and not truncated and cursor.gap_end is None:
+            return
+
+        for fill in fills:
+            ts = fill_timestamp(fill)
+            if ts is None:
+                ts = cursor.sequence_timestamp or datetime.now(timezone.utc).timestamp()
+            cursor.seen[fill_key(fill)] = ts
+
+        if truncated:
+            if oldest is not None:
+                cursor.gap_end = oldest
+            logger.warning(
+                "Fill ingest: fetch truncated; holding mark, fills before %s still to read",
+                datetime.fromtimestamp(cursor.gap_end, tz=timezone.utc).isoformat() if cursor.gap_end else "?",
+            )
+        else:
+            # Everything up to the newest applied fill has now been read
+            cursor.gap_end = None
+            for key, ts in cursor.seen.items():
+                if cursor.sequence_timestamp is None or ts >= cursor.sequence_timestamp:
+                    cursor.sequence_timestamp = ts
+                    cursor.trade_id = key
+
+        # Only fills inside the overlap (or past a held mark) can be returned again
+        if cursor.sequence_timestamp is not None:
+            horizon = cursor.sequence_timestamp - self.config.overlap_seconds
+            cursor.seen = {key: ts for key, ts in cursor.seen.items() if ts >= horizon}
+        if len(cursor.seen) > self.config.max_seen:
+            newest = sorted(cursor.seen.items(), key=lambda item: item[1])[-self.config.max_seen:]
+            cursor.seen = dict(newest)
+
+        self._persist(cursor)
+
+    def _persist(self, cursor: FillCursor) -> None:
+        if self.state_store is not None:
+            try:
+                self.state_store.save_fill_cursor(cursor.to_dict())
+            except Exception as exc:
+                logger.warning("Fill cursor persist failed: %s", exc)
@@ -0,0 +1,689 @@
+"""
+247trader-v2 Core: Indicator State
+
+Streaming indicators for live trigger scans, kept per (symbol, timeframe).
+
+Each closed candle advances EMA, Wilder RSI, ATR and the rolling windows
+(running sums, monotonic-deque highs/lows, a sorted window for the ATR
+median) in O(1) instead of recomputing them over the whole 168-bar window
+every cycle. The newest candle is still forming: it is never committed, and
+reads combine it with the closed state, so a state built from a candle list
+reproduces what the windowed computation over that list gives. States can be
+saved to a JSON snapshot so restarts resume without re-warming.
+"""
+
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Optional, Sequence, Tuple
+
+from core.candles import CandleSeries, candle_epoch
+from infra.config_fields import apply_fields
+
+logger = logging.getLogger(__name__)
+
+StateKey = Tuple[str, str]           # (symbol, timeframe)
+
+PERSIST_VERSION = 1
+
+
+@dataclass
+class IndicatorStateConfig:
+    """Streaming indicator settings (app.yaml triggers.indicator_state)."""
+    enabled: bool = True
+    persist_path: Optional[str] = None        # JSON snapshot; None keeps state in memory
+    persist_interval_seconds: float = 300.0   # Minimum spacing between periodic saves
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "IndicatorStateConfig":
+        config = apply_fields(cls(), data, "triggers.indicator_state", non_negative=("persist_interval_seconds",))
+        persist_path = (data or {}).get("persist_path")
+        config.persist_path = str(persist_path) if persist_path else None
+        return config
+
+
+@dataclass(frozen=True)
+class IndicatorParams:
+    """Periods and window sizes; windows count bars including the open candle."""
+    window: int = 168              # Bars a scan evaluates (ATR median, return volatility)
+    atr_period: int = 14
+    ema_period: int = 21
+    ema_slope_lookback: int = 3
+    rsi_period: int = 14
+    volume_window: int = 24
+    breakout_window: int = 24
+    outlier_window: int = 20       # Closed bars only (the open bar is what gets validated)
+    vwap_window: int = 12
+    close_history: int = 24        # Momentum looks back 24 bars
+
+    def __post_init__(self):
+        for name, value in asdict(self).items():
+            if value < 1:
+                object.__setattr__(self, name, 1)
+
+
+# ----------------------------------------------------------------------
+# Primitives
+# ----------------------------------------------------------------------
+
+
+class RunningEMA:
+    """EMA seeded with the SMA of the first `period` values."""
+
+    __slots__ = ("period", "value", "_seed", "_count")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.value: Optional[float] = None
+        self._seed = 0.0
+        self._count = 0
+
+    def update(self, x: float) -> None:
+        if self.value is None:
+            self._seed += x
+            self._count += 1
+            if self._count == self.period:
+                self.value = self._seed / self.period
+        else:
+            self.value = (x - self.value) * (2.0 / (self.period + 1)) + self.value
+
+    def peek(self, x: float) -> Optional[float]:
+        """Value if x were the next input, without committing it."""
+        if self.value is not None:
+            return (x - self.value) * (2.0 / (self.period + 1)) + self.value
+        if self._count + 1 == self.period:
+            return (self._seed + x) / self.period
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"value": self.value, "seed": self._seed, "count": self._count}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        self.value = data["value"]
+        self._seed = float(data["seed"])
+        self._count = int(data["count"])
+
+
+class RunningRSI:
+    """Wilder RSI over closes; the first value needs `period` price changes."""
+
+    __slots__ = ("period", "prev", "avg_gain", "avg_loss", "_count")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.prev: Optional[float] = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self._count = 0
+
+    def _step(self, delta: float) -> Tuple[float, float]:
+        keep = self.period - 1
+        if delta > 0:
+            return (self.avg_gain * keep + delta) / self.period, (self.avg_loss * keep + 0.0) / self.period
+        return (self.avg_gain * keep + 0.0) / self.period, (self.avg_loss * keep - delta) / self.period
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        return 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def update(self, close: float) -> None:
+        if self.prev is None:
+            self.prev = close
+            return
+        delta = close - self.prev
+        self.prev = close
+        if self._count < self.period:
+            if delta > 0:
+                self.avg_gain += delta
+            else:
+                self.avg_loss -= delta
+            self._count += 1
+            if self._count == self.period:
+                self.avg_gain /= self.period
+                self.avg_loss /= self.period
+        else:
+            self.avg_gain, self.avg_loss = self._step(delta)
+
+    @property
+    def value(self) -> Optional[float]:
+        if self._count < self.period:
+            return None
+        return self._rsi(self.avg_gain, self.avg_loss)
+
+    def peek(self, close: float) -> Optional[float]:
+        if self.prev is None:
+            return None
+        delta = close - self.prev
+        if self._count == self.period:
+            return self._rsi(*self._step(delta))
+        if self._count + 1 == self.period:
+            gain = self.avg_gain + (delta if delta > 0 else 0.0)
+            loss = self.avg_loss - (delta if delta <= 0 else 0.0)
+            return self._rsi(gain / self.period, loss / self.period)
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"prev": self.prev, "gain": self.avg_gain, "loss": self.avg_loss, "count": self._count}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        self.prev = data["prev"]
+        self.avg_gain = float(data["gain"])
+        self.avg_loss = float(data["loss"])
+        self._count = int(data["count"])
+
+
+class RollingSum:
+    """Running sum of the last `window` values (re-summed every window pushes to bound drift)."""
+
+    __slots__ = ("window", "values", "total", "_pushes")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: Deque[float] = deque(maxlen=window)
+        self.total = 0.0
+        self._pushes = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.window
+
+    def push(self, x: float) -> None:
+        if self.full:
+            self.total -= self.values[0]
+        self.values.append(x)
+        self.total += x
+        self._pushes += 1
+        if self._pushes >= self.window:
+            self._pushes = 0
+            self.total = math.fsum(self.values)
+
+    def total_with(self, x: float) -> float:
+        """Sum of the window if x were pushed (drops the oldest value when full)."""
+        return self.total + x - (self.values[0] if self.full else 0.0)
+
+    def count_with(self) -> int:
+        return min(len(self.values) + 1, self.window)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"values": list(self.values)}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        self.values = deque((float(v) for v in data["values"]), maxlen=self.window)
+        self.total = math.fsum(self.values)
+        self._pushes = 0
+
+
+class RollingExtreme:
+    """Max (or min) of the last `window` values via a monotonic deque."""
+
+    __slots__ = ("window", "keep_max", "_seq", "_items")
+
+    def __init__(self, window: int, keep_max: bool = True):
+        self.window = window
+        self.keep_max = keep_max
+        self._seq = 0
+        self._items: Deque[Tuple[int, float]] = deque()   # (sequence, value), monotonic values
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return old <= new if self.keep_max else old >= new
+
+    def push(self, x: float) -> None:
+        self._seq += 1
+        items = self._items
+        while items and self._dominates(x, items[-1][1]):
+            items.pop()
+        items.append((self._seq, x))
+        if items[0][0] <= self._seq - self.window:
+            items.popleft()
+
+    def value_with(self, x: float) -> float:
+        """Extreme of the last window-1 pushed values and x."""
+        cutoff = self._seq - (self.window - 1)
+        for seq, value in self._items:
+            if seq > cutoff:
+                return max(value, x) if self.keep_max else min(value, x)
+        return x
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seq": self._seq, "items": [list(item) for item in self._items]}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        self._seq = int(data["seq"])
+        self._items = deque((int(seq), float(value)) for seq, value in data["items"])
+
+
+class RollingMedian:
+    """Upper median of the last `window` values (sorted window kept with bisect)."""
+
+    __slots__ = ("window", "values", "_sorted")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: Deque[float] = deque(maxlen=window)
+        self._sorted: list = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, x: float) -> None:
+        if len(self.values) == self.window:
+            del self._sorted[bisect_left(self._sorted, self.values[0])]
+        self.values.append(x)
+        insort(self._sorted, x)
+
+    @property
+    def median(self) -> Optional[float]:
+        if not self._sorted:
+            return None
+        return self._sorted[len(self._sorted) // 2]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"values": list(self.values)}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        self.values = deque((float(v) for v in data["values"]), maxlen=self.window)
+        self._sorted = sorted(self.values)
+
+
+# ----------------------------------------------------------------------
+# Per-series state
+# ----------------------------------------------------------------------
+
+
+def _bars(candles: Sequence[Any], start: int, stop: int) -> Iterable[Tuple[float, float, float, float]]:
+    """(high, low, close, volume) of candles[start:stop], read from the columns of a CandleSeries."""
+    if isinstance(candles, CandleSeries):
+        window = slice(start, stop)
+        return zip(candles.high[window], candles.low[window], candles.close[window], candles.volume[window])
+    return ((c.high, c.low, c.close, c.volume) for c in candles[start:stop])
+
+
+def _epoch_at(candles: Sequence[Any], index: int) -> Optional[int]:
+    if isinstance(candles, CandleSeries):
+        return candles.epochs[index]
+    return candle_epoch(candles[index])
+
+
+def _close_at(candles: Sequence[Any], index: int) -> float:
+    if isinstance(candles, CandleSeries):
+        return candles.close[index]
+    return candles[index].close
+
+
+class IndicatorState:
+    """
+    Indicators for one (symbol, timeframe) series.
+
+    advance() commits a closed candle; set_open() records the still-forming
+    candle that every read is evaluated at.
+    """
+
+    _PARTS = ("ema", "rsi", "true_ranges", "atr_history", "returns", "returns_sq", "volume",
+              "outlier_close", "outlier_volume", "highs", "lows", "vwap_pv", "vwap_volume")
+
+    def __init__(self, params: IndicatorParams):
+        p = params
+        self.params = params
+        self.last_closed: Optional[int] = None    # Epoch of the newest committed candle
+        self.bars = 0                             # Closed candles committed
+        self.closes: Deque[float] = deque(maxlen=p.close_history - 1)
+        self.ema = RunningEMA(p.ema_period)
+        self.ema_history: Deque[float] = deque(maxlen=p.ema_slope_lookback)
+        self.rsi = RunningRSI(p.rsi_period)
+        self.true_ranges = RollingSum(p.atr_period)
+        # Closed-bar ATR% values whose whole window lies inside the scan window
+        self.atr_history = RollingMedian(max(p.window - p.atr_period - 1, 1))
+        self.returns = RollingSum(max(p.window - 1, 1))    # Returns between `window` bars
+        self.returns_sq = RollingSum(max(p.window - 1, 1))
+        self.volume = RollingSum(p.volume_window)
+        self.outlier_close = RollingSum(p.outlier_window)
+        self.outlier_volume = RollingSum(p.outlier_window)
+        self.highs = RollingExtreme(p.breakout_window, keep_max=True)
+        self.lows = RollingExtreme(p.breakout_window, keep_max=False)
+        self.vwap_pv = RollingSum(p.vwap_window)
+        self.vwap_volume = RollingSum(p.vwap_window)
+        self.open_bar: Optional[Tuple[float, float, float, float]] = None   # (high, low, close, volume)
+
+    @classmethod
+    def from_candles(cls, params: IndicatorParams, candles: Sequence[Any]) -> "IndicatorState":
+        """State for a candle list: all but the newest committed, the newest left open."""
+        state = cls(params)
+        if not candles:
+            return state
+        newest = len(candles) - 1
+        for high, low, close, volume in _bars(candles, 0, newest):
+            state.advance(high, low, close, volume)
+        state.last_closed = _epoch_at(candles, newest - 1) if newest else None
+        state.open_bar = next(iter(_bars(candles, newest, newest + 1)))
+        return state
+
+    # -- updates -------------------------------------------------------
+
+    def _true_range(self, high: float, low: float) -> Optional[float]:
+        if not self.closes:
+            return None
+        prev = self.closes[-1]
+        return max(high - low, abs(high - prev), abs(low - prev))
+
+    def advance(self, high: float, low: float, close: float, volume: float) -> None:
+        """Commit one closed candle."""
+        if self.closes:
+            prev = self.closes[-1]
+            tr = self._true_range(high, low)
+            assert tr is not None  # closes is non-empty
+            self.true_ranges.push(tr)
+            if self.true_ranges.full:
+                atr = self.true_ranges.total / self.params.atr_period / close * 100.0 if close > 0 else 0.0
+                self.atr_history.push(atr)
+            if prev > 0:
+                ret = (close - prev) / prev
+                self.returns.push(ret)
+                self.returns_sq.push(ret * ret)
+
+        self.ema.update(close)
+        if self.ema.value is not None:
+            self.ema_history.append(self.ema.value)
+        self.rsi.update(close)
+        self.volume.push(volume)
+        self.outlier_close.push(close)
+        self.outlier_volume.push(volume)
+        self.highs.push(high)
+        self.lows.push(low)
+        self.vwap_pv.push((high + low + close) / 3.0 * volume)
+        self.vwap_volume.push(volume)
+        self.closes.append(close)
+        self.bars += 1
+
+    def set_open(self, candle: Any) -> None:
+        self.open_bar = (candle.high, candle.low, candle.close, candle.volume)
+
+    # -- reads at the open candle ---------------------------------------
+
+    def _open(self) -> Tuple[float, float, float, float]:
+        """The open candle; reads below require set_open() to have run."""
+        assert self.open_bar is not None
+        return self.open_bar
+
+    @property
+    def count(self) -> int:
+        """Bars available including the open candle."""
+        return self.bars + (1 if self.open_bar is not None else 0)
+
+    @property
+    def close(self) -> float:
+        return self._open()[2]
+
+    @property
+    def current_volume(self) -> float:
+        return self._open()[3]
+
+    def close_ago(self, bars: int) -> float:
+        """Close `bars` candles before the open one (bars >= 1)."""
+        return self.closes[-bars]
+
+    def atr_pct(self) -> float:
+        """ATR% including the open candle; 0.0 during warm-up."""
+        high, low, close, _ = self._open()
+        tr = self._true_range(high, low)
+        if tr is None or self.true_ranges.count_with() < self.params.atr_period or close <= 0:
+            return 0.0
+        return self.true_ranges.total_with(tr) / self.params.atr_period / close * 100.0
+
+    def atr_median(self) -> Optional[float]:
+        """Median closed-bar ATR% over the scan window (excludes the open candle)."""
+        return self.atr_history.median
+
+    def returns_std(self) -> Optional[float]:
+        """Population std of simple returns over the scan window, open candle included."""
+        ret = None
+        if self.closes and self.closes[-1] > 0:
+            ret = (self.close - self.closes[-1]) / self.closes[-1]
+        if ret is None:
+            count, total, total_sq = len(self.returns), self.returns.total, self.returns_sq.total
+        else:
+            count = self.returns.count_with()
+            total, total_sq = self.returns.total_with(ret), self.returns_sq.total_with(ret * ret)
+        if count == 0:
+            return None
+        mean = total / count
+        return math.sqrt(max(total_sq / count - mean * mean, 0.0))
+
+    def volume_sum(self) -> float:
+        """Volume over volume_window bars including the open candle."""
+        return self.volume.total_with(self.current_volume)
+
+    def outlier_means(self) -> Tuple[float, float]:
+        """Mean close and volume of the last outlier_window closed candles."""
+        window = self.params.outlier_window
+        return self.outlier_close.total / window, self.outlier_volume.total / window
+
+    def breakout_range(self) -> Tuple[float, float]:
+        """(highest high, lowest low) over breakout_window bars including the open candle."""
+        high, low, _, _ = self._open()
+        return self.highs.value_with(high), self.lows.value_with(low)
+
+    def ema_now(self) -> Optional[float]:
+        return self.ema.peek(self.close)
+
+    def ema_ago(self, bars: int) -> Optional[float]:
+        """EMA `bars` candles before the open one (bars >= 1)."""
+        if bars > len(self.ema_history):
+            return None
+        return self.ema_history[-bars]
+
+    def rsi_pair(self) -> Tuple[Optional[float], Optional[float]]:
+        """(RSI at the last closed candle, RSI including the open candle)."""
+        return self.rsi.value, self.rsi.peek(self.close)
+
+    def vwap(self) -> Optional[float]:
+        """VWAP over vwap_window bars including the open candle; None without volume."""
+        high, low, close, volume = self._open()
+        denominator = self.vwap_volume.total_with(volume)
+        if denominator <= 0:
+            return None
+        return self.vwap_pv.total_with((high + low + close) / 3.0 * volume) / denominator
+
+    # -- persistence ----------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "last_closed": self.last_closed,
+            "bars": self.bars,
+            "closes": list(self.closes),
+            "ema_history": list(self.ema_history),
+        }
+        for name in self._PARTS:
+            data[name] = getattr(self, name).to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, params: IndicatorParams, data: Dict[str, Any]) -> "IndicatorState":
+        state = cls(params)
+        state.last_closed = data["last_closed"]
+        state.bars = int(data["bars"])
+        state.closes.extend(float(v) for v in data["closes"])
+        state.ema_history.extend(float(v) for v in data["ema_history"])
+        for name in cls._PARTS:
+            getattr(state, name).restore(data[name])
+        return state
+
+
+class IndicatorStore:
+    """
+    Thread-safe IndicatorState registry keyed by (symbol, timeframe).
+
+    Usage:
+        store = IndicatorStore(params, IndicatorStateConfig(persist_path="data/indicator_state.json"))
+        state = store.sync("BTC-USD", "1h", candles)   # commits new closed candles
+        state.atr_pct(), state.breakout_range(), ...
+    """
+
+    def __init__(self, params: IndicatorParams, config: Optional[IndicatorStateConfig] = None):
+        self.params = params
+        self.config = config or IndicatorStateConfig()
+        self._states: Dict[StateKey, IndicatorState] = {}
+        self._lock = threading.Lock()
+        self._last_persist = time.monotonic()
+        self._dirty = False
+        self._stats = {"incremental": 0, "rebuilds": 0, "bars_committed": 0, "evicted": 0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._states)
+
+    def sync(self, symbol: str, timeframe: str, candles: Sequence[Any]) -> IndicatorState:
+        """
+        Bring the series' state up to date with candles (oldest first) and
+        return it, evaluated at the newest candle.
+
+        Candles newer than the last committed one are committed, except the
+        newest, which is still forming. The state is rebuilt from candles when
+        they no longer continue it: no overlap with the committed candle (gap,
+        restart after a long pause), a revised committed close, or timestamps
+        that don't advance.
+        """
+        key = (symbol, timeframe)
+        with self._lock:
+            state = self._states.get(key)
+            start = self._resume_index(state, candles)
+            if start is None:
+                state = IndicatorState.from_candles(self.params, candles)
+                self._states[key] = state
+                self._stats["rebuilds"] += 1
+                committed = max(len(candles) - 1, 0)
+            else:
+                assert state is not None  # only an existing state resumes
+                newest = len(candles) - 1
+                for high, low, close, volume in _bars(candles, start, newest):
+                    state.advance(high, low, close, volume)
+                committed = newest - start
+                if committed:
+                    state.last_closed = _epoch_at(candles, newest - 1)
+                state.open_bar = next(iter(_bars(candles, newest, newest + 1)))
+                self._stats["incremental"] += 1
+            self._stats["bars_committed"] += committed
+            self._dirty = True
+        return state
+
+    @staticmethod
+    def _resume_index(state: Optional[IndicatorState], candles: Sequence[Any]) -> Optional[int]:
+        """Index of the first candle to commit onto state, or None to rebuild."""
+        if state is None or state.last_closed is None or not state.closes or len(candles) < 2:
+            return None
+        newest = _epoch_at(candles, -1)
+        if newest is None or newest <= state.last_closed:
+            return None
+        for i in range(len(candles) - 2, -1, -1):
+            epoch = _epoch_at(candles, i)
+            if epoch is None or epoch < state.last_closed:
+                return None
+            if epoch == state.last_closed:
+                return i + 1 if _close_at(candles, i) == state.closes[-1] else None
+        return None
+
+    def retain(self, symbols: Iterable[str]) -> int:
+        """Drop states for symbols not in symbols. Returns states dropped."""
+        keep = set(symbols)
+        with self._lock:
+            stale = [key for key in self._states if key[0] not in keep]
+            for key in stale:
+                del self._states[key]
+            if stale:
+                self._dirty = True
+                self._stats["evicted"] += len(stale)
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["series"] = len(self._states)
+        return stats
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> int:
+        """
+        Restore states from persist_path.
+
+        Snapshots taken with different indicator parameters are ignored.
+
+        Returns:
+            Number of series restored (0 when disabled, missing or unreadable)
+        """
+        if not self.config.persist_path:
+            return 0
+        path = Path(self.config.persist_path)
+        if not path.exists():
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != PERSIST_VERSION:
+                logger.warning("Ignoring indicator state %s: unsupported version %r", path, payload.get("version"))
+                return 0
+            if payload.get("params") != asdict(self.params):
+                logger.info("Ignoring indicator state %s: indicator parameters changed", path)
+                return 0
+            restored = {
+                (item["symbol"], item["timeframe"]): IndicatorState.from_dict(self.params, item["state"])
+                for item in payload.get("series", [])
+            }
+        except Exception as exc:
+            logger.warning("Failed to load indicator state %s: %s", path, exc)
+            return 0
+
+        with self._lock:
+            self._states.update(restored)
+        logger.info("Loaded indicator state for %d series from %s", len(restored), path)
+        return len(restored)
+
+    def save(self) -> bool:
+        """Write all states to persist_path atomically. Returns True when written."""
+        if not self.config.persist_path:
+            return False
+        path = Path(self.config.persist_path)
+        with self._lock:
+            payload = {
+                "version": PERSIST_VERSION,
+                "saved_at": datetime.now().isoformat(),
+                "params": asdict(self.params),
+                "series": [
+                    {"symbol": symbol, "timeframe": timeframe, "state": state.to_dict()}
+                    for (symbol, timeframe), state in self._states.items()
+                ],
+            }
+            self._dirty = False
+            self._last_persist = time.monotonic()
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".indicators_", suffix=".json.tmp")
+            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except Exception as exc:
+            logger.warning("Failed to persist indicator state %s: %s", path, exc)
+            return False
+        return True
+
+    def maybe_save(self) -> bool:
+        """Save when something changed and persist_interval_seconds has elapsed."""
+        if not self.config.persist_path or not self._dirty:
+            return False
+        if time.monotonic() - self._last_persist < self.config.persist_interval_seconds:
+            return False
+        return self.save()
@@ -0,0 +1,292 @@
+"""
+247trader-v2 Core: Indicators
+
+Columnar indicator kernel for trigger and signal evaluation.
+
+Candles are converted once per asset into contiguous float64 columns
+(array('d') for open/high/low/close/volume) and each indicator computes the
+whole series with NumPy over a zero-copy view of them, instead of every check
+walking the List[OHLCV] dataclasses on its own. Series are returned as
+float64 ndarrays; positions inside an indicator's warm-up window hold NaN, so
+series stay index-aligned with the candles. A CandleSeries (core.candles)
+already stores these columns and is used as-is.
+
+Rolling windows use prefix sums (cumsum) or sliding-window views; the EMA
+and Wilder recursions are evaluated in blocks with a scaled cumsum (see
+_ewm), which agrees with the sequential loop to ~1e-13 relative.
+"""
+
+import math
+from array import array
+from typing import Iterator, List, Optional, Sequence, Union, overload
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from core.candles import CandleSeries
+
+NAN = math.nan
+
+FloatColumn = Union[array, np.ndarray, Sequence[float]]
+
+# Largest factor the scaled cumsum in _ewm may grow by within one block
+_EWM_MAX_GROWTH = 1e12
+
+
+class OHLCVColumns(Sequence):
+    """
+    Struct-of-arrays view of a candle list.
+
+    Indexing and iteration still yield the original candle objects, so code
+    written against List[OHLCV] keeps working when handed an OHLCVColumns.
+    """
+
+    __slots__ = ("open", "high", "low", "close", "volume", "_rows")
+
+    def __init__(self, open: array, high: array, low: array, close: array,
+                 volume: array, rows: Optional[Sequence] = None):
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self._rows = rows
+
+    @classmethod
+    def from_candles(cls, candles: Sequence) -> "OHLCVColumns":
+        rows = list(candles)
+        return cls(
+            array("d", [c.open for c in rows]),
+            array("d", [c.high for c in rows]),
+            array("d", [c.low for c in rows]),
+            array("d", [c.close for c in rows]),
+            array("d", [c.volume for c in rows]),
+            rows,
+        )
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @overload
+    def __getitem__(self, index: int): ...
+    @overload
+    def __getitem__(self, index: slice) -> list: ...
+
+    def __getitem__(self, index):
+        if self._rows is None:
+            raise TypeError("OHLCVColumns built without candle rows")
+        return self._rows[index]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._rows or ())
+
+
+def as_columns(candles: Sequence) -> Union[OHLCVColumns, CandleSeries]:
+    """Columns for candles (returned as-is when already columnar, e.g. a CandleSeries)."""
+    if isinstance(candles, (OHLCVColumns, CandleSeries)):
+        return candles
+    return OHLCVColumns.from_candles(candles)
+
+
+def _values(values: FloatColumn) -> np.ndarray:
+    """float64 ndarray over values (zero-copy for array('d') / memoryview columns)."""
+    return np.asarray(values, dtype=np.float64)
+
+
+def _nan_series(n: int) -> np.ndarray:
+    return np.full(n, NAN)
+
+
+def _ewm(values: np.ndarray, alpha: float, seed: float) -> np.ndarray:
+    """
+    y[i] = (1 - alpha) * y[i-1] + alpha * values[i] with y[-1] = seed.
+
+    Within a block of length L, y[j] = d^j * (y0 + alpha * cumsum(x[k] / d^k))
+    with d = 1 - alpha; L is capped so d^-L stays below _EWM_MAX_GROWTH.
+    """
+    n = len(values)
+    out = np.empty(n)
+    if n == 0:
+        return out
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[:] = values
+        return out
+    block = max(1, min(n, int(math.log(_EWM_MAX_GROWTH) / -math.log(decay)))) if decay < 1.0 else n
+    powers = decay ** np.arange(1, block + 1)
+    carry = seed
+    for start in range(0, n, block):
+        chunk = values[start:start + block]
+        scale = powers[:len(chunk)]
+        out[start:start + len(chunk)] = scale * (carry + alpha * np.cumsum(chunk / scale))
+        carry = out[start + len(chunk) - 1]
+    return out
+
+
+def pct_change(values: FloatColumn, periods: int = 1) -> np.ndarray:
+    """Percent change vs `periods` bars earlier; NaN in the warm-up and where the base is 0."""
+    v = _values(values)
+    out = _nan_series(len(v))
+    if periods <= 0 or len(v) <= periods:
+        return out
+    base = v[:-periods]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[periods:] = np.where(base != 0, (v[periods:] - base) / base * 100.0, NAN)
+    return out
+
+
+def rolling_sum(values: FloatColumn, window: int) -> np.ndarray:
+    """Sum of the trailing `window` values (running prefix sums)."""
+    v = _values(values)
+    n = len(v)
+    out = _nan_series(n)
+    if window <= 0 or n < window:
+        return out
+    prefix = np.concatenate(([0.0], np.cumsum(v)))
+    out[window - 1:] = prefix[window:] - prefix[:n + 1 - window]
+    return out
+
+
+def rolling_mean(values: FloatColumn, window: int) -> np.ndarray:
+    sums = rolling_sum(values, window)
+    return sums / window if window > 0 else sums
+
+
+def _rolling_extreme(values: FloatColumn, window: int, keep_max: bool) -> np.ndarray:
+    v = _values(values)
+    n = len(v)
+    out = _nan_series(n)
+    if window <= 0 or n < window:
+        return out
+    windows = sliding_window_view(v, window)
+    out[window - 1:] = windows.max(axis=1) if keep_max else windows.min(axis=1)
+    return out
+
+
+def rolling_max(values: FloatColumn, window: int) -> np.ndarray:
+    """Max of the trailing `window` values."""
+    return _rolling_extreme(values, window, keep_max=True)
+
+
+def rolling_min(values: FloatColumn, window: int) -> np.ndarray:
+    """Min of the trailing `window` values."""
+    return _rolling_extreme(values, window, keep_max=False)
+
+
+def true_range(high: FloatColumn, low: FloatColumn, close: FloatColumn) -> np.ndarray:
+    """max(H-L, |H-prevC|, |L-prevC|); NaN for the first bar (no previous close)."""
+    h, l, c = _values(high), _values(low), _values(close)
+    out = _nan_series(len(c))
+    if len(c) < 2:
+        return out
+    prev_close = c[:-1]
+    out[1:] = np.maximum(h[1:] - l[1:], np.maximum(np.abs(h[1:] - prev_close), np.abs(l[1:] - prev_close)))
+    return out
+
+
+def atr_pct(high: FloatColumn, low: FloatColumn, close: FloatColumn, period: int = 14) -> np.ndarray:
+    """
+    Simple-average true range over `period` bars as % of the bar's close.
+
+    Value i averages the true ranges of bars i-period+1..i (needs bar
+    i-period's close); NaN before that or where the close is not positive.
+    """
+    c = _values(close)
+    n = len(c)
+    out = _nan_series(n)
+    if period <= 0 or n < period + 1:
+        return out
+    ranges = true_range(high, low, c)[1:]
+    window_sums = np.convolve(ranges, np.ones(period), mode="valid")
+    closes = c[period:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period:] = np.where(closes > 0, window_sums / period / closes * 100.0, NAN)
+    return out
+
+
+def ema(values: FloatColumn, period: int) -> np.ndarray:
+    """EMA seeded with the SMA of the first `period` values; NaN before the seed."""
+    v = _values(values)
+    n = len(v)
+    out = _nan_series(n)
+    if period <= 0 or n < period:
+        return out
+    seed = float(np.sum(v[:period])) / period
+    out[period - 1] = seed
+    out[period:] = _ewm(v[period:], 2.0 / (period + 1), seed)
+    return out
+
+
+def _wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder smoothing of values; element 0 is the seed (mean of the first `period` values)."""
+    seed = float(values[:period].sum()) / period
+    return np.concatenate(([seed], _ewm(values[period:], 1.0 / period, seed)))
+
+
+def rsi(closes: FloatColumn, period: int = 14) -> np.ndarray:
+    """Wilder RSI; first value at index `period`, NaN before."""
+    v = _values(closes)
+    n = len(v)
+    out = _nan_series(n)
+    if period <= 0 or n < period + 1:
+        return out
+
+    deltas = np.diff(v)
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+    avg_gain = _wilder(gains, period)
+    avg_loss = _wilder(losses, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period:] = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return out
+
+
+def returns_std(closes: FloatColumn, lookback: int) -> Optional[float]:
+    """
+    Population standard deviation of the last `lookback` simple returns.
+
+    Returns whose previous close is not positive are skipped; None when no
+    return is available.
+    """
+    v = _values(closes)
+    n = len(v)
+    start = max(1, n - lookback)
+    if start >= n:
+        return None
+    prev, cur = v[start - 1:n - 1], v[start:]
+    valid = prev > 0
+    if not valid.any():
+        return None
+    returns = (cur[valid] - prev[valid]) / prev[valid]
+    return float(np.std(returns))
+
+
+def vwap(high: FloatColumn, low: FloatColumn, close: FloatColumn, volume: FloatColumn) -> Optional[float]:
+    """Volume-weighted typical price ((H+L+C)/3); None without volume."""
+    vol = _values(volume)
+    denominator = float(vol.sum())
+    if denominator <= 0:
+        return None
+    typical = (_values(high) + _values(low) + _values(close)) / 3.0
+    return float(np.dot(typical, vol)) / denominator
+
+
+def pivot_lows(low: FloatColumn, lookback: int = 48, window: int = 2) -> List[int]:
+    """
+    Indices of pivot lows in the last `lookback` bars.
+
+    A pivot low is <= the `window` lows before it and strictly < the
+    `window` lows after it.
+    """
+    lows = _values(low)
+    n = len(lows)
+    first = max(0, n - lookback) + window
+    last = n - window
+    if first >= last:
+        return []
+    centre = lows[first:last]
+    is_pivot = np.ones(last - first, dtype=bool)
+    for k in range(1, window + 1):
+        is_pivot &= centre <= lows[first - k:last - k]
+        is_pivot &= centre < lows[first + k:last + k]
+    return (np.flatnonzero(is_pivot) + first).tolist()
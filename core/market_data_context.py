@@ -0,0 +1,297 @@
+"""
+247trader-v2 Core: Market Data Context
+
+Market data for one trading cycle, shared by every stage of the pipeline
+(universe -> triggers -> strategies -> risk -> execution).
+
+A MarketDataContext is created at the start of a cycle and dropped at the
+end. Reads are lazy and memoized per (kind, symbol, params) for the life of
+the cycle: the first stage that needs BTC-USD's 1h candles fetches them,
+later stages get the same object. Concurrent reads of one key share a single
+request (QuoteCache single-flight), and a request for fewer candles than
+already fetched is served by slicing the larger series.
+
+The context is exchange-shaped (get_quote, get_orderbook, get_ohlcv,
+get_quotes_bulk, fetch_many), so components written against an exchange can
+be handed the context for a cycle; other attributes are forwarded to the
+exchange. Strategies must not fetch (REQ-STR1) and use cached() instead.
+Execution calls invalidate(symbol) before pricing an order.
+
+Derived features (returns, volatility, ATR, volume ratios) live in the
+context's FeatureStore (features), so they too are computed once per cycle.
+
+report() gives per-cycle requests, fetches and fetches avoided, by kind and
+by caller label (``caller=``), plus the feature store's hit ratios.
+"""
+
+import logging
+import math
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from core.feature_store import FeatureStore
+from core.quote_cache import UNLABELED, QuoteCache, QuoteCacheConfig
+from infra.fanout import FetchResult
+
+logger = logging.getLogger(__name__)
+
+
+def _params_key(params: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(sorted(params.items()))
+
+
+class MarketDataView:
+    """
+    Read-only view of a MarketDataContext for strategies.
+
+    Only returns what earlier stages already fetched this cycle; a miss is
+    None, never a request.
+    """
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context: "MarketDataContext"):
+        self._context = context
+
+    def quote(self, symbol: str):
+        return self._context.cached("quote", symbol)
+
+    def orderbook(self, symbol: str, depth_levels: int = 50):
+        return self._context.cached("orderbook", symbol, depth_levels=depth_levels)
+
+    def ohlcv(self, symbol: str, interval: str = "1h", limit: int = 100):
+        return self._context.cached("ohlcv", symbol, interval=interval, limit=limit)
+
+    @property
+    def features(self) -> FeatureStore:
+        """The cycle's feature store (features are derived, never fetched)."""
+        return self._context.features
+
+
+class MarketDataContext:
+    """
+    Per-cycle, lazily populated market data memo in front of an exchange.
+
+    Usage:
+        market_data = MarketDataContext(exchange, cycle_id=run_id)
+        universe = universe_mgr.get_universe(regime, market_data=market_data)
+        triggers = trigger_engine.scan(assets, regime, market_data=market_data)
+        logger.info(market_data.summary())
+    """
+
+    _GETTERS = {"quote": "get_quote", "orderbook": "get_orderbook", "ohlcv": "get_ohlcv"}
+
+    def __init__(self, exchange: Any, cycle_id: Optional[str] = None):
+        self.exchange = exchange
+        self.cycle_id = cycle_id
+        # Entries never expire: the context itself is the cycle-scoped lifetime
+        self._memo = QuoteCache(QuoteCacheConfig(max_age_seconds=math.inf), on_lookup=self._count)
+        self._ohlcv_limits: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._kinds: Dict[str, Dict[str, int]] = defaultdict(lambda: {"requests": 0, "fetched": 0})
+        self._features: Optional[FeatureStore] = None
+
+    # ------------------------------------------------------------------
+    # Exchange-shaped reads
+    # ------------------------------------------------------------------
+
+    def get_quote(self, symbol: str, caller: str = UNLABELED):
+        return self._memo.get(
+            "quote", symbol, lambda: self.exchange.get_quote(symbol, caller=caller), caller=caller,
+        )
+
+    def get_orderbook(self, symbol: str, depth_levels: int = 50, caller: str = UNLABELED):
+        return self._memo.get(
+            "orderbook", (symbol, depth_levels),
+            lambda: self.exchange.get_orderbook(symbol, depth_levels=depth_levels, caller=caller),
+            symbol=symbol, caller=caller,
+        )
+
+    def get_ohlcv(self, symbol: str, interval: str = "1h", limit: int = 100, caller: str = UNLABELED):
+        """Candles for symbol; a smaller limit is sliced from a larger series already fetched."""
+        with self._lock:
+            fetched_limit = self._ohlcv_limits.get((symbol, interval), 0)
+        if fetched_limit > limit:
+            found, candles = self._memo.peek("ohlcv", (symbol, interval, fetched_limit))
+            if found:
+                self._memo.record("ohlcv", caller, "hit")
+                return candles[-limit:] if limit > 0 else candles[:0]
+
+        candles = self._memo.get(
+            "ohlcv", (symbol, interval, limit),
+            lambda: self.exchange.get_ohlcv(symbol, interval=interval, limit=limit),
+            symbol=symbol, caller=caller,
+        )
+        with self._lock:
+            if limit > self._ohlcv_limits.get((symbol, interval), 0):
+                self._ohlcv_limits[(symbol, interval)] = limit
+        return candles
+
+    def get_quotes_bulk(self, symbols: Optional[List[str]] = None, caller: str = UNLABELED,
+                        **kwargs: Any) -> Dict[str, Any]:
+        """
+        Quotes for symbols: memoized ones are reused, the rest come from one
+        bulk call (left out when the exchange has no bulk endpoint).
+        """
+        if symbols is None:
+            return self.exchange.get_quotes_bulk(None, **kwargs)
+        quotes: Dict[str, Any] = {}
+        missing: List[str] = []
+        for symbol in dict.fromkeys(symbols):
+            found, quote = self._memo.peek("quote", symbol)
+            if found:
+                quotes[symbol] = quote
+                self._memo.record("quote", caller, "hit")
+            else:
+                missing.append(symbol)
+        bulk = getattr(self.exchange, "get_quotes_bulk", None)
+        if missing and callable(bulk):
+            fetched = bulk(missing, **kwargs)
+            if isinstance(fetched, dict):
+                for symbol, quote in fetched.items():
+                    self._memo.put("quote", symbol, quote)
+                    self._memo.record("quote", caller, "miss")
+                quotes.update(fetched)
+        return quotes
+
+    def fetch_many(self, kind: str, symbols: List[str], caller: str = UNLABELED,
+                   **params: Any) -> List[FetchResult]:
+        """exchange.fetch_many for the symbols not memoized yet; results in input order."""
+        if kind not in self._GETTERS:
+            return self.exchange.fetch_many(kind, symbols, caller=caller, **params)
+        timeout = params.pop("timeout", None)
+        results: Dict[str, FetchResult] = {}
+        missing: List[str] = []
+        for symbol in symbols:
+            found, value = self._memo.peek(kind, self._key(kind, symbol, params))
+            if found:
+                results[symbol] = FetchResult(symbol=symbol, value=value)
+                self._memo.record(kind, caller, "hit")
+            else:
+                missing.append(symbol)
+
+        fetch_many = getattr(self.exchange, "fetch_many", None)
+        if missing and callable(fetch_many):
+            extra = {"timeout": timeout} if timeout is not None else {}
+            for result in fetch_many(kind, missing, caller=caller, **params, **extra):
+                results[result.symbol] = result
+                self._memo.record(kind, caller, "miss")
+                if result.ok:
+                    self._store(kind, result.symbol, params, result.value)
+        elif missing:
+            getter = getattr(self, self._GETTERS[kind])
+            for symbol in missing:
+                try:
+                    results[symbol] = FetchResult(symbol=symbol, value=getter(symbol, caller=caller, **params))
+                except Exception as exc:
+                    results[symbol] = FetchResult(symbol=symbol, error=exc)
+        return [results[s] for s in symbols if s in results]
+
+    def cached(self, kind: str, symbol: str, **params: Any) -> Optional[Any]:
+        """Value an earlier stage already fetched, or None (never fetches)."""
+        found, value = self._memo.peek(kind, self._key(kind, symbol, params))
+        if found:
+            return value
+        if kind == "ohlcv":
+            interval, limit = params.get("interval", "1h"), params.get("limit", 100)
+            with self._lock:
+                fetched_limit = self._ohlcv_limits.get((symbol, interval), 0)
+            if fetched_limit > limit:
+                found, value = self._memo.peek("ohlcv", (symbol, interval, fetched_limit))
+                if found:
+                    return value[-limit:]
+        return None
+
+    @property
+    def features(self) -> FeatureStore:
+        """Per-cycle feature store, created on first use."""
+        with self._lock:
+            if self._features is None:
+                self._features = FeatureStore(cycle_id=self.cycle_id)
+            return self._features
+
+    def view(self) -> MarketDataView:
+        """Read-only view for StrategyContext.market_data."""
+        return MarketDataView(self)
+
+    def invalidate(self, symbol: Optional[str] = None) -> int:
+        """Forget memoized data for symbol (all symbols when None), e.g. before pricing an order."""
+        with self._lock:
+            if symbol is None:
+                self._ohlcv_limits.clear()
+            else:
+                for key in [k for k in self._ohlcv_limits if k[0] == symbol]:
+                    del self._ohlcv_limits[key]
+        return self._memo.invalidate(symbol)
+
+    # Same name as the exchange hook, so callers that invalidate an exchange
+    # invalidate the context too
+    invalidate_quotes = invalidate
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("exchange", "_memo", "_lock", "_kinds", "_ohlcv_limits", "_features"):
+            raise AttributeError(name)
+        return getattr(self.exchange, name)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def report(self) -> Dict[str, Any]:
+        """Requests served, fetches made and fetches avoided this cycle, by kind and by caller."""
+        with self._lock:
+            kinds = {kind: dict(counts) for kind, counts in self._kinds.items()}
+        for counts in kinds.values():
+            counts["avoided"] = counts["requests"] - counts["fetched"]
+        requests = sum(c["requests"] for c in kinds.values())
+        fetched = sum(c["fetched"] for c in kinds.values())
+        return {
+            "cycle_id": self.cycle_id,
+            "requests": requests,
+            "fetched": fetched,
+            "avoided": requests - fetched,
+            "by_kind": kinds,
+            "by_caller": self._memo.stats(),
+            "features": self._features.report() if self._features is not None else None,
+        }
+
+    def summary(self) -> str:
+        report = self.report()
+        kinds = ", ".join(
+            f"{kind}={c['fetched']}/{c['requests']}" for kind, c in sorted(report["by_kind"].items())
+        )
+        line = (
+            f"Market data: {report['requests']} requests, {report['fetched']} fetched, "
+            f"{report['avoided']} avoided ({kinds or 'none'})"
+        )
+        if self._features is not None and len(self._features):
+            line = f"{line} | {self._features.summary()}"
+        return line
+
+    # ------------------------------------------------------------------
+
+    def _count(self, kind: str, caller: str, outcome: str) -> None:
+        with self._lock:
+            counts = self._kinds[kind]
+            counts["requests"] += 1
+            if outcome == "miss":
+                counts["fetched"] += 1
+
+    @staticmethod
+    def _key(kind: str, symbol: str, params: Dict[str, Any]) -> Hashable:
+        if kind == "quote":
+            return symbol
+        if kind == "orderbook":
+            return symbol, params.get("depth_levels", 50)
+        if kind == "ohlcv":
+            return symbol, params.get("interval", "1h"), params.get("limit", 100)
+        return symbol, _params_key(params)
+
+    def _store(self, kind: str, symbol: str, params: Dict[str, Any], value: Any) -> None:
+        self._memo.put(kind, self._key(kind, symbol, params), value, symbol=symbol)
+        if kind == "ohlcv":
+            interval, limit = params.get("interval", "1h"), params.get("limit", 100)
+            with self._lock:
+                if limit > self._ohlcv_limits.get((symbol, interval), 0):
+                    self._ohlcv_limits[(symbol, interval)] = limit
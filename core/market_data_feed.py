@@ -0,0 +1,506 @@
+"""
+247trader-v2 Core: Streaming Market Data Feed
+
+Subscribes to the Coinbase Advanced Trade WebSocket ticker and level2 channels
+and keeps an in-process top-of-book / last-trade cache per product.
+CoinbaseExchange.get_quote serves from this cache while it is fresh and falls
+back to the REST ticker otherwise.
+
+Freshness follows the same rules the execution engine applies to every quote
+(quote_freshness_error). A level2 book is current as of the last message
+received on a healthy connection: heartbeats prove liveness, and a sequence
+gap or disconnect drops every book until a new snapshot arrives.
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.exchange_coinbase import Quote
+from core.order_book import OrderBook
+from infra.config_fields import apply_fields
+from infra.ws_client import WebSocketClient, WebSocketError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WS_URL = "wss://advanced-trade-ws.coinbase.com"
+
+
+def quote_freshness_error(quote, symbol: str, max_age_seconds: float) -> Optional[str]:
+    """
+    Check a quote's timestamp against a maximum age.
+
+    Shared by ExecutionEngine._validate_quote_freshness and the streaming
+    cache so both apply identical rules.
+
+    Returns:
+        Error string if missing/stale/future-dated, None if fresh
+    """
+    if quote is None:
+        return f"Quote is None for {symbol}"
+
+    if not hasattr(quote, 'timestamp') or quote.timestamp is None:
+        return f"Quote missing timestamp for {symbol}"
+
+    now = datetime.now(timezone.utc)
+
+    # Ensure quote timestamp is timezone-aware
+    quote_ts = quote.timestamp
+    if quote_ts.tzinfo is None:
+        # Assume UTC if naive
+        quote_ts = quote_ts.replace(tzinfo=timezone.utc)
+
+    age_seconds = (now - quote_ts).total_seconds()
+
+    if age_seconds > max_age_seconds:
+        return (f"Quote too stale for {symbol}: {age_seconds:.1f}s old "
+               f"(max: {max_age_seconds}s)")
+
+    if age_seconds < 0:
+        # Future timestamp - clock skew issue
+        return (f"Quote timestamp in future for {symbol}: {age_seconds:.1f}s ahead "
+               f"(possible clock skew)")
+
+    return None
+
+
+@dataclass
+class MarketDataFeedConfig:
+    """Streaming feed settings (config/app.yaml → exchange.market_data)."""
+
+    enabled: bool = False
+    url: str = DEFAULT_WS_URL
+    channels: Tuple[str, ...] = ("ticker", "level2")
+    heartbeats: bool = True
+    max_quote_age_seconds: float = 5.0
+    connect_timeout: float = 5.0
+    idle_timeout: float = 10.0
+    reconnect_initial_seconds: float = 1.0
+    reconnect_max_seconds: float = 30.0
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> "MarketDataFeedConfig":
+        return apply_fields(cls(), raw, "exchange.market_data")
+
+
+@dataclass
+class TopOfBook:
+    """Best bid/ask and last trade for one product."""
+
+    symbol: str
+    bid: float = 0.0
+    ask: float = 0.0
+    bid_size: float = 0.0
+    ask_size: float = 0.0
+    last: float = 0.0
+    volume_24h: float = 0.0  # Quote-denominated (USD), like the REST ticker
+    updated_at: Optional[datetime] = None
+    book_synced: bool = False  # level2 snapshot applied since (re)connect
+
+
+@dataclass
+class _ProductState:
+    symbol: str
+    book: OrderBook = field(init=False)
+    book_synced: bool = False
+    book_updated_at: Optional[datetime] = None
+    ticker_bid: float = 0.0
+    ticker_ask: float = 0.0
+    last: float = 0.0
+    volume_24h_base: float = 0.0
+    ticker_updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        self.book = OrderBook(self.symbol)
+
+    def reset_book(self) -> None:
+        self.book.clear()
+        self.book_synced = False
+
+
+class MarketDataFeed:
+    """
+    Background WebSocket subscriber with a top-of-book cache.
+
+    Usage:
+        feed = MarketDataFeed(MarketDataFeedConfig(enabled=True))
+        exchange.attach_market_data_feed(feed)
+        feed.start(["BTC-USD", "ETH-USD"])
+        ...
+        feed.update_symbols(universe_symbols)  # diffed subscribe/unsubscribe
+        quote = feed.get_quote("BTC-USD")     # None when stale or unknown
+    """
+
+    def __init__(self, config: Optional[MarketDataFeedConfig] = None,
+                 client_factory: Callable[..., WebSocketClient] = WebSocketClient):
+        self.config = config or MarketDataFeedConfig()
+        self._client_factory = client_factory
+        self._lock = threading.Lock()
+        self._products: Dict[str, _ProductState] = {}
+        self._symbols: List[str] = []
+        self._subscribed: set = set()
+        self._client: Optional[WebSocketClient] = None
+        self._connected = False
+        self._last_message_at: Optional[datetime] = None
+        self._last_sequence: Optional[int] = None
+        self._resync = False
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "messages": 0,
+            "reconnects": 0,
+            "sequence_gaps": 0,
+            "quote_hits": 0,
+            "quote_misses": 0,
+            "quote_stale": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self, symbols: Optional[Iterable[str]] = None) -> None:
+        if symbols is not None:
+            with self._lock:
+                self._symbols = list(dict.fromkeys(symbols))
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="market-data-feed", daemon=True)
+        self._thread.start()
+        logger.info("Started market data feed (%s, channels=%s)", self.config.url, ",".join(self.config.channels))
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        with self._lock:
+            client = self._client
+        if client is not None:
+            client.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def update_symbols(self, symbols: Iterable[str]) -> None:
+        """Set the product list; subscriptions are diffed on the live connection."""
+        wanted = list(dict.fromkeys(symbols))
+        with self._lock:
+            self._symbols = wanted
+            client = self._client if self._connected else None
+            wanted_set = set(wanted)
+            added = [s for s in wanted if s not in self._subscribed]
+            removed = [s for s in self._subscribed if s not in wanted_set]
+            for symbol in removed:
+                self._products.pop(symbol, None)
+
+        if client is None:
+            self._wake.set()  # reader may be idle waiting for a first symbol
+            return
+        try:
+            if added:
+                self._send_subscription(client, "subscribe", added)
+            if removed:
+                self._send_subscription(client, "unsubscribe", removed)
+        except WebSocketError as e:
+            logger.warning("Market data subscription update failed: %s", e)
+
+    # ------------------------------------------------------------------
+    # Cache reads
+    # ------------------------------------------------------------------
+
+    def top_of_book(self, symbol: str) -> Optional[TopOfBook]:
+        with self._lock:
+            state = self._products.get(symbol)
+            if state is None:
+                return None
+            return self._top_of_book(state)
+
+    def get_quote(self, symbol: str, max_age_seconds: Optional[float] = None) -> Optional[Quote]:
+        """
+        Quote from the streaming cache, or None if the product is unknown,
+        one-sided, missing ticker data, or older than max_age_seconds.
+        """
+        max_age = self.config.max_quote_age_seconds if max_age_seconds is None else max_age_seconds
+        with self._lock:
+            state = self._products.get(symbol)
+            top = self._top_of_book(state) if state is not None else None
+            if top is None or top.bid <= 0 or top.ask <= 0 or top.ask < top.bid or top.updated_at is None:
+                self._stats["quote_misses"] += 1
+                return None
+
+        mid = (top.bid + top.ask) / 2.0
+        quote = Quote(
+            symbol=symbol,
+            bid=top.bid,
+            ask=top.ask,
+            mid=mid,
+            spread_bps=(top.ask - top.bid) / mid * 10000.0,
+            last=top.last or mid,
+            volume_24h=top.volume_24h,
+            timestamp=top.updated_at,
+        )
+        stale = quote_freshness_error(quote, symbol, max_age)
+        with self._lock:
+            if stale:
+                self._stats["quote_stale"] += 1
+            else:
+                self._stats["quote_hits"] += 1
+        if stale:
+            logger.debug("Streaming quote unusable: %s", stale)
+            return None
+        return quote
+
+    def get_order_book(self, symbol: str, max_age_seconds: Optional[float] = None) -> Optional[OrderBook]:
+        """
+        Copy of the streamed L2 book, or None if it is not synced or older
+        than max_age_seconds (same freshness rules as get_quote).
+        """
+        max_age = self.config.max_quote_age_seconds if max_age_seconds is None else max_age_seconds
+        with self._lock:
+            state = self._products.get(symbol)
+            if state is None or not state.book_synced or not state.book.is_two_sided():
+                return None
+            as_of = self._book_as_of(state)
+            book = state.book.copy()
+        probe = Quote(symbol=symbol, bid=0.0, ask=0.0, mid=0.0, spread_bps=0.0,
+                      last=0.0, volume_24h=0.0, timestamp=as_of)
+        if quote_freshness_error(probe, symbol, max_age):
+            return None
+        return book
+
+    def _book_as_of(self, state: _ProductState) -> datetime:
+        # Caller holds self._lock. A synced book is current up to the last
+        # message received on a live connection.
+        candidates = [t for t in (state.book_updated_at, state.ticker_updated_at) if t]
+        if self._connected and self._last_message_at:
+            candidates.append(self._last_message_at)
+        return max(candidates)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["connected"] = self._connected
+            snapshot["products"] = len(self._products)
+            snapshot["synced_books"] = sum(1 for p in self._products.values() if p.book_synced)
+        return snapshot
+
+    def _top_of_book(self, state: _ProductState) -> Optional[TopOfBook]:
+        # Caller holds self._lock. Ticker data supplies last/volume; without it
+        # the quote would report zero 24h volume, so treat it as a miss.
+        if state.ticker_updated_at is None:
+            return None
+
+        if state.book_synced and state.book.is_two_sided():
+            book = state.book
+            bid, ask = book.best_bid, book.best_ask
+            bid_size, ask_size = book.best_bid_size, book.best_ask_size
+            updated_at = self._book_as_of(state)
+        else:
+            bid, ask = state.ticker_bid, state.ticker_ask
+            bid_size = ask_size = 0.0
+            updated_at = state.ticker_updated_at
+
+        return TopOfBook(
+            symbol=state.symbol,
+            bid=bid,
+            ask=ask,
+            bid_size=bid_size,
+            ask_size=ask_size,
+            last=state.last,
+            volume_24h=state.volume_24h_base * state.last,
+            updated_at=updated_at,
+            book_synced=state.book_synced,
+        )
+
+    # ------------------------------------------------------------------
+    # Message handling
+    # ------------------------------------------------------------------
+
+    def handle_message(self, raw) -> None:
+        """Apply one WebSocket message (JSON text or decoded dict) to the cache."""
+        try:
+            message = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+        except ValueError:
+            logger.debug("Ignoring non-JSON market data message")
+            return
+        if not isinstance(message, dict):
+            return
+
+        if message.get("type") == "error":
+            logger.warning("Market data feed error: %s", message.get("message"))
+            return
+
+        received_at = datetime.now(timezone.utc)
+        channel = message.get("channel")
+        events = message.get("events") or []
+
+        with self._lock:
+            self._stats["messages"] += 1
+            self._last_message_at = received_at
+            self._check_sequence(message.get("sequence_num"))
+
+            if channel == "l2_data":
+                for event in events:
+                    self._apply_level2(event, received_at)
+            elif channel in ("ticker", "ticker_batch"):
+                for event in events:
+                    for ticker in event.get("tickers") or []:
+                        self._apply_ticker(ticker, received_at)
+            elif channel == "subscriptions":
+                logger.debug("Market data subscriptions: %s", events)
+
+    def _check_sequence(self, sequence) -> None:
+        # Caller holds self._lock
+        if sequence is None:
+            return
+        try:
+            sequence = int(sequence)
+        except (TypeError, ValueError):
+            return
+        last = self._last_sequence
+        self._last_sequence = sequence
+        if last is not None and sequence > last + 1:
+            self._stats["sequence_gaps"] += 1
+            logger.warning("Market data sequence gap (%d -> %d); resyncing books", last, sequence)
+            for state in self._products.values():
+                state.reset_book()
+            self._resync = True
+
+    def _state(self, symbol: str) -> _ProductState:
+        state = self._products.get(symbol)
+        if state is None:
+            state = _ProductState(symbol=symbol)
+            self._products[symbol] = state
+        return state
+
+    def _apply_level2(self, event: Dict[str, Any], received_at: datetime) -> None:
+        symbol = event.get("product_id")
+        if not symbol:
+            return
+        state = self._state(symbol)
+        event_type = event.get("type")
+        if event_type != "snapshot" and not state.book_synced:
+            return  # deltas before a snapshot cannot be applied
+
+        bids, asks = [], []
+        for update in event.get("updates") or []:
+            try:
+                level = (float(update["price_level"]), float(update["new_quantity"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+            (bids if update.get("side") == "bid" else asks).append(level)
+
+        if event_type == "snapshot":
+            state.book.apply_snapshot(bids, asks)  # sorted once, not level by level
+            state.book_synced = True
+        else:
+            for price, size in bids:
+                state.book.apply_update("bid", price, size)
+            for price, size in asks:
+                state.book.apply_update("ask", price, size)
+        state.book_updated_at = received_at
+
+    def _apply_ticker(self, ticker: Dict[str, Any], received_at: datetime) -> None:
+        symbol = ticker.get("product_id")
+        if not symbol:
+            return
+        state = self._state(symbol)
+
+        def _num(key: str) -> float:
+            try:
+                return float(ticker.get(key) or 0.0)
+            except (TypeError, ValueError):
+                return 0.0
+
+        price = _num("price")
+        if price > 0:
+            state.last = price
+        volume = _num("volume_24_h")
+        if volume > 0:
+            state.volume_24h_base = volume
+        bid, ask = _num("best_bid"), _num("best_ask")
+        if bid > 0 and ask > 0:
+            state.ticker_bid, state.ticker_ask = bid, ask
+        state.ticker_updated_at = received_at
+
+    # ------------------------------------------------------------------
+    # Connection loop
+    # ------------------------------------------------------------------
+
+    def _send_subscription(self, client: WebSocketClient, action: str, symbols: List[str]) -> None:
+        for channel in self.config.channels:
+            client.send_text(json.dumps({"type": action, "product_ids": symbols, "channel": channel}))
+        with self._lock:
+            if action == "subscribe":
+                self._subscribed.update(symbols)
+            else:
+                self._subscribed.difference_update(symbols)
+
+    def _run(self) -> None:
+        backoff = self.config.reconnect_initial_seconds
+        first = True
+        while not self._stop.is_set():
+            with self._lock:
+                symbols = list(self._symbols)
+            if not symbols:
+                self._wake.wait(1.0)
+                self._wake.clear()
+                continue
+
+            if not first:
+                with self._lock:
+                    self._stats["reconnects"] += 1
+            first = False
+
+            client = self._client_factory(self.config.url, connect_timeout=self.config.connect_timeout)
+            try:
+                client.connect()
+                with self._lock:
+                    self._client = client
+                    self._connected = True
+                    self._last_sequence = None
+                    self._resync = False
+                    self._subscribed.clear()
+                    self._last_message_at = datetime.now(timezone.utc)
+                if self.config.heartbeats:
+                    client.send_text(json.dumps({"type": "subscribe", "channel": "heartbeats"}))
+                self._send_subscription(client, "subscribe", symbols)
+                logger.info("Market data feed connected: %d products", len(symbols))
+                backoff = self.config.reconnect_initial_seconds
+
+                last_activity = time.monotonic()
+                while not self._stop.is_set():
+                    message = client.recv(timeout=1.0)
+                    if message is not None:
+                        last_activity = time.monotonic()
+                        self.handle_message(message)
+                    elif time.monotonic() - last_activity > self.config.idle_timeout:
+                        raise WebSocketError(f"no messages for {self.config.idle_timeout:.0f}s")
+                    with self._lock:
+                        resync = self._resync
+                    if resync:
+                        raise WebSocketError("sequence gap")
+            except Exception as e:
+                if not self._stop.is_set():
+                    logger.warning("Market data feed disconnected: %s (retry in %.1fs)", e, backoff)
+            finally:
+                client.close()
+                with self._lock:
+                    self._client = None
+                    self._connected = False
+                    self._subscribed.clear()
+                    for state in self._products.values():
+                        state.reset_book()
+
+            if self._stop.wait(backoff):
+                break
+            backoff = min(backoff * 2, self.config.reconnect_max_seconds)
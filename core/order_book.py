@@ -0,0 +1,266 @@
+"""
+247trader-v2 Core: L2 Order Book
+
+Incrementally maintained price-level book. Each side keeps its levels in
+compact, price-sorted ``array('d')`` buffers plus cumulative notional/size
+arrays, so the queries the universe and execution layers need are binary
+searches:
+
+- depth_usd(side, band_bps): USD resting within N bps of mid
+- estimate_fill(side, notional_usd): VWAP, levels consumed and slippage to
+  fill a USD amount by walking the book
+
+Updates locate their level by bisection and shift the arrays in C
+(array.insert / del). The cumulative arrays are rebuilt lazily, once per
+batch of updates, on the next query.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from operator import mul
+from typing import Iterable, Optional, Tuple
+
+Level = Tuple[float, float]
+
+
+@dataclass
+class FillEstimate:
+    """Result of walking the book for a USD notional."""
+    side: str              # "buy" (lifts asks) | "sell" (hits bids)
+    notional_usd: float    # Requested
+    filled_usd: float      # Available (== notional_usd when complete)
+    base_size: float       # Base units obtained/sold
+    vwap: float
+    levels_consumed: int
+    slippage_bps: float    # VWAP vs mid (always >= 0)
+    complete: bool
+
+
+class _BookSide:
+    """One side of the book, prices ascending."""
+
+    __slots__ = ("prices", "sizes", "_cum_notional", "_cum_size", "_dirty")
+
+    def __init__(self):
+        self.prices = array("d")
+        self.sizes = array("d")
+        self._cum_notional = array("d", [0.0])
+        self._cum_size = array("d", [0.0])
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def load(self, levels: Iterable[Level]) -> None:
+        merged = {}
+        for price, size in levels:
+            if price > 0 and size > 0:
+                merged[price] = size
+        ordered = sorted(merged.items())
+        self.prices = array("d", (p for p, _ in ordered))
+        self.sizes = array("d", (s for _, s in ordered))
+        self._dirty = True
+
+    def set(self, price: float, size: float) -> None:
+        i = bisect_left(self.prices, price)
+        exists = i < len(self.prices) and self.prices[i] == price
+        if size <= 0:
+            if exists:
+                del self.prices[i]
+                del self.sizes[i]
+                self._dirty = True
+        elif exists:
+            self.sizes[i] = size
+            self._dirty = True
+        else:
+            self.prices.insert(i, price)
+            self.sizes.insert(i, size)
+            self._dirty = True
+
+    def cumulative(self) -> Tuple[array, array]:
+        if self._dirty:
+            self._cum_notional = array("d", accumulate(map(mul, self.prices, self.sizes), initial=0.0))
+            self._cum_size = array("d", accumulate(self.sizes, initial=0.0))
+            self._dirty = False
+        return self._cum_notional, self._cum_size
+
+    def copy(self) -> "_BookSide":
+        other = _BookSide()
+        other.prices = array("d", self.prices)
+        other.sizes = array("d", self.sizes)
+        other._dirty = True
+        return other
+
+
+class OrderBook:
+    """
+    Level-2 order book for one product.
+
+    Usage:
+        book = OrderBook("BTC-USD")
+        book.apply_snapshot(bids=[(60000.0, 0.5)], asks=[(60010.0, 0.4)])
+        book.apply_update("bid", 60005.0, 0.2)   # size 0 removes the level
+        book.depth_usd("ask", band_bps=20)
+        book.estimate_fill("buy", 25_000)
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self._bids = _BookSide()
+        self._asks = _BookSide()
+
+    @classmethod
+    def from_levels(cls, symbol: str, bids: Iterable[Level], asks: Iterable[Level]) -> "OrderBook":
+        book = cls(symbol)
+        book.apply_snapshot(bids, asks)
+        return book
+
+    def apply_snapshot(self, bids: Iterable[Level], asks: Iterable[Level]) -> None:
+        self._bids.load(bids)
+        self._asks.load(asks)
+
+    def apply_update(self, side: str, price: float, size: float) -> None:
+        """Set one level; side is "bid" or "ask"/"offer"."""
+        (self._bids if side == "bid" else self._asks).set(price, size)
+
+    def clear(self) -> None:
+        self._bids = _BookSide()
+        self._asks = _BookSide()
+
+    def copy(self) -> "OrderBook":
+        other = OrderBook(self.symbol)
+        other._bids = self._bids.copy()
+        other._asks = self._asks.copy()
+        return other
+
+    # ------------------------------------------------------------------
+    # Top of book
+    # ------------------------------------------------------------------
+
+    @property
+    def best_bid(self) -> float:
+        return self._bids.prices[-1] if self._bids.prices else 0.0
+
+    @property
+    def best_ask(self) -> float:
+        return self._asks.prices[0] if self._asks.prices else 0.0
+
+    @property
+    def best_bid_size(self) -> float:
+        return self._bids.sizes[-1] if self._bids.sizes else 0.0
+
+    @property
+    def best_ask_size(self) -> float:
+        return self._asks.sizes[0] if self._asks.sizes else 0.0
+
+    @property
+    def mid(self) -> float:
+        bid, ask = self.best_bid, self.best_ask
+        return (bid + ask) / 2.0 if bid > 0 and ask > 0 else 0.0
+
+    @property
+    def spread_bps(self) -> float:
+        mid = self.mid
+        return (self.best_ask - self.best_bid) / mid * 10000.0 if mid > 0 else 0.0
+
+    @property
+    def bid_levels(self) -> int:
+        return len(self._bids)
+
+    @property
+    def ask_levels(self) -> int:
+        return len(self._asks)
+
+    def is_two_sided(self) -> bool:
+        return self.best_bid > 0 and self.best_ask > 0
+
+    # ------------------------------------------------------------------
+    # Depth / impact queries
+    # ------------------------------------------------------------------
+
+    def depth_usd(self, side: str, band_bps: float = 20.0) -> float:
+        """
+        USD notional resting within band_bps of mid.
+
+        Args:
+            side: "bid", "ask" or "both"
+            band_bps: Distance from mid in basis points
+        """
+        if side == "both":
+            return self.depth_usd("bid", band_bps) + self.depth_usd("ask", band_bps)
+
+        mid = self.mid
+        if mid <= 0:
+            return 0.0
+        band = band_bps / 10000.0
+        if side == "bid":
+            prices = self._bids.prices
+            cum, _ = self._bids.cumulative()
+            i = bisect_left(prices, mid * (1 - band))
+            return cum[-1] - cum[i]
+        prices = self._asks.prices
+        cum, _ = self._asks.cumulative()
+        return cum[bisect_right(prices, mid * (1 + band))]
+
+    def estimate_fill(self, side: str, notional_usd: float) -> Optional[FillEstimate]:
+        """
+        Walk the book for a USD notional.
+
+        Args:
+            side: "buy" consumes asks, "sell" consumes bids (case-insensitive)
+            notional_usd: Order size in quote currency
+
+        Returns:
+            FillEstimate, or None for an empty side / non-positive size. When the
+            book is too thin, the estimate covers everything available and
+            complete is False.
+        """
+        side = side.lower()
+        mid = self.mid
+        if notional_usd <= 0 or mid <= 0:
+            return None
+
+        if side == "buy":
+            prices = self._asks.prices
+            cum, cum_size = self._asks.cumulative()
+            n = len(prices)
+            if cum[n] < notional_usd:
+                filled, base, levels, complete = cum[n], cum_size[n], n, False
+            else:
+                # First level whose cumulative notional covers the order
+                k = bisect_left(cum, notional_usd)
+                filled = notional_usd
+                base = cum_size[k - 1] + (notional_usd - cum[k - 1]) / prices[k - 1]
+                levels, complete = k, True
+        else:
+            prices = self._bids.prices
+            cum, cum_size = self._bids.cumulative()
+            n = len(prices)
+            total = cum[n]
+            if total < notional_usd:
+                filled, base, levels, complete = total, cum_size[n], n, False
+            else:
+                # Walking down from the best bid: j is the partially filled level
+                j = bisect_right(cum, total - notional_usd) - 1
+                j = min(max(j, 0), n - 1)
+                above = total - cum[j + 1]
+                filled = notional_usd
+                base = (cum_size[n] - cum_size[j + 1]) + (notional_usd - above) / prices[j]
+                levels, complete = n - j, True
+
+        if base <= 0:
+            return None
+        vwap = filled / base
+        slippage = abs(vwap - mid) / mid * 10000.0
+        return FillEstimate(
+            side=side,
+            notional_usd=notional_usd,
+            filled_usd=filled,
+            base_size=base,
+            vwap=vwap,
+            levels_consumed=levels,
+            slippage_bps=slippage,
+            complete=complete,
+        )
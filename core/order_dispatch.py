@@ -0,0 +1,193 @@
+"""
+247trader-v2 Core: Concurrent Order Dispatch
+
+Submits a batch of independent orders in parallel instead of one by one.
+
+- Orders for the same base asset share a lane and run in batch order; lanes
+  for different assets run concurrently on a small FanoutExecutor pool.
+- BUY orders hold their quote-currency notional in QuoteReservations from pair
+  selection until the order completes, so two lanes cannot both spend the
+  same USDC balance.
+- Submissions are paced by an order-rate bucket on top of the exchange's own
+  per-endpoint private rate limits.
+- A critical order is a barrier: everything before it finishes first, it runs
+  alone, and if it fails nothing after it is submitted.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from core.rate_limiter import EndpointQuota
+from infra.config_fields import apply_fields
+from infra.fanout import FanoutConfig, FanoutExecutor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OrderDispatchConfig:
+    """Dispatch settings (config/policy.yaml → execution.dispatch)."""
+
+    max_workers: int = 4
+    orders_per_second: float = 10.0
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> "OrderDispatchConfig":
+        return apply_fields(cls(), raw, "execution.dispatch")
+
+
+class QuoteReservations:
+    """
+    USD-equivalent holds on quote currencies for in-flight BUY orders.
+
+    Exchange balances only drop once an order is resting, so concurrent
+    orders would otherwise select pairs against the same balance. Callers
+    select a pair against a ``snapshot`` taken beforehand, without holding
+    the lock, then commit with ``try_reserve``; the commit fails if another
+    order took a hold on that currency in the meantime.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._held: Dict[str, float] = {}
+
+    def reserved(self, currency: str) -> float:
+        with self.lock:
+            return self._held.get(currency, 0.0)
+
+    def reserve(self, currency: str, amount_usd: float) -> None:
+        if amount_usd <= 0:
+            return
+        with self.lock:
+            self._held[currency] = self._held.get(currency, 0.0) + amount_usd
+
+    def try_reserve(self, currency: str, amount_usd: float, held_seen: float) -> bool:
+        """Reserve unless holds on ``currency`` grew past ``held_seen``."""
+        with self.lock:
+            if self._held.get(currency, 0.0) > held_seen + 1e-9:
+                return False
+            self.reserve(currency, amount_usd)
+            return True
+
+    def release(self, currency: str, amount_usd: float) -> None:
+        with self.lock:
+            remaining = self._held.get(currency, 0.0) - amount_usd
+            if remaining > 1e-9:
+                self._held[currency] = remaining
+            else:
+                self._held.pop(currency, None)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self.lock:
+            return dict(self._held)
+
+
+class OrderDispatcher:
+    """
+    Runs order batches through a per-asset lane pool.
+
+    The pool is created lazily and reused; a pool of one worker runs the
+    batch inline, exactly like the original sequential loop.
+    """
+
+    def __init__(self, config: Optional[OrderDispatchConfig] = None):
+        self.config = config or OrderDispatchConfig()
+        self._fanout = FanoutExecutor(
+            FanoutConfig(max_workers=self.config.max_workers, timeout_seconds=None),
+            name="order-dispatch",
+        )
+        self._throttle = EndpointQuota(name="order_dispatch", requests_per_second=self.config.orders_per_second)
+
+    @staticmethod
+    def lane_key(order: Dict[str, Any]) -> str:
+        symbol = str(order.get("symbol") or "")
+        return symbol.split("-")[0].upper()
+
+    def _pace(self) -> None:
+        delay = self._throttle.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def dispatch(self, orders: List[Dict[str, Any]],
+                 execute: Callable[[Dict[str, Any], float], Any],
+                 on_error: Optional[Callable[[Dict[str, Any], Exception], Any]] = None) -> List[Any]:
+        """
+        Execute orders, concurrently where they do not conflict.
+
+        Args:
+            orders: Order dicts (symbol, side, size_usd, optional critical, ...)
+            execute: Callable(order, decided_at) returning an ExecutionResult;
+                decided_at is the monotonic time the batch was handed over
+            on_error: Callable(order, exc) returning the failed result for an
+                order whose execute raised; it may re-raise to abort the batch
+
+        Returns:
+            Results in batch order, up to and including a failed critical order
+
+        Raises:
+            The first unhandled execute error, once every lane has finished
+            (orders already submitted by other lanes are not abandoned)
+        """
+        decided_at = time.monotonic()
+        results: List[Any] = []
+        segment: List[Dict[str, Any]] = []
+
+        for order in orders:
+            if not order.get("critical", False):
+                segment.append(order)
+                continue
+            results.extend(self._run_segment(segment, execute, on_error, decided_at))
+            segment = []
+            result = self._attempt(order, execute, on_error, decided_at)
+            results.append(result)
+            if not result.success:
+                logger.warning("Critical order failed, stopping batch execution")
+                return results
+
+        results.extend(self._run_segment(segment, execute, on_error, decided_at))
+        return results
+
+    def _attempt(self, order: Dict[str, Any],
+                 execute: Callable[[Dict[str, Any], float], Any],
+                 on_error: Optional[Callable[[Dict[str, Any], Exception], Any]],
+                 decided_at: float) -> Any:
+        self._pace()
+        try:
+            return execute(order, decided_at)
+        except Exception as exc:
+            if on_error is None:
+                raise
+            logger.warning("Order %s %s raised: %s", order.get("side"), order.get("symbol"), exc)
+            return on_error(order, exc)
+
+    def _run_segment(self, orders: List[Dict[str, Any]],
+                     execute: Callable[[Dict[str, Any], float], Any],
+                     on_error: Optional[Callable[[Dict[str, Any], Exception], Any]],
+                     decided_at: float) -> List[Any]:
+        if not orders:
+            return []
+
+        lanes: Dict[str, List[int]] = {}
+        for idx, order in enumerate(orders):
+            lanes.setdefault(self.lane_key(order), []).append(idx)
+
+        if len(lanes) == 1 or self.config.max_workers <= 1:
+            return [self._attempt(order, execute, on_error, decided_at) for order in orders]
+
+        slots: List[Any] = [None] * len(orders)
+
+        def run_lane(key: str) -> None:
+            # An unhandled error ends this lane only; the others run to completion
+            for idx in lanes[key]:
+                slots[idx] = self._attempt(orders[idx], execute, on_error, decided_at)
+
+        outcomes = self._fanout.map(run_lane, list(lanes))
+        for outcome in outcomes:
+            outcome.unwrap()
+        return slots
+
+    def shutdown(self) -> None:
+        self._fanout.shutdown()
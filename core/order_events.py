@@ -0,0 +1,515 @@
+"""
+247trader-v2 Core: User Order Event Stream
+
+Subscribes to the authenticated Coinbase Advanced Trade WebSocket ``user``
+channel and keeps the latest state of every order on the account. Order and
+fill updates are pushed to listeners (ExecutionEngine maps them into
+OrderStateMachine and StateStore) as they arrive, and code that waits for an
+order to fill or reach a terminal state blocks on the stream instead of
+sleeping between REST polls.
+
+REST stays in the loop as a watchdog: await_order still polls
+get_order_status every ``watchdog_seconds`` while waiting, and falls back to
+plain polling whenever the stream is not healthy (disconnected, no snapshot
+yet since the last reconnect, or a sequence gap).
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from infra.config_fields import apply_fields
+from infra.ws_client import WebSocketClient, WebSocketError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WS_URL = "wss://advanced-trade-ws-user.coinbase.com"
+
+TERMINAL_STATUSES = {"FILLED", "CANCELLED", "CANCELED", "EXPIRED", "FAILED", "REJECTED"}
+
+MAX_TRACKED_ORDERS = 2000
+
+StatusPredicate = Callable[[Dict[str, Any]], bool]
+
+
+@dataclass
+class UserOrderStreamConfig:
+    """User channel settings (config/app.yaml → exchange.user_stream)."""
+
+    enabled: bool = False
+    url: str = DEFAULT_WS_URL
+    heartbeats: bool = True
+    connect_timeout: float = 5.0
+    idle_timeout: float = 15.0
+    reconnect_initial_seconds: float = 1.0
+    reconnect_max_seconds: float = 30.0
+    watchdog_seconds: float = 5.0
+    reconcile_rest_interval_seconds: float = 300.0
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> "UserOrderStreamConfig":
+        return apply_fields(cls(), raw, "exchange.user_stream")
+
+
+def _num(raw: Dict[str, Any], *keys: str) -> float:
+    for key in keys:
+        value = raw.get(key)
+        if value in (None, ""):
+            continue
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            continue
+    return 0.0
+
+
+@dataclass
+class OrderUpdate:
+    """Latest known state of one order, as reported on the user channel."""
+
+    order_id: str
+    client_order_id: Optional[str]
+    product_id: Optional[str]
+    side: Optional[str]
+    status: str
+    filled_size: float = 0.0
+    average_filled_price: float = 0.0
+    filled_value: float = 0.0
+    total_fees: float = 0.0
+    leaves_size: float = 0.0
+    limit_price: float = 0.0
+    created_time: Optional[str] = None
+    received_at: Optional[datetime] = None
+
+    @classmethod
+    def from_event(cls, raw: Dict[str, Any], received_at: Optional[datetime] = None) -> Optional["OrderUpdate"]:
+        order_id = raw.get("order_id")
+        if not order_id:
+            return None
+        filled_size = _num(raw, "cumulative_quantity", "filled_size")
+        average_price = _num(raw, "avg_price", "average_filled_price")
+        filled_value = _num(raw, "filled_value") or filled_size * average_price
+        return cls(
+            order_id=str(order_id),
+            client_order_id=raw.get("client_order_id") or None,
+            product_id=raw.get("product_id"),
+            side=(raw.get("order_side") or raw.get("side") or "").upper() or None,
+            status=str(raw.get("status") or "UNKNOWN").upper(),
+            filled_size=filled_size,
+            average_filled_price=average_price,
+            filled_value=filled_value,
+            total_fees=_num(raw, "total_fees"),
+            leaves_size=_num(raw, "leaves_quantity"),
+            limit_price=_num(raw, "limit_price"),
+            created_time=raw.get("creation_time") or raw.get("created_time"),
+            received_at=received_at,
+        )
+
+    @property
+    def terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_status(self) -> Dict[str, Any]:
+        """Same keys as CoinbaseExchange.get_order_status / list_open_orders entries."""
+        size = self.filled_size + self.leaves_size
+        return {
+            "order_id": self.order_id,
+            "client_order_id": self.client_order_id,
+            "product_id": self.product_id,
+            "side": self.side,
+            "status": self.status,
+            "filled_size": self.filled_size,
+            "average_filled_price": self.average_filled_price,
+            "filled_value": self.filled_value,
+            "total_fees": self.total_fees,
+            "leaves_quantity": self.leaves_size,
+            "size": size,
+            "quote_size": size * self.limit_price if self.limit_price > 0 else self.filled_value,
+            "created_time": self.created_time,
+        }
+
+
+def poll_order(
+    poll: Callable[[], Optional[Dict[str, Any]]],
+    *,
+    timeout: float,
+    done: StatusPredicate,
+    poll_interval: float,
+    stop: Optional[threading.Event] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    REST polling loop: call poll() every poll_interval until done(status) or timeout.
+
+    Setting ``stop`` ends the wait early (the caller is being canceled).
+
+    Returns:
+        The status that satisfied done, else the last status seen (or None)
+    """
+    deadline = time.monotonic() + timeout
+    last: Optional[Dict[str, Any]] = None
+    while True:
+        status = poll()
+        if status:
+            last = status
+            if done(status):
+                return status
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return last
+        if stop is None:
+            time.sleep(min(poll_interval, remaining))
+        elif stop.wait(min(poll_interval, remaining)):
+            return last
+
+
+def await_order(
+    stream: Optional["OrderEventStream"],
+    order_id: str,
+    poll: Callable[[], Optional[Dict[str, Any]]],
+    *,
+    timeout: float,
+    done: StatusPredicate,
+    poll_interval: float = 0.5,
+    stop: Optional[threading.Event] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Wait for an order status matching done, from the stream when possible.
+
+    With no stream this is poll_order; otherwise see OrderEventStream.await_order.
+    """
+    if stream is None:
+        return poll_order(poll, timeout=timeout, done=done, poll_interval=poll_interval, stop=stop)
+    return stream.await_order(order_id, poll, timeout=timeout, done=done, poll_interval=poll_interval, stop=stop)
+
+
+class OrderEventStream:
+    """
+    Background subscriber for the authenticated ``user`` channel.
+
+    Usage:
+        stream = OrderEventStream(config, auth=exchange.websocket_auth)
+        engine.attach_order_events(stream)   # registers the state listener
+        stream.start()
+        ...
+        status = await_order(stream, order_id, poll, timeout=30, done=is_terminal)
+    """
+
+    def __init__(self, config: Optional[UserOrderStreamConfig] = None,
+                 auth: Optional[Callable[[str, List[str]], Dict[str, Any]]] = None,
+                 client_factory: Callable[..., WebSocketClient] = WebSocketClient):
+        self.config = config or UserOrderStreamConfig()
+        self._auth = auth
+        self._client_factory = client_factory
+        self._cond = threading.Condition()
+        self._orders: "OrderedDict[str, OrderUpdate]" = OrderedDict()
+        self._by_client: Dict[str, str] = {}
+        self._listeners: List[Callable[[OrderUpdate], None]] = []
+        self._client: Optional[WebSocketClient] = None
+        self._connected = False
+        self._synced = False
+        self._last_message_at: Optional[float] = None
+        self._last_sequence: Optional[int] = None
+        self._resync = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "messages": 0,
+            "order_updates": 0,
+            "reconnects": 0,
+            "sequence_gaps": 0,
+            "stream_waits": 0,
+            "watchdog_polls": 0,
+            "fallback_waits": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="user-order-stream", daemon=True)
+        self._thread.start()
+        logger.info("Started user order stream (%s)", self.config.url)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        with self._cond:
+            client = self._client
+        if client is not None:
+            client.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def add_listener(self, listener: Callable[[OrderUpdate], None]) -> None:
+        """Call listener(update) on the stream thread for every order update."""
+        with self._cond:
+            self._listeners.append(listener)
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def healthy(self) -> bool:
+        """Connected, snapshot applied, and no longer silent than idle_timeout."""
+        with self._cond:
+            return self._healthy()
+
+    def _healthy(self) -> bool:
+        # Caller holds self._cond
+        if not (self._connected and self._synced) or self._last_message_at is None:
+            return False
+        return time.monotonic() - self._last_message_at <= self.config.idle_timeout
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def latest(self, order_id: Optional[str] = None,
+               client_order_id: Optional[str] = None) -> Optional[OrderUpdate]:
+        with self._cond:
+            if not order_id and client_order_id:
+                order_id = self._by_client.get(client_order_id)
+            return self._orders.get(order_id) if order_id else None
+
+    def open_orders(self) -> Optional[List[Dict[str, Any]]]:
+        """Open orders as list_open_orders-shaped dicts, or None when not healthy."""
+        with self._cond:
+            if not self._healthy():
+                return None
+            return [u.to_status() for u in self._orders.values() if not u.terminal]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot["connected"] = self._connected
+            snapshot["synced"] = self._synced
+            snapshot["tracked_orders"] = len(self._orders)
+            snapshot["open_orders"] = sum(1 for u in self._orders.values() if not u.terminal)
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Waiting
+    # ------------------------------------------------------------------
+
+    def await_order(
+        self,
+        order_id: str,
+        poll: Callable[[], Optional[Dict[str, Any]]],
+        *,
+        timeout: float,
+        done: StatusPredicate,
+        poll_interval: float = 0.5,
+        stop: Optional[threading.Event] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Block until the order's status satisfies done, or timeout.
+
+        While the stream is healthy this waits on pushed updates and only
+        calls poll() (REST) once per watchdog_seconds without a resolution;
+        when the stream is not healthy it behaves like poll_order. Setting
+        ``stop`` ends the wait at the next message or poll.
+
+        Returns:
+            The status that satisfied done, else the last status seen (or None)
+        """
+        deadline = time.monotonic() + timeout
+        last: Optional[Dict[str, Any]] = None
+
+        while True:
+            remaining = deadline - time.monotonic()
+            with self._cond:
+                healthy = self._healthy()
+                if healthy:
+                    self._stats["stream_waits"] += 1
+                    window = max(0.0, min(self.config.watchdog_seconds, remaining))
+                    update = self._wait_for(order_id, done, window, stop)
+                    if update is not None:
+                        return update.to_status()
+                    current = self._orders.get(order_id)
+                    if current is not None:
+                        last = current.to_status()
+                    healthy = self._healthy()
+                    self._stats["watchdog_polls" if healthy else "fallback_waits"] += 1
+            if stop is not None and stop.is_set():
+                return last
+
+            status = poll()
+            if status:
+                last = status
+                if done(status):
+                    return status
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return last
+            if healthy:
+                continue
+            if stop is None:
+                time.sleep(min(poll_interval, remaining))
+            elif stop.wait(min(poll_interval, remaining)):
+                return last
+
+    def _wait_for(self, order_id: str, done: StatusPredicate, window: float,
+                  stop: Optional[threading.Event] = None) -> Optional[OrderUpdate]:
+        # Caller holds self._cond. Returns early (None) when the stream drops
+        # or stop is set; every message (heartbeats included) wakes the wait.
+        deadline = time.monotonic() + window
+        while True:
+            update = self._orders.get(order_id)
+            if update is not None and done(update.to_status()):
+                return update
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._healthy() or (stop is not None and stop.is_set()):
+                return None
+            self._cond.wait(remaining)
+
+    # ------------------------------------------------------------------
+    # Message handling
+    # ------------------------------------------------------------------
+
+    def handle_message(self, raw) -> None:
+        """Apply one WebSocket message (JSON text or decoded dict)."""
+        try:
+            message = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+        except ValueError:
+            logger.debug("Ignoring non-JSON user channel message")
+            return
+        if not isinstance(message, dict):
+            return
+
+        if message.get("type") == "error":
+            logger.warning("User order stream error: %s", message.get("message"))
+            return
+
+        received_at = datetime.now(timezone.utc)
+        updates: List[OrderUpdate] = []
+        with self._cond:
+            self._stats["messages"] += 1
+            self._last_message_at = time.monotonic()
+            self._check_sequence(message.get("sequence_num"))
+
+            if message.get("channel") == "user":
+                for event in message.get("events") or []:
+                    if event.get("type") == "snapshot":
+                        self._synced = True
+                    for raw_order in event.get("orders") or []:
+                        update = OrderUpdate.from_event(raw_order, received_at)
+                        if update is not None:
+                            self._store(update)
+                            updates.append(update)
+                self._stats["order_updates"] += len(updates)
+            listeners = list(self._listeners)
+            self._cond.notify_all()
+
+        for update in updates:
+            for listener in listeners:
+                try:
+                    listener(update)
+                except Exception as exc:
+                    logger.warning("Order update listener failed for %s: %s", update.order_id, exc)
+
+    def _store(self, update: OrderUpdate) -> None:
+        # Caller holds self._cond
+        self._orders[update.order_id] = update
+        self._orders.move_to_end(update.order_id)
+        if update.client_order_id:
+            self._by_client[update.client_order_id] = update.order_id
+        if len(self._orders) <= MAX_TRACKED_ORDERS:
+            return
+        for order_id, tracked in list(self._orders.items()):
+            if len(self._orders) <= MAX_TRACKED_ORDERS:
+                break
+            if tracked.terminal:
+                del self._orders[order_id]
+                if tracked.client_order_id:
+                    self._by_client.pop(tracked.client_order_id, None)
+
+    def _check_sequence(self, sequence) -> None:
+        # Caller holds self._cond
+        if sequence is None:
+            return
+        try:
+            sequence = int(sequence)
+        except (TypeError, ValueError):
+            return
+        last = self._last_sequence
+        self._last_sequence = sequence
+        if last is not None and sequence > last + 1:
+            # Missed updates: stop trusting the cache until a fresh snapshot
+            self._stats["sequence_gaps"] += 1
+            self._synced = False
+            self._resync = True
+            logger.warning("User order stream sequence gap (%d -> %d); resubscribing", last, sequence)
+
+    # ------------------------------------------------------------------
+    # Connection loop
+    # ------------------------------------------------------------------
+
+    def _subscribe(self, client: WebSocketClient, channel: str) -> None:
+        message: Dict[str, Any] = {"type": "subscribe", "channel": channel, "product_ids": []}
+        if self._auth is not None:
+            message.update(self._auth(channel, []))
+        client.send_text(json.dumps(message))
+
+    def _set_disconnected(self) -> None:
+        with self._cond:
+            self._client = None
+            self._connected = False
+            self._synced = False
+            self._cond.notify_all()  # waiters fall back to REST
+
+    def _run(self) -> None:
+        backoff = self.config.reconnect_initial_seconds
+        first = True
+        while not self._stop.is_set():
+            if not first:
+                with self._cond:
+                    self._stats["reconnects"] += 1
+            first = False
+
+            client = self._client_factory(self.config.url, connect_timeout=self.config.connect_timeout)
+            try:
+                client.connect()
+                with self._cond:
+                    self._client = client
+                    self._connected = True
+                    self._synced = False
+                    self._resync = False
+                    self._last_sequence = None
+                    self._last_message_at = time.monotonic()
+                if self.config.heartbeats:
+                    self._subscribe(client, "heartbeats")
+                self._subscribe(client, "user")
+                logger.info("User order stream connected")
+                backoff = self.config.reconnect_initial_seconds
+
+                while not self._stop.is_set():
+                    message = client.recv(timeout=1.0)
+                    if message is not None:
+                        self.handle_message(message)
+                    with self._cond:
+                        idle = time.monotonic() - (self._last_message_at or 0.0)
+                        resync = self._resync
+                    if idle > self.config.idle_timeout:
+                        raise WebSocketError(f"no messages for {self.config.idle_timeout:.0f}s")
+                    if resync:
+                        raise WebSocketError("sequence gap")
+            except Exception as e:
+                if not self._stop.is_set():
+                    logger.warning("User order stream disconnected: %s (retry in %.1fs)", e, backoff)
+            finally:
+                client.close()
+                self._set_disconnected()
+
+            if self._stop.wait(backoff):
+                break
+            backoff = min(backoff * 2, self.config.reconnect_max_seconds)
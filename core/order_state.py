@@ -10,13 +10,17 @@ Provides:
 - Lifecycle timestamps
 - Status checking
 - Telemetry hooks
+- Secondary indexes (status, symbol, exchange order_id, terminal orders in
+  completion order) so per-cycle queries do not scan order history
 """
 
 from enum import Enum
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timedelta, timezone
+from itertools import count, islice
+from typing import Optional, Dict, Any, Iterable, List
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -39,13 +43,34 @@ class OrderSide(Enum):
     SELL = "sell"
 
 
-@dataclass
+ACTIVE_STATUSES = frozenset({
+    OrderStatus.NEW.value,
+    OrderStatus.OPEN.value,
+    OrderStatus.PARTIAL_FILL.value,
+})
+TERMINAL_STATUSES = frozenset({
+    OrderStatus.FILLED.value,
+    OrderStatus.CANCELED.value,
+    OrderStatus.EXPIRED.value,
+    OrderStatus.REJECTED.value,
+    OrderStatus.FAILED.value,
+})
+
+# How long the singleton machine keeps terminal orders after completion; late
+# fills and fill reconciliation look back well within a day
+DEFAULT_TERMINAL_RETENTION_SECONDS = 24 * 3600.0
+
+
+@dataclass(slots=True)
 class OrderState:
     """
     Order state with lifecycle tracking.
 
     Tracks complete order lifecycle from creation through terminal state,
     including timestamps for each transition and execution metrics.
+
+    Orders held by an OrderStateMachine change status and order_id through
+    its transition()/update_fill() methods, which keep its indexes current.
     """
     # Identifiers
     order_id: Optional[str] = None
@@ -91,23 +116,11 @@ class OrderState:
 
     def is_terminal(self) -> bool:
         """Check if order is in terminal state"""
-        terminal_states = {
-            OrderStatus.FILLED.value,
-            OrderStatus.CANCELED.value,
-            OrderStatus.EXPIRED.value,
-            OrderStatus.REJECTED.value,
-            OrderStatus.FAILED.value
-        }
-        return self.status in terminal_states
+        return self.status in TERMINAL_STATUSES
 
     def is_active(self) -> bool:
         """Check if order is actively working"""
-        active_states = {
-            OrderStatus.NEW.value,
-            OrderStatus.OPEN.value,
-            OrderStatus.PARTIAL_FILL.value
-        }
-        return self.status in active_states
+        return self.status in ACTIVE_STATUSES
 
     def fill_percentage(self) -> float:
         """Return fill percentage (0-100)"""
@@ -165,11 +178,135 @@ class OrderStateMachine:
         OrderStatus.FAILED: set(),
     }
 
-    def __init__(self):
-        """Initialize order state machine"""
-        self.orders: Dict[str, OrderState] = {}
+    def __init__(self, terminal_retention_seconds: Optional[float] = None):
+        """
+        Initialize order state machine.
+
+        Args:
+            terminal_retention_seconds: Drop terminal orders this long after
+                they complete (None keeps them until cleanup_old_orders)
+        """
+        if terminal_retention_seconds is not None and terminal_retention_seconds <= 0:
+            raise ValueError("terminal_retention_seconds must be positive")
+        self.terminal_retention_seconds = terminal_retention_seconds
+        # Orders are created on dispatch worker threads and updated from the
+        # user-channel stream; the table and indexes change under this lock
+        self._lock = threading.RLock()
+        self._seq = count()
+        self._orders: Dict[str, OrderState] = {}
+        self._reset_indexes()
         logger.info("OrderStateMachine initialized")
 
+    @property
+    def orders(self) -> Dict[str, OrderState]:
+        """client_order_id → OrderState. Add and change orders through the machine's methods."""
+        return self._orders
+
+    @orders.setter
+    def orders(self, value: Dict[str, OrderState]) -> None:
+        with self._lock:
+            self._orders = dict(value)
+            self._reset_indexes()
+            for key, order in self._orders.items():
+                self._index(key, order)
+
+    # ------------------------------------------------------------------
+    # Indexes
+    #
+    # create_order() and transition() update these explicitly. Entries are
+    # checked against the table when read, so an order removed from
+    # ``orders`` directly (del, clear) is skipped and pruned lazily.
+    # ------------------------------------------------------------------
+
+    def _reset_indexes(self) -> None:
+        self._by_status: Dict[str, Dict[str, None]] = {}    # status -> ordered set of keys
+        self._by_symbol: Dict[str, Dict[str, None]] = {}    # symbol -> ordered set of keys
+        self._by_order_id: Dict[str, str] = {}               # exchange order_id -> key
+        self._order_seq: Dict[str, int] = {}                 # key -> insertion sequence
+        self._terminal: Dict[str, None] = {}                 # terminal keys, oldest completion first
+
+    def _index(self, key: str, order: OrderState) -> None:
+        # Caller holds self._lock
+        self._order_seq[key] = next(self._seq)
+        self._terminal.pop(key, None)
+        self._by_status.setdefault(order.status, {})[key] = None
+        self._by_symbol.setdefault(order.symbol, {})[key] = None
+        if order.order_id:
+            self._by_order_id[order.order_id] = key
+        if order.status in TERMINAL_STATUSES:
+            self._terminal[key] = None
+
+    def _index_status(self, key: str, old_status: str, new_status: str) -> None:
+        # Caller holds self._lock
+        self._discard(self._by_status, old_status, key)
+        self._by_status.setdefault(new_status, {})[key] = None
+        # Re-entering a terminal state (late fill after cancel) moves to the newest end
+        self._terminal.pop(key, None)
+        if new_status in TERMINAL_STATUSES:
+            self._terminal[key] = None
+            self._expire_terminal()
+
+    def _expire_terminal(self) -> int:
+        # Caller holds self._lock; the ring is in completion order, so stop at the first fresh order
+        if self.terminal_retention_seconds is None:
+            return 0
+        cutoff = datetime.now(timezone.utc).timestamp() - self.terminal_retention_seconds
+        expired, stale = [], []
+        for key in self._terminal:
+            order = self._orders.get(key)
+            if order is None or order.status not in TERMINAL_STATUSES:
+                stale.append(key)
+                continue
+            if order.completed_at is not None and order.completed_at.timestamp() >= cutoff:
+                break
+            expired.append(key)
+        for key in stale:
+            self._terminal.pop(key, None)
+        for key in expired:
+            self._remove(key)
+        return len(expired)
+
+    def _remove(self, key: str) -> None:
+        # Caller holds self._lock
+        order = self._orders.pop(key, None)
+        self._terminal.pop(key, None)
+        self._order_seq.pop(key, None)
+        if order is None:
+            return
+        self._discard(self._by_status, order.status, key)
+        self._discard(self._by_symbol, order.symbol, key)
+        if order.order_id and self._by_order_id.get(order.order_id) == key:
+            del self._by_order_id[order.order_id]
+
+    @staticmethod
+    def _discard(index: Dict[Any, Dict[str, None]], value: Any, key: str) -> None:
+        bucket = index.get(value)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del index[value]
+
+    def _live(self, index: Dict[str, Dict[str, None]], value: str, field_name: str) -> List[str]:
+        # Caller holds self._lock; drops keys whose order left the table or moved on
+        bucket = index.get(value)
+        if not bucket:
+            return []
+        keys, dead = [], []
+        for key in bucket:
+            order = self._orders.get(key)
+            if order is not None and getattr(order, field_name) == value:
+                keys.append(key)
+            else:
+                dead.append(key)
+        for key in dead:
+            self._discard(index, value, key)
+        return keys
+
+    def _ordered(self, keys: Iterable[str]) -> List[OrderState]:
+        # Caller holds self._lock; results keep insertion order like a dict scan
+        seq = self._order_seq
+        return [self._orders[key] for key in sorted(keys, key=lambda key: seq.get(key, -1))]
+
     def create_order(
         self,
         client_order_id: str,
@@ -193,21 +330,23 @@ class OrderStateMachine:
         Returns:
             OrderState object
         """
-        if client_order_id in self.orders:
-            logger.warning(f"Order {client_order_id} already exists")
-            return self.orders[client_order_id]
-
-        order = OrderState(
-            client_order_id=client_order_id,
-            symbol=symbol,
-            side=side.lower(),
-            size_usd=size_usd,
-            size_base=size_base,
-            route=route,
-            status=OrderStatus.NEW.value
-        )
+        with self._lock:
+            if client_order_id in self.orders:
+                logger.warning(f"Order {client_order_id} already exists")
+                return self.orders[client_order_id]
+
+            order = OrderState(
+                client_order_id=client_order_id,
+                symbol=symbol,
+                side=side.lower(),
+                size_usd=size_usd,
+                size_base=size_base,
+                route=route,
+                status=OrderStatus.NEW.value
+            )
+            self._orders[client_order_id] = order
+            self._index(client_order_id, order)
 
-        self.orders[client_order_id] = order
         logger.info(f"Created order {client_order_id}: {symbol} {side} ${size_usd:.2f}")
         return order
 
@@ -233,59 +372,66 @@ class OrderStateMachine:
         Returns:
             True if transition succeeded, False otherwise
         """
-        if client_order_id not in self.orders:
-            logger.error(f"Order {client_order_id} not found")
-            return False
-
-        order = self.orders[client_order_id]
-        current_status = OrderStatus(order.status)
+        with self._lock:
+            if client_order_id not in self.orders:
+                logger.error(f"Order {client_order_id} not found")
+                return False
 
-        # Check if transition is valid or requires override (late fill reconciliation, etc.)
-        valid_next_states = self.VALID_TRANSITIONS.get(current_status, set())
-        override_allowed = allow_override or self._should_allow_override(current_status, new_status)
+            order = self.orders[client_order_id]
+            current_status = OrderStatus(order.status)
 
-        if current_status == OrderStatus.CANCELED and new_status == OrderStatus.FILLED and not override_allowed:
-            logger.warning(
-                "Late fill detected after cancel for %s; forcing idempotent upgrade to FILLED",
-                client_order_id,
-            )
-            override_allowed = True
+            # Check if transition is valid or requires override (late fill reconciliation, etc.)
+            valid_next_states = self.VALID_TRANSITIONS.get(current_status, set())
+            override_allowed = allow_override or self._should_allow_override(current_status, new_status)
 
-        if new_status not in valid_next_states:
-            if not override_allowed:
+            if current_status == OrderStatus.CANCELED and new_status == OrderStatus.FILLED and not override_allowed:
                 logger.warning(
-                    f"Invalid transition for {client_order_id}: "
-                    f"{current_status.value} → {new_status.value}"
+                    "Late fill detected after cancel for %s; forcing idempotent upgrade to FILLED",
+                    client_order_id,
                 )
-                return False
-            logger.info(
-                "Override transition for %s: %s → %s",
-                client_order_id,
-                current_status.value,
-                new_status.value,
-            )
+                override_allowed = True
 
-        # Perform transition
-        old_status = order.status
-        order.status = new_status.value
-        now = datetime.now(timezone.utc)
+            if new_status not in valid_next_states:
+                if not override_allowed:
+                    logger.warning(
+                        f"Invalid transition for {client_order_id}: "
+                        f"{current_status.value} → {new_status.value}"
+                    )
+                    return False
+                logger.info(
+                    "Override transition for %s: %s → %s",
+                    client_order_id,
+                    current_status.value,
+                    new_status.value,
+                )
 
-        # Update timestamps
-        if new_status == OrderStatus.OPEN:
-            order.submitted_at = now
-            if order_id:
-                order.order_id = order_id
+            # Perform transition
+            old_status = order.status
+            order.status = new_status.value
+            now = datetime.now(timezone.utc)
+
+            # Update timestamps
+            if new_status == OrderStatus.OPEN:
+                order.submitted_at = now
+                if order_id and order_id != order.order_id:
+                    if order.order_id and self._by_order_id.get(order.order_id) == client_order_id:
+                        del self._by_order_id[order.order_id]
+                    order.order_id = order_id
+                    self._by_order_id[order_id] = client_order_id
+
+            elif new_status == OrderStatus.PARTIAL_FILL:
+                if not order.first_fill_at:
+                    order.first_fill_at = now
 
-        elif new_status == OrderStatus.PARTIAL_FILL:
-            if not order.first_fill_at:
-                order.first_fill_at = now
+            elif new_status in {OrderStatus.FILLED, OrderStatus.CANCELED, OrderStatus.EXPIRED, OrderStatus.REJECTED, OrderStatus.FAILED}:
+                order.completed_at = now
+                if error:
+                    order.error = error
+                if rejection_reason:
+                    order.rejection_reason = rejection_reason
 
-        elif new_status in {OrderStatus.FILLED, OrderStatus.CANCELED, OrderStatus.EXPIRED, OrderStatus.REJECTED, OrderStatus.FAILED}:
-            order.completed_at = now
-            if error:
-                order.error = error
-            if rejection_reason:
-                order.rejection_reason = rejection_reason
+            if old_status != order.status:
+                self._index_status(client_order_id, old_status, order.status)
 
         logger.info(
             f"Order {client_order_id} transitioned: "
@@ -379,61 +525,103 @@ class OrderStateMachine:
         """Get order by client_order_id"""
         return self.orders.get(client_order_id)
 
+    def get_order_by_exchange_id(self, order_id: str) -> Optional[OrderState]:
+        """Get order by exchange order_id"""
+        with self._lock:
+            key = self._by_order_id.get(order_id)
+            order = self._orders.get(key) if key is not None else None
+            if order is None or order.order_id != order_id:
+                self._by_order_id.pop(order_id, None)
+                return None
+            return order
+
     def get_active_orders(self) -> List[OrderState]:
         """Get all active (non-terminal) orders"""
-        return [order for order in self.orders.values() if order.is_active()]
+        with self._lock:
+            keys = [key for status in ACTIVE_STATUSES for key in self._live(self._by_status, status, "status")]
+            return self._ordered(keys)
 
     def get_terminal_orders(self) -> List[OrderState]:
-        """Get all terminal orders"""
-        return [order for order in self.orders.values() if order.is_terminal()]
+        """Get all terminal orders, oldest completion first"""
+        with self._lock:
+            return [self._orders[key] for key in self._terminal_keys()]
 
     def get_orders_by_status(self, status: OrderStatus) -> List[OrderState]:
         """Get orders in specific status"""
-        return [order for order in self.orders.values() if order.status == status.value]
+        with self._lock:
+            return self._ordered(self._live(self._by_status, status.value, "status"))
+
+    def get_orders_by_symbol(self, symbol: str, active_only: bool = False) -> List[OrderState]:
+        """Get orders for a trading pair"""
+        with self._lock:
+            orders = self._ordered(self._live(self._by_symbol, symbol, "symbol"))
+        if active_only:
+            return [order for order in orders if order.is_active()]
+        return orders
 
     def get_stale_orders(self, max_age_seconds: float) -> List[OrderState]:
-        """Get active orders older than max_age_seconds"""
-        return [
-            order for order in self.get_active_orders()
-            if order.age_seconds() > max_age_seconds
-        ]
+        """
+        Get active orders older than max_age_seconds, oldest first.
+
+        Only the active-status buckets are read, so the cost follows the
+        number of working orders rather than the order history.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+        stale = [order for order in self.get_active_orders() if order.created_at < cutoff]
+        stale.sort(key=lambda order: order.created_at)
+        return stale
 
     def cleanup_old_orders(self, keep_last_n: int = 100):
         """
         Remove old terminal orders, keeping only last N.
 
+        Terminal orders are kept in completion order, so this drops the
+        oldest ones without sorting. Orders past terminal_retention_seconds
+        are dropped as well.
+
         Args:
             keep_last_n: Number of terminal orders to keep
         """
-        terminal = sorted(
-            self.get_terminal_orders(),
-            key=lambda o: o.completed_at or o.created_at,
-            reverse=True
-        )
-
-        if len(terminal) > keep_last_n:
-            to_remove = terminal[keep_last_n:]
-            for order in to_remove:
-                if order.client_order_id:
-                    del self.orders[order.client_order_id]
-            logger.info(f"Cleaned up {len(to_remove)} old terminal orders")
+        with self._lock:
+            removed = self._expire_terminal()
+            if len(self._terminal) > len(self._orders):
+                self._terminal_keys()   # orders were removed from the table directly
+            excess = len(self._terminal) - keep_last_n
+            for key in list(islice(self._terminal, max(0, excess))):
+                self._remove(key)
+                removed += 1
+        if removed:
+            logger.info(f"Cleaned up {removed} old terminal orders")
+
+    def _terminal_keys(self) -> List[str]:
+        # Caller holds self._lock
+        keys, dead = [], []
+        for key in self._terminal:
+            order = self._orders.get(key)
+            (keys if order is not None and order.status in TERMINAL_STATUSES else dead).append(key)
+        for key in dead:
+            self._terminal.pop(key, None)
+        return keys
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics"""
-        orders_list = list(self.orders.values())
-        active = self.get_active_orders()
-        terminal = self.get_terminal_orders()
-
-        status_counts = {}
-        for status in OrderStatus:
-            status_counts[status.value] = len(self.get_orders_by_status(status))
+        with self._lock:
+            status_counts = {
+                status.value: len(self._live(self._by_status, status.value, "status"))
+                for status in OrderStatus
+            }
+            total = len(self._orders)
+        active = sum(status_counts[status] for status in ACTIVE_STATUSES)
+        terminal = sum(status_counts[status] for status in TERMINAL_STATUSES)
+        oldest = min((order.created_at for order in self.get_active_orders()), default=None)
+        oldest_age = (datetime.now(timezone.utc) - oldest).total_seconds() if oldest is not None else 0
 
         return {
-            "total_orders": len(orders_list),
-            "active_orders": len(active),
-            "terminal_orders": len(terminal),
+            "total_orders": total,
+            "active_orders": active,
+            "terminal_orders": terminal,
             "status_breakdown": status_counts,
-            "oldest_active_age": max([o.age_seconds() for o in active], default=0),
+            "oldest_active_age": oldest_age,
         }
 
 
@@ -445,5 +633,5 @@ def get_order_state_machine() -> OrderStateMachine:
     """Get singleton order state machine"""
     global _state_machine
     if _state_machine is None:
-        _state_machine = OrderStateMachine()
+        _state_machine = OrderStateMachine(terminal_retention_seconds=DEFAULT_TERMINAL_RETENTION_SECONDS)
     return _state_machine
@@ -0,0 +1,239 @@
+"""
+247trader-v2 Core: Quote Cache
+
+Short-lived cache for REST quotes and order book snapshots with per-key
+single-flight. Within one trading cycle the same product is quoted by the
+universe builder, account snapshot, purge/liquidation helpers and execution;
+requests inside max_age_seconds share one result, and concurrent requests for
+a key that is already being fetched wait for that call instead of issuing
+their own.
+
+Execution paths that must see a new price call invalidate(symbol) first.
+Hits, misses and coalesced waits are counted per caller label (passed as
+``caller=`` by the code path doing the lookup), so stats() shows which paths
+benefit.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from infra.config_fields import apply_fields
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, Hashable]   # (kind, key), e.g. ("quote", "BTC-USD")
+
+_COUNTERS = {"hit": "hits", "miss": "misses", "coalesced": "coalesced"}
+
+# Metrics label for lookups whose caller did not name itself
+UNLABELED = "unlabeled"
+
+
+@dataclass
+class QuoteCacheConfig:
+    """Quote cache settings (app.yaml exchange.quote_cache)."""
+    enabled: bool = True
+    max_age_seconds: float = 2.0   # Serve cached quotes/books younger than this
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "QuoteCacheConfig":
+        return apply_fields(cls(), data, "exchange.quote_cache", non_negative=("max_age_seconds",))
+
+
+class _InFlight:
+    """One pending fetch that followers wait on."""
+
+    __slots__ = ("symbol", "done", "value", "error")
+
+    def __init__(self, symbol: Hashable):
+        self.symbol = symbol
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class QuoteCache:
+    """
+    Thread-safe TTL cache with single-flight fetches.
+
+    Usage:
+        cache = QuoteCache(QuoteCacheConfig(max_age_seconds=2.0))
+        quote = cache.get("quote", "BTC-USD", lambda: fetch_quote("BTC-USD"))
+        cache.invalidate("BTC-USD")   # before pricing a live order
+    """
+
+    def __init__(
+        self,
+        config: Optional[QuoteCacheConfig] = None,
+        on_lookup: Optional[Callable[[str, str, str], None]] = None,
+    ):
+        """
+        Args:
+            config: Cache settings
+            on_lookup: Called as on_lookup(kind, caller, outcome) for every
+                lookup; outcome is "hit", "miss" or "coalesced"
+        """
+        self.config = config or QuoteCacheConfig()
+        self.on_lookup = on_lookup
+        self._entries: Dict[CacheKey, Tuple[float, Any, Hashable]] = {}   # -> (stored_at, value, symbol)
+        self._in_flight: Dict[CacheKey, _InFlight] = {}
+        # Bumped by invalidate(); results fetched under an older generation
+        # are returned to their callers but not stored
+        self._generation: Dict[Hashable, int] = defaultdict(int)
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._callers: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0, "coalesced": 0})
+
+    def get(
+        self,
+        kind: str,
+        key: Hashable,
+        fetch: Callable[[], Any],
+        symbol: Optional[Hashable] = None,
+        caller: str = UNLABELED,
+    ) -> Any:
+        """
+        Return a fresh cached value or fetch it once for all concurrent callers.
+
+        Args:
+            kind: Namespace ("quote", "orderbook")
+            key: Cache key within the namespace
+            fetch: Zero-argument loader; exceptions propagate to every waiter
+                and are not cached
+            symbol: Product the value belongs to, for invalidate() (default: key)
+            caller: Metrics label for stats() and on_lookup
+        """
+        if not self.config.enabled:
+            return fetch()
+
+        owner: Hashable = symbol if symbol is not None else key
+        cache_key = (kind, key)
+        now = time.monotonic()
+        hit: Optional[Tuple[float, Any, Hashable]] = None
+        generation = (0, 0)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and now - entry[0] <= self.config.max_age_seconds:
+                hit = entry
+                outcome = "hit"
+            else:
+                joined = self._in_flight.get(cache_key)
+                if joined is None:
+                    pending = self._in_flight[cache_key] = _InFlight(owner)
+                    generation = (self._epoch, self._generation[owner])
+                    outcome = "miss"
+                else:
+                    pending = joined
+                    outcome = "coalesced"
+            self._callers[caller][_COUNTERS[outcome]] += 1
+
+        self._notify(kind, caller, outcome)
+
+        if hit is not None:
+            return hit[1]
+        if outcome == "coalesced":
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            pending.value = fetch()
+        except BaseException as exc:
+            pending.error = exc
+            raise
+        else:
+            with self._lock:
+                if (self._epoch, self._generation[owner]) == generation:
+                    self._entries[cache_key] = (time.monotonic(), pending.value, owner)
+            return pending.value
+        finally:
+            with self._lock:
+                if self._in_flight.get(cache_key) is pending:
+                    del self._in_flight[cache_key]
+            pending.done.set()
+
+    def _notify(self, kind: str, caller: str, outcome: str) -> None:
+        if self.on_lookup is not None:
+            try:
+                self.on_lookup(kind, caller, outcome)
+            except Exception as exc:
+                logger.debug("Quote cache lookup hook failed: %s", exc)
+
+    def peek(self, kind: str, key: Hashable) -> Tuple[bool, Any]:
+        """(found, value) for a fresh entry, without fetching or counting."""
+        if not self.config.enabled:
+            return False, None
+        with self._lock:
+            entry = self._entries.get((kind, key))
+        if entry is not None and time.monotonic() - entry[0] <= self.config.max_age_seconds:
+            return True, entry[1]
+        return False, None
+
+    def record(self, kind: str, caller: str, outcome: str) -> None:
+        """
+        Count a lookup served outside get() ("hit", "miss" or "coalesced").
+
+        Used by callers that do their own single-flight (the asyncio
+        connector) but share this cache's entries and stats.
+        """
+        with self._lock:
+            self._callers[caller][_COUNTERS[outcome]] += 1
+        self._notify(kind, caller, outcome)
+
+    def token(self, symbol: Hashable) -> Tuple[int, int]:
+        """Invalidation token for symbol; pass to put() to drop values fetched before an invalidate()."""
+        with self._lock:
+            return self._epoch, self._generation[symbol]
+
+    def put(self, kind: str, key: Hashable, value: Any, symbol: Optional[Hashable] = None,
+            token: Optional[Tuple[int, int]] = None) -> None:
+        """Store a value obtained elsewhere (e.g. a bulk quote request)."""
+        if not self.config.enabled:
+            return
+        owner: Hashable = symbol if symbol is not None else key
+        with self._lock:
+            if token is not None and token != (self._epoch, self._generation[owner]):
+                return
+            self._entries[(kind, key)] = (time.monotonic(), value, owner)
+
+    def invalidate(self, symbol: Optional[str] = None) -> int:
+        """
+        Drop cached values for symbol (all symbols when None).
+
+        Fetches already in flight still complete for their existing waiters but
+        are not stored, and later callers start a new fetch instead of joining
+        them. Returns the number of entries dropped.
+        """
+        with self._lock:
+            if symbol is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._in_flight.clear()
+                self._epoch += 1
+                return dropped
+            self._generation[symbol] += 1
+            for k in [k for k, pending in self._in_flight.items() if pending.symbol == symbol]:
+                del self._in_flight[k]
+            stale = [k for k, entry in self._entries.items() if entry[2] == symbol]
+            for k in stale:
+                del self._entries[k]
+            return len(stale)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-caller hits/misses/coalesced and hit_rate (hits + coalesced over requests)."""
+        with self._lock:
+            report = {}
+            for caller, counts in self._callers.items():
+                total = counts["hits"] + counts["misses"] + counts["coalesced"]
+                report[caller] = dict(counts, hit_rate=(counts["hits"] + counts["coalesced"]) / total if total else 0.0)
+            return report
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._callers.clear()
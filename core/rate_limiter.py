@@ -13,6 +13,7 @@ Coinbase Advanced Trade API Limits (as of 2024):
 Pattern: Token bucket with endpoint-specific quotas
 """
 
+import asyncio
 import time
 import logging
 from collections import deque
@@ -38,6 +39,9 @@ class EndpointQuota:
     calls: deque = field(init=False, default_factory=lambda: deque())
     violations: int = 0
 
+    # Guards bucket state when worker threads share the quota
+    _lock: Lock = field(init=False, default_factory=Lock, repr=False, compare=False)
+
     def __post_init__(self):
         self.tokens = self.requests_per_second
 
@@ -47,17 +51,20 @@ class EndpointQuota:
         now = time.monotonic()
         cutoff = now - self.window_seconds
 
-        # Clean old calls
-        while self.calls and self.calls[0] < cutoff:
-            self.calls.popleft()
+        with self._lock:
+            # Clean old calls
+            while self.calls and self.calls[0] < cutoff:
+                self.calls.popleft()
+            count = len(self.calls)
 
-        return len(self.calls) / self.requests_per_second if self.requests_per_second > 0 else 0.0
+        return count / self.requests_per_second if self.requests_per_second > 0 else 0.0
 
     @property
     def available_tokens(self) -> float:
         """Tokens available after refill"""
-        self._refill()
-        return self.tokens
+        with self._lock:
+            self._refill()
+            return self.tokens
 
     def _refill(self):
         """Refill tokens based on elapsed time"""
@@ -76,14 +83,38 @@ class EndpointQuota:
         Returns:
             True if tokens acquired, False if insufficient
         """
-        self._refill()
+        with self._lock:
+            self._refill()
 
-        if self.tokens >= tokens:
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                self.calls.append(time.monotonic())
+                return True
+
+        return False
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens unconditionally and return the delay before they are valid.
+
+        The bucket may go negative; later callers queue behind earlier
+        reservations, so concurrent waiters are served in arrival order
+        without re-checking after they sleep.
+
+        Returns:
+            Seconds the caller must wait before issuing the request
+        """
+        with self._lock:
+            self._refill()
             self.tokens -= tokens
+            delay = -self.tokens / self.requests_per_second if self.tokens < 0 else 0.0
             self.calls.append(time.monotonic())
-            return True
+            return delay
 
-        return False
+    def record_call(self) -> None:
+        """Record a call that bypassed the token bucket."""
+        with self._lock:
+            self.calls.append(time.monotonic())
 
     def wait_time(self, tokens: float = 1.0) -> float:
         """
@@ -92,13 +123,14 @@ class EndpointQuota:
         Returns:
             0.0 if tokens available now, otherwise seconds to wait
         """
-        self._refill()
+        with self._lock:
+            self._refill()
 
-        if self.tokens >= tokens:
-            return 0.0
+            if self.tokens >= tokens:
+                return 0.0
 
-        # Calculate time needed to refill required tokens
-        tokens_needed = tokens - self.tokens
+            # Calculate time needed to refill required tokens
+            tokens_needed = tokens - self.tokens
         return tokens_needed / self.requests_per_second
 
 
@@ -243,25 +275,46 @@ class RateLimiter:
         quota = self._get_or_create_quota(endpoint, is_private)
 
         if wait:
-            wait_time = quota.wait_time(tokens)
+            # Reserve first, sleep outside the lock: concurrent callers each
+            # get their own slot instead of racing for the same refill.
+            wait_time = quota.reserve(tokens)
             if wait_time > 0:
                 logger.debug(f"Rate limiting {endpoint}: waiting {wait_time:.3f}s")
                 time.sleep(wait_time)
+            acquired = True
+        else:
+            acquired = quota.acquire(tokens)
+            if not acquired:
+                quota.violations += 1
 
-        acquired = quota.acquire(tokens)
+        # Check for high utilization
+        if acquired:
+            self._check_utilization(endpoint, quota)
 
-        if not acquired and not wait:
-            quota.violations += 1
+        return acquired
 
-        # Check for high utilization
-        if acquired and quota.utilization >= self.alert_threshold:
+    async def acquire_async(self, endpoint: str, is_private: bool = False, tokens: float = 1.0) -> bool:
+        """
+        Coroutine form of acquire(wait=True).
+
+        Waits on the event loop instead of blocking the thread, so many
+        requests can queue for tokens concurrently on one loop.
+        """
+        quota = self._get_or_create_quota(endpoint, is_private)
+        wait_time = quota.reserve(tokens)
+        if wait_time > 0:
+            logger.debug(f"Rate limiting {endpoint}: waiting {wait_time:.3f}s")
+            await asyncio.sleep(wait_time)
+        self._check_utilization(endpoint, quota)
+        return True
+
+    def _check_utilization(self, endpoint: str, quota: EndpointQuota) -> None:
+        if quota.utilization >= self.alert_threshold:
             logger.warning(
                 f"High rate limit utilization for {endpoint}: "
                 f"{quota.utilization:.1%} (threshold: {self.alert_threshold:.1%})"
             )
 
-        return acquired
-
     def record(self, endpoint: str, is_private: bool = False, violated: bool = False):
         """
         Record API call for tracking (use when not using acquire()).
@@ -272,7 +325,7 @@ class RateLimiter:
             violated: Whether this call resulted in 429 response
         """
         quota = self._get_or_create_quota(endpoint, is_private)
-        quota.calls.append(time.monotonic())
+        quota.record_call()
 
         if violated:
             quota.violations += 1
@@ -310,14 +363,13 @@ class RateLimiter:
         """Reset rate limiter state (for testing)"""
         with self._lock:
             if endpoint:
-                if endpoint in self._quotas:
-                    quota = self._quotas[endpoint]
-                    quota.tokens = quota.requests_per_second
-                    quota.calls.clear()
-                    quota.violations = 0
+                quotas = [self._quotas[endpoint]] if endpoint in self._quotas else []
             else:
                 # Reset all
-                for quota in self._quotas.values():
+                quotas = list(self._quotas.values())
+            for quota in quotas:
+                with quota._lock:
                     quota.tokens = quota.requests_per_second
+                    quota.last_refill = time.monotonic()
                     quota.calls.clear()
                     quota.violations = 0
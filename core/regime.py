@@ -4,13 +4,30 @@
 Simple market regime classifier: bull / chop / bear / crash
 Based on BTC trend and volatility.
 
+RegimeDetector classifies a candle list from scratch. IncrementalRegimeDetector
+keeps rolling state instead: each closed candle updates every horizon's return
+window (Welford mean/variance with eviction) in O(1), so 1d/7d/30d regimes are
+all available after every update, and the state can be checkpointed to JSON.
+
 No AI - just math on BTC-USD.
 """
 
-from typing import List, Literal
-from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Literal, Optional, Sequence, Tuple
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
+import json
 import logging
+import math
+import os
+import tempfile
+import threading
+import time
+
+from core.candle_resampler import granularity_seconds
+from core.candles import CandleSeries, candle_epoch, column
+from infra.config_fields import apply_fields
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +66,7 @@ class RegimeDetector:
         Detect current market regime from BTC candles.
 
         Args:
-            btc_candles: List of OHLCV candles (sorted by time)
+            btc_candles: OHLCV candles or a CandleSeries (sorted by time)
             lookback_days: Days to look back
 
         Returns:
@@ -68,17 +85,16 @@ class RegimeDetector:
 
         # Calculate trend (% change over lookback)
         lookback_hours = lookback_days * 24
-        start_price = btc_candles[-lookback_hours].close
-        current_price = btc_candles[-1].close
+        closes = column(btc_candles[-lookback_hours:], "close")
+        start_price = closes[0]
+        current_price = closes[-1]
         trend_pct = ((current_price - start_price) / start_price) * 100
 
         # Calculate realized volatility (std dev of hourly returns)
         hourly_returns = []
-        for i in range(-lookback_hours, 0):
-            if i == -lookback_hours:
-                continue
-            prev_close = btc_candles[i-1].close
-            curr_close = btc_candles[i].close
+        for i in range(1, len(closes)):
+            prev_close = closes[i-1]
+            curr_close = closes[i]
             ret = ((curr_close - prev_close) / prev_close) * 100
             hourly_returns.append(ret)
 
@@ -171,6 +187,388 @@ class RegimeDetector:
         return multipliers.get(regime, multipliers["chop"])
 
 
+PERSIST_VERSION = 1
+
+
+@dataclass
+class RegimeStateConfig:
+    """Incremental regime detector settings (app.yaml regime_detector)."""
+    enabled: bool = True
+    symbol: str = "BTC-USD"
+    interval: str = "1h"
+    horizons: Dict[str, float] = field(default_factory=lambda: {"1d": 1.0, "7d": 7.0, "30d": 30.0})
+    primary: str = "7d"                       # Horizon that sets the trading regime
+    persist_path: Optional[str] = None        # JSON checkpoint; None keeps the state in memory
+    persist_interval_seconds: float = 300.0   # Minimum spacing between periodic saves
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "RegimeStateConfig":
+        config = apply_fields(cls(), data, "regime_detector", non_negative=("persist_interval_seconds",))
+        if not data:
+            return config
+
+        if granularity_seconds(config.interval) is None:
+            logger.warning("Unknown regime_detector.interval=%r; using 1h", config.interval)
+            config.interval = "1h"
+
+        horizons = data.get("horizons")
+        if isinstance(horizons, dict) and horizons:
+            parsed = {}
+            for name, days in horizons.items():
+                try:
+                    if float(days) > 0:
+                        parsed[str(name)] = float(days)
+                        continue
+                except (TypeError, ValueError):
+                    pass
+                logger.warning("Invalid regime_detector.horizons.%s=%r; skipped", name, days)
+            if parsed:
+                config.horizons = parsed
+        if config.primary not in config.horizons:
+            fallback = next(iter(config.horizons))
+            logger.warning("regime_detector.primary=%r is not a horizon; using %s", config.primary, fallback)
+            config.primary = fallback
+
+        persist_path = data.get("persist_path")
+        config.persist_path = str(persist_path) if persist_path else None
+
+        return config
+
+
+def _welford_add(count: int, mean: float, m2: float, x: float) -> Tuple[int, float, float]:
+    count += 1
+    delta = x - mean
+    mean += delta / count
+    return count, mean, m2 + delta * (x - mean)
+
+
+def _welford_remove(count: int, mean: float, m2: float, x: float) -> Tuple[int, float, float]:
+    if count <= 1:
+        return 0, 0.0, 0.0
+    new_mean = (count * mean - x) / (count - 1)
+    return count - 1, new_mean, max(m2 - (x - mean) * (x - new_mean), 0.0)
+
+
+class RollingStats:
+    """
+    Mean and sample variance of the last `window` values.
+
+    Welford updates with eviction: O(1) per push. The moments are recomputed
+    from the window once every `window` pushes so float drift stays bounded
+    (amortized O(1)).
+    """
+
+    __slots__ = ("window", "values", "mean", "_m2", "_pushes")
+
+    def __init__(self, window: int):
+        self.window = max(int(window), 1)
+        self.values: Deque[float] = deque()
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._pushes = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, x: float) -> None:
+        count = len(self.values)
+        if count == self.window:
+            count, self.mean, self._m2 = _welford_remove(count, self.mean, self._m2, self.values.popleft())
+        self.values.append(x)
+        _, self.mean, self._m2 = _welford_add(count, self.mean, self._m2, x)
+        self._pushes += 1
+        if self._pushes >= self.window:
+            self._resync()
+
+    def _resync(self) -> None:
+        count, mean, m2 = 0, 0.0, 0.0
+        for value in self.values:
+            count, mean, m2 = _welford_add(count, mean, m2, value)
+        self.mean, self._m2, self._pushes = mean, m2, 0
+
+    @property
+    def variance(self) -> float:
+        count = len(self.values)
+        return self._m2 / (count - 1) if count > 1 else 0.0
+
+    def stats_with(self, x: float) -> Tuple[int, float, float]:
+        """(count, mean, sample variance) of the window plus x, without committing x."""
+        count, mean, m2 = _welford_add(len(self.values), self.mean, self._m2, x)
+        return count, mean, m2 / (count - 1) if count > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"values": list(self.values)}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        self.values = deque(float(v) for v in data["values"][-self.window:])
+        self._resync()
+
+
+class _Horizon:
+    """Rolling trend/volatility inputs for one lookback, `bars` candles including the open one."""
+
+    __slots__ = ("name", "days", "bars", "closes", "returns")
+
+    def __init__(self, name: str, days: float, bars: int):
+        self.name = name
+        self.days = days
+        self.bars = max(bars, 2)
+        self.closes: Deque[float] = deque(maxlen=self.bars - 1)     # Closed candles in the window
+        self.returns = RollingStats(max(self.bars - 2, 1))          # % returns between them
+
+    def advance(self, close: float) -> None:
+        if self.closes and self.closes[-1] > 0:
+            prev = self.closes[-1]
+            self.returns.push((close - prev) / prev * 100)
+        self.closes.append(close)
+
+    def read(self, close: float) -> Optional[Tuple[float, float]]:
+        """(trend %, hourly-return std %) with `close` as the open candle; None during warm-up."""
+        if len(self.closes) < self.bars - 1 or self.closes[0] <= 0 or self.closes[-1] <= 0:
+            return None
+        trend_pct = (close - self.closes[0]) / self.closes[0] * 100
+        last = (close - self.closes[-1]) / self.closes[-1] * 100
+        count, _, variance = self.returns.stats_with(last)
+        return trend_pct, math.sqrt(variance) if count > 1 else 0.0
+
+
+class IncrementalRegimeDetector(RegimeDetector):
+    """
+    Regime detector with rolling per-horizon state.
+
+    Closed candles are committed once (advance); the newest candle is still
+    forming and only read, so sync(candles) classifies exactly what
+    RegimeDetector.detect would over the same candles, per horizon.
+
+    Usage:
+        detector = IncrementalRegimeDetector(RegimeStateConfig(persist_path="data/regime_state.json"))
+        detector.load()
+        signals = detector.sync(btc_candles)     # {"1d": RegimeSignal, "7d": ..., "30d": ...}
+        regime = detector.signal().regime        # primary horizon
+    """
+
+    def __init__(self, config: Optional[RegimeStateConfig] = None):
+        super().__init__()
+        self.config = config or RegimeStateConfig()
+        self.interval_seconds = granularity_seconds(self.config.interval) or 3600
+        self._bars_per_year = 365 * 86400 / self.interval_seconds
+        self._lock = threading.Lock()
+        self._last_persist = time.monotonic()
+        self._dirty = False
+        self._stats = {"incremental": 0, "rebuilds": 0, "bars_committed": 0}
+        self._reset()
+
+    def _reset(self) -> None:
+        self._horizons = {
+            name: _Horizon(name, days, int(round(days * 86400 / self.interval_seconds)))
+            for name, days in self.config.horizons.items()
+        }
+        self.last_closed: Optional[int] = None    # Epoch of the newest committed candle
+        self.last_close: Optional[float] = None
+        self.open_close: Optional[float] = None   # Close of the still-forming candle
+        self.bars = 0
+
+    @property
+    def max_bars(self) -> int:
+        """Candles the longest horizon needs, including the open one."""
+        return max(h.bars for h in self._horizons.values())
+
+    def advance(self, close: float, epoch: Optional[int] = None) -> None:
+        """Commit one closed candle to every horizon."""
+        for horizon in self._horizons.values():
+            horizon.advance(close)
+        self.last_close = close
+        if epoch is not None:
+            self.last_closed = epoch
+        self.bars += 1
+
+    def sync(self, candles: Sequence[Any]) -> Dict[str, RegimeSignal]:
+        """
+        Commit candles newer than the last committed one (all but the newest,
+        which is still forming) and return the regime for every horizon.
+
+        The state is rebuilt from candles when they do not continue it: no
+        overlap with the committed candle, a revised committed close, or
+        timestamps that do not advance.
+        """
+        with self._lock:
+            if len(candles):
+                closes = column(candles, "close")
+                epochs = candles.epochs if isinstance(candles, CandleSeries) else [candle_epoch(c) for c in candles]
+                start = self._resume_index(closes, epochs)
+                if start is None:
+                    self._reset()
+                    start = 0
+                    self._stats["rebuilds"] += 1
+                else:
+                    self._stats["incremental"] += 1
+                newest = len(closes) - 1
+                for i in range(start, newest):
+                    self.advance(closes[i], epochs[i])
+                self._stats["bars_committed"] += max(newest - start, 0)
+                self.open_close = closes[newest]
+                self._dirty = True
+            return self._signals()
+
+    def _resume_index(self, closes: Sequence[float], epochs: Sequence[Optional[int]]) -> Optional[int]:
+        """Index of the first candle to commit onto the state, or None to rebuild."""
+        if self.last_closed is None or len(closes) < 2:
+            return None
+        if epochs[-1] is None or epochs[-1] <= self.last_closed:
+            return None
+        for i in range(len(closes) - 2, -1, -1):
+            epoch = epochs[i]
+            if epoch is None or epoch < self.last_closed:
+                return None
+            if epoch == self.last_closed:
+                return i + 1 if closes[i] == self.last_close else None
+        return None
+
+    def signals(self) -> Dict[str, RegimeSignal]:
+        """Regime per horizon at the current open candle."""
+        with self._lock:
+            return self._signals()
+
+    def signal(self, horizon: Optional[str] = None) -> RegimeSignal:
+        """Regime for one horizon (default: the primary one)."""
+        with self._lock:
+            return self._signal(self._horizons[horizon or self.config.primary])
+
+    def _signals(self) -> Dict[str, RegimeSignal]:
+        return {name: self._signal(h) for name, h in self._horizons.items()}
+
+    def _signal(self, horizon: _Horizon) -> RegimeSignal:
+        reading = horizon.read(self.open_close) if self.open_close is not None else None
+        if reading is None:
+            return RegimeSignal(
+                regime="chop",
+                confidence=0.5,
+                btc_trend_pct=0.0,
+                volatility_pct=0.0,
+                timestamp=datetime.now(timezone.utc),
+                reason="Insufficient data - defaulting to chop"
+            )
+        trend_pct, vol = reading
+        vol_annual_pct = vol * self._bars_per_year ** 0.5
+        regime, confidence, reason = self._classify(trend_pct, vol_annual_pct)
+        return RegimeSignal(
+            regime=regime,
+            confidence=confidence,
+            btc_trend_pct=trend_pct,
+            volatility_pct=vol_annual_pct,
+            timestamp=datetime.now(timezone.utc),
+            reason=reason
+        )
+
+    def detect(self, btc_candles: List, lookback_days: int = 7) -> RegimeSignal:
+        """
+        RegimeDetector.detect on the rolling state: candles continuing it are
+        committed incrementally. Lookbacks that are not a configured horizon
+        fall back to the full recomputation.
+        """
+        horizon = next((n for n, h in self._horizons.items() if h.days == lookback_days), None)
+        if horizon is None:
+            return super().detect(btc_candles, lookback_days)
+
+        signal = self.sync(btc_candles)[horizon]
+        logger.info(
+            f"Regime: {signal.regime.upper()} (conf={signal.confidence:.2f}) | "
+            f"BTC trend: {signal.btc_trend_pct:+.1f}% | Vol: {signal.volatility_pct:.0f}%"
+        )
+        return signal
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, bars=self.bars)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _layout(self) -> Dict[str, Any]:
+        return {"symbol": self.config.symbol, "interval": self.config.interval,
+                "horizons": {name: h.bars for name, h in self._horizons.items()}}
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "layout": self._layout(),
+                "last_closed": self.last_closed,
+                "last_close": self.last_close,
+                "open_close": self.open_close,
+                "bars": self.bars,
+                "horizons": {
+                    name: {"closes": list(h.closes), "returns": h.returns.to_dict()}
+                    for name, h in self._horizons.items()
+                },
+            }
+
+    def restore(self, data: Dict[str, Any]) -> bool:
+        """Restore a to_dict() checkpoint; False when it was taken with other horizons or interval."""
+        if data.get("layout") != self._layout():
+            return False
+        with self._lock:
+            self._reset()
+            for name, h in self._horizons.items():
+                saved = data["horizons"][name]
+                h.closes.extend(float(v) for v in saved["closes"])
+                h.returns.restore(saved["returns"])
+            self.last_closed = data["last_closed"]
+            self.last_close = data["last_close"]
+            self.open_close = data["open_close"]
+            self.bars = int(data["bars"])
+        return True
+
+    def load(self) -> bool:
+        """Restore the checkpoint at persist_path. Returns True when restored."""
+        if not self.config.persist_path:
+            return False
+        path = Path(self.config.persist_path)
+        if not path.exists():
+            return False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != PERSIST_VERSION:
+                logger.warning("Ignoring regime state %s: unsupported version %r", path, payload.get("version"))
+                return False
+            if not self.restore(payload["state"]):
+                logger.info("Ignoring regime state %s: horizons or interval changed", path)
+                return False
+        except Exception as exc:
+            logger.warning("Failed to load regime state %s: %s", path, exc)
+            return False
+        logger.info("Loaded regime state (%d bars) from %s", self.bars, path)
+        return True
+
+    def save(self) -> bool:
+        """Write the checkpoint to persist_path atomically. Returns True when written."""
+        if not self.config.persist_path:
+            return False
+        path = Path(self.config.persist_path)
+        payload = {"version": PERSIST_VERSION, "saved_at": datetime.now().isoformat(), "state": self.to_dict()}
+        self._dirty = False
+        self._last_persist = time.monotonic()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".regime_", suffix=".json.tmp")
+            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except Exception as exc:
+            logger.warning("Failed to persist regime state %s: %s", path, exc)
+            return False
+        return True
+
+    def maybe_save(self, force: bool = False) -> bool:
+        """Save when something changed and persist_interval_seconds has elapsed (or force)."""
+        if not self.config.persist_path or not self._dirty:
+            return False
+        if not force and time.monotonic() - self._last_persist < self.config.persist_interval_seconds:
+            return False
+        return self.save()
+
+
 def test_regime_detector():
     """Test regime detection"""
     from dataclasses import dataclass as dc
@@ -256,6 +256,8 @@ class RiskEngine:
     Returns: approved=True + vetoed proposals, OR approved=False + reason
     """
 
+    _market_data = None   # MarketDataContext for the check_all in progress
+
     def __init__(self, policy: Dict, universe_manager=None, exchange=None, state_store=None, alert_service=None):
         self.policy = policy
         self.risk_config = policy.get("risk", {})
@@ -723,11 +725,12 @@ class RiskEngine:
     def _safe_mid_price(self, product: str) -> float:
         """Best-effort mid-price for exposure estimation (non-critical)."""
 
-        if not self.exchange:
+        source = self._market_data if self._market_data is not None else self.exchange
+        if not source:
             return 0.0
 
         try:
-            quote = self.exchange.get_quote(product)
+            quote = source.get_quote(product, caller="RiskEngine._safe_mid_price")
             return float(getattr(quote, "mid", 0.0) or 0.0)
         except Exception:
             return 0.0
@@ -735,7 +738,8 @@ class RiskEngine:
     def check_all(self, 
                   proposals: List[TradeProposal],
                   portfolio: PortfolioState,
-                  regime: str = "chop") -> RiskCheckResult:
+                  regime: str = "chop",
+                  market_data=None) -> RiskCheckResult:
         """
         Run all risk checks on trade proposals.
 
@@ -743,10 +747,22 @@ class RiskEngine:
             proposals: List of proposed trades
             portfolio: Current portfolio state
             regime: Market regime
+            market_data: Cycle's MarketDataContext; exposure estimates price
+                through it instead of re-quoting the exchange
 
         Returns:
             RiskCheckResult with approved proposals or rejection reason
         """
+        self._market_data = market_data
+        try:
+            return self._check_all(proposals, portfolio, regime)
+        finally:
+            self._market_data = None
+
+    def _check_all(self,
+                   proposals: List[TradeProposal],
+                   portfolio: PortfolioState,
+                   regime: str) -> RiskCheckResult:
         original_proposal_count = len(proposals)
         logger.info(f"Running risk checks on {original_proposal_count} proposals (regime={regime})")
 
@@ -14,6 +14,7 @@ from typing import List, Optional, Dict, Any
 import logging
 
 from core.universe import UniverseManager, UniverseSnapshot
+from core.market_data_context import MarketDataContext
 from core.triggers import TriggerEngine, TriggerSignal
 from core.regime import RegimeDetector
 from strategy.rules_engine import TradeProposal
@@ -35,6 +36,7 @@ class CycleResult:
     executed: List[TradeProposal]
     no_trade_reason: Optional[str]
     error: Optional[str] = None
+    market_data_report: Optional[Dict[str, Any]] = None
 
 
 class TradingCyclePipeline:
@@ -84,7 +86,8 @@ class TradingCyclePipeline:
                       regime: str,
                       cycle_number: int,
                       state: Optional[Dict[str, Any]] = None,
-                      trigger_provider: Optional[callable] = None) -> CycleResult:
+                      trigger_provider: Optional[callable] = None,
+                      market_data: Optional[MarketDataContext] = None) -> CycleResult:
         """
         Execute one trading cycle through the pipeline.
 
@@ -96,14 +99,31 @@ class TradingCyclePipeline:
             state: Optional state dict for strategies
             trigger_provider: Optional callback(universe, current_time, regime) -> List[TriggerSignal]
                             Used by backtesting to provide historical triggers
+            market_data: Cycle's MarketDataContext, shared by the universe,
+                trigger, strategy and risk stages; its fetch report is
+                attached to the result
 
         Returns:
             CycleResult with universe, triggers, proposals, approvals
         """
+        result = self._run_cycle(current_time, portfolio, regime, cycle_number,
+                                 state, trigger_provider, market_data)
+        if market_data is not None:
+            result.market_data_report = market_data.report()
+        return result
+
+    def _run_cycle(self,
+                   current_time: datetime,
+                   portfolio: PortfolioState,
+                   regime: str,
+                   cycle_number: int,
+                   state: Optional[Dict[str, Any]],
+                   trigger_provider: Optional[callable],
+                   market_data: Optional[MarketDataContext]) -> CycleResult:
         try:
             # Step 1: Build universe
             logger.debug(f"Pipeline Step 1: Building universe (regime={regime})")
-            universe = self.universe_mgr.get_universe(regime=regime)
+            universe = self.universe_mgr.get_universe(regime=regime, market_data=market_data)
 
             if not universe or universe.total_eligible == 0:
                 return CycleResult(
@@ -130,7 +150,7 @@ class TradingCyclePipeline:
             else:
                 # Live mode: use trigger engine with live exchange data
                 all_assets = universe.get_all_eligible()
-                triggers = self.trigger_engine.scan(all_assets, regime=regime)
+                triggers = self.trigger_engine.scan(all_assets, regime=regime, market_data=market_data)
 
             if not triggers or len(triggers) == 0:
                 return CycleResult(
@@ -155,7 +175,8 @@ class TradingCyclePipeline:
                     regime=regime,
                     timestamp=current_time,
                     cycle_number=cycle_number,
-                    state=state or {}
+                    state=state or {},
+                    market_data=market_data.view() if market_data is not None else None,
                 )
 
                 base_proposals = self.strategy_registry.aggregate_proposals(strategy_context)
@@ -184,7 +205,8 @@ class TradingCyclePipeline:
 
             # Step 4: Risk approval
             logger.debug("Pipeline Step 4: Risk approval")
-            risk_result = self.risk_engine.check_all(base_proposals, portfolio, regime=regime)
+            risk_result = self.risk_engine.check_all(base_proposals, portfolio, regime=regime,
+                                                     market_data=market_data)
 
             if not risk_result.approved:
                 logger.debug(f"Risk rejection: {risk_result.reason}")
@@ -0,0 +1,188 @@
+"""
+247trader-v2 Core: Trigger Matrix
+
+Cross-sectional trigger screening for TriggerEngine.scan.
+
+The closes the checks compare (the open candle, the four bars before it and
+the bar 23 hours back) are laid out as a NumPy (bar offset x asset) float64
+matrix, next to per-asset vectors of the window aggregates the checks use
+(open-bar volume, 24h volume, breakout high/low). Price-move, volume-spike,
+breakout and momentum conditions are then evaluated across the whole
+universe as boolean masks, instead of four Python checks per asset. The
+arithmetic is the same IEEE float64 operations, in the same order, that the
+per-asset checks perform.
+
+The matrix is filled from each asset's streaming IndicatorState, so building
+it costs a few reads per asset rather than a pass over the candles, and it
+sees the exact values the per-asset checks read. Comparisons keep a tiny
+tolerance at the threshold so the screen never drops a pair a check would
+accept; screened pairs are confirmed by the per-asset checks, which build the
+TriggerSignal objects, so the scan returns what the per-symbol loop does.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TRIGGER_TYPES = ("price_move", "volume_spike", "breakout", "momentum")
+
+TOLERANCE = 1e-9          # Relative slack on threshold comparisons
+PRICE_MOVE_MIN_BARS = 60  # _check_price_move needs this much history
+MOMENTUM_BARS = 24        # 24h return: open candle vs 23 bars before it
+VOLUME_WINDOW = 24
+
+# Bar offsets held per column, oldest first (0 = open candle)
+BAR_OFFSETS = (MOMENTUM_BARS - 1, 4, 3, 2, 1, 0)
+
+
+@dataclass
+class ScreenThresholds:
+    pct_15m: float
+    pct_60m: float
+    volume_ratio: float
+    breakout_lookback: int
+    only_upside: bool
+    regime: str
+
+
+@dataclass
+class CandleMatrix:
+    """Recent closes and window aggregates of many assets, one column per asset."""
+    members: List[int]       # Position of each column's asset in the input
+    counts: List[int]        # Candles each column's asset was scanned with
+    close: np.ndarray        # (len(BAR_OFFSETS), width); close[-1] is the open candle
+    volume: np.ndarray       # Open-candle volume
+    volume_total: np.ndarray # Volume over the last 24 bars, open candle included
+    high: np.ndarray         # Breakout-window high, open candle included
+    low: np.ndarray          # Breakout-window low, open candle included
+
+    @property
+    def width(self) -> int:
+        return len(self.members)
+
+    @classmethod
+    def from_views(cls, views: Sequence[Any], counts: Sequence[int]) -> Tuple["CandleMatrix", List[int]]:
+        """
+        Lay out IndicatorState views (one per asset) as matrix columns.
+
+        Assets with fewer than MOMENTUM_BARS candles or a non-positive
+        price are left out.
+
+        Returns:
+            (matrix, positions of the assets left out)
+        """
+        members: List[int] = []
+        member_counts: List[int] = []
+        closes: List[Tuple[float, ...]] = []
+        aggregates: List[Tuple[float, float, float, float]] = []
+        left_out: List[int] = []
+        for position, (view, count) in enumerate(zip(views, counts)):
+            try:
+                history, open_bar = view.closes, view.open_bar
+                if (count < MOMENTUM_BARS or open_bar is None or len(history) < MOMENTUM_BARS - 1
+                        or view.params.volume_window != VOLUME_WINDOW):
+                    left_out.append(position)
+                    continue
+                # Deque reads near either end are O(1); the middle of the window is never needed
+                column = (history[-23], history[-4], history[-3], history[-2], history[-1], open_bar[2])
+                high, low = view.breakout_range()
+                if min(column) <= 0 or low <= 0:
+                    left_out.append(position)
+                    continue
+                row = (open_bar[3], view.volume_sum(), high, low)
+            except (TypeError, ValueError, AttributeError, IndexError):
+                left_out.append(position)
+                continue
+            members.append(position)
+            member_counts.append(count)
+            closes.append(column)
+            aggregates.append(row)
+
+        close = np.array(closes, dtype=np.float64).reshape(len(members), len(BAR_OFFSETS)).T
+        volume, volume_total, high, low = np.array(aggregates, dtype=np.float64).reshape(len(members), 4).T
+        return cls(members, member_counts, close, volume, volume_total, high, low), left_out
+
+
+# ----------------------------------------------------------------------
+# Column operations (element-wise across assets)
+# ----------------------------------------------------------------------
+
+
+def _pct(new: np.ndarray, old: np.ndarray) -> np.ndarray:
+    """(new - old) / old * 100, same operation order as indicators.pct_change."""
+    return (new - old) / old * 100.0
+
+
+def _at_least(values: np.ndarray, threshold: float) -> np.ndarray:
+    return values >= threshold - TOLERANCE * max(abs(threshold), 1.0)
+
+
+# Trigger-type tuple for each 4-bit combination of fired flags
+_COMBINATIONS = [
+    tuple(name for bit, name in enumerate(TRIGGER_TYPES) if code >> bit & 1)
+    for code in range(1 << len(TRIGGER_TYPES))
+]
+
+
+def screen(matrix: CandleMatrix, thresholds: ScreenThresholds) -> List[Tuple[str, ...]]:
+    """
+    Trigger types worth confirming for each matrix column.
+
+    Mirrors the firing conditions of TriggerEngine's price-move,
+    volume-spike, breakout and momentum checks.
+    """
+    if matrix.width == 0:
+        return []
+    close = matrix.close
+    last = close[-1]
+    counts = np.asarray(matrix.counts)
+
+    # Price move: largest and latest of the last four 1h moves
+    moves = np.abs(_pct(close[-4:], close[-5:-1]))
+    price_move = (counts >= PRICE_MOVE_MIN_BARS) & (
+        _at_least(moves.max(axis=0), thresholds.pct_15m) | _at_least(moves[-1], thresholds.pct_60m)
+    )
+
+    # Volume spike: last bar vs 24h average hourly volume
+    total = matrix.volume_total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(total != 0, matrix.volume / (total / VOLUME_WINDOW), 0.0)
+    volume_spike = _at_least(ratio, thresholds.volume_ratio)
+
+    # Breakout: near the lookback high, or bouncing >5% off a nearby low
+    hi, lo = matrix.high, matrix.low
+    slack = 1.0 + TOLERANCE
+    breakout = (counts >= thresholds.breakout_lookback) & (hi != lo) & (
+        (last * slack >= hi * 0.995) | ((last <= lo * 1.10 * slack) & ((last - lo) / lo * slack > 0.05))
+    )
+
+    # Momentum: 24h return of at least 2% in an allowed direction
+    return_24h = (last - close[0]) / close[0]
+    momentum = _at_least(np.abs(return_24h), 0.02)
+    if thresholds.only_upside:
+        momentum &= return_24h >= 0
+    if thresholds.regime in ("bear", "crash"):
+        momentum &= return_24h <= 0
+
+    codes = price_move | volume_spike << 1 | breakout << 2 | momentum << 3
+    return [_COMBINATIONS[code] for code in codes.tolist()]
+
+
+def thresholds_for(regime_thresholds: dict, regime: str, breakout_lookback: int,
+                   only_upside: bool) -> Optional[ScreenThresholds]:
+    regime_key = regime if regime in regime_thresholds else "chop"
+    settings = regime_thresholds.get(regime_key)
+    if settings is None:
+        return None
+    return ScreenThresholds(
+        pct_15m=settings.get("pct_change_15m", 2.0),
+        pct_60m=settings.get("pct_change_60m", 4.0),
+        volume_ratio=settings.get("volume_ratio_1h", 1.9),
+        breakout_lookback=breakout_lookback,
+        only_upside=only_upside,
+        regime=regime,
+    )
@@ -7,17 +7,29 @@ Decides which assets warrant deeper analysis.
 Inspired by Jesse's clean strategy lifecycle and Freqtrade's indicator patterns.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import logging
+import math
 
+from core import indicators
 from core.exchange_coinbase import get_exchange, OHLCV
-from core.universe import UniverseAsset
+from core.feature_store import FeatureFrame, FeatureStore, volatility_pct_from_view
+from core.indicator_state import IndicatorParams, IndicatorState, IndicatorStateConfig, IndicatorStore
+from core.indicators import as_columns
+from core.trigger_matrix import TRIGGER_TYPES, CandleMatrix, screen, thresholds_for
+from core.universe import UniverseAsset, UniverseDiff
+from infra.fanout import FetchResult
 
 logger = logging.getLogger(__name__)
 
 
+def _pct_moves(closes: Sequence[float]) -> List[float]:
+    """Bar-to-bar % changes of a few closes (indicators.pct_change without its array overhead)."""
+    return [(new - old) / old * 100.0 if old else math.nan for old, new in zip(closes, closes[1:])]
+
+
 @dataclass
 class TriggerSignal:
     """A trigger signal for an asset"""
@@ -54,6 +66,9 @@ class TriggerEngine:
     Output: Ranked list of assets with trigger signals
     """
 
+    _market_data = None   # MarketDataContext for the scan in progress
+    _features = None      # FeatureStore for the scan in progress
+
     def __init__(self, config_path: str = "config/signals.yaml", policy_path: str = "config/policy.yaml"):
         self.exchange = get_exchange()
 
@@ -142,6 +157,17 @@ class TriggerEngine:
         self.fallback_config = self.policy_triggers.get("fallback", {}) or {}
         self._no_trigger_streak = 0
 
+        # Cross-sectional screening: evaluate trigger conditions for the whole
+        # universe at once and run per-asset checks only where something can fire
+        cross_cfg = self.config.get("cross_sectional", {}) or {}
+        self.cross_sectional_enabled = bool(cross_cfg.get("enabled", True))
+        self.cross_sectional_min_assets = int(cross_cfg.get("min_assets", 8))
+
+        # Streaming indicators, advanced once per closed candle (persistence
+        # is enabled by configure_indicator_state)
+        self.indicator_store = IndicatorStore(self._indicator_params())
+        self._scan_views: Dict[int, Tuple[Sequence[OHLCV], IndicatorState]] = {}
+
         logger.info(f"Initialized TriggerEngine (regime_aware={bool(self.regime_thresholds)}, "
                    f"lookback={self.lookback_hours}h, atr_filter={self.enable_atr_filter}, "
                    f"only_upside={self.only_upside}, max_triggers={self.max_triggers_per_cycle})")
@@ -151,84 +177,84 @@ class TriggerEngine:
                    f"atr={self.regime_thresholds['chop']['atr_filter_min_mult']}x")
 
     def scan(self, assets: List[UniverseAsset], 
-             regime: str = "chop") -> List[TriggerSignal]:
+             regime: str = "chop",
+             market_data=None) -> List[TriggerSignal]:
         """
         Scan eligible assets for triggers.
 
         Args:
             assets: List of eligible universe assets
             regime: Current market regime
+            market_data: Cycle's MarketDataContext; candles are read through it
+                (and left there for later stages) instead of the exchange, and
+                derived features go to its feature store
 
         Returns:
             List of TriggerSignals, sorted by strength
         """
+        self._market_data = market_data
+        self._features = market_data.features if market_data is not None else FeatureStore()
+        try:
+            return self._scan(assets, regime)
+        finally:
+            self._market_data = None
+            self._features = None
+
+    @property
+    def _source(self):
+        """Where candles come from: the cycle's market data context, else the exchange."""
+        return self._market_data if self._market_data is not None else self.exchange
+
+    def _scan(self, assets: List[UniverseAsset], regime: str) -> List[TriggerSignal]:
         logger.info(f"Scanning {len(assets)} assets for triggers (regime={regime})")
 
         signals = []
         asset_contexts: List[Tuple[UniverseAsset, List[OHLCV]]] = []
+        prefetched = self._prefetch_candles([asset.symbol for asset in assets])
 
+        self._scan_views = {}
+        params = self._indicator_params()
+        if params != self.indicator_store.params:
+            logger.info("Indicator parameters changed; rebuilding streaming indicator state")
+            self.indicator_store = IndicatorStore(params, self.indicator_store.config)
+
+        scanned: List[Tuple[UniverseAsset, List[OHLCV]]] = []
         for asset in assets:
             try:
-                # Get OHLCV data
-                candles = self.exchange.get_ohlcv(asset.symbol, interval="1h", limit=168)  # 7 days
+                # Get OHLCV data (7 days), fetched concurrently above when possible
+                result = prefetched.get(asset.symbol)
+                if result is not None:
+                    candles = result.unwrap()
+                else:
+                    candles = self._source.get_ohlcv(asset.symbol, interval="1h", limit=168)
 
                 if not candles:
                     continue
 
-                # Validate price data for outliers (bad ticks, flash crashes/spikes)
-                outlier_reason = self._validate_price_outlier(asset.symbol, candles)
-                if outlier_reason:
-                    logger.warning(f"{asset.symbol}: {outlier_reason}")
-                    continue  # Skip this asset for this cycle
-
-                # Check ATR volatility filter (skip low-volatility chop)
-                atr_reason = self._check_atr_filter(asset.symbol, candles, regime)
-                if atr_reason:
-                    logger.debug(f"{asset.symbol}: {atr_reason}")
-                    continue  # Skip this asset for this cycle
-
-                asset_contexts.append((asset, candles))
-
-                # Check various trigger types
-                triggers = []
-
-                # Price move (regime-aware thresholds)
-                price_move_trigger = self._check_price_move(asset, candles, regime)
-                if price_move_trigger:
-                    triggers.append(price_move_trigger)
-
-                # Volume spike (regime-aware threshold)
-                vol_trigger = self._check_volume_spike(asset, candles, regime)
-                if vol_trigger:
-                    triggers.append(vol_trigger)
-
-                # Breakout
-                breakout_trigger = self._check_breakout(asset, candles, regime)
-                if breakout_trigger:
-                    triggers.append(breakout_trigger)
-
-                # Momentum
-                momentum_trigger = self._check_momentum(asset, candles, regime)
-                if momentum_trigger:
-                    triggers.append(momentum_trigger)
-
-                # Take strongest trigger
-                if triggers:
-                    strongest = max(triggers, key=lambda t: t.strength * t.confidence)
-                    signals.append(strongest)
-                    logger.debug(
-                        f"{asset.symbol}: {strongest.trigger_type} "
-                        f"(strength={strongest.strength:.2f}, conf={strongest.confidence:.2f})"
-                    )
-
+                # Advance the symbol's streaming indicators; every check reads them
+                self._sync_indicators(asset.symbol, candles)
+                scanned.append((asset, candles))
             except Exception as e:
                 logger.warning(f"Failed to scan {asset.symbol}: {e}")
 
+        if self.cross_sectional_enabled and len(scanned) >= self.cross_sectional_min_assets:
+            signals, asset_contexts = self._scan_cross_sectional(scanned, regime)
+        else:
+            for asset, candles in scanned:
+                passed, strongest = self._evaluate_asset(asset, candles, regime)
+                if passed:
+                    asset_contexts.append((asset, candles))
+                if strongest:
+                    signals.append(strongest)
+
         if not signals:
             signals = self._maybe_run_fallback_scan(asset_contexts, regime)
         else:
             self._no_trigger_streak = 0
 
+        if self.indicator_store.config.enabled:
+            self.indicator_store.maybe_save()
+
         # Sort by strength × confidence
         signals.sort(key=lambda s: s.strength * s.confidence, reverse=True)
 
@@ -248,6 +274,197 @@ class TriggerEngine:
 
         return signals
 
+    def _evaluate_asset(
+        self,
+        asset: UniverseAsset,
+        candles: List[OHLCV],
+        regime: str,
+        trigger_types: Sequence[str] = TRIGGER_TYPES,
+    ) -> Tuple[bool, Optional[TriggerSignal]]:
+        """
+        Run the data guards and trigger checks for one asset.
+
+        Returns:
+            (passed the outlier/ATR guards, strongest trigger or None)
+        """
+        passed = False
+        try:
+            # Validate price data for outliers (bad ticks, flash crashes/spikes)
+            outlier_reason = self._validate_price_outlier(asset.symbol, candles)
+            if outlier_reason:
+                logger.warning(f"{asset.symbol}: {outlier_reason}")
+                return False, None  # Skip this asset for this cycle
+
+            # Check ATR volatility filter (skip low-volatility chop)
+            atr_reason = self._check_atr_filter(asset.symbol, candles, regime)
+            if atr_reason:
+                logger.debug(f"{asset.symbol}: {atr_reason}")
+                return False, None  # Skip this asset for this cycle
+            passed = True
+
+            checks = {
+                "price_move": self._check_price_move,    # Regime-aware thresholds
+                "volume_spike": self._check_volume_spike,
+                "breakout": self._check_breakout,
+                "momentum": self._check_momentum,
+            }
+            triggers = []
+            for trigger_type in trigger_types:
+                trigger = checks[trigger_type](asset, candles, regime)
+                if trigger:
+                    triggers.append(trigger)
+
+            # Take strongest trigger
+            if not triggers:
+                return True, None
+            strongest = max(triggers, key=lambda t: t.strength * t.confidence)
+            logger.debug(
+                f"{asset.symbol}: {strongest.trigger_type} "
+                f"(strength={strongest.strength:.2f}, conf={strongest.confidence:.2f})"
+            )
+            return True, strongest
+
+        except Exception as e:
+            logger.warning(f"Failed to scan {asset.symbol}: {e}")
+            return passed, None
+
+    def _scan_cross_sectional(
+        self,
+        scanned: List[Tuple[UniverseAsset, List[OHLCV]]],
+        regime: str,
+    ) -> Tuple[List[TriggerSignal], List[Tuple[UniverseAsset, List[OHLCV]]]]:
+        """
+        Screen the whole universe as one assets x time matrix, then confirm
+        candidates with the per-asset checks.
+
+        The matrix is read from the indicator views synced for this scan.
+        Assets it can't hold (short history, bad prices) go through the
+        per-symbol path. Returns the same signals, in the same
+        order, as evaluating every asset individually.
+        """
+        try:
+            thresholds = thresholds_for(self.regime_thresholds, regime, int(self.lookback_hours), self.only_upside)
+            matrix, left_out = CandleMatrix.from_views(
+                [self._indicator_view(candles) for _, candles in scanned],
+                [len(candles) for _, candles in scanned],
+            )
+            screened = screen(matrix, thresholds)
+        except Exception as e:
+            logger.warning(f"Cross-sectional screen failed, scanning per symbol: {e}")
+            matrix, screened, left_out = None, [], list(range(len(scanned)))
+
+        candidates: Dict[int, Sequence[str]] = {position: TRIGGER_TYPES for position in left_out}
+        if matrix is not None:
+            for position, trigger_types in zip(matrix.members, screened):
+                if trigger_types:
+                    candidates[position] = trigger_types
+        logger.debug(
+            f"Cross-sectional screen: {matrix.width if matrix else 0} assets in matrix, "
+            f"{len(left_out)} per symbol, {len(candidates)} to confirm"
+        )
+
+        signals: List[TriggerSignal] = []
+        guard_results: Dict[int, bool] = {}
+        for position, (asset, candles) in enumerate(scanned):
+            trigger_types = candidates.get(position)
+            if not trigger_types:
+                continue
+            passed, strongest = self._evaluate_asset(asset, candles, regime, trigger_types)
+            guard_results[position] = passed
+            if strongest:
+                signals.append(strongest)
+
+        asset_contexts: List[Tuple[UniverseAsset, List[OHLCV]]] = []
+        if not signals:
+            # Fallback scan needs every asset that passes the data guards
+            for position, (asset, candles) in enumerate(scanned):
+                passed = guard_results.get(position)
+                if passed is None:
+                    passed, _ = self._evaluate_asset(asset, candles, regime, trigger_types=())
+                if passed:
+                    asset_contexts.append((asset, candles))
+        return signals, asset_contexts
+
+    def _prefetch_candles(self, symbols: List[str]) -> Dict[str, FetchResult]:
+        """Fetch 1h candles for all symbols on the exchange's fan-out pool."""
+        fetch_many = getattr(self._source, "fetch_many", None)
+        if len(symbols) < 2 or not callable(fetch_many):
+            return {}
+        try:
+            results = fetch_many("ohlcv", symbols, interval="1h", limit=168,
+                                 caller="TriggerEngine._prefetch_candles")
+        except Exception as e:
+            logger.warning(f"Concurrent candle fetch failed, scanning sequentially: {e}")
+            return {}
+        if not isinstance(results, list):
+            return {}
+        return {r.symbol: r for r in results if isinstance(r, FetchResult)}
+
+    def _indicator_params(self) -> IndicatorParams:
+        trend = self.trend_filter_config or {}
+        return IndicatorParams(
+            atr_period=int(self.atr_lookback),
+            ema_period=int(trend.get("ema_period_hours", 21)),
+            ema_slope_lookback=max(1, int(trend.get("slope_lookback_hours", 3))),
+            breakout_window=int(self.lookback_hours),
+            outlier_window=int(self.circuit_breakers.get("outlier_lookback_periods", 20)),
+        )
+
+    def configure_indicator_state(self, config: Optional[Dict[str, Any]]) -> None:
+        """Apply app.yaml triggers.indicator_state and restore its snapshot."""
+        state_config = IndicatorStateConfig.from_dict(config)
+        self.indicator_store = IndicatorStore(self._indicator_params(), state_config)
+        if state_config.enabled:
+            self.indicator_store.load()
+        logger.info(
+            "Streaming indicators %s (snapshot=%s)",
+            "enabled" if state_config.enabled else "disabled",
+            state_config.persist_path or "none",
+        )
+
+    def retain_indicators(self, symbols) -> int:
+        """Drop indicator state for symbols that left the universe."""
+        return self.indicator_store.retain(symbols)
+
+    def apply_universe_diff(self, diff: UniverseDiff) -> int:
+        """Drop indicator state for the symbols a universe refresh removed."""
+        if not diff.removed:
+            return 0
+        return self.indicator_store.retain(diff.symbols)
+
+    def persist_indicators(self, force: bool = False) -> bool:
+        """Save the indicator snapshot (periodically, or now when force is set)."""
+        if not self.indicator_store.config.enabled:
+            return False
+        return self.indicator_store.save() if force else self.indicator_store.maybe_save()
+
+    def _sync_indicators(self, symbol: str, candles: Sequence[OHLCV],
+                         timeframe: str = "1h") -> IndicatorState:
+        """Advance the streaming state for symbol/timeframe and register it for this scan."""
+        if self.indicator_store.config.enabled:
+            view = self.indicator_store.sync(symbol, timeframe, candles)
+        else:
+            view = IndicatorState.from_candles(self.indicator_store.params, candles)
+        self._scan_views[id(candles)] = (candles, view)
+        if self._features is not None:
+            self._features.frame(symbol, timeframe, candles).provide("indicators", view)
+        return view
+
+    def _indicator_view(self, candles: Sequence[OHLCV]) -> IndicatorState:
+        """Indicators at the newest candle: this scan's synced state, else built from candles."""
+        cached = self._scan_views.get(id(candles))
+        if cached is not None and cached[0] is candles:
+            return cached[1]
+        return IndicatorState.from_candles(self._indicator_params(), candles)
+
+    def _feature_frame(self, candles: Sequence[OHLCV]) -> FeatureFrame:
+        """Features of candles: the frame bound during this scan, else a throwaway one."""
+        frame = self._features.frame_for(candles) if self._features is not None else None
+        if frame is None:
+            frame = FeatureStore().frame(None, "1h", candles)
+            frame.provide("indicators", self._indicator_view(candles))
+        return frame
+
     def _maybe_run_fallback_scan(
         self,
         asset_contexts: List[Tuple[UniverseAsset, List[OHLCV]]],
@@ -347,27 +564,25 @@ class TriggerEngine:
         if len(candles) < lookback + 1:
             return None  # Insufficient data, skip validation
 
-        current = candles[-1]
-        historical = candles[-(lookback+1):-1]  # Last N periods, excluding current
+        view = self._indicator_view(candles)
+        current_close = view.close
+        current_volume = view.current_volume
 
-        # Calculate moving average of close prices
-        avg_price = sum(c.close for c in historical) / len(historical)
+        # Moving averages of close and volume over the last N periods, excluding current
+        avg_price, avg_volume = view.outlier_means()
 
         # Calculate deviation
         if avg_price <= 0:
             return f"Invalid average price: {avg_price}"
 
-        deviation_pct = abs(current.close - avg_price) / avg_price * 100.0
+        deviation_pct = abs(current_close - avg_price) / avg_price * 100.0
 
         # If deviation exceeds threshold, check volume confirmation
         if deviation_pct > max_dev_pct:
-            # Calculate average volume
-            avg_volume = sum(c.volume for c in historical) / len(historical)
-
             if avg_volume <= 0:
                 return f"Invalid average volume: {avg_volume}"
 
-            volume_ratio = current.volume / avg_volume
+            volume_ratio = current_volume / avg_volume
 
             # Extreme move without volume confirmation = outlier
             if volume_ratio < min_vol_ratio:
@@ -392,36 +607,7 @@ class TriggerEngine:
         Returns:
             ATR as percentage of current price
         """
-        if len(candles) < period + 1:
-            return 0.0
-
-        true_ranges = []
-        for i in range(-period, 0):
-            high = candles[i].high
-            low = candles[i].low
-            prev_close = candles[i-1].close
-
-            # True Range = max of:
-            # 1) Current High - Current Low
-            # 2) |Current High - Previous Close|
-            # 3) |Current Low - Previous Close|
-            tr = max(
-                high - low,
-                abs(high - prev_close),
-                abs(low - prev_close)
-            )
-            true_ranges.append(tr)
-
-        # Average True Range
-        atr = sum(true_ranges) / len(true_ranges)
-
-        # Express as percentage of current price
-        current_price = candles[-1].close
-        if current_price <= 0:
-            return 0.0
-
-        atr_pct = (atr / current_price) * 100.0
-        return atr_pct
+        return self._feature_frame(candles).get("atr_pct", period=period)
 
     def _check_atr_filter(self, symbol: str, candles: List[OHLCV], regime: str = "chop") -> Optional[str]:
         """
@@ -445,26 +631,15 @@ class TriggerEngine:
         regime_key = regime if regime in self.regime_thresholds else "chop"
         atr_min_mult = self.regime_thresholds[regime_key].get("atr_filter_min_mult", 1.1)
 
-        # Calculate current ATR
-        current_atr_pct = self._calculate_atr_pct(candles, self.atr_lookback)
-
-        # Calculate median ATR over last 7 days (168 hours)
-        atr_samples = []
-        for i in range(-168, -self.atr_lookback):
-            if i + self.atr_lookback < 0:
-                # Calculate ATR for this window
-                window = candles[i:i+self.atr_lookback+1]
-                if len(window) >= self.atr_lookback + 1:
-                    atr_pct = self._calculate_atr_pct(window, self.atr_lookback)
-                    atr_samples.append(atr_pct)
+        view = self._indicator_view(candles)
+        current_atr_pct = view.atr_pct()
 
-        if not atr_samples:
+        # Median ATR over the windows ending within the last 7 days (168 hours),
+        # excluding the current bar
+        median_atr_pct = view.atr_median()
+        if median_atr_pct is None:
             return None  # Can't calculate median
 
-        # Calculate median
-        sorted_samples = sorted(atr_samples)
-        median_atr_pct = sorted_samples[len(sorted_samples) // 2]
-
         # Check if current ATR meets minimum threshold
         if median_atr_pct <= 0:
             return None  # Invalid median
@@ -486,30 +661,12 @@ class TriggerEngine:
 
         Returns volatility as percentage (e.g., 50.0 for 50% annualized).
         """
-        if len(candles) < 24:
-            return 50.0  # Default moderate volatility
-
-        # Calculate hourly returns for last 7 days (168 hours)
-        returns = []
-        lookback = min(168, len(candles) - 1)
-        for i in range(len(candles) - lookback, len(candles)):
-            if candles[i-1].close > 0:
-                ret = (candles[i].close - candles[i-1].close) / candles[i-1].close
-                returns.append(ret)
+        return self._feature_frame(candles).get("volatility_pct")
 
-        if not returns:
-            return 50.0
-
-        # Standard deviation of returns
-        import math
-        mean_ret = sum(returns) / len(returns)
-        variance = sum((r - mean_ret) ** 2 for r in returns) / len(returns)
-        hourly_vol = math.sqrt(variance)
-
-        # Annualize: hourly vol × sqrt(24 × 365)
-        annualized_vol = hourly_vol * math.sqrt(24 * 365) * 100  # Convert to percentage
-
-        return min(annualized_vol, 200.0)  # Cap at 200% to avoid extreme outliers
+    def _volatility(self, view: IndicatorState) -> float:
+        # Std of hourly returns over the last 7 days (168 hours), annualized
+        # (sqrt(24 x 365)); 50% with < 24 bars, capped at 200%
+        return volatility_pct_from_view(view, "1h")
 
     def _check_price_move(
         self,
@@ -537,26 +694,19 @@ class TriggerEngine:
             pct_15m = max(override_15, 0.0)
             pct_60m = max(override_60, 0.0)
 
-        current_price = candles[-1].close
+        view = self._indicator_view(candles)
+        current_price = view.close
 
-        # 15-minute move (15 bars ago with 1h candles)
-        # Note: With 1h candles, we can't get true 15m moves, so we use closest approximation
-        # For now, use 1h candle as proxy for short-term move
-        price_1h_ago = candles[-2].close if len(candles) >= 2 else current_price
-        abs((current_price - price_1h_ago) / price_1h_ago * 100)
+        # Hourly % moves of the last 4 hours (1h candles)
+        closes = [view.close_ago(k) for k in range(4, 0, -1)] + [current_price]
+        moves = [abs(m) for m in _pct_moves(closes)]
 
         # 60-minute move is just the 1h candle move
-        price_60m_ago = candles[-2].close if len(candles) >= 2 else current_price
-        move_60m = abs((current_price - price_60m_ago) / price_60m_ago * 100)
-
-        # For better 15m detection, check last 4h for any large single-hour move
-        max_1h_move = 0.0
-        if len(candles) >= 5:
-            for i in range(1, 5):  # Check last 4 hours
-                prev_price = candles[-(i+1)].close
-                curr_price = candles[-i].close
-                move = abs((curr_price - prev_price) / prev_price * 100)
-                max_1h_move = max(max_1h_move, move)
+        move_60m = moves[-1]
+
+        # With 1h candles we can't get true 15m moves; as a proxy, take the
+        # largest single-hour move of the last 4h
+        max_1h_move = max(moves, default=0.0)
 
         # Check 15m threshold (using max 1h move as proxy)
         triggered_15m = max_1h_move >= pct_15m
@@ -618,17 +768,13 @@ class TriggerEngine:
         regime_key = regime if regime in self.regime_thresholds else "chop"
         volume_threshold = self.regime_thresholds[regime_key].get("volume_ratio_1h", 1.9)
 
+        view = self._indicator_view(candles)
+
         # Current 1h volume (last candle)
-        current_volume = candles[-1].volume
+        current_volume = view.current_volume
 
         # Calculate 24h average hourly volume (spec-compliant)
-        if len(candles) >= 24:
-            # Use last 24 hours for average
-            volume_24h = sum(c.volume for c in candles[-24:])
-            avg_hourly = volume_24h / 24
-        else:
-            # Fallback for insufficient data
-            avg_hourly = sum(c.volume for c in candles) / len(candles)
+        avg_hourly = view.volume_sum() / 24
 
         if avg_hourly == 0:
             return None
@@ -652,11 +798,9 @@ class TriggerEngine:
         # CRITICAL FIX: Calculate price change for rules engine
         # _rule_volume_spike requires price_change_pct to determine trade direction
         price_change_pct = None
-        if len(candles) >= 2:
-            prev_close = candles[-2].close
-            current_close = candles[-1].close
-            if prev_close > 0:
-                price_change_pct = ((current_close - prev_close) / prev_close) * 100.0
+        prev_close = view.close_ago(1)
+        if prev_close > 0:
+            price_change_pct = (view.close - prev_close) / prev_close * 100.0
 
         return TriggerSignal(
             symbol=asset.symbol,
@@ -665,7 +809,7 @@ class TriggerEngine:
             confidence=confidence,
             reason=f"Volume {volume_ratio:.2f}x avg hourly (1h: ${current_volume:,.0f} vs 24h avg: ${avg_hourly:,.0f})",
             timestamp=datetime.now(timezone.utc),
-            current_price=candles[-1].close,
+            current_price=view.close,
             volume_ratio=volume_ratio,
             volatility=volatility,
             price_change_pct=price_change_pct
@@ -684,11 +828,11 @@ class TriggerEngine:
         if len(candles) < lookback:
             return None
 
-        current_price = candles[-1].close
+        view = self._indicator_view(candles)
+        current_price = view.close
 
         # Get high/low over lookback period
-        high_lookback = max(c.high for c in candles[-lookback:])
-        low_lookback = min(c.low for c in candles[-lookback:])
+        high_lookback, low_lookback = view.breakout_range()
         range_lookback = high_lookback - low_lookback
 
         if range_lookback == 0:
@@ -767,7 +911,7 @@ class TriggerEngine:
             "min_bounce_from_low_pct"
         ]):
             try:
-                candles_5m = self.exchange.get_ohlcv(symbol, interval="5m", limit=60)
+                candles_5m = self._source.get_ohlcv(symbol, interval="5m", limit=60)
             except Exception as exc:  # pragma: no cover - network noise handled upstream
                 logger.debug(
                     f"{symbol}: reversal confirmation 5m candles unavailable: {exc}"
@@ -780,8 +924,10 @@ class TriggerEngine:
         elif candles_1h:
             last_close = candles_1h[-1].close
 
+        view_5m = self._sync_indicators(symbol, candles_5m, "5m") if candles_5m else None
+
         if config.get("close_above_vwap_5m"):
-            vwap = self._calculate_vwap(candles_5m[-12:]) if candles_5m else None
+            vwap = view_5m.vwap() if view_5m else None
             if vwap:
                 qualifiers["reversal_close_above_vwap_5m"] = last_close > vwap
                 metrics["reversal_vwap_5m"] = vwap
@@ -800,10 +946,9 @@ class TriggerEngine:
                 qualifiers["reversal_higher_low"] = False
 
         if config.get("rsi_cross_up_50"):
-            closes = [c.close for c in candles_5m] if candles_5m else [c.close for c in candles_1h]
-            rsi_series = self._calculate_rsi_series(closes, period=14)
-            if len(rsi_series) >= 2:
-                prev_rsi, curr_rsi = rsi_series[-2], rsi_series[-1]
+            rsi_view = view_5m or (self._indicator_view(candles_1h) if candles_1h else None)
+            prev_rsi, curr_rsi = rsi_view.rsi_pair() if rsi_view else (None, None)
+            if prev_rsi is not None and curr_rsi is not None:
                 qualifiers["reversal_rsi_cross_50"] = prev_rsi <= 50.0 and curr_rsi > 50.0
                 metrics["reversal_rsi"] = curr_rsi
                 metrics["reversal_rsi_prev"] = prev_rsi
@@ -826,23 +971,6 @@ class TriggerEngine:
 
         return qualifiers, metrics
 
-    def _calculate_ema_series(self, values: List[float], period: int) -> List[Optional[float]]:
-        if period <= 0:
-            return []
-        if len(values) < period:
-            return []
-
-        multiplier = 2.0 / (period + 1)
-        ema_values: List[Optional[float]] = [None] * max(period - 1, 0)
-        ema = sum(values[:period]) / period
-        ema_values.append(ema)
-
-        for price in values[period:]:
-            ema = (price - ema) * multiplier + ema
-            ema_values.append(ema)
-
-        return ema_values
-
     def _passes_trend_filter(self, candles: List[OHLCV], regime: str) -> Tuple[bool, str, Dict[str, float]]:
         config = self.trend_filter_config or {}
         metrics: Dict[str, float] = {}
@@ -859,25 +987,22 @@ class TriggerEngine:
         else:
             min_slope = float(slope_cfg)
 
-        closes = [c.close for c in candles]
-        if len(closes) < period + slope_lookback:
+        if len(candles) < period + slope_lookback:
             metrics["trend_filter_passed"] = 0.0
             return False, (
                 f"Trend filter: insufficient data for EMA period {period}"
             ), metrics
 
-        ema_series = self._calculate_ema_series(closes, period)
-        ema_values = [value for value in ema_series if value is not None]
+        view = self._indicator_view(candles)
+        current_ema = view.ema_now()
+        prior_ema = view.ema_ago(slope_lookback)
 
-        if len(ema_values) < slope_lookback + 1:
+        if current_ema is None or prior_ema is None:
             metrics["trend_filter_passed"] = 0.0
             return False, (
                 f"Trend filter: insufficient EMA samples for slope lookback {slope_lookback}"
             ), metrics
 
-        current_ema = ema_values[-1]
-        prior_ema = ema_values[-(slope_lookback + 1)]
-
         if prior_ema <= 0:
             metrics["trend_filter_passed"] = 0.0
             return False, "Trend filter: invalid prior EMA value", metrics
@@ -900,63 +1025,12 @@ class TriggerEngine:
         metrics["trend_filter_passed"] = 1.0
         return True, "", metrics
 
-    def _calculate_vwap(self, candles: List[OHLCV]) -> Optional[float]:
-        if not candles:
-            return None
-        numerator = 0.0
-        denominator = 0.0
-        for candle in candles:
-            typical_price = (candle.high + candle.low + candle.close) / 3.0
-            numerator += typical_price * candle.volume
-            denominator += candle.volume
-        if denominator <= 0:
-            return None
-        return numerator / denominator
-
     def _find_recent_pivot_lows(self, candles: List[OHLCV], lookback: int = 48,
                                  window: int = 2) -> List[OHLCV]:
         if not candles:
             return []
-        pivots: List[OHLCV] = []
-        start = max(0, len(candles) - lookback)
-        for idx in range(start + window, len(candles) - window):
-            low_value = candles[idx].low
-            if all(low_value <= candles[idx - offset].low for offset in range(1, window + 1)) and \
-               all(low_value < candles[idx + offset].low for offset in range(1, window + 1)):
-                pivots.append(candles[idx])
-        return pivots[-3:]
-
-    def _calculate_rsi_series(self, closes: List[float], period: int = 14) -> List[float]:
-        if len(closes) < period + 1:
-            return []
-
-        gains = []
-        losses = []
-        for i in range(1, len(closes)):
-            delta = closes[i] - closes[i - 1]
-            gains.append(max(delta, 0.0))
-            losses.append(abs(min(delta, 0.0)))
-
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-
-        rsis: List[float] = []
-        if avg_loss == 0:
-            rsis.append(100.0)
-        else:
-            rs = avg_gain / avg_loss if avg_loss else float("inf")
-            rsis.append(100.0 - (100.0 / (1.0 + rs)))
-
-        for idx in range(period, len(gains)):
-            avg_gain = ((avg_gain * (period - 1)) + gains[idx]) / period
-            avg_loss = ((avg_loss * (period - 1)) + losses[idx]) / period
-            if avg_loss == 0:
-                rsis.append(100.0)
-            else:
-                rs = avg_gain / avg_loss if avg_loss else float("inf")
-                rsis.append(100.0 - (100.0 / (1.0 + rs)))
-
-        return rsis
+        indices = indicators.pivot_lows(as_columns(candles).low, lookback, window)
+        return [candles[idx] for idx in indices[-3:]]
 
     def _check_momentum(self, asset: UniverseAsset, candles: List[OHLCV],
                        regime: str) -> Optional[TriggerSignal]:
@@ -968,9 +1042,11 @@ class TriggerEngine:
         if len(candles) < 24:
             return None
 
+        view = self._indicator_view(candles)
+
         # Calculate 24h return
-        price_24h_ago = candles[-24].close
-        current_price = candles[-1].close
+        price_24h_ago = view.close_ago(23)
+        current_price = view.close
         return_24h = (current_price - price_24h_ago) / price_24h_ago
 
         # Lowered threshold: 2% move (aggressive to ensure triggers fire)
@@ -989,10 +1065,8 @@ class TriggerEngine:
         strength = min(abs(return_24h) / 0.10, 1.0)  # 10% return = max strength
 
         # Confidence = consistency (check if all recent candles moved same direction)
-        recent_returns = [
-            (candles[i].close - candles[i-1].close) / candles[i-1].close
-            for i in range(-12, 0)  # Last 12 hours
-        ]
+        closes = [view.close_ago(k) for k in range(12, 0, -1)] + [current_price]
+        recent_returns = _pct_moves(closes)  # Last 12 hours
         same_direction = sum(1 for r in recent_returns if (r > 0) == (return_24h > 0))
         confidence = same_direction / len(recent_returns)
 
@@ -5,12 +5,15 @@ Loads universe config and enforces eligibility rules.
 Salvaged from v1 but simplified and hardened.
 """
 
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone, timedelta
 import logging
+import threading
 
 from core.exchange_coinbase import get_exchange, Quote
+from core.order_book import OrderBook
+from infra.fanout import FetchResult
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +56,105 @@ class UniverseSnapshot:
                 return asset
         return None
 
+    def to_dict(self) -> dict:
+        """JSON-safe form (see CatalogCache)"""
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "regime": self.regime,
+            "tier_1_assets": [asdict(a) for a in self.tier_1_assets],
+            "tier_2_assets": [asdict(a) for a in self.tier_2_assets],
+            "tier_3_assets": [asdict(a) for a in self.tier_3_assets],
+            "excluded_assets": list(self.excluded_assets),
+            "total_eligible": self.total_eligible,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UniverseSnapshot":
+        return cls(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            regime=data["regime"],
+            tier_1_assets=[UniverseAsset(**a) for a in data["tier_1_assets"]],
+            tier_2_assets=[UniverseAsset(**a) for a in data["tier_2_assets"]],
+            tier_3_assets=[UniverseAsset(**a) for a in data["tier_3_assets"]],
+            excluded_assets=list(data.get("excluded_assets", [])),
+            total_eligible=int(data["total_eligible"]),
+        )
+
+
+# Eligibility reasons from near-threshold overrides; they consume per-build
+# override caps, so assets admitted this way are re-evaluated on every build
+_OVERRIDE_REASONS = frozenset({"override_volume", "override_depth"})
+
+
+def _moved(previous: float, current: float, tolerance_pct: float) -> bool:
+    """True when current differs from previous by more than tolerance_pct (relative)."""
+    if previous == current:
+        return False
+    scale = max(abs(previous), abs(current))
+    return abs(current - previous) > tolerance_pct * scale
+
+
+@dataclass
+class UniverseDiff:
+    """Change between two consecutive universe snapshots"""
+    snapshot: UniverseSnapshot
+    added: List[UniverseAsset] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[UniverseAsset] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    @property
+    def symbols(self) -> Set[str]:
+        """Eligible symbols in the new snapshot"""
+        return {a.symbol for a in self.snapshot.get_all_eligible()}
+
+    @classmethod
+    def between(cls, previous: Optional[UniverseSnapshot], current: UniverseSnapshot,
+                tolerance_pct: float = 0.0) -> "UniverseDiff":
+        """
+        Diff current against previous (None: every eligible asset is added).
+
+        An asset counts as changed when its tier, allocation band or
+        eligibility reason differ, or when volume/spread/depth moved by more
+        than tolerance_pct.
+        """
+        before = {a.symbol: a for a in previous.get_all_eligible()} if previous else {}
+        after = current.get_all_eligible()
+        diff = cls(snapshot=current)
+        for asset in after:
+            old = before.get(asset.symbol)
+            if old is None:
+                diff.added.append(asset)
+            elif cls._asset_changed(old, asset, tolerance_pct):
+                diff.changed.append(asset)
+        current_symbols = {a.symbol for a in after}
+        diff.removed = [s for s in before if s not in current_symbols]
+        return diff
+
+    @staticmethod
+    def _asset_changed(old: UniverseAsset, new: UniverseAsset, tolerance_pct: float) -> bool:
+        if (old.tier, old.allocation_min_pct, old.allocation_max_pct, old.eligibility_reason) != (
+            new.tier, new.allocation_min_pct, new.allocation_max_pct, new.eligibility_reason
+        ):
+            return True
+        return any(
+            _moved(a, b, tolerance_pct)
+            for a, b in ((old.volume_24h, new.volume_24h), (old.spread_bps, new.spread_bps),
+                         (old.depth_usd, new.depth_usd))
+        )
+
+
+@dataclass
+class _LiquidityEvaluation:
+    """Last liquidity verdict for a (tier, symbol) and the inputs it was computed from"""
+    volume_24h: float
+    spread_bps: float
+    depth_usd: float
+    result: Tuple[bool, Optional[str], Optional[str]]
+
 
 class UniverseManager:
     """
@@ -63,8 +165,14 @@ class UniverseManager:
     - Apply liquidity filters
     - Apply regime adjustments
     - Track excluded assets
+    - Report what changed between refreshes (UniverseDiff)
     """
 
+    # Incremental refresh state (set up in __init__)
+    _evaluations: Optional[Dict[Tuple[int, str], _LiquidityEvaluation]] = None
+    _refresh_tolerance_pct: float = 0.0
+    last_diff: Optional[UniverseDiff] = None
+
     def __init__(self, config: dict, exchange=None, state_store=None, alert_service=None):
         self.config = config
         self.exchange = exchange
@@ -90,6 +198,21 @@ class UniverseManager:
         self._products_cache_ttl = timedelta(minutes=products_cache_minutes)
         logger.info(f"Product list cache enabled: TTL={products_cache_minutes}min")
 
+        # Incremental refresh: a symbol's liquidity verdict is reused until its
+        # volume/spread/depth move by more than this fraction (0 re-checks all)
+        self._refresh_tolerance_pct = float(config.get('universe', {}).get('refresh_tolerance_pct', 0.05) or 0.0)
+        self._evaluations = {}
+        self._refresh_stats = {"evaluated": 0, "reused": 0}
+        self.last_diff = None
+        self._served: Optional[UniverseSnapshot] = None   # Last snapshot get_universe returned
+
+        # Warm start from a persisted snapshot (see attach_catalog_cache)
+        self._catalog = None
+        self._cache_restored = False
+        self._background_refresh: Optional[threading.Thread] = None
+        self._build_lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+
     @classmethod
     def from_config_path(cls, config_path: str, exchange=None, state_store=None, alert_service=None):
         """
@@ -141,6 +264,8 @@ class UniverseManager:
         - Liquidity metrics
         - Exchange support
         """
+        exchange = self.exchange or get_exchange()
+
         # OPTIMIZATION: Check products cache first to avoid redundant API calls
         symbols = self._get_cached_products()
 
@@ -150,7 +275,6 @@ class UniverseManager:
             logger.info("Fetching all tradable pairs from Coinbase...")
 
             try:
-                exchange = get_exchange()
                 symbols = exchange.get_symbols()
 
                 # CRITICAL: Treat empty symbols as failure
@@ -186,27 +310,26 @@ class UniverseManager:
             tier2_min_volume = dynamic_config.get('tier2_min_volume_usd', 20_000_000)   # $20M
             tier3_min_volume = dynamic_config.get('tier3_min_volume_usd', 5_000_000)    # $5M
 
-            # Fetch product data for all pairs
+            # Fetch product data for all pairs (bulk: O(1) requests, no symbol cap)
             tier1_symbols = []
             tier2_symbols = []
             tier3_symbols = []
 
-            for symbol in usd_pairs[:50]:  # Limit to first 50 to avoid rate limits
-                try:
-                    quote = exchange.get_quote(symbol)
-
-                    # Categorize by 24h volume
-                    if quote.volume_24h >= tier1_min_volume:
-                        tier1_symbols.append(symbol)
-                    elif quote.volume_24h >= tier2_min_volume:
-                        tier2_symbols.append(symbol)
-                    elif quote.volume_24h >= tier3_min_volume:
-                        tier3_symbols.append(symbol)
-
-                except Exception as e:
-                    logger.debug(f"Failed to fetch {symbol}: {e}")
+            quotes = self._prefetch_quotes(exchange, usd_pairs, fallback=True)
+            for symbol in usd_pairs:
+                quote = quotes.get(symbol)
+                if quote is None:
+                    logger.debug(f"No bulk quote for {symbol}; skipping")
                     continue
 
+                # Categorize by 24h volume
+                if quote.volume_24h >= tier1_min_volume:
+                    tier1_symbols.append(symbol)
+                elif quote.volume_24h >= tier2_min_volume:
+                    tier2_symbols.append(symbol)
+                elif quote.volume_24h >= tier3_min_volume:
+                    tier3_symbols.append(symbol)
+
             logger.info(f"Dynamic universe: {len(tier1_symbols)} tier1, {len(tier2_symbols)} tier2, {len(tier3_symbols)} tier3")
 
             # CRITICAL: Treat empty tier 1 as failure
@@ -285,32 +408,74 @@ class UniverseManager:
             return config
 
     def get_universe(self, regime: str = "chop", 
-                     force_refresh: bool = False) -> UniverseSnapshot:
+                     force_refresh: bool = False,
+                     market_data=None) -> UniverseSnapshot:
         """
         Get eligible universe snapshot for given regime.
 
         Args:
             regime: "bull" | "chop" | "bear" | "crash"
             force_refresh: Skip cache and rebuild
+            market_data: Cycle's MarketDataContext; a rebuild reads quotes and
+                books through it so later stages reuse them
 
         Returns:
             UniverseSnapshot with eligible assets
         """
         # Check cache
-        if not force_refresh and self._is_cache_valid(regime):
-            cache_time = self._cache_time
-            if cache_time and cache_time.tzinfo is None:
-                cache_time = cache_time.replace(tzinfo=timezone.utc)
-            age = None
-            if cache_time:
-                age = datetime.now(timezone.utc) - cache_time
-            logger.debug(f"Using cached universe (age: {age})")
-            return self._cache
+        with self._snapshot_lock:
+            if not force_refresh and self._is_cache_valid(regime):
+                cache_time = self._cache_time
+                if cache_time and cache_time.tzinfo is None:
+                    cache_time = cache_time.replace(tzinfo=timezone.utc)
+                age = None
+                if cache_time:
+                    age = datetime.now(timezone.utc) - cache_time
+                logger.debug(f"Using cached universe (age: {age})")
+                if self._cache is self._served:
+                    self.last_diff = UniverseDiff(snapshot=self._cache)
+                elif self.last_diff is None or self.last_diff.snapshot is not self._cache:
+                    # Restored snapshot: nothing was built from it yet
+                    self.last_diff = UniverseDiff.between(None, self._cache)
+                self._served = self._cache
+                if self._cache_restored:
+                    self._refresh_in_background(regime)
+                return self._cache
+
+        with self._build_lock:
+            snapshot = self._rebuild(regime, force_refresh, source=market_data)
+        with self._snapshot_lock:
+            self._served = snapshot
+        return snapshot
+
+    def _refresh_in_background(self, regime: str) -> None:
+        """Rebuild a restored snapshot on a daemon thread (once) while it keeps being served."""
+        catalog = self._catalog
+        if catalog is None or not catalog.config.refresh_in_background:
+            return
+        if self._background_refresh is not None and self._background_refresh.is_alive():
+            return
+
+        def _run() -> None:
+            try:
+                with self._build_lock:
+                    if self._cache_restored:
+                        self._rebuild(regime, force_refresh=False)
+            except Exception as exc:
+                logger.warning(f"Background universe refresh failed: {exc}")
 
+        self._background_refresh = threading.Thread(target=_run, name="universe-refresh", daemon=True)
+        self._background_refresh.start()
+
+    def _rebuild(self, regime: str, force_refresh: bool, source=None) -> UniverseSnapshot:
+        """Build, diff, cache and persist a fresh snapshot (caller holds _build_lock)."""
         logger.info(f"Building universe snapshot for regime={regime}")
 
-        exchange = get_exchange()
+        exchange = source or self.exchange or get_exchange()
         self._near_threshold_usage = {"tier1": 0, "tier2": 0, "tier3": 0}
+        self._refresh_stats = {"evaluated": 0, "reused": 0}
+        if force_refresh and self._evaluations is not None:
+            self._evaluations.clear()
 
         # Get tier definitions
         tiers_config = self.config.get("tiers", {})
@@ -335,13 +500,22 @@ class UniverseManager:
         except Exception as exc:
             logger.warning(f"Failed to load red flag bans from StateStore: {exc}")
 
+        # Fetch liquidity inputs for tiers 1 and 2 in one concurrent wave
+        wanted = [
+            s for tier_key in ("tier_1_core", "tier_2_rotational")
+            for s in tiers_config.get(tier_key, {}).get("symbols", [])
+            if s not in excluded
+        ]
+        market_data = self._fetch_liquidity_inputs(exchange, list(dict.fromkeys(wanted)))
+
         # Build tier 1 (core)
         tier_1 = self._build_tier_1(
             tiers_config.get("tier_1_core", {}),
             liquidity_config,
             regime_mods,
             exchange,
-            excluded
+            excluded,
+            market_data=market_data,
         )
 
         # Build tier 2 (rotational)
@@ -350,9 +524,16 @@ class UniverseManager:
             liquidity_config,
             regime_mods,
             exchange,
-            excluded
+            excluded,
+            market_data=market_data,
         )
 
+        # Forget verdicts for symbols no longer configured or now excluded
+        if self._evaluations:
+            keep = set(wanted)
+            for key in [k for k in self._evaluations if k[1] not in keep]:
+                del self._evaluations[key]
+
         # Build tier 3 (event-driven)
         tier_3 = self._build_tier_3(
             tiers_config.get("tier_3_event_driven", {}),
@@ -400,24 +581,36 @@ class UniverseManager:
                 )
                 logger.error(f"🚨 EMPTY UNIVERSE: {eligible_count}/{min_eligible} eligible assets")
 
-        # Cache result
-        self._cache = snapshot
-        self._cache_time = datetime.now(timezone.utc)
+        # Diff against the previous snapshot, then cache result
+        with self._snapshot_lock:
+            self.last_diff = UniverseDiff.between(self._cache, snapshot, self._refresh_tolerance_pct)
+            self._cache = snapshot
+            self._cache_time = datetime.now(timezone.utc)
+            self._cache_restored = False
+        if self._catalog is not None:
+            self._catalog.store_universe(snapshot.to_dict())
 
         logger.info(
             f"Universe snapshot: {len(tier_1)} core, {len(tier_2)} rotational, "
-            f"{len(tier_3)} event-driven, {len(excluded)} excluded"
+            f"{len(tier_3)} event-driven, {len(excluded)} excluded "
+            f"(+{len(self.last_diff.added)} -{len(self.last_diff.removed)} ~{len(self.last_diff.changed)}; "
+            f"re-evaluated {self._refresh_stats['evaluated']}, reused {self._refresh_stats['reused']})"
         )
 
         return snapshot
 
     def _build_tier_1(self, tier_config: dict, liquidity_config: dict,
-                      regime_mods: dict, exchange, excluded_symbols: set = None) -> List[UniverseAsset]:
+                      regime_mods: dict, exchange, excluded_symbols: set = None,
+                      market_data: Optional[Tuple[dict, dict, dict]] = None) -> List[UniverseAsset]:
         """Build tier 1 (core) assets"""
         symbols = tier_config.get("symbols", [])
         constraints = tier_config.get("constraints", {})
         excluded_symbols = excluded_symbols or set()
 
+        quotes, quote_results, book_results = market_data or self._fetch_liquidity_inputs(
+            exchange, [s for s in symbols if s not in excluded_symbols]
+        )
+
         assets = []
         for symbol in symbols:
             # Skip excluded assets
@@ -426,13 +619,14 @@ class UniverseManager:
                 continue
             try:
                 # Get market data
-                quote = exchange.get_quote(symbol)
-                orderbook = exchange.get_orderbook(symbol)
+                quote = quotes.get(symbol) or self._resolve(quote_results, symbol, exchange.get_quote)
+                orderbook = self._resolve(book_results, symbol, exchange.get_orderbook)
 
-                # Check liquidity
-                eligible, reason, eligibility_reason = self._check_liquidity(
+                # Check liquidity (reused while inputs stay within tolerance)
+                evaluation = self._evaluate_liquidity(
                     quote, orderbook, liquidity_config, constraints, tier=1
                 )
+                eligible, reason, eligibility_reason = evaluation.result
 
                 # Apply regime modifier
                 multiplier = regime_mods.get("tier_1_multiplier", 1.0)
@@ -442,9 +636,9 @@ class UniverseManager:
                     tier=1,
                     allocation_min_pct=constraints.get("min_allocation_pct", 5.0) * multiplier,
                     allocation_max_pct=constraints.get("max_allocation_pct", 40.0) * multiplier,
-                    volume_24h=quote.volume_24h,
-                    spread_bps=quote.spread_bps,
-                    depth_usd=orderbook.total_depth_usd,
+                    volume_24h=evaluation.volume_24h,
+                    spread_bps=evaluation.spread_bps,
+                    depth_usd=evaluation.depth_usd,
                     eligible=eligible,
                     ineligible_reason=reason,
                     eligibility_reason=eligibility_reason,
@@ -477,7 +671,8 @@ class UniverseManager:
         return assets
 
     def _build_tier_2(self, tier_config: dict, liquidity_config: dict,
-                      regime_mods: dict, exchange, excluded_symbols: set = None) -> List[UniverseAsset]:
+                      regime_mods: dict, exchange, excluded_symbols: set = None,
+                      market_data: Optional[Tuple[dict, dict, dict]] = None) -> List[UniverseAsset]:
         """Build tier 2 (rotational) assets"""
         symbols = tier_config.get("symbols", [])
         constraints = tier_config.get("constraints", {})
@@ -488,6 +683,10 @@ class UniverseManager:
         if not symbols:
             return []
 
+        quotes, quote_results, book_results = market_data or self._fetch_liquidity_inputs(
+            exchange, [s for s in symbols if s not in excluded_symbols]
+        )
+
         assets = []
         for symbol in symbols:
             # Skip excluded assets
@@ -497,13 +696,14 @@ class UniverseManager:
 
             try:
                 # Get market data
-                quote = exchange.get_quote(symbol)
-                orderbook = exchange.get_orderbook(symbol)
+                quote = quotes.get(symbol) or self._resolve(quote_results, symbol, exchange.get_quote)
+                orderbook = self._resolve(book_results, symbol, exchange.get_orderbook)
 
-                # Check liquidity
-                eligible, reason, eligibility_reason = self._check_liquidity(
+                # Check liquidity (reused while inputs stay within tolerance)
+                evaluation = self._evaluate_liquidity(
                     quote, orderbook, liquidity_config, constraints, tier=2
                 )
+                eligible, reason, eligibility_reason = evaluation.result
 
                 if not eligible:
                     # Use INFO instead of DEBUG for better visibility
@@ -531,9 +731,9 @@ class UniverseManager:
                     tier=2,
                     allocation_min_pct=constraints.get("min_allocation_pct", 2.0) * multiplier,
                     allocation_max_pct=constraints.get("max_allocation_pct", 20.0) * multiplier,
-                    volume_24h=quote.volume_24h,
-                    spread_bps=quote.spread_bps,
-                    depth_usd=orderbook.total_depth_usd,
+                    volume_24h=evaluation.volume_24h,
+                    spread_bps=evaluation.spread_bps,
+                    depth_usd=evaluation.depth_usd,
                     eligible=True,
                     ineligible_reason=None,
                     eligibility_reason=eligibility_reason,
@@ -547,6 +747,67 @@ class UniverseManager:
 
         return assets
 
+    def _fetch_liquidity_inputs(self, exchange, symbols: List[str]) -> Tuple[dict, dict, dict]:
+        """
+        Quotes and order books for symbols: bulk quotes, then the rest of the
+        quotes and all books concurrently.
+
+        Returns:
+            (quotes, quote_results, book_results) for the tier builders
+        """
+        quotes = self._prefetch_quotes(exchange, symbols)
+        quote_results = self._fan_out(exchange, "quote", [s for s in symbols if s not in quotes])
+        book_results = self._fan_out(exchange, "orderbook", symbols)
+        return quotes, quote_results, book_results
+
+    def _prefetch_quotes(self, exchange, symbols: List[str], fallback: bool = False) -> Dict[str, Quote]:
+        """
+        Fetch quotes for a whole tier with the exchange's bulk endpoint.
+
+        Returns an empty dict when the exchange has no bulk API or the batch
+        call fails. With fallback=False, symbols the batch could not price are
+        left out so the tier loop quotes them individually (once).
+        """
+        bulk = getattr(exchange, "get_quotes_bulk", None)
+        if not symbols or not callable(bulk):
+            return {}
+        try:
+            quotes = bulk(symbols, fallback=fallback)
+        except Exception as e:
+            logger.warning(f"Bulk quote fetch failed for {len(symbols)} symbols: {e}")
+            return {}
+        if not isinstance(quotes, dict):
+            return {}
+        logger.debug(f"Prefetched {len(quotes)}/{len(symbols)} quotes in bulk")
+        return quotes
+
+    def _fan_out(self, exchange, kind: str, symbols: List[str]) -> Dict[str, FetchResult]:
+        """
+        Fetch per-symbol data for a tier concurrently via exchange.fetch_many.
+
+        Returns an empty dict when the exchange has no fan-out API, so the
+        tier loop falls back to sequential calls.
+        """
+        fetch_many = getattr(exchange, "fetch_many", None)
+        if not symbols or not callable(fetch_many):
+            return {}
+        try:
+            results = fetch_many(kind, symbols, caller="UniverseManager._fan_out")
+        except Exception as e:
+            logger.warning(f"Concurrent {kind} fetch failed for {len(symbols)} symbols: {e}")
+            return {}
+        if not isinstance(results, list):
+            return {}
+        return {r.symbol: r for r in results if isinstance(r, FetchResult)}
+
+    @staticmethod
+    def _resolve(results: Dict[str, FetchResult], symbol: str, fetch):
+        """Take a prefetched value (re-raising its error) or fetch it inline."""
+        result = results.get(symbol)
+        if result is None:
+            return fetch(symbol)
+        return result.unwrap()
+
     def _build_tier_3(self, tier_config: dict, liquidity_config: dict,
                       regime_mods: dict) -> List[UniverseAsset]:
         """Build tier 3 (event-driven) assets"""
@@ -607,6 +868,52 @@ class UniverseManager:
         )
         return reason_code
 
+    @staticmethod
+    def _depth_within_band(orderbook, global_config: dict) -> float:
+        """
+        Two-sided depth for the liquidity check.
+
+        Snapshots carry depth within ±20bps. When the L2 book is attached and
+        liquidity.depth_band_bps asks for a different band, query the book
+        directly instead of re-fetching.
+        """
+        band_bps = global_config.get("depth_band_bps")
+        book = getattr(orderbook, "book", None)
+        if band_bps is None or not isinstance(book, OrderBook):
+            return orderbook.total_depth_usd
+        return book.depth_usd("both", float(band_bps))
+
+    def _evaluate_liquidity(self, quote: Quote, orderbook, global_config: dict,
+                            tier_config: dict, tier: int) -> _LiquidityEvaluation:
+        """
+        Liquidity verdict for an asset, re-checked only when its inputs moved.
+
+        The previous verdict (and the inputs it was computed from) is kept while
+        volume, spread and depth all stay within refresh_tolerance_pct of the
+        last evaluation, so small fluctuations neither re-run the checks nor
+        show up as changed assets in the diff.
+        """
+        key = (tier, quote.symbol)
+        previous = self._evaluations.get(key) if self._evaluations is not None else None
+        inputs = (quote.volume_24h, quote.spread_bps, orderbook.total_depth_usd)
+        if previous is not None and not any(
+            _moved(old, new, self._refresh_tolerance_pct)
+            for old, new in zip((previous.volume_24h, previous.spread_bps, previous.depth_usd), inputs)
+        ):
+            self._refresh_stats["reused"] += 1
+            return previous
+
+        evaluation = _LiquidityEvaluation(
+            *inputs, result=self._check_liquidity(quote, orderbook, global_config, tier_config, tier=tier)
+        )
+        if self._evaluations is not None:
+            self._refresh_stats["evaluated"] += 1
+            if evaluation.result[2] in _OVERRIDE_REASONS:
+                self._evaluations.pop(key, None)
+            else:
+                self._evaluations[key] = evaluation
+        return evaluation
+
     def _check_liquidity(self, quote: Quote, orderbook, 
                          global_config: dict, tier_config: dict, tier: int = 3) -> Tuple[bool, Optional[str], Optional[str]]:
         """
@@ -734,12 +1041,14 @@ class UniverseManager:
             # Fallback to legacy global setting
             min_depth_tier = global_config.get("min_orderbook_depth_usd", 10_000)
 
-        if orderbook.total_depth_usd < min_depth_tier:
+        depth_usd = self._depth_within_band(orderbook, global_config)
+
+        if depth_usd < min_depth_tier:
             applied_depth_override = self._apply_near_threshold_override(
                 symbol=quote.symbol,
                 tier=tier,
                 metric="depth",
-                metric_value=orderbook.total_depth_usd,
+                metric_value=depth_usd,
                 floor=min_depth_tier,
                 reason_code="override_depth",
             )
@@ -749,13 +1058,13 @@ class UniverseManager:
             else:
                 logger.debug(
                     f"{quote.symbol}: depth check FAIL - "
-                    f"${orderbook.total_depth_usd:,.0f} < ${min_depth_tier:,.0f} (T{tier})"
+                    f"${depth_usd:,.0f} < ${min_depth_tier:,.0f} (T{tier})"
                 )
-                return False, f"Depth ${orderbook.total_depth_usd:,.0f} < ${min_depth_tier:,.0f} (T{tier})", None
+                return False, f"Depth ${depth_usd:,.0f} < ${min_depth_tier:,.0f} (T{tier})", None
 
         logger.debug(
             f"{quote.symbol}: depth check PASS - "
-            f"${orderbook.total_depth_usd:,.0f} ≥ ${min_depth_tier:,.0f} (T{tier})"
+            f"${depth_usd:,.0f} ≥ ${min_depth_tier:,.0f} (T{tier})"
         )
 
         if eligibility_reason:
@@ -770,6 +1079,32 @@ class UniverseManager:
 
         return True, None, eligibility_reason
 
+    def attach_catalog_cache(self, cache) -> None:
+        """
+        Persist every snapshot to cache and start from its restored one.
+
+        A restored snapshot is served while it is younger than the refresh
+        interval (and built for the current regime); the first cycle that
+        uses it starts a rebuild in the background.
+        """
+        self._catalog = cache
+        restored = cache.universe() if cache is not None else None
+        if not restored or self._cache is not None:
+            return
+        try:
+            snapshot = UniverseSnapshot.from_dict(restored[0])
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning(f"Ignoring persisted universe snapshot: {exc}")
+            return
+        with self._snapshot_lock:
+            self._cache = snapshot
+            self._cache_time = datetime.fromtimestamp(restored[1], tz=timezone.utc)
+            self._cache_restored = True
+        logger.info(
+            f"Restored universe snapshot: {snapshot.total_eligible} eligible, regime={snapshot.regime}, "
+            f"age={datetime.now(timezone.utc) - self._cache_time}"
+        )
+
     def _is_cache_valid(self, regime: str) -> bool:
         """Check if cached snapshot is still valid"""
         if self._cache is None or self._cache_time is None:
@@ -0,0 +1,199 @@
+"""
+247trader-v2 Infrastructure: Async HTTP Client
+
+Small facade over an ``aiohttp`` ClientSession for the async exchange
+connector.
+
+aiohttp does the HTTP work (keep-alive pooling with a per-host connection
+cap, TLS, chunked/compressed bodies, timeouts); this module pins the surface
+the connector relies on: get/request returning a fully-read response with
+status_code / json() / raise_for_status(), JSON bodies serialized with
+json.dumps (the same bytes the HMAC signer hashes), and connection stats.
+
+Network failures surface as ConnectionError / TimeoutError and non-2xx
+responses as AsyncHttpError from raise_for_status(), mirroring how the
+requests-based transport is used by the sync connector.
+"""
+
+import asyncio
+import json as jsonlib
+import logging
+import ssl
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    AIOHTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "247trader-v2"
+
+
+class AsyncHttpError(Exception):
+    """Non-2xx response (raised by AsyncHttpResponse.raise_for_status)."""
+
+    def __init__(self, response: "AsyncHttpResponse"):
+        self.response = response
+        self.status_code = response.status_code
+        super().__init__(f"{response.status_code} {response.reason} for url: {response.url}")
+
+
+@dataclass
+class AsyncHttpResponse:
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    content: bytes
+    url: str
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content) if self.content else None
+
+    def raise_for_status(self) -> None:
+        if not 200 <= self.status_code < 300:
+            raise AsyncHttpError(self)
+
+
+@dataclass
+class AsyncHttpConfig:
+    """Connection limits and timeouts for AsyncHttpClient."""
+    max_connections_per_host: int = 64   # Requests beyond this queue for a connection
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    idle_timeout: float = 30.0           # Drop keep-alive connections idle this long
+
+
+class AsyncHttpClient:
+    """
+    Keep-alive HTTP client for one event loop at a time.
+
+    aiohttp sessions are bound to the loop that created them; using the client
+    from a new loop (e.g. successive asyncio.run calls in tests) opens a new
+    session.
+
+    Usage:
+        client = AsyncHttpClient()
+        response = await client.get("https://api.coinbase.com/api/v3/brokerage/time")
+        response.raise_for_status()
+        payload = response.json()
+        await client.aclose()
+    """
+
+    def __init__(self, config: Optional[AsyncHttpConfig] = None,
+                 ssl_context: Optional[ssl.SSLContext] = None):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp required for the async connector. Run: pip install aiohttp")
+        self.config = config or AsyncHttpConfig()
+        self._ssl = ssl_context
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats = {"requests": 0, "connections_opened": 0, "connections_reused": 0}
+
+    def _session(self) -> "aiohttp.ClientSession":
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is not None and not session.closed:
+            return session
+
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._count("connections_opened"))
+        trace.on_connection_reuseconn.append(self._count("connections_reused"))
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=max(1, self.config.max_connections_per_host),
+            keepalive_timeout=self.config.idle_timeout,
+            ssl=self._ssl if self._ssl is not None else True,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(sock_connect=self.config.connect_timeout),
+            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+            trace_configs=[trace],
+        )
+        self._sessions[loop] = session
+        return session
+
+    def _count(self, key: str):
+        async def _on_event(session, context, params) -> None:
+            self._stats[key] += 1
+        return _on_event
+
+    async def get(self, url: str, *, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None,
+                  timeout: Optional[float] = None) -> AsyncHttpResponse:
+        return await self.request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    async def request(self, method: str, url: str, *,
+                      params: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None,
+                      json: Any = None,
+                      timeout: Optional[float] = None) -> AsyncHttpResponse:
+        """
+        Send one request and read the whole response.
+
+        Args:
+            method: HTTP verb
+            url: Absolute http(s) URL (may already carry a query string)
+            params: Extra query parameters
+            headers: Request headers
+            json: Body serialized with json.dumps (same bytes the HMAC signer hashes)
+            timeout: Read timeout for the whole exchange (default config.read_timeout)
+
+        Raises:
+            ConnectionError: connection failed or the response was malformed
+            TimeoutError: connect or read timeout
+        """
+        request_headers = dict(headers or {})
+        data = None
+        if json is not None or method.upper() in ("POST", "PUT", "PATCH"):
+            data = b"" if json is None else jsonlib.dumps(json).encode("utf-8")
+            if not any(name.lower() == "content-type" for name in request_headers):
+                request_headers["Content-Type"] = "application/json"
+
+        read_timeout = self.config.read_timeout if timeout is None else timeout
+        self._stats["requests"] += 1
+        try:
+            async with self._session().request(
+                method.upper(), url,
+                params=params,
+                data=data,
+                headers=request_headers,
+                timeout=aiohttp.ClientTimeout(total=read_timeout, sock_connect=self.config.connect_timeout),
+            ) as response:
+                content = await response.read()
+                return AsyncHttpResponse(
+                    response.status,
+                    response.reason or "",
+                    {name.lower(): value for name, value in response.headers.items()},
+                    content,
+                    url,
+                )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{method.upper()} {url} timed out after {read_timeout}s") from None
+        except aiohttp.InvalidURL as exc:
+            raise ValueError(f"Unsupported URL: {url}") from exc
+        except aiohttp.ClientError as exc:
+            raise ConnectionError(f"{method.upper()} {url} failed: {exc}") from exc
+
+    async def aclose(self) -> None:
+        """Close the running loop's session and its keep-alive connections."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # pragma: no cover - called outside a loop
+            return
+        session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
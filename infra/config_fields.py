@@ -0,0 +1,106 @@
+"""
+247trader-v2 Infrastructure: Config Fields
+
+Shared parsing behind the settings dataclasses' ``from_dict``: copies the keys
+of a YAML section onto a config instance, cast to the type of each field's
+default (bool, int, float, str, tuple of str).
+
+Booleans accept YAML booleans and the strings true/false, yes/no, on/off, 1/0;
+integers accept whole numbers only (2.7 is rejected, not truncated). A value
+that does not parse, or a number outside its range (> 0, or >= 0 for fields
+listed as non_negative), keeps the default and logs a warning; a bad setting
+never stops startup. Fields whose default is None, dicts and other shapes are
+left to the caller.
+"""
+
+import logging
+from dataclasses import fields
+from typing import Any, Iterable, Mapping, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+C = TypeVar("C")
+
+_TRUE = frozenset({"true", "yes", "on", "1"})
+_FALSE = frozenset({"false", "no", "off", "0"})
+
+
+def apply_fields(config: C, data: Optional[Mapping[str, Any]], section: str,
+                 non_negative: Iterable[str] = (), skip: Iterable[str] = ()) -> C:
+    """
+    Overwrite config's fields with the values present in data.
+
+    Args:
+        config: Dataclass instance holding the defaults (modified in place)
+        data: Raw config section; None or missing keys keep the defaults
+        section: Name used in warnings, e.g. "execution.scheduler"
+        non_negative: Numeric fields that accept 0 (others must be > 0)
+        skip: Fields the caller parses itself
+
+    Returns:
+        config
+    """
+    if not data:
+        return config
+    zero_ok, own = set(non_negative), set(skip)
+
+    for spec in fields(config):  # type: ignore[arg-type]
+        name = spec.name
+        if name in own:
+            continue
+        value = data.get(name)
+        if value is None:
+            continue
+        default = getattr(config, name)
+
+        if isinstance(default, bool):
+            flag = _parse_bool(value)
+            if flag is None:
+                logger.warning("Invalid %s.%s: %r; using %r", section, name, value, default)
+            else:
+                setattr(config, name, flag)
+        elif isinstance(default, (int, float)):
+            parsed = _parse_int(value) if isinstance(default, int) else _parse_float(value)
+            if parsed is not None and (parsed > 0 or (name in zero_ok and parsed == 0)):
+                setattr(config, name, parsed)
+            else:
+                logger.warning("Invalid %s.%s: %r; using %r", section, name, value, default)
+        elif isinstance(default, str):
+            if value:
+                setattr(config, name, str(value))
+        elif isinstance(default, tuple):
+            if value:
+                items = [value] if isinstance(value, str) else value
+                setattr(config, name, tuple(str(item) for item in items))
+
+    return config
+
+
+def _parse_bool(value: Any) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+    return None
+
+
+def _parse_float(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    parsed = _parse_float(value)
+    if parsed is None or not parsed.is_integer():
+        return None
+    return int(parsed)
@@ -0,0 +1,146 @@
+"""
+247trader-v2 Infrastructure: Bounded Fan-Out Executor
+
+Runs one I/O-bound call across many symbols on a small, reusable worker pool.
+Results come back in input order and a failure for one symbol is captured on
+its FetchResult instead of aborting the batch. Pacing is left to the callee:
+exchange methods acquire their own per-endpoint rate-limit tokens, so the pool
+size only bounds how many requests are in flight at once.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from infra.config_fields import apply_fields
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FanoutConfig:
+    """Worker pool settings (config/app.yaml → exchange.fanout)."""
+
+    max_workers: int = 8
+    timeout_seconds: Optional[float] = 30.0
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> "FanoutConfig":
+        cfg = apply_fields(cls(), raw, "exchange.fanout", skip=("timeout_seconds",))
+        data = raw or {}
+
+        # None (or <= 0) disables the deadline
+        if "timeout_seconds" in data:
+            timeout = data.get("timeout_seconds")
+            try:
+                parsed = float(timeout) if timeout is not None else 0.0
+            except (TypeError, ValueError):
+                logger.warning("Invalid exchange.fanout.timeout_seconds: %r; using %r", timeout, cfg.timeout_seconds)
+            else:
+                cfg.timeout_seconds = parsed if parsed > 0 else None
+
+        return cfg
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one fanned-out call."""
+
+    symbol: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """Return the value, re-raising the captured error if the call failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class FanoutExecutor:
+    """
+    Bounded thread pool for per-symbol fan-out.
+
+    The pool is created lazily and reused across cycles. A batch of one
+    symbol (or a pool of one worker) runs inline on the caller's thread.
+    """
+
+    def __init__(self, config: Optional[FanoutConfig] = None, name: str = "fanout"):
+        self.config = config or FanoutConfig()
+        self._name = name
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix=self._name,
+                )
+            return self._pool
+
+    @staticmethod
+    def _call(fn: Callable[[str], Any], symbol: str) -> FetchResult:
+        start = time.perf_counter()
+        try:
+            value = fn(symbol)
+        except Exception as exc:  # isolate per-symbol failures
+            return FetchResult(symbol, error=exc, duration=time.perf_counter() - start)
+        return FetchResult(symbol, value=value, duration=time.perf_counter() - start)
+
+    def map(self, fn: Callable[[str], Any], symbols: Sequence[str],
+            timeout: Optional[float] = None) -> List[FetchResult]:
+        """
+        Apply fn to every symbol concurrently.
+
+        Args:
+            fn: Callable taking a symbol
+            symbols: Symbols to fetch (order is preserved in the result)
+            timeout: Batch deadline in seconds (defaults to config.timeout_seconds);
+                calls still running at the deadline are reported as TimeoutError
+
+        Returns:
+            One FetchResult per input symbol, in input order
+        """
+        symbols = list(symbols)
+        if not symbols:
+            return []
+
+        if len(symbols) == 1 or self.config.max_workers <= 1:
+            return [self._call(fn, symbol) for symbol in symbols]
+
+        deadline = self.config.timeout_seconds if timeout is None else timeout
+        pool = self._executor()
+        futures = [pool.submit(self._call, fn, symbol) for symbol in symbols]
+        _, pending = wait(futures, timeout=deadline)
+
+        results: List[FetchResult] = []
+        for symbol, future in zip(symbols, futures):
+            if future in pending:
+                future.cancel()
+                results.append(FetchResult(
+                    symbol,
+                    error=TimeoutError(f"{symbol}: fan-out deadline of {deadline}s exceeded"),
+                    duration=deadline or 0.0,
+                ))
+            else:
+                results.append(future.result())
+
+        if pending:
+            logger.warning("Fan-out timed out for %d/%d symbols", len(pending), len(symbols))
+        return results
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
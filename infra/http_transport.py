@@ -0,0 +1,372 @@
+"""
+247trader-v2 Infrastructure: Pooled HTTP Transport
+
+Keep-alive connection pooling for exchange REST traffic.
+
+Every bare ``requests.get``/``requests.request`` call opens a fresh TCP+TLS
+connection. This transport owns a single ``requests.Session`` with bounded
+per-host pools, a shared TLS context that resumes sessions when a new
+connection is unavoidable, and per-request accounting of pool hits/misses and
+handshakes so the cost shows up in metrics.
+"""
+
+import logging
+import ssl
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from infra.config_fields import apply_fields
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WARMUP_URL = "https://api.coinbase.com/api/v3/brokerage/time"
+
+TimeoutType = Union[None, float, Tuple[float, float]]
+
+# Per-thread accounting for the request currently in flight. urllib3 is
+# synchronous, so connect() runs on the thread that issued the request.
+_usage_local = threading.local()
+
+
+@dataclass
+class HttpPoolConfig:
+    """Pool sizing and timeout settings (``exchange.http`` in app.yaml)"""
+    pool_connections: int = 4           # Distinct host pools kept alive
+    pool_maxsize: int = 16              # Keep-alive connections per host
+    pool_block: bool = False            # Block instead of opening overflow connections
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0          # Public market-data calls
+    private_read_timeout: float = 20.0  # Authenticated / order calls
+    public_api_read_timeout: float = 20.0  # Unauthenticated brokerage API calls
+    tls_session_reuse: bool = True
+    warmup: bool = True
+    warmup_connections: int = 2
+    warmup_timeout: float = 3.0
+    warmup_urls: Tuple[str, ...] = (DEFAULT_WARMUP_URL,)
+
+    @classmethod
+    def from_dict(cls, cfg: Optional[Dict[str, Any]]) -> "HttpPoolConfig":
+        return apply_fields(cls(), cfg, "exchange.http", non_negative=("warmup_connections",))
+
+
+@dataclass
+class ConnectionUsage:
+    """Connection activity attributed to a single request"""
+    pool_requests: int = 0
+    new_connections: int = 0
+    tls_handshakes: int = 0
+    tls_resumed: int = 0
+
+    @property
+    def pool_hit(self) -> bool:
+        """True when the request was served on an already-open connection"""
+        return self.pool_requests > 0 and self.new_connections == 0
+
+
+@dataclass
+class TransportStats:
+    """Cumulative pool statistics since the transport was created"""
+    requests: int = 0
+    pool_hits: int = 0
+    pool_misses: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    tls_resumed: int = 0
+    by_host: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.pool_hits + self.pool_misses
+        return self.pool_hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "pool_hits": self.pool_hits,
+            "pool_misses": self.pool_misses,
+            "hit_ratio": self.hit_ratio,
+            "connections_opened": self.connections_opened,
+            "tls_handshakes": self.tls_handshakes,
+            "tls_resumed": self.tls_resumed,
+            "by_host": {host: dict(counts) for host, counts in self.by_host.items()},
+        }
+
+
+def _current_usage() -> Optional[ConnectionUsage]:
+    return getattr(_usage_local, "usage", None)
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """
+    SSL context that offers the last TLS session seen for a host on new connections.
+
+    Keep-alive reuse avoids most handshakes; when the pool does have to dial
+    (overflow, server-side idle close), an abbreviated resumption handshake is
+    still much cheaper than a full one.
+    """
+
+    def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT):  # noqa: D401 - signature mirrors SSLContext
+        self._session_lock = threading.Lock()
+        self._sessions: Dict[str, ssl.SSLSession] = {}
+        self._recent: Dict[str, "weakref.ReferenceType[ssl.SSLSocket]"] = {}
+
+    def _cached_session(self, host: str) -> Optional[ssl.SSLSession]:
+        with self._session_lock:
+            # TLS 1.3 tickets arrive after the handshake, so prefer the session
+            # of the most recent live socket over the one captured at connect.
+            ref = self._recent.get(host)
+            sock = ref() if ref is not None else None
+            if sock is not None:
+                try:
+                    session = sock.session
+                except (OSError, ValueError):
+                    session = None
+                if session is not None and session.has_ticket:
+                    self._sessions[host] = session
+            return self._sessions.get(host)
+
+    def wrap_socket(self, sock, server_side=False, do_handshake_on_connect=True,
+                    suppress_ragged_eofs=True, server_hostname=None, session=None):
+        if session is None and server_hostname and not server_side:
+            session = self._cached_session(server_hostname)
+        try:
+            ssock = super().wrap_socket(
+                sock,
+                server_side=server_side,
+                do_handshake_on_connect=do_handshake_on_connect,
+                suppress_ragged_eofs=suppress_ragged_eofs,
+                server_hostname=server_hostname,
+                session=session,
+            )
+        except ssl.SSLError:
+            if session is None:
+                raise
+            # Stale/rejected session: forget it so the next dial does a full handshake
+            with self._session_lock:
+                self._sessions.pop(server_hostname, None)
+                self._recent.pop(server_hostname, None)
+            logger.debug("TLS session resumption rejected for %s", server_hostname)
+            raise
+        if server_hostname and not server_side:
+            with self._session_lock:
+                self._recent[server_hostname] = weakref.ref(ssock)
+        return ssock
+
+
+def _build_ssl_context() -> ssl.SSLContext:
+    context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.load_verify_locations(requests.certs.where())
+    return context
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        super().connect()
+        _note_connect(self.host, tls=False, resumed=False)
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        super().connect()
+        resumed = bool(getattr(self.sock, "session_reused", False))
+        _note_connect(self.host, tls=True, resumed=resumed)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+    def urlopen(self, *args, **kwargs):
+        usage = _current_usage()
+        if usage is not None:
+            usage.pool_requests += 1
+        return super().urlopen(*args, **kwargs)
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+    def urlopen(self, *args, **kwargs):
+        usage = _current_usage()
+        if usage is not None:
+            usage.pool_requests += 1
+        return super().urlopen(*args, **kwargs)
+
+
+def _note_connect(host: str, *, tls: bool, resumed: bool) -> None:
+    usage = _current_usage()
+    if usage is None:
+        return
+    usage.new_connections += 1
+    if tls:
+        usage.tls_handshakes += 1
+        if resumed:
+            usage.tls_resumed += 1
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools count connections and share one TLS context"""
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext], **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self._ssl_context is not None:
+            pool_kwargs.setdefault("ssl_context", self._ssl_context)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+class PooledHttpTransport:
+    """
+    Shared keep-alive HTTP session for exchange calls.
+
+    Features:
+    - Bounded per-host connection pools (no handshake per call)
+    - Connect/read timeouts from config
+    - TLS session resumption for unavoidable new connections
+    - Per-request pool hit/miss + handshake accounting
+    - Startup warm-up so the first cycle does not pay for dialing
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None):
+        self.config = config or HttpPoolConfig()
+        self._lock = threading.Lock()
+        self._stats = TransportStats()
+        self._ssl_context = _build_ssl_context() if self.config.tls_session_reuse else None
+
+        self.session = requests.Session()
+        adapter = _PooledAdapter(
+            self._ssl_context,
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+            max_retries=0,  # Retries are owned by CoinbaseExchange._req
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _resolve_timeout(self, timeout: TimeoutType) -> Tuple[float, float]:
+        if timeout is None:
+            return (self.config.connect_timeout, self.config.read_timeout)
+        if isinstance(timeout, tuple):
+            return timeout
+        return (min(self.config.connect_timeout, float(timeout)), float(timeout))
+
+    def request(self, method: str, url: str, *, timeout: TimeoutType = None, **kwargs) -> requests.Response:
+        """
+        Issue a request over the pooled session.
+
+        Connection activity for this call is available afterwards (on the same
+        thread) via ``last_usage()``.
+        """
+        usage = ConnectionUsage()
+        _usage_local.usage = usage
+        try:
+            return self.session.request(method, url, timeout=self._resolve_timeout(timeout), **kwargs)
+        finally:
+            _usage_local.usage = None
+            _usage_local.last = usage
+            self._record(url, usage)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    @staticmethod
+    def last_usage() -> Optional[ConnectionUsage]:
+        """Connection usage of the most recent request on the calling thread."""
+        return getattr(_usage_local, "last", None)
+
+    def _record(self, url: str, usage: ConnectionUsage) -> None:
+        if usage.pool_requests == 0:
+            return
+        host = requests.utils.urlparse(url).hostname or "unknown"
+        with self._lock:
+            stats = self._stats
+            stats.requests += usage.pool_requests
+            stats.connections_opened += usage.new_connections
+            stats.tls_handshakes += usage.tls_handshakes
+            stats.tls_resumed += usage.tls_resumed
+            host_counts = stats.by_host.setdefault(host, {"hits": 0, "misses": 0, "handshakes": 0})
+            if usage.pool_hit:
+                stats.pool_hits += 1
+                host_counts["hits"] += 1
+            else:
+                stats.pool_misses += 1
+                host_counts["misses"] += 1
+            host_counts["handshakes"] += usage.tls_handshakes
+
+    def stats(self) -> TransportStats:
+        with self._lock:
+            snapshot = TransportStats(
+                requests=self._stats.requests,
+                pool_hits=self._stats.pool_hits,
+                pool_misses=self._stats.pool_misses,
+                connections_opened=self._stats.connections_opened,
+                tls_handshakes=self._stats.tls_handshakes,
+                tls_resumed=self._stats.tls_resumed,
+                by_host={host: dict(counts) for host, counts in self._stats.by_host.items()},
+            )
+        return snapshot
+
+    def warm_up(self, urls: Optional[Iterable[str]] = None, connections: Optional[int] = None) -> int:
+        """
+        Pre-open keep-alive connections so the first cycle skips handshakes.
+
+        Issues ``connections`` concurrent GETs per URL (concurrency is what
+        forces the pool to hold more than one socket). Failures are logged and
+        ignored; warm-up is best effort.
+
+        Returns:
+            Number of warm-up requests that completed
+        """
+        targets = list(urls) if urls is not None else list(self.config.warmup_urls)
+        count = max(1, int(connections if connections is not None else self.config.warmup_connections))
+        if not targets:
+            return 0
+
+        timeout = (min(self.config.connect_timeout, self.config.warmup_timeout), self.config.warmup_timeout)
+
+        def _touch(url: str) -> bool:
+            try:
+                self.request("GET", url, timeout=timeout).close()
+                return True
+            except Exception as exc:
+                logger.debug("HTTP warm-up failed for %s: %s", url, exc)
+                return False
+
+        started = time.perf_counter()
+        jobs = [url for url in targets for _ in range(count)]
+        with ThreadPoolExecutor(max_workers=min(len(jobs), self.config.pool_maxsize)) as pool:
+            warmed = sum(1 for ok in pool.map(_touch, jobs) if ok)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if warmed:
+            logger.info("HTTP pool warm-up: %d/%d connections ready in %.0fms", warmed, len(jobs), elapsed_ms)
+        else:
+            logger.warning("HTTP pool warm-up failed for all %d targets (%.0fms)", len(jobs), elapsed_ms)
+        return warmed
+
+    def close(self) -> None:
+        self.session.close()
+
+
+__all__ = [
+    "ConnectionUsage",
+    "HttpPoolConfig",
+    "PooledHttpTransport",
+    "TransportStats",
+]
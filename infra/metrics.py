@@ -3,18 +3,25 @@
 from __future__ import annotations
 
 import logging
+import threading
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 try:
-    from prometheus_client import Counter, Gauge, Summary, start_http_server
+    from prometheus_client import Counter, Gauge, Histogram, Summary, start_http_server
 except ImportError:  # pragma: no cover - optional dependency
-    Counter = Gauge = Summary = None  # type: ignore
+    Counter = Gauge = Histogram = Summary = None  # type: ignore
     start_http_server = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Strategy run latency buckets (seconds); also used for the in-memory snapshot
+STRATEGY_DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Decision-to-ack latency buckets (seconds) for submitted orders
+ORDER_ACK_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
 
 @dataclass
 class CycleStats:
@@ -56,6 +63,16 @@ class MetricsRecorder:
         self._last_rate_usage: Dict[str, float] = {}
         self._last_api_event: Optional[Dict[str, str]] = None
         self._last_no_trade_reason: Optional[str] = None
+        self._http_pool_counts: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "handshakes": 0,
+            "resumed_handshakes": 0,
+        }
+        self._quote_cache_counts: Dict[str, Dict[str, int]] = {}
+        self._strategy_stats: Dict[str, Dict[str, Any]] = {}
+        self._order_ack_stats: Dict[str, Dict[str, Any]] = {}
+        self._order_ack_lock = threading.Lock()  # recorded from dispatch worker threads
 
         if not self._prom_available and enabled:
             logger.warning(
@@ -73,6 +90,14 @@ class MetricsRecorder:
             self._rate_limit_gauge = None
             self._rate_limit_counter = None
             self._api_latency_summary = None
+            self._http_pool_counter = None
+            self._tls_handshake_counter = None
+            self._quote_cache_counter = None
+            # Strategy execution metrics
+            self._strategy_duration_histogram = None
+            self._strategy_runs_counter = None
+            self._strategy_cpu_counter = None
+            self._order_ack_histogram = None
             # Trading metrics
             self._no_trade_counter = None
             self._exposure_gauge = None
@@ -128,6 +153,43 @@ class MetricsRecorder:
             "Latency of exchange API calls",
             labelnames=("endpoint", "channel", "status"),
         )
+        self._http_pool_counter = Counter(  # type: ignore[assignment]
+            "exchange_http_pool_requests_total",
+            "Exchange HTTP requests by keep-alive pool outcome",
+            labelnames=("channel", "outcome"),  # outcome: "hit" (reused), "miss" (new connection)
+        )
+        self._tls_handshake_counter = Counter(  # type: ignore[assignment]
+            "exchange_tls_handshakes_total",
+            "TLS handshakes performed for exchange connections",
+            labelnames=("kind",),  # kind: "full", "resumed"
+        )
+        self._quote_cache_counter = Counter(  # type: ignore[assignment]
+            "exchange_quote_cache_requests_total",
+            "Quote/orderbook cache lookups by calling code path",
+            labelnames=("kind", "caller", "outcome"),  # outcome: "hit", "miss", "coalesced"
+        )
+        self._strategy_duration_histogram = Histogram(  # type: ignore[assignment]
+            "trader_strategy_duration_seconds",
+            "Wall-clock duration of each strategy run",
+            labelnames=("strategy",),
+            buckets=STRATEGY_DURATION_BUCKETS,
+        )
+        self._strategy_runs_counter = Counter(  # type: ignore[assignment]
+            "trader_strategy_runs_total",
+            "Strategy runs by outcome",
+            labelnames=("strategy", "outcome"),  # outcome: "ok", "error", "timeout", "skipped", "over_budget"
+        )
+        self._strategy_cpu_counter = Counter(  # type: ignore[assignment]
+            "trader_strategy_cpu_seconds_total",
+            "CPU time consumed by strategy runs",
+            labelnames=("strategy",),
+        )
+        self._order_ack_histogram = Histogram(  # type: ignore[assignment]
+            "trader_order_ack_latency_seconds",
+            "Time from trade decision to exchange acknowledgement per order",
+            labelnames=("mode", "side"),
+            buckets=ORDER_ACK_BUCKETS,
+        )
         self._no_trade_counter = Counter(  # type: ignore[assignment]
             "trader_no_trade_total",
             "Number of cycles that resulted in no-trade outcomes, grouped by reason",
@@ -293,19 +355,100 @@ class MetricsRecorder:
             if violated and self._rate_limit_counter:
                 self._rate_limit_counter.labels(channel=channel).inc()
 
-    def record_api_call(self, endpoint: str, channel: str, duration: float, status: str) -> None:
+    def record_api_call(
+        self,
+        endpoint: str,
+        channel: str,
+        duration: float,
+        status: str,
+        *,
+        pool_hit: Optional[bool] = None,
+        handshakes: int = 0,
+        resumed_handshakes: int = 0,
+    ) -> None:
         self._last_api_event = {
             "endpoint": endpoint,
             "channel": channel,
             "status": status,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
+        if pool_hit is not None:
+            self._last_api_event["pool"] = "hit" if pool_hit else "miss"
+            self._http_pool_counts["hits" if pool_hit else "misses"] += 1
+        self._http_pool_counts["handshakes"] += max(handshakes, 0)
+        self._http_pool_counts["resumed_handshakes"] += max(resumed_handshakes, 0)
+
         if self._enabled and self._api_latency_summary:
             self._api_latency_summary.labels(
                 endpoint=endpoint,
                 channel=channel,
                 status=status,
             ).observe(duration)
+        if self._enabled and pool_hit is not None and self._http_pool_counter:
+            self._http_pool_counter.labels(channel=channel, outcome="hit" if pool_hit else "miss").inc()
+        if self._enabled and handshakes > 0 and self._tls_handshake_counter:
+            full = max(handshakes - resumed_handshakes, 0)
+            if full:
+                self._tls_handshake_counter.labels(kind="full").inc(full)
+            if resumed_handshakes > 0:
+                self._tls_handshake_counter.labels(kind="resumed").inc(resumed_handshakes)
+
+    def record_quote_cache_lookup(self, kind: str, caller: str, outcome: str) -> None:
+        counts = self._quote_cache_counts.setdefault(caller, {"hit": 0, "miss": 0, "coalesced": 0})
+        counts[outcome] = counts.get(outcome, 0) + 1
+        if self._enabled and self._quote_cache_counter:
+            self._quote_cache_counter.labels(kind=kind, caller=caller, outcome=outcome).inc()
+
+    def record_strategy_run(
+        self,
+        strategy: str,
+        duration: float,
+        outcome: str,
+        *,
+        cpu_seconds: Optional[float] = None,
+    ) -> None:
+        stats = self._strategy_stats.setdefault(strategy, {
+            "runs": 0,
+            "outcomes": {},
+            "buckets": [0] * (len(STRATEGY_DURATION_BUCKETS) + 1),
+            "last_duration": 0.0,
+            "max_duration": 0.0,
+            "cpu_seconds": 0.0,
+        })
+        stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+        if outcome != "skipped":
+            stats["runs"] += 1
+            stats["buckets"][bisect_left(STRATEGY_DURATION_BUCKETS, duration)] += 1
+            stats["last_duration"] = duration
+            stats["max_duration"] = max(stats["max_duration"], duration)
+        if cpu_seconds:
+            stats["cpu_seconds"] += cpu_seconds
+
+        if self._enabled and self._strategy_runs_counter:
+            self._strategy_runs_counter.labels(strategy=strategy, outcome=outcome).inc()
+            if outcome != "skipped" and self._strategy_duration_histogram:
+                self._strategy_duration_histogram.labels(strategy=strategy).observe(duration)
+            if cpu_seconds and self._strategy_cpu_counter:
+                self._strategy_cpu_counter.labels(strategy=strategy).inc(cpu_seconds)
+
+    def record_order_ack_latency(self, mode: str, side: str, seconds: float) -> None:
+        side = (side or "unknown").lower()
+        with self._order_ack_lock:
+            stats = self._order_ack_stats.setdefault(side, {
+                "orders": 0,
+                "buckets": [0] * (len(ORDER_ACK_BUCKETS) + 1),
+                "total_seconds": 0.0,
+                "last_seconds": 0.0,
+                "max_seconds": 0.0,
+            })
+            stats["orders"] += 1
+            stats["buckets"][bisect_left(ORDER_ACK_BUCKETS, seconds)] += 1
+            stats["total_seconds"] += seconds
+            stats["last_seconds"] = seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+        if self._enabled and self._order_ack_histogram:
+            self._order_ack_histogram.labels(mode=(mode or "unknown").upper(), side=side).observe(seconds)
 
     def record_no_trade_reason(self, reason: str) -> None:
         self._last_no_trade_reason = reason
@@ -327,7 +470,28 @@ class MetricsRecorder:
 
     def last_no_trade_reason(self) -> Optional[str]:
         return self._last_no_trade_reason
+
+    def http_pool_snapshot(self) -> Dict[str, int]:
+        return dict(self._http_pool_counts)
+
+    def quote_cache_snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {caller: dict(counts) for caller, counts in self._quote_cache_counts.items()}
+
+    def strategy_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-strategy outcome counts and latency bucket counts (STRATEGY_DURATION_BUCKETS, then +Inf)."""
+        return {
+            name: {**stats, "outcomes": dict(stats["outcomes"]), "buckets": list(stats["buckets"])}
+            for name, stats in self._strategy_stats.items()
+        }
     
+    def order_ack_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-side decision-to-ack latency counts (ORDER_ACK_BUCKETS, then +Inf)."""
+        with self._order_ack_lock:
+            return {
+                side: {**stats, "buckets": list(stats["buckets"])}
+                for side, stats in self._order_ack_stats.items()
+            }
+
     def record_exposure(self, at_risk_pct: float, pending_pct: float = 0.0) -> None:
         """Record portfolio exposure percentages"""
         if self._enabled and self._exposure_gauge:
@@ -0,0 +1,210 @@
+"""
+247trader-v2 Infrastructure: Request Signing
+
+Auth header builders for Coinbase Advanced Trade with the expensive parts
+done once instead of per request.
+
+- JwtSigner (Cloud/PEM keys): the PEM is parsed into a key object once, and
+  each ES256 token is reused for the same "METHOD host/path" URI until a
+  fixed fraction of its lifetime has passed. Tokens are re-signed well before
+  they expire, so retries and slow requests never carry a token that is about
+  to lapse. The uri-less WebSocket token is cached the same way.
+- HmacSigner (legacy keys): the HMAC key schedule is computed once and copied
+  per request; signatures are memoized for the current one-second timestamp,
+  which is all the poll loops need.
+"""
+
+import hashlib
+import hmac
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import jwt
+    from cryptography.hazmat.primitives import serialization
+    JWT_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    JWT_AVAILABLE = False
+
+JWT_LIFETIME_SECONDS = 120       # Coinbase accepts at most 2 minutes
+JWT_REUSE_FRACTION = 0.5         # Re-sign once half the lifetime has elapsed
+JWT_HOST = "api.coinbase.com"
+WS_TOKEN_KEY = "websocket"      # Cache slot for the uri-less WebSocket token
+
+
+class JwtSigner:
+    """
+    ES256 bearer tokens with a cached key and per-URI token reuse.
+
+    Usage:
+        signer = JwtSigner(api_key, pem)
+        headers = {"Authorization": f"Bearer {signer.token('GET', '/api/v3/brokerage/accounts')}"}
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        pem: str,
+        lifetime_seconds: int = JWT_LIFETIME_SECONDS,
+        reuse_fraction: float = JWT_REUSE_FRACTION,
+        max_cached: int = 256,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not JWT_AVAILABLE:
+            raise ImportError("PyJWT and cryptography required for Cloud API. Run: pip install PyJWT cryptography")
+        if not api_key or not pem:
+            raise ValueError("API key and private key required for JWT authentication")
+        self.api_key = api_key
+        self.lifetime_seconds = int(lifetime_seconds)
+        self.reuse_seconds = max(0.0, min(float(reuse_fraction), 1.0)) * self.lifetime_seconds
+        self.max_cached = max(1, int(max_cached))
+        self._pem = pem
+        self._clock = clock
+        self._key: Any = None
+        self._tokens: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()   # uri -> (token, refresh_at)
+        self._lock = threading.Lock()
+        self._stats = {"signed": 0, "reused": 0}
+
+    def _private_key(self) -> Any:
+        if self._key is None:
+            try:
+                self._key = serialization.load_pem_private_key(self._pem.encode("utf-8"), password=None)
+            except Exception as e:
+                raise ValueError(f"Failed to load private key: {e}")
+        return self._key
+
+    def token(self, method: str, path: str) -> str:
+        """JWT for one request path (query string excluded)."""
+        uri = f"{method.upper()} {JWT_HOST}{path}"
+        return self._cached(uri, uri)
+
+    def websocket_token(self) -> str:
+        """JWT for WebSocket subscribe messages (no uri claim)."""
+        return self._cached(WS_TOKEN_KEY, None)
+
+    def _cached(self, cache_key: str, uri: Optional[str]) -> str:
+        now = self._clock()
+        with self._lock:
+            cached = self._tokens.get(cache_key)
+            if cached is not None and now < cached[1]:
+                self._tokens.move_to_end(cache_key)
+                self._stats["reused"] += 1
+                return cached[0]
+
+        token = self.sign(uri, now)
+        with self._lock:
+            self._tokens[cache_key] = (token, now + self.reuse_seconds)
+            self._tokens.move_to_end(cache_key)
+            while len(self._tokens) > self.max_cached:
+                self._tokens.popitem(last=False)
+            self._stats["signed"] += 1
+        return token
+
+    def sign(self, uri: Optional[str], now: Optional[float] = None) -> str:
+        """
+        Sign a fresh token for uri ("METHOD host/path"), bypassing the cache.
+
+        WebSocket tokens carry no uri claim; pass None for those.
+        """
+        issued = int(self._clock() if now is None else now)
+        claims = {
+            "sub": self.api_key,
+            "iss": "cdp",  # Coinbase Developer Platform
+            "nbf": issued,
+            "exp": issued + self.lifetime_seconds,
+        }
+        if uri is not None:
+            claims["uri"] = uri
+        return jwt.encode(
+            claims,
+            self._private_key(),
+            algorithm="ES256",
+            headers={"kid": self.api_key, "nonce": secrets.token_hex()},
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, cached=len(self._tokens))
+
+
+class HmacSigner:
+    """
+    CB-ACCESS-* headers with a precomputed HMAC-SHA256 key.
+
+    Usage:
+        signer = HmacSigner(api_key, api_secret)
+        headers.update(signer.headers("GET", "/api/v3/brokerage/orders/historical/fills", ""))
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        max_cached: int = 256,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not api_key or not api_secret:
+            raise ValueError("COINBASE_API_KEY and COINBASE_API_SECRET required for authenticated requests")
+        self.api_key = api_key
+        self.max_cached = max(1, int(max_cached))
+        self._clock = clock
+        self._mac = hmac.new(api_secret.encode(), digestmod=hashlib.sha256)
+        self._timestamp = ""
+        self._signatures: Dict[Tuple[str, str, str, str], str] = {}
+        self._lock = threading.Lock()
+        self._stats = {"signed": 0, "reused": 0}
+
+    def headers(self, method: str, path: str, body_str: str = "") -> Dict[str, str]:
+        ts = str(int(self._clock()))
+        method = method.upper()
+        key = (ts, method, path, body_str)
+        with self._lock:
+            if ts != self._timestamp:
+                # Signatures embed the timestamp; only the current second is reusable
+                self._timestamp = ts
+                self._signatures.clear()
+            sig = self._signatures.get(key)
+            if sig is not None:
+                self._stats["reused"] += 1
+
+        if sig is None:
+            mac = self._mac.copy()
+            mac.update((ts + method + path + body_str).encode())
+            sig = mac.hexdigest()
+            with self._lock:
+                if ts == self._timestamp and len(self._signatures) < self.max_cached:
+                    self._signatures[key] = sig
+                self._stats["signed"] += 1
+
+        return {
+            "CB-ACCESS-KEY": self.api_key,
+            "CB-ACCESS-SIGN": sig,
+            "CB-ACCESS-TIMESTAMP": ts,
+        }
+
+    def websocket_fields(self, channel: str, product_ids: Iterable[str] = ()) -> Dict[str, str]:
+        """Auth fields for a WebSocket subscribe message (signs timestamp + channel + products)."""
+        ts = str(int(self._clock()))
+        mac = self._mac.copy()
+        mac.update((ts + channel + ",".join(product_ids)).encode())
+        with self._lock:
+            self._stats["signed"] += 1
+        return {
+            "api_key": self.api_key,
+            "timestamp": ts,
+            "signature": mac.hexdigest(),
+        }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, cached=len(self._signatures))
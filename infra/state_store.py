@@ -5,6 +5,7 @@ Persistent state management with atomic writes.
 Ported from v1 with enhancements for v2 architecture.
 """
 
+import functools
 import json
 import os
 import sqlite3
@@ -43,8 +44,11 @@ DEFAULT_STATE = {
     "cash_balances": {},  # quote currency -> available
     "open_orders": {},  # client_order_id/order_id -> metadata
     "recent_orders": [],  # bounded history of closed/canceled orders
+    "parent_orders": {},  # parent_id -> progress of background TWAP/ladder parents
+    "recent_parent_orders": [],  # bounded history of finished parents
     "pending_markers": {},  # lightweight pending flags with TTL
     "last_fill_times": {},  # symbol:side -> ISO timestamp of last fill
+    "fill_cursor": {},  # high-water mark + recent trade ids of applied fills (FillIngester)
     "fill_history": {},  # symbol:side -> bounded list of fill timestamps
     "last_reconcile_at": None,
     "last_reset_date": None,
@@ -59,6 +63,23 @@ DEFAULT_STATE = {
 }
 
 
+def _atomic(method):
+    """
+    Run a load-modify-save method under the store lock.
+
+    load() and save() each lock on their own; without this, an order update
+    applied from the user-channel stream thread could interleave with the
+    main loop and one of the two writes would be lost.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class StateBackend(ABC):
     """Storage backend contract for StateStore."""
 
@@ -311,6 +332,7 @@ class StateStore:
             logger.debug("Flushed state via %s", self._backend_description)
             return state
     
+    @_atomic
     def update(self, event: str, **kwargs) -> Dict[str, Any]:
         """
         Update state with event.
@@ -367,6 +389,7 @@ class StateStore:
         self.save(state)
         return state
 
+    @_atomic
     def reconcile_exchange_snapshot(
         self,
         *,
@@ -407,6 +430,7 @@ class StateStore:
         self.save(state)
         return state
 
+    @_atomic
     def record_open_order(self, key: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Persist metadata for a newly submitted order."""
 
@@ -432,6 +456,7 @@ class StateStore:
         self.save(state)
         return state
 
+    @_atomic
     def close_order(
         self,
         key: str,
@@ -473,6 +498,74 @@ class StateStore:
         self.save(state)
         return True, entry
 
+    @_atomic
+    def save_fill_cursor(self, cursor: Dict[str, Any]) -> None:
+        """Persist the fill reconciliation high-water mark (FillIngester)."""
+
+        state = self.load()
+        state["fill_cursor"] = {**cursor}
+        self.save(state)
+
+    @_atomic
+    def record_parent_order(self, parent_id: str, payload: Dict[str, Any]) -> None:
+        """Persist progress of an active parent order (ExecutionScheduler)."""
+
+        state = self.load()
+        state.setdefault("parent_orders", {})[parent_id] = {**payload}
+        self.save(state)
+
+    @_atomic
+    def close_parent_order(
+        self,
+        parent_id: str,
+        *,
+        status: str,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Archive a finished parent order into recent_parent_orders."""
+
+        state = self.load()
+        entry = state.setdefault("parent_orders", {}).pop(parent_id, None)
+        if entry is None and details is None:
+            return False
+
+        entry = {**(entry or {}), **(details or {})}
+        entry["status"] = status
+        entry["closed_at"] = datetime.now(timezone.utc).isoformat()
+        history = state.setdefault("recent_parent_orders", [])
+        history.append(entry)
+        if len(history) > 50:
+            state["recent_parent_orders"] = history[-50:]
+        self.save(state)
+        return True
+
+    @_atomic
+    def record_purge_failure(self, symbol: str, details: Dict[str, Any]) -> int:
+        """Count a failed purge for symbol (backoff input); returns the failure count."""
+
+        state = self.load()
+        purge_failures = state.setdefault("purge_failures", {})
+        failure_count = purge_failures.get(symbol, {}).get("failure_count", 0) + 1
+        purge_failures[symbol] = {
+            **details,
+            "failure_count": failure_count,
+            "last_failed_at_iso": datetime.now(timezone.utc).isoformat(),
+        }
+        self.save(state)
+        return failure_count
+
+    @_atomic
+    def clear_purge_failure(self, symbol: str) -> bool:
+        state = self.load()
+        purge_failures = state.get("purge_failures", {})
+        if symbol not in purge_failures:
+            return False
+        del purge_failures[symbol]
+        state["purge_failures"] = purge_failures
+        self.save(state)
+        return True
+
+    @_atomic
     def purge_expired_pending(self) -> None:
         state = self.load()
         removed = self._purge_expired_pending(state)
@@ -503,6 +596,7 @@ class StateStore:
 
         return removed
 
+    @_atomic
     def set_pending(
         self,
         product_id: str,
@@ -550,6 +644,7 @@ class StateStore:
 
         self.save(state)
 
+    @_atomic
     def clear_pending(
         self,
         product_id: str,
@@ -584,6 +679,7 @@ class StateStore:
         if removed:
             self.save(state)
 
+    @_atomic
     def has_pending(self, product_id: str, side: str) -> bool:
         state = self.load()
         bucket = self._pending_bucket(state)
@@ -611,6 +707,7 @@ class StateStore:
         state = self.load()
         return key in state.get("open_orders", {})
 
+    @_atomic
     def sync_open_orders(
         self,
         active_orders: Dict[str, Dict[str, Any]],
@@ -710,6 +807,7 @@ class StateStore:
         
         return state
     
+    @_atomic
     def update_from_fills(self, filled_orders: list, portfolio: Any) -> Dict[str, Any]:
         """
         Update state after order fills.
@@ -790,6 +888,7 @@ class StateStore:
         except Exception:
             return False
     
+    @_atomic
     def record_fill(
         self,
         symbol: str,
@@ -1047,6 +1146,7 @@ class StateStore:
                 count += 1
         return count
 
+    @_atomic
     def mark_position_managed(self, symbol: str) -> None:
         """Explicitly mark a position as managed by the bot."""
 
@@ -1078,6 +1178,7 @@ class StateStore:
         state = self.load()
         return state.get(key, default)
     
+    @_atomic
     def reset(self, full: bool = False) -> Dict[str, Any]:
         """
         Reset state counters.
@@ -1102,6 +1203,7 @@ class StateStore:
         self.save(state)
         return state
     
+    @_atomic
     def update_managed_position_targets(
         self,
         symbol: str,
@@ -1153,6 +1255,7 @@ class StateStore:
             f"max_hold={max_hold_hours}h"
         )
     
+    @_atomic
     def update_latency_stats(self, latency_data: Dict[str, Any]) -> None:
         """
         Update latency statistics in state.
@@ -1164,6 +1267,7 @@ class StateStore:
         state["latency_stats"] = latency_data
         self.save(state)
     
+    @_atomic
     def flag_asset_red_flag(self, symbol: str, reason: str, ban_hours: int = 168) -> None:
         """
         Flag an asset with a red flag (scam, exploit, regulatory action, etc.).
@@ -1193,6 +1297,7 @@ class StateStore:
             f"🚩 RED FLAG: {symbol} banned for {ban_hours}h (reason: {reason}, expires: {expires_at.isoformat()})"
         )
     
+    @_atomic
     def get_red_flag_banned_symbols(self) -> Dict[str, Dict[str, str]]:
         """
         Get all currently banned symbols (red flags).
@@ -1245,6 +1350,7 @@ class StateStore:
             return True, ban_info.get("reason", "unknown")
         return False, None
     
+    @_atomic
     def clear_red_flag_ban(self, symbol: str) -> bool:
         """
         Manually clear a red flag ban for a symbol.
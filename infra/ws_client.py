@@ -0,0 +1,143 @@
+"""
+247trader-v2 Infrastructure: WebSocket Client
+
+Thin blocking wrapper over the ``websocket-client`` package with the small
+surface the streaming feeds need: connect, send text, and recv with a timeout
+(None when nothing arrived) so a reader thread can wake up periodically.
+Framing, the opening handshake, ping/pong and close are handled by the
+library; its errors are mapped onto WebSocketError / WebSocketClosed.
+"""
+
+import logging
+import ssl
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    websocket = None  # type: ignore[assignment]
+    WEBSOCKET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketError(Exception):
+    """Protocol or handshake failure."""
+
+
+class WebSocketClosed(WebSocketError):
+    """The connection was closed (by either side)."""
+
+
+class WebSocketClient:
+    """
+    Blocking WebSocket client.
+
+    Usage:
+        ws = WebSocketClient("wss://advanced-trade-ws.coinbase.com")
+        ws.connect()
+        ws.send_text('{"type": "subscribe", ...}')
+        while True:
+            message = ws.recv(timeout=1.0)  # None on timeout
+    """
+
+    def __init__(self, url: str, connect_timeout: float = 5.0,
+                 ssl_context: Optional[ssl.SSLContext] = None,
+                 max_message_bytes: int = 16 * 1024 * 1024):
+        self.url = url
+        self.connect_timeout = connect_timeout
+        self.max_message_bytes = max_message_bytes
+        self._ssl_context = ssl_context
+        self._ws: Optional[Any] = None
+        # close() may run on another thread while the reader is in recv()
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    def connect(self) -> None:
+        if not WEBSOCKET_AVAILABLE:
+            raise WebSocketError("websocket-client required for streaming. Run: pip install websocket-client")
+        options: Dict[str, Any] = {"enable_multithread": True, "skip_utf8_validation": True}
+        if self._ssl_context is not None:
+            options["sslopt"] = {"context": self._ssl_context}
+        try:
+            ws = websocket.create_connection(self.url, timeout=self.connect_timeout, **options)
+        except (websocket.WebSocketException, OSError, ValueError) as e:
+            raise WebSocketError(f"Connect failed: {e}") from e
+        with self._lock:
+            self._ws = ws
+
+    def send_text(self, text: str) -> None:
+        ws = self._ws
+        if ws is None:
+            raise WebSocketClosed("Not connected")
+        try:
+            ws.send(text)
+        except (websocket.WebSocketException, OSError) as e:
+            self._drop()
+            raise WebSocketClosed(f"Send failed: {e}") from e
+
+    def recv(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Receive the next complete text (or binary, decoded) message.
+
+        Returns:
+            Message text, or None if nothing complete arrived within timeout
+
+        Raises:
+            WebSocketClosed: peer closed the connection or the socket failed
+        """
+        ws = self._ws
+        if ws is None:
+            raise WebSocketClosed("Not connected")
+        try:
+            ws.settimeout(timeout)
+            message = ws.recv()
+        except websocket.WebSocketTimeoutException:
+            return None
+        except websocket.WebSocketConnectionClosedException as e:
+            self._drop()
+            raise WebSocketClosed(f"Connection closed: {e}") from e
+        except (websocket.WebSocketException, OSError) as e:
+            if self._ws is None:
+                raise WebSocketClosed("Closed locally") from e
+            self._drop()
+            raise WebSocketClosed(f"Receive failed: {e}") from e
+
+        if len(message) > self.max_message_bytes:
+            self._drop()
+            raise WebSocketError("Message exceeds max_message_bytes")
+        if isinstance(message, bytes):
+            return message.decode("utf-8", errors="replace")
+        return message
+
+    def close(self) -> None:
+        with self._lock:
+            ws, self._ws = self._ws, None
+        if ws is None:
+            return
+        # Don't wait for the peer's close reply: the reader thread may be
+        # blocked in recv() on the same socket. abort() wakes it up.
+        try:
+            ws.send_close()
+        except (websocket.WebSocketException, OSError):
+            pass
+        self._shutdown(ws)
+
+    def _drop(self) -> None:
+        with self._lock:
+            ws, self._ws = self._ws, None
+        if ws is not None:
+            self._shutdown(ws)
+
+    @staticmethod
+    def _shutdown(ws: Any) -> None:
+        for step in (ws.abort, ws.shutdown):
+            try:
+                step()
+            except (websocket.WebSocketException, OSError):
+                pass
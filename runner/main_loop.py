@@ -17,19 +17,27 @@ This module implements Phase 1: Core skeleton (no AI, DRY_RUN only)
 
 import time
 import signal
+import threading
 import yaml
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import logging
 from uuid import uuid4
 from contextlib import contextmanager
 
-from core.exchange_coinbase import CoinbaseExchange
+from core.exchange_coinbase import MAX_CANDLES_PER_REQUEST, CoinbaseExchange
+from core.exchange_coinbase_async import AsyncCoinbaseExchange, AsyncIoConfig, CoinbaseExchangeFacade
+from core.market_data_feed import MarketDataFeed, MarketDataFeedConfig
+from core.order_events import OrderEventStream, UserOrderStreamConfig, await_order
+from core.execution_scheduler import ExecutionScheduler, ExecutionSchedulerConfig, ParentContext, ParentOrder
 from core.exceptions import CriticalDataUnavailable
-from core.universe import UniverseManager
+from core.universe import UniverseDiff, UniverseManager
+from core.catalog_cache import CatalogCache, CatalogCacheConfig
+from core.market_data_context import MarketDataContext
 from core.triggers import TriggerEngine
+from core.regime import IncrementalRegimeDetector, RegimeSignal, RegimeStateConfig
 from strategy.rules_engine import TradeProposal, RulesEngine
 from core.risk import RiskEngine, PortfolioState
 from core.execution import ExecutionEngine, ExecutionResult
@@ -44,6 +52,8 @@ from infra.symbols import normalize_symbol
 
 logger = logging.getLogger(__name__)
 
+REGIME_WARM_CANDLES = 168   # Candles per cycle once the regime detector is warm (the trigger scan's 1h window)
+
 
 class TradingLoop:
     """
@@ -57,6 +67,9 @@ class TradingLoop:
     - Handle errors gracefully
     """
 
+    market_data: Optional[MarketDataContext] = None   # Current cycle's shared market data
+    last_market_data_report: Optional[Dict[str, Any]] = None
+
     def __init__(self, config_dir: str = "config", mode_override: Optional[str] = None):
         """
         Initialize TradingLoop.
@@ -196,6 +209,14 @@ class TradingLoop:
         # Configure rate limits from policy (preferred) or fallback to app.yaml
         rate_limit_cfg = self.policy_config.get("rate_limits") or exchange_config.get("rate_limit")
         self.exchange.configure_rate_limits(rate_limit_cfg)
+        self.exchange.configure_http(exchange_config.get("http"))
+        self.exchange.configure_fanout(exchange_config.get("fanout"))
+        self.exchange.configure_candle_cache(exchange_config.get("candle_cache"))
+        self.exchange.configure_quote_cache(exchange_config.get("quote_cache"))
+        self.catalog_cache = self._load_catalog_cache(exchange_config.get("catalog_cache"))
+        self.market_data_feed: Optional[MarketDataFeed] = None
+        self._start_market_data_feed(exchange_config.get("market_data"))
+        self._enable_async_exchange(exchange_config.get("async_io"))
         state_cfg = self.app_config.get("state") or {}
         self.state_store = create_state_store_from_config(state_cfg)
         persist_interval = state_cfg.get("persist_interval_seconds")
@@ -242,11 +263,20 @@ class TradingLoop:
             state_store=self.state_store,
             alert_service=self.alerts,  # Wire alerts for empty universe detection
         )
+        if self.catalog_cache is not None:
+            self.universe_mgr.attach_catalog_cache(self.catalog_cache)
         self.trigger_engine = TriggerEngine()
+        self.trigger_engine.configure_indicator_state(
+            (self.app_config.get("triggers") or {}).get("indicator_state")
+        )
+        self.regime_detector = self._init_regime_detector(self.app_config.get("regime_detector"))
 
         # Initialize multi-strategy framework (REQ-STR1-3)
         from strategy.registry import StrategyRegistry
-        self.strategy_registry = StrategyRegistry(config_path=self.config_dir / "strategies.yaml")
+        self.strategy_registry = StrategyRegistry(
+            config_path=self.config_dir / "strategies.yaml",
+            metrics=self.metrics,
+        )
 
         # Keep legacy rules_engine reference for backward compatibility
         self.rules_engine = self.strategy_registry.strategies.get("rules_engine")
@@ -268,7 +298,12 @@ class TradingLoop:
             state_store=self.state_store,
             alert_service=self.alerts,  # Wire alerts for rejection bursts and reconcile mismatches
             risk_engine=self.risk_engine,  # Wire RiskEngine for TradeLimits cooldowns/spacing
+            metrics=self.metrics,
         )
+        self.order_event_stream: Optional[OrderEventStream] = None
+        self._start_order_event_stream(exchange_config.get("user_stream"))
+        self.execution_scheduler: Optional[ExecutionScheduler] = None
+        self._start_execution_scheduler((self.policy_config.get("execution") or {}).get("scheduler"))
 
         self.position_manager = PositionManager(
             policy=self.policy_config,
@@ -472,7 +507,8 @@ class TradingLoop:
 
         # State
         self.portfolio = self._init_portfolio_state()
-        self.current_regime = "chop"  # TODO: Replace with regime detector
+        self.current_regime = "chop"  # Until the regime detector has a full primary horizon
+        self.regime_signals: Dict[str, RegimeSignal] = {}
         self.cycle_count = 0  # Track cycle number for strategy context
 
         # Exception burst tracking for alert detection
@@ -519,8 +555,22 @@ class TradingLoop:
         # Stop loop after current cycle
         self._running = False
 
+        # Stop background parents first: their working children are canceled
+        # here, and no new slice can be placed behind the sweep below
+        self._stop_execution_scheduler()
         self._stop_state_store_supervisor()
         self._stop_health_server()
+        self._stop_market_data_feed()
+        self._persist_candle_cache()
+        self._persist_indicator_state()
+        self._persist_regime_state()
+        registry = getattr(self, "strategy_registry", None)
+        if registry is not None:
+            registry.shutdown()
+        executor = getattr(self, "executor", None)
+        if executor is not None and hasattr(executor, "shutdown"):
+            executor.shutdown()
+        self._stop_order_event_stream()
 
         # Graceful cleanup (only if not DRY_RUN)
         if self.mode == "DRY_RUN":
@@ -651,6 +701,295 @@ class TradingLoop:
         except Exception as exc:
             logger.warning("State store supervisor stop failed: %s", exc)
 
+    def _apply_universe_diff(self, universe) -> None:
+        """
+        Warm/evict per-symbol caches from what the last universe refresh changed.
+
+        Feed subscriptions follow added/removed symbols, and candle, indicator
+        and quote caches are pruned only when symbols left the universe. A
+        snapshot without a matching UniverseManager.last_diff is reconciled in
+        full.
+        """
+        diff = getattr(self.universe_mgr, "last_diff", None)
+        if not isinstance(diff, UniverseDiff) or diff.snapshot is not universe:
+            diff = None
+        elif not diff.is_empty:
+            logger.info(
+                "Universe diff: +%d -%d ~%d (added=%s removed=%s)",
+                len(diff.added), len(diff.removed), len(diff.changed),
+                [a.symbol for a in diff.added], diff.removed,
+            )
+
+        if self.market_data_feed and (diff is None or diff.added or diff.removed):
+            self.market_data_feed.update_symbols(a.symbol for a in universe.get_all_eligible())
+
+        evict = diff is None or bool(diff.removed)
+        if diff is not None and diff.removed:
+            invalidate = getattr(self.exchange, "invalidate_quotes", None)
+            if callable(invalidate):
+                for symbol in diff.removed:
+                    invalidate(symbol)
+        self._maintain_candle_cache(universe, evict=evict)
+        self._maintain_indicator_state(universe, diff)
+
+    def _maintain_candle_cache(self, universe, evict: bool = True) -> None:
+        """Evict candle series for symbols that left the universe and persist periodically."""
+        retain = getattr(self.exchange, "retain_candles", None)
+        if not callable(retain):
+            return
+        try:
+            if evict:
+                evicted = retain({a.symbol for a in universe.get_all_eligible()})
+                if evicted:
+                    logger.debug("Candle cache: evicted %s series", evicted)
+            self.exchange.persist_candles()
+        except Exception as exc:
+            logger.warning("Candle cache maintenance failed: %s", exc)
+
+    def _persist_candle_cache(self) -> None:
+        persist = getattr(self.exchange, "persist_candles", None)
+        if not callable(persist):
+            return
+        try:
+            persist(force=True)
+        except Exception as exc:
+            logger.warning("Candle cache persist on shutdown failed: %s", exc)
+
+    def _maintain_indicator_state(self, universe, diff: Optional[UniverseDiff] = None) -> None:
+        """Drop streaming indicator state for symbols that left the universe and persist periodically."""
+        try:
+            if diff is None:
+                self.trigger_engine.retain_indicators(a.symbol for a in universe.get_all_eligible())
+            else:
+                self.trigger_engine.apply_universe_diff(diff)
+            self.trigger_engine.persist_indicators()
+        except Exception as exc:
+            logger.warning("Indicator state maintenance failed: %s", exc)
+
+    def _persist_indicator_state(self) -> None:
+        engine = getattr(self, "trigger_engine", None)
+        if engine is None:
+            return
+        try:
+            engine.persist_indicators(force=True)
+        except Exception as exc:
+            logger.warning("Indicator state persist on shutdown failed: %s", exc)
+
+    def _init_regime_detector(self, regime_cfg: Optional[Dict[str, Any]]) -> Optional[IncrementalRegimeDetector]:
+        """Build the rolling regime detector from app.yaml regime_detector and restore its checkpoint."""
+        config = RegimeStateConfig.from_dict(regime_cfg)
+        if not config.enabled:
+            logger.info("Regime detector disabled; trading in chop")
+            return None
+        detector = IncrementalRegimeDetector(config)
+        detector.load()
+        logger.info(
+            "Regime detector: %s %s, horizons=%s (primary=%s)",
+            config.symbol, config.interval, ",".join(config.horizons), config.primary,
+        )
+        return detector
+
+    def _update_regime(self) -> None:
+        """Advance the regime detector with the latest candles and set current_regime from its primary horizon."""
+        detector = getattr(self, "regime_detector", None)
+        if detector is None:
+            return
+        config = detector.config
+        # Cold: as much history as one request returns; warm: the trigger
+        # scan's window, so its read of the same series is a memo hit
+        limit = min(detector.max_bars, MAX_CANDLES_PER_REQUEST) if detector.bars == 0 else REGIME_WARM_CANDLES
+        source = self.market_data if self.market_data is not None else self.exchange
+        try:
+            candles = source.get_ohlcv(config.symbol, interval=config.interval, limit=limit)
+            signals = detector.sync(candles)
+        except Exception as exc:
+            logger.warning("Regime detection failed; keeping %s: %s", self.current_regime, exc)
+            return
+
+        self.regime_signals = signals
+        primary = signals[config.primary]
+        if primary.regime != self.current_regime:
+            logger.info("Regime change: %s -> %s (%s)", self.current_regime, primary.regime, primary.reason)
+        self.current_regime = primary.regime
+        logger.info(
+            "Regime: %s",
+            " | ".join(f"{name}={signal.regime}({signal.btc_trend_pct:+.1f}%)" for name, signal in signals.items()),
+        )
+        detector.maybe_save()
+
+    def _persist_regime_state(self) -> None:
+        detector = getattr(self, "regime_detector", None)
+        if detector is None:
+            return
+        try:
+            detector.maybe_save(force=True)
+        except Exception as exc:
+            logger.warning("Regime state persist on shutdown failed: %s", exc)
+
+    def _load_catalog_cache(self, cache_cfg: Optional[Dict[str, Any]]) -> Optional[CatalogCache]:
+        """Restore the persisted product catalog when exchange.catalog_cache has a persist_path."""
+        config = CatalogCacheConfig.from_dict(cache_cfg)
+        if not config.enabled or not config.persist_path:
+            return None
+        cache = CatalogCache(config)
+        cache.load()
+        self.exchange.attach_catalog_cache(cache)
+        return cache
+
+    def _enable_async_exchange(self, async_cfg: Optional[Dict[str, Any]]) -> None:
+        """Route reads/orders through the asyncio connector when exchange.async_io.enabled is set."""
+        config = AsyncIoConfig.from_dict(async_cfg)
+        if not config.enabled:
+            return
+        async_exchange = AsyncCoinbaseExchange(self.exchange, max_connections=config.max_connections)
+        self.exchange = CoinbaseExchangeFacade(async_exchange)
+        logger.info("Async exchange I/O enabled (max_connections=%d)", config.max_connections)
+
+    def _start_market_data_feed(self, md_cfg: Optional[Dict[str, Any]]) -> None:
+        """Start the streaming quote cache when exchange.market_data.enabled is set."""
+        md_cfg = md_cfg or {}
+        config = MarketDataFeedConfig.from_dict(md_cfg)
+        if not config.enabled:
+            return
+        if md_cfg.get("max_quote_age_seconds") is None:
+            # Same limit ExecutionEngine applies, so cached quotes are never rejected as stale
+            micro = self.policy_config.get("microstructure", {}) or {}
+            config.max_quote_age_seconds = float(micro.get("max_quote_age_seconds", 30))
+        feed = MarketDataFeed(config)
+        self.exchange.attach_market_data_feed(feed)
+        feed.start()
+        self.market_data_feed = feed
+
+    def _stop_market_data_feed(self) -> None:
+        feed = getattr(self, "market_data_feed", None)
+        if not feed:
+            return
+        try:
+            feed.stop()
+        except Exception as exc:  # pragma: no cover - best-effort shutdown
+            logger.warning("Market data feed stop failed: %s", exc)
+        finally:
+            self.market_data_feed = None
+            self.exchange.attach_market_data_feed(None)
+
+    def _start_order_event_stream(self, stream_cfg: Optional[Dict[str, Any]]) -> None:
+        """Track live orders over the user channel when exchange.user_stream.enabled is set."""
+        config = UserOrderStreamConfig.from_dict(stream_cfg)
+        if not config.enabled:
+            return
+        if self.mode != "LIVE":
+            logger.info("User order stream disabled in %s mode (no exchange orders)", self.mode)
+            return
+        stream = OrderEventStream(config, auth=self.exchange.websocket_auth)
+        self.executor.attach_order_events(stream)
+        stream.start()
+        self.order_event_stream = stream
+
+    def _stop_order_event_stream(self) -> None:
+        stream = getattr(self, "order_event_stream", None)
+        if not stream:
+            return
+        try:
+            stream.stop()
+        except Exception as exc:  # pragma: no cover - best-effort shutdown
+            logger.warning("User order stream stop failed: %s", exc)
+        finally:
+            self.order_event_stream = None
+            self.executor.attach_order_events(None)
+
+    def _start_execution_scheduler(self, scheduler_cfg: Optional[Dict[str, Any]]) -> None:
+        """Run TWAP/ladder parents in the background when execution.scheduler.enabled is set."""
+        config = ExecutionSchedulerConfig.from_dict(scheduler_cfg)
+        if not config.enabled:
+            return
+        self.execution_scheduler = ExecutionScheduler(
+            config,
+            state_store=self.state_store,
+            cancel_order=self.exchange.cancel_order,
+            halt_check=self._kill_switch_active,
+        )
+        logger.info("Execution scheduler enabled (max_workers=%d)", config.max_workers)
+
+    def _stop_execution_scheduler(self) -> None:
+        scheduler = getattr(self, "execution_scheduler", None)
+        if not scheduler:
+            return
+        try:
+            summary = scheduler.shutdown()
+            if summary.get("parents"):
+                logger.warning("Execution scheduler stopped: %s", summary)
+        except Exception as exc:  # pragma: no cover - best-effort shutdown
+            logger.warning("Execution scheduler stop failed: %s", exc)
+        finally:
+            self.execution_scheduler = None
+
+    def _kill_switch_active(self) -> bool:
+        governance_cfg = (self.policy_config.get("governance") or {}) if hasattr(self, "policy_config") else {}
+        kill_switch_file = governance_cfg.get("kill_switch_file", "data/KILL_SWITCH")
+        return bool(kill_switch_file and Path(kill_switch_file).exists())
+
+    def _liquidate(
+        self,
+        currency: str,
+        balance: float,
+        *,
+        usd_target: Optional[float] = None,
+        tier: Optional[int] = None,
+        preferred_pair: Optional[str] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ) -> bool:
+        """
+        Sell a holding via maker TWAP, in the background when the scheduler is on.
+
+        Returns:
+            Without a scheduler (or outside LIVE): the TWAP result.
+            With one: True once the parent is accepted (on_done receives the
+            final result later), False if this currency already has a parent
+            in flight or the scheduler is stopping.
+        """
+        if not self._liquidates_in_background():
+            success = self._sell_via_market_order(
+                currency,
+                balance,
+                usd_target=usd_target,
+                tier=tier,
+                preferred_pair=preferred_pair,
+            )
+            if on_done is not None:
+                on_done(success)
+            return success
+
+        def job(ctx: ParentContext) -> bool:
+            return self._sell_via_market_order(
+                currency,
+                balance,
+                usd_target=usd_target,
+                tier=tier,
+                preferred_pair=preferred_pair,
+                ctx=ctx,
+            )
+
+        def finished(_parent: ParentOrder, success: bool) -> None:
+            if on_done is not None:
+                on_done(success)
+
+        parent = self.execution_scheduler.submit(
+            "twap",
+            currency,
+            "SELL",
+            usd_target if usd_target is not None else 0.0,
+            job,
+            on_done=finished,
+        )
+        if parent is None:
+            logger.info("TWAP: %s liquidation already in flight; not scheduling another", currency)
+            return False
+        return True
+
+    def _liquidates_in_background(self) -> bool:
+        """True when _liquidate hands sells to the execution scheduler (accepted, not yet filled)."""
+        return getattr(self, "execution_scheduler", None) is not None and self.mode == "LIVE"
+
     def _stop_health_server(self) -> None:
         server = getattr(self, "health_server", None)
         if not server:
@@ -701,9 +1040,7 @@ class TradingLoop:
         except Exception:
             exchange_rate = {}
 
-        governance_cfg = (self.policy_config.get("governance") or {}) if hasattr(self, "policy_config") else {}
-        kill_switch_file = governance_cfg.get("kill_switch_file", "data/KILL_SWITCH")
-        kill_switch_active = bool(kill_switch_file and Path(kill_switch_file).exists())
+        kill_switch_active = self._kill_switch_active()
 
         circuit_snapshot: Dict[str, Any] = {}
         if hasattr(self, "risk_engine") and hasattr(self.risk_engine, "circuit_snapshot"):
@@ -766,6 +1103,17 @@ class TradingLoop:
         payload["ok"] = len(issues) == 0
         return payload
 
+    def _warm_up_connections(self) -> None:
+        """Pre-open keep-alive connections before the first live cycle (skipped in DRY_RUN)."""
+        if self.mode == "DRY_RUN":
+            return
+        try:
+            opened = self.exchange.warm_up_connections()
+            if opened:
+                logger.info("Warmed up %d exchange connection(s)", opened)
+        except Exception as exc:  # pragma: no cover - best-effort warm-up
+            logger.debug("Connection warm-up failed: %s", exc)
+
     def _startup_validations(self) -> None:
         """
         Run startup validations per REQ-SEC2 and REQ-TIME1.
@@ -1089,15 +1437,18 @@ class TradingLoop:
         )
 
         price_cache: Dict[str, Optional[float]] = {"USD": 1.0, "USDC": 1.0, "USDT": 1.0}
+        usd_quote_failed = self._prefetch_usd_mids(accounts, cash_equivalents, price_cache)
 
         def _get_mid(currency: str) -> Optional[float]:
             if currency in price_cache:
                 return price_cache[currency]
 
             for quote_currency in ("USD", "USDC", "USDT"):
+                if quote_currency == "USD" and currency in usd_quote_failed:
+                    continue  # already tried in the concurrent prefetch
                 product_id = f"{currency}-{quote_currency}"
                 try:
-                    quote = self.exchange.get_quote(product_id)
+                    quote = self.exchange.get_quote(product_id, caller="TradingLoop._build_account_snapshot")
                     mid = float(getattr(quote, "mid", 0.0))
                 except Exception:
                     mid = 0.0
@@ -1171,6 +1522,62 @@ class TradingLoop:
 
         return snapshot
 
+    def _prefetch_usd_mids(
+        self,
+        accounts: List[dict],
+        cash_equivalents: set,
+        price_cache: Dict[str, Optional[float]],
+    ) -> set:
+        """
+        Quote every non-cash holding against USD in one fan-out batch.
+
+        Priced currencies are written into price_cache. Returns the currencies
+        whose USD quote failed so the caller can go straight to the stablecoin
+        pairs instead of retrying USD serially.
+        """
+        fetch_many = getattr(self.exchange, "fetch_many", None)
+        if not callable(fetch_many):
+            return set()
+
+        currencies = []
+        for account in accounts or []:
+            currency = account.get("currency")
+            if not currency or currency in cash_equivalents or currency in price_cache or currency in currencies:
+                continue
+            try:
+                available = float(account.get("available_balance", {}).get("value", 0.0) or 0.0)
+                hold = float(account.get("hold", {}).get("value", 0.0) or 0.0)
+            except (TypeError, ValueError):
+                continue
+            if available + hold > 0:
+                currencies.append(currency)
+
+        if len(currencies) < 2:
+            return set()
+
+        try:
+            results = fetch_many("quote", [f"{currency}-USD" for currency in currencies],
+                                 caller="TradingLoop._prefetch_usd_mids")
+        except Exception as exc:
+            logger.debug("Concurrent USD quote prefetch failed: %s", exc)
+            return set()
+        if not isinstance(results, list) or len(results) != len(currencies):
+            return set()
+
+        failed = set()
+        for currency, result in zip(currencies, results):
+            mid = 0.0
+            if getattr(result, "ok", False):
+                try:
+                    mid = float(getattr(result.value, "mid", 0.0))
+                except (TypeError, ValueError):
+                    mid = 0.0
+            if mid > 0:
+                price_cache[currency] = mid
+            else:
+                failed.add(currency)
+        return failed
+
     def _build_pending_orders_from_state(self, state: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
         """
         Build pending_orders dict from persisted open_orders for risk accounting.
@@ -1499,6 +1906,9 @@ class TradingLoop:
             min_value_usd=min_value,
             sort_by="performance",
         )
+        scheduler = getattr(self, "execution_scheduler", None)
+        if scheduler is not None:
+            candidates = [c for c in candidates if not scheduler.is_active(c.get("currency"))]
         if not candidates:
             logger.warning("Capacity check: no liquidation candidates available to free slot")
             return False
@@ -1520,22 +1930,24 @@ class TradingLoop:
             balance,
         )
 
-        success = self._sell_via_market_order(
+        def _trim_done(success: bool) -> None:
+            if success:
+                logger.info(
+                    "Capacity trim complete: freed slot by selling %s (~$%.2f)",
+                    candidate.get("currency"),
+                    usd_target,
+                )
+
+        # With the execution scheduler, True means the TWAP parent was accepted
+        return self._liquidate(
             candidate.get("currency"),
             balance,
             usd_target=usd_target,
             tier=tier,
             preferred_pair=candidate.get("pair"),
+            on_done=_trim_done,
         )
 
-        if success:
-            logger.info(
-                "Capacity trim complete: freed slot by selling %s (~$%.2f)",
-                candidate.get("currency"),
-                usd_target,
-            )
-        return success
-
     def _ensure_capacity_for_new_positions(self) -> Optional[str]:
         """Ensure we have room for new positions; trim if max_open is saturated."""
         strategy_cfg = self.policy_config.get("strategy", {}) or {}
@@ -1545,6 +1957,18 @@ class TradingLoop:
         if current_open < max_open:
             return None
 
+        scheduler = getattr(self, "execution_scheduler", None)
+        in_flight = [p.symbol for p in scheduler.active() if p.side == "SELL"] if scheduler is not None else []
+        if in_flight:
+            # The slot is pending until the background sell fills; don't trim another
+            logger.info(
+                "Max open positions reached (%d/%d); liquidation of %s still in flight, waiting for it to free a slot.",
+                current_open,
+                max_open,
+                ", ".join(sorted(in_flight)),
+            )
+            return "max_open_positions_trim_pending"
+
         logger.warning(
             "Max open positions reached (%d/%d). Attempting to free a slot before proposing new trades.",
             current_open,
@@ -1553,7 +1977,8 @@ class TradingLoop:
 
         trimmed = self._trim_worst_position_for_capacity()
         if trimmed:
-            return "max_open_positions_trimmed"
+            # An accepted background parent has not freed the slot yet
+            return "max_open_positions_trim_pending" if self._liquidates_in_background() else "max_open_positions_trimmed"
         return "max_open_positions_saturated"
 
     def run_cycle(self):
@@ -1572,6 +1997,11 @@ class TradingLoop:
         logger.info(f"CYCLE START: {cycle_started.isoformat()} (Cycle #{self.cycle_count})")
         logger.info("=" * 80)
         self._stage_timings = {}
+        # Quotes are shared within a cycle, never across cycles
+        invalidate_quotes = getattr(self.exchange, "invalidate_quotes", None)
+        if callable(invalidate_quotes):
+            invalidate_quotes()
+        self._begin_market_data()
 
         try:
             logger.info("📋 Step 0: Purging expired pending orders...")
@@ -1684,6 +2114,10 @@ class TradingLoop:
                     logger.info(
                         "Capacity freed this cycle; skipping new proposals to allow state to settle."
                     )
+                elif capacity_reason == "max_open_positions_trim_pending":
+                    logger.info(
+                        "Capacity trim in flight; skipping new proposals until the liquidation fills."
+                    )
                 else:
                     logger.warning(
                         "Max open positions remain saturated; skipping proposal generation this cycle."
@@ -1709,11 +2143,18 @@ class TradingLoop:
                 )
                 return
 
+            # Regime from BTC (rolling state, one candle update per cycle)
+            with self._stage_timer("regime_detect"):
+                self._update_regime()
+
             # Step 6: Build universe
             logger.info("🌍 Step 6: Building trading universe...")
             with self._stage_timer("universe_build"):
-                universe = self.universe_mgr.get_universe(regime=self.current_regime)
+                universe = self.universe_mgr.get_universe(regime=self.current_regime,
+                                                          market_data=self.market_data)
                 logger.info(f"✅ Universe built: {universe.total_eligible} eligible assets")
+            if universe:
+                self._apply_universe_diff(universe)
 
             # Optional purge: liquidate excluded/ineligible holdings proactively
             logger.info("🧹 Step 7: Checking for ineligible holdings to purge...")
@@ -1769,7 +2210,8 @@ class TradingLoop:
             logger.info(f"🔎 Step 8: Scanning {universe.total_eligible} assets for triggers (regime={self.current_regime})...")
             with self._stage_timer("trigger_scan"):
                 all_assets = universe.get_all_eligible()
-                triggers = self.trigger_engine.scan(all_assets, regime=self.current_regime)
+                triggers = self.trigger_engine.scan(all_assets, regime=self.current_regime,
+                                                    market_data=self.market_data)
                 logger.info(f"✅ Trigger scan complete: {len(triggers) if triggers else 0} signals detected")
 
             if not triggers or len(triggers) == 0:
@@ -1810,6 +2252,7 @@ class TradingLoop:
                             portfolio=self.portfolio,
                             guardrails=guardrails_snapshot,
                             metadata=ai_agent_metadata,
+                            features=self.market_data.features if self.market_data is not None else None,
                         )
                         
                         if ai_agent_proposals:
@@ -1915,6 +2358,7 @@ class TradingLoop:
                     cycle_number=self.cycle_count + 1,
                     nav=float(self.portfolio.account_value_usd or 0.0),
                     state=self.state_store.load(),
+                    market_data=self.market_data.view() if self.market_data is not None else None,
                     )
 
                     # Generate proposals from local rules engine
@@ -1933,43 +2377,44 @@ class TradingLoop:
                     if self.dual_trader_enabled and self.ai_trader_strategy and self.meta_arbitrator:
                         logger.info("🤖 Dual-trader mode: generating AI trader proposals...")
 
-                    # Enrich context for AI trader
-                    ai_context = StrategyContext(
-                        universe=strategy_context.universe,
-                        triggers=strategy_context.triggers,
-                        regime=strategy_context.regime,
-                        timestamp=strategy_context.timestamp,
-                        cycle_number=strategy_context.cycle_number,
-                        nav=strategy_context.nav,
-                        state={
-                            **(strategy_context.state or {}),
-                            "positions": self.state_store.load().get("positions", {}),
-                            "available_capital": self.portfolio.available_capital_usd or 0.0,
-                        },
-                        risk_constraints={
-                            "max_total_at_risk_pct": self.runtime_max_at_risk_pct,
-                            "max_position_size_pct": self.policy_config.get("max_position_size_pct", 7.0),
-                            "min_trade_notional_usd": self.policy_config.get("min_trade_notional_usd", 5.0),
-                            "max_trades_per_cycle": self.policy_config.get("max_trades_per_cycle", 3),
-                            "max_trades_per_day": self.policy_config.get("max_trades_per_day", 10),
-                        },
-                    )
-
-                    ai_proposals = self.ai_trader_strategy.generate_proposals(ai_context)
-                    logger.info(f"✅ AI trader generated {len(ai_proposals)} proposals")
+                        # Enrich context for AI trader
+                        ai_context = StrategyContext(
+                            universe=strategy_context.universe,
+                            triggers=strategy_context.triggers,
+                            regime=strategy_context.regime,
+                            timestamp=strategy_context.timestamp,
+                            cycle_number=strategy_context.cycle_number,
+                            nav=strategy_context.nav,
+                            market_data=strategy_context.market_data,
+                            state={
+                                **(strategy_context.state or {}),
+                                "positions": self.state_store.load().get("positions", {}),
+                                "available_capital": self.portfolio.available_capital_usd or 0.0,
+                            },
+                            risk_constraints={
+                                "max_total_at_risk_pct": self.runtime_max_at_risk_pct,
+                                "max_position_size_pct": self.policy_config.get("max_position_size_pct", 7.0),
+                                "min_trade_notional_usd": self.policy_config.get("min_trade_notional_usd", 5.0),
+                                "max_trades_per_cycle": self.policy_config.get("max_trades_per_cycle", 3),
+                                "max_trades_per_day": self.policy_config.get("max_trades_per_day", 10),
+                            },
+                        )
 
-                    # Arbitrate between local and AI proposals
-                    proposals, arbitration_log = self.meta_arbitrator.aggregate_proposals(
-                        local_proposals=local_proposals,
-                        ai_proposals=ai_proposals,
-                    )
+                        ai_proposals = self.ai_trader_strategy.generate_proposals(ai_context)
+                        logger.info(f"✅ AI trader generated {len(ai_proposals)} proposals")
 
-                    # Log arbitration decisions
-                    for decision in arbitration_log:
-                        logger.info(
-                            f"  ⚖️  {decision.symbol}: {decision.resolution} - {decision.reason}"
+                        # Arbitrate between local and AI proposals
+                        proposals, arbitration_log = self.meta_arbitrator.aggregate_proposals(
+                            local_proposals=local_proposals,
+                            ai_proposals=ai_proposals,
                         )
 
+                        # Log arbitration decisions
+                        for decision in arbitration_log:
+                            logger.info(
+                                f"  ⚖️  {decision.symbol}: {decision.resolution} - {decision.reason}"
+                            )
+
                         # Store arbitration log for audit trail
                         self._current_arbitration_log = arbitration_log
 
@@ -1988,6 +2433,7 @@ class TradingLoop:
                             portfolio=self.portfolio,
                             guardrails=guardrails_snapshot,
                             metadata=ai_agent_metadata,
+                            features=self.market_data.features if self.market_data is not None else None,
                         )
 
                         if ai_agent_proposals:
@@ -2251,7 +2697,8 @@ class TradingLoop:
                 risk_result = self.risk_engine.check_all(
                     proposals=proposals,
                     portfolio=self.portfolio,
-                    regime=self.current_regime
+                    regime=self.current_regime,
+                    market_data=self.market_data,
                 )
                 logger.info(f"✅ Risk checks complete: approved={risk_result.approved}, filtered={len(risk_result.approved_proposals)}/{len(proposals)}")
 
@@ -2345,6 +2792,7 @@ class TradingLoop:
 
             adjusted_proposals: List[Tuple[TradeProposal, float]] = []
             final_orders: List[ExecutionResult] = []
+            executed_proposals: List[TradeProposal] = []
 
             with self._stage_timer("execution"):
                 # Step 12a: Check if we need to rebalance BEFORE attempting execution (LIVE/PAPER only)
@@ -2441,49 +2889,57 @@ class TradingLoop:
                         )
                         return
 
-                    # Execute each adjusted proposal
+                    # Execute adjusted proposals (independent assets are dispatched concurrently)
                     logger.info(f"📤 Step 12d: Submitting {len(adjusted_proposals)} order(s) to exchange...")
+                    batch = []
                     for idx, (proposal, size_usd) in enumerate(adjusted_proposals, 1):
                         logger.info(f"🔹 Order {idx}/{len(adjusted_proposals)}: {proposal.side} {proposal.symbol} ${size_usd:.2f} (confidence={proposal.confidence:.2f})")
+                        batch.append({
+                            "symbol": proposal.symbol,
+                            "side": proposal.side,
+                            "size_usd": size_usd,
+                            # Extract tier from proposal asset if available
+                            "tier": proposal.asset.tier if proposal.asset else None,
+                            "confidence": proposal.confidence,
+                        })
 
-                        # Extract tier from proposal asset if available
-                        tier = proposal.asset.tier if proposal.asset else None
-
-                        try:
-                            result = self.executor.execute(
-                                symbol=proposal.symbol,
-                                side=proposal.side,
-                                size_usd=size_usd,
-                                tier=tier,
-                                confidence=proposal.confidence,
-                            )
-                        except CriticalDataUnavailable as data_exc:
-                            self._abort_cycle_due_to_data(
-                                cycle_started,
-                                data_exc.source,
-                                str(data_exc.original) if data_exc.original else None,
-                            )
-                            return
+                    try:
+                        results = self.executor.execute_batch(batch)
+                    except CriticalDataUnavailable as data_exc:
+                        self._abort_cycle_due_to_data(
+                            cycle_started,
+                            data_exc.source,
+                            str(data_exc.original) if data_exc.original else None,
+                        )
+                        return
 
+                    for (proposal, _), result in zip(adjusted_proposals, results):
+                        latency = (
+                            f", ack={result.ack_latency_seconds * 1000:.0f}ms"
+                            if result.ack_latency_seconds is not None else ""
+                        )
                         if result.success:
                             if result.filled_size and result.filled_size > 0:
                                 logger.info(
-                                    "✅ Order filled: %s %.6f @ $%.2f (route=%s, order_id=%s)",
+                                    "✅ Order filled: %s %.6f @ $%.2f (route=%s, order_id=%s%s)",
                                     proposal.symbol,
                                     result.filled_size,
                                     result.filled_price,
                                     result.route,
                                     result.order_id,
+                                    latency,
                                 )
                             else:
                                 logger.info(
-                                    "🕒 Order accepted: %s %s (route=%s, order_id=%s)",
+                                    "🕒 Order accepted: %s %s (route=%s, order_id=%s%s)",
                                     proposal.side,
                                     proposal.symbol,
                                     result.route,
                                     result.order_id,
+                                    latency,
                                 )
                             final_orders.append(result)
+                            executed_proposals.append(proposal)
                         else:
                             logger.warning(f"⚠️ Trade failed: {proposal.symbol} - {result.error}")
 
@@ -2504,7 +2960,7 @@ class TradingLoop:
                     self.metrics.record_fill_ratio(fill_count, total_attempts)
 
                 # Record each fill by side and update managed positions
-                for order, (proposal, _) in zip(final_orders, adjusted_proposals):
+                for order, proposal in zip(final_orders, executed_proposals):
                     if order.success:
                         # Record fill metric
                         side = proposal.side.lower() if hasattr(proposal, 'side') else "buy"
@@ -2745,6 +3201,7 @@ class TradingLoop:
         if not status.startswith("executed"):
             metrics.record_no_trade_reason(status)
         self._log_cycle_latency_summary(status=status, total_duration=duration)
+        self._log_market_data_report()
 
         # Update Prometheus metrics if enabled
         if self.prometheus_exporter:
@@ -2768,6 +3225,22 @@ class TradingLoop:
             if latency_tracker:
                 latency_tracker.record(f"cycle_{stage}", duration * 1000.0, {"mode": self.mode})
 
+    def _begin_market_data(self) -> None:
+        """Start the cycle's shared MarketDataContext (universe -> triggers -> strategies -> risk -> execution)."""
+        self.market_data = MarketDataContext(self.exchange, cycle_id=getattr(self, "run_id", None))
+        executor = getattr(self, "executor", None)
+        if executor is not None:
+            executor.market_data = self.market_data
+
+    def _log_market_data_report(self) -> None:
+        market_data = self.market_data
+        if market_data is None:
+            return
+        report = market_data.report()
+        if report["requests"] or (report["features"] or {}).get("requests"):
+            logger.info(market_data.summary())
+        self.last_market_data_report = report
+
     def _log_cycle_latency_summary(self, *, status: str, total_duration: float) -> None:
         metrics = getattr(self, "metrics", None)
         per_cycle = getattr(self, "_stage_timings", None)
@@ -2920,7 +3393,7 @@ class TradingLoop:
 
             # Estimate USD value
             try:
-                quote = self.exchange.get_quote(symbol)
+                quote = self.exchange.get_quote(symbol, caller="TradingLoop._purge_ineligible_holdings")
                 value_usd = balance * quote.mid
             except Exception as e:
                 logger.info(f"Skip purge for {symbol}: cannot quote ({e})")
@@ -2976,50 +3449,46 @@ class TradingLoop:
             tier = tier or 3
 
             tag = "excluded" if is_excluded else "ineligible"
+            scheduler = getattr(self, "execution_scheduler", None)
+            if scheduler is not None and scheduler.is_active(currency):
+                logger.info(f"Purge: {currency} liquidation already in flight, skipping")
+                continue
             logger.info(f"Purge: selling {balance:.6f} {currency} ({tag}), ~${value_usd:.2f}")
 
-            if self._sell_via_market_order(
+            def _purge_done(success: bool, symbol=symbol, balance=balance, value_usd=value_usd,
+                            prior=liquidations) -> None:
+                if success:
+                    # Clear any previous purge failure tracking on success
+                    if self.state_store.clear_purge_failure(symbol):
+                        logger.info(f"✅ Purge success for {symbol}, cleared failure tracking")
+                    return
+
+                logger.warning(f"⚠️ Purge sell failed for {symbol}")
+                # Track purge failure in state (backoff for future cycles)
+                failure_count = self.state_store.record_purge_failure(
+                    symbol,
+                    {
+                        "last_error": f"Purge failed after {prior} other liquidations",
+                        "balance": balance,
+                        "value_usd": value_usd,
+                    },
+                )
+                logger.info(
+                    f"📝 Tracked purge failure for {symbol}: "
+                    f"count={failure_count}, balance={balance:.6f}, value=${value_usd:.2f}"
+                )
+
+            # With the execution scheduler this only submits the TWAP parent;
+            # _purge_done runs when it finishes
+            if self._liquidate(
                 currency,
                 balance,
                 usd_target=value_usd,
                 tier=tier,
                 preferred_pair=symbol,
+                on_done=_purge_done,
             ):
                 liquidations += 1
-                # Clear any previous purge failure tracking on success
-                state = self.state_store.load()
-                purge_failures = state.get("purge_failures", {})
-                if symbol in purge_failures:
-                    del purge_failures[symbol]
-                    state["purge_failures"] = purge_failures
-                    self.state_store.save(state)
-                    logger.info(f"✅ Purge success for {symbol}, cleared failure tracking")
-            else:
-                logger.warning(f"⚠️ Purge sell failed for {symbol}")
-
-                # Track purge failure in state (backoff for future cycles)
-                state = self.state_store.load()
-                purge_failures = state.get("purge_failures", {})
-
-                failure_entry = purge_failures.get(symbol, {})
-                failure_count = failure_entry.get("failure_count", 0) + 1
-                now_iso = datetime.now(timezone.utc).isoformat()
-
-                purge_failures[symbol] = {
-                    "failure_count": failure_count,
-                    "last_failed_at_iso": now_iso,
-                    "last_error": f"Purge failed after {liquidations} other liquidations",
-                    "balance": balance,
-                    "value_usd": value_usd,
-                }
-
-                state["purge_failures"] = purge_failures
-                self.state_store.save(state)
-
-                logger.info(
-                    f"📝 Tracked purge failure for {symbol}: "
-                    f"count={failure_count}, balance={balance:.6f}, value=${value_usd:.2f}"
-                )
 
     def _reconcile_exchange_state(self) -> None:
         """Refresh the persistent state store with the latest exchange snapshot."""
@@ -3056,11 +3525,11 @@ class TradingLoop:
             }
 
             try:
-                quote = self.exchange.get_quote(f"{currency}-USD")
+                quote = self.exchange.get_quote(f"{currency}-USD", caller="TradingLoop._reconcile_exchange_state")
                 position["usd_value"] = total * quote.mid
             except Exception:
                 try:
-                    quote = self.exchange.get_quote(f"{currency}-USDC")
+                    quote = self.exchange.get_quote(f"{currency}-USDC", caller="TradingLoop._reconcile_exchange_state")
                     position["usd_value"] = total * quote.mid
                 except Exception:
                     position["usd_value"] = 0.0
@@ -3139,7 +3608,7 @@ class TradingLoop:
                 price = float(px_raw) if px_raw else None
                 if price is None and base_units > 0:
                     try:
-                        quote = self.exchange.get_quote(product)
+                        quote = self.exchange.get_quote(product, caller="TradingLoop._get_open_order_exposure")
                         price = quote.mid
                     except Exception:
                         price = 0.0
@@ -3151,7 +3620,7 @@ class TradingLoop:
                     base_units = float(market_conf.get("base_size") or 0.0)
                     if base_units > 0:
                         try:
-                            quote = self.exchange.get_quote(product)
+                            quote = self.exchange.get_quote(product, caller="TradingLoop._get_open_order_exposure")
                             notional = base_units * quote.mid
                         except Exception:
                             notional = 0.0
@@ -3212,6 +3681,13 @@ class TradingLoop:
         exposure_usd += self.portfolio.get_pending_notional_usd("buy")
         logger.info(f"  📊 + Pending buys: ${self.portfolio.get_pending_notional_usd('buy'):.2f}")
 
+        # Background liquidations still working are pending sells: exposure on its way out
+        scheduler = getattr(self, "execution_scheduler", None)
+        in_flight_usd = scheduler.remaining_usd("SELL") if scheduler is not None else 0.0
+        if in_flight_usd > 0:
+            exposure_usd = max(0.0, exposure_usd - in_flight_usd)
+            logger.info(f"  📊 - In-flight liquidations: ${in_flight_usd:.2f}")
+
         exposure_pct = (exposure_usd / nav) * 100 if nav else 0.0
         logger.info(f"  📊 Total exposure: ${exposure_usd:.2f} ({exposure_pct:.1f}%)")
 
@@ -3276,7 +3752,7 @@ class TradingLoop:
                     else:
                         try:
                             pair = f"{curr}-USD"
-                            quote = self.executor.exchange.get_quote(pair)
+                            quote = self.executor.exchange.get_quote(pair, caller="TradingLoop._auto_trim_to_risk_cap")
                             usd_val = bal * quote.mid
                             is_preferred = curr in self.executor.preferred_quotes
                             status = "preferred quote (normally exempt)" if is_preferred else "eligible for trim"
@@ -3326,7 +3802,7 @@ class TradingLoop:
 
                 try:
                     pair = f"{curr}-USD"
-                    quote = self.executor.exchange.get_quote(pair)
+                    quote = self.executor.exchange.get_quote(pair, caller="TradingLoop._auto_trim_to_risk_cap")
                     value_usd = bal * quote.mid
                     logger.info(f"    💰 {curr} value: ${value_usd:.2f} (min_notional=${self.executor.min_notional_usd:.2f})")
 
@@ -3408,6 +3884,7 @@ class TradingLoop:
         target_account_uuid = preferred_target.get("uuid") if preferred_target else None
 
         remaining_excess_usd = excess_usd
+        scheduled_usd = 0.0   # Accepted by the scheduler: pending, not freed yet
         trimmed_any = False
 
         logger.info(f"🔧 TRIM STEP 9: Processing {len(candidates)} liquidation candidates (max_liqs={max_liqs})")
@@ -3415,6 +3892,10 @@ class TradingLoop:
         for idx, candidate in enumerate(candidates, 1):
             logger.info(f"  🎯 Candidate {idx}/{len(candidates)}: {candidate.get('currency')}")
 
+            if scheduler is not None and scheduler.is_active(candidate.get("currency")):
+                logger.info("    ⏭️  Skipping: liquidation already in flight (counted as pending)")
+                continue
+
             if remaining_excess_usd <= tolerance_usd:
                 logger.info(f"    ✅ Trim complete: remaining excess ${remaining_excess_usd:.2f} <= tolerance ${tolerance_usd:.2f}")
                 break
@@ -3511,16 +3992,33 @@ class TradingLoop:
 
                 logger.info(f"    🚀 Executing _sell_via_market_order({currency}, {units_to_liquidate:.8f}, ${min(freed_usd, remaining_excess_usd):.2f}, T{tier}, force_taker={is_emergency})")
 
-                success = self._sell_via_market_order(
-                    currency,
-                    units_to_liquidate,
-                    usd_target=min(freed_usd, remaining_excess_usd),
-                    tier=tier,
-                    preferred_pair=candidate.get("pair"),
-                    force_taker=is_emergency,  # Skip maker-first for emergency
-                )
+                background = False
+                if is_emergency:
+                    success = self._sell_via_market_order(
+                        currency,
+                        units_to_liquidate,
+                        usd_target=min(freed_usd, remaining_excess_usd),
+                        tier=tier,
+                        preferred_pair=candidate.get("pair"),
+                        force_taker=True,  # Skip maker-first for emergency
+                    )
+                else:
+                    # Maker TWAP runs as a background parent when the scheduler is on
+                    background = self._liquidates_in_background()
+                    success = self._liquidate(
+                        currency,
+                        units_to_liquidate,
+                        usd_target=min(freed_usd, remaining_excess_usd),
+                        tier=tier,
+                        preferred_pair=candidate.get("pair"),
+                    )
 
-                if success:
+                if success and background:
+                    scheduled_usd += min(freed_usd, remaining_excess_usd)
+                    logger.info(
+                        f"    ⏳ TWAP SCHEDULED: {currency} (~${min(freed_usd, remaining_excess_usd):.2f}) counted as pending, not freed"
+                    )
+                elif success:
                     logger.info(
                         f"    ✅ Market order SUCCESS: sold {currency} via {'EMERGENCY TAKER' if is_emergency else 'TWAP'} (~${min(freed_usd, remaining_excess_usd):.2f})"
                     )
@@ -3545,9 +4043,12 @@ class TradingLoop:
             self.metrics.record_trim_attempt("failed", consecutive_failures=0)
             return False
 
-        # Record successful trim
-        liquidated_usd = excess_usd - remaining_excess_usd
-        logger.info(f"🔧 TRIM STEP 11: Recording successful trim (liquidated=${liquidated_usd:.2f})")
+        # Record successful trim; scheduled sells are reported once they fill, not here
+        liquidated_usd = max(0.0, excess_usd - remaining_excess_usd - scheduled_usd)
+        logger.info(
+            f"🔧 TRIM STEP 11: Recording successful trim (liquidated=${liquidated_usd:.2f}, "
+            f"scheduled=${scheduled_usd:.2f})"
+        )
         self.metrics.record_trim_attempt("success", consecutive_failures=0, liquidated_usd=liquidated_usd)
 
         logger.info("🔧 TRIM STEP 12: Reconciling exchange state post-trim")
@@ -3572,7 +4073,7 @@ class TradingLoop:
 
         logger.info(
             f"✅ AUTO TRIM COMPLETE: liquidated ${liquidated_usd:.2f}, "
-            f"remaining excess=${remaining_excess_usd:.2f}, "
+            f"scheduled ${scheduled_usd:.2f}, remaining excess=${remaining_excess_usd:.2f}, "
             f"exposure {exposure_pct:.1f}% → {new_exposure_pct if 'new_exposure_pct' in locals() else '?'}%"
         )
         return True
@@ -3701,6 +4202,7 @@ class TradingLoop:
         tier: Optional[int] = None,
         preferred_pair: Optional[str] = None,
         force_taker: bool = False,
+        ctx: Optional[ParentContext] = None,
     ) -> bool:
         """
         Liquidate a position using maker-only TWAP (Time-Weighted Average Price) slices.
@@ -3712,6 +4214,8 @@ class TradingLoop:
         Args:
             force_taker: If True, bypass maker-first TWAP and immediately execute with IOC
                          for emergency trims (BTC/ETH over risk cap).
+            ctx: Set when running as an ExecutionScheduler parent; progress is
+                 reported through it and the loop stops once it is canceled.
         """
         if balance <= 0:
             logger.debug("TWAP purge skipped: zero balance for %s", currency)
@@ -3755,7 +4259,7 @@ class TradingLoop:
         pair = None
         for candidate in candidates:
             try:
-                quote = self.exchange.get_quote(candidate)
+                quote = self.exchange.get_quote(candidate, caller="TradingLoop._sell_via_market_order")
                 pair = candidate
                 break
             except CriticalDataUnavailable:
@@ -3867,6 +4371,9 @@ class TradingLoop:
         consecutive_no_fill = 0
 
         while total_filled_usd + 1e-6 < target_value_usd:
+            if ctx is not None and ctx.stopping:
+                logger.warning("TWAP: parent for %s canceled after %d slices", pair, attempt)
+                break
             if attempt >= max_slices:
                 logger.warning("TWAP: reached max slices (%d) for %s", max_slices, pair)
                 break
@@ -3877,7 +4384,7 @@ class TradingLoop:
             attempt += 1
 
             try:
-                quote = self.exchange.get_quote(pair)
+                quote = self.exchange.get_quote(pair, caller="TradingLoop._sell_via_market_order")
             except CriticalDataUnavailable:
                 raise
             except Exception as exc:
@@ -3939,6 +4446,8 @@ class TradingLoop:
                 )
                 break
 
+            if ctx is not None:
+                ctx.set_working(result.order_id, pair)
             filled_value, filled_units, fees, fills, status = self._await_twap_slice(
                 pair=pair,
                 order_id=result.order_id,
@@ -3946,11 +4455,20 @@ class TradingLoop:
                 slice_target_usd=slice_notional,
                 replace_seconds=replace_seconds,
                 poll_interval=poll_interval,
+                stop=ctx.stop_event if ctx is not None else None,
             )
 
             total_filled_usd += filled_value
             total_fees += fees
             total_filled_units += filled_units
+            if ctx is not None:
+                ctx.set_working(None)
+                ctx.report(
+                    filled_usd=total_filled_usd,
+                    filled_units=total_filled_units,
+                    fees=total_fees,
+                    slices=attempt,
+                )
 
             status_upper = (status or "").upper()
 
@@ -4089,7 +4607,9 @@ class TradingLoop:
             total_fees,
             residual,
         )
-        self.portfolio = self._init_portfolio_state()
+        if ctx is None:
+            # Background parents leave the portfolio to the next cycle's refresh
+            self.portfolio = self._init_portfolio_state()
         return True
 
     def _await_twap_slice(
@@ -4100,31 +4620,34 @@ class TradingLoop:
         slice_target_usd: float,
         replace_seconds: float,
         poll_interval: float,
+        stop: Optional[threading.Event] = None,
     ) -> Tuple[float, float, float, List[Dict[str, Any]], str]:
-        """Poll order status for a TWAP slice and aggregate fills."""
+        """Wait for a TWAP slice to finish (user channel, REST watchdog) and aggregate fills."""
         if not order_id:
             logger.warning("TWAP: missing order_id for client %s", client_order_id)
             return 0.0, 0.0, 0.0, [], "missing_order"
 
         terminal_states = {"FILLED", "DONE", "CANCELED", "CANCELLED", "EXPIRED", "FAILED"}
-        deadline = time.monotonic() + max(replace_seconds, 1.0)
-        last_status = None
 
-        while time.monotonic() < deadline:
+        def _poll() -> Optional[Dict[str, Any]]:
             try:
-                status = self.exchange.get_order_status(order_id)
+                return self.exchange.get_order_status(order_id)
             except CriticalDataUnavailable:
                 raise
             except Exception as exc:
                 logger.debug("TWAP: status poll failed for %s: %s", order_id, exc)
-                status = None
-
-            if status:
-                last_status = status.get("status") or last_status
-                if (last_status or "").upper() in terminal_states:
-                    break
-
-            time.sleep(poll_interval)
+                return None
+
+        status = await_order(
+            getattr(self, "order_event_stream", None),
+            order_id,
+            _poll,
+            timeout=max(replace_seconds, 1.0),
+            done=lambda snap: (snap.get("status") or "").upper() in terminal_states,
+            poll_interval=poll_interval,
+            stop=stop,
+        )
+        last_status = (status or {}).get("status")
 
         if not last_status or (last_status.upper() not in terminal_states):
             try:
@@ -4202,6 +4725,7 @@ class TradingLoop:
         configured_interval = max(configured_interval, 1.0)
 
         logger.info(f"Starting continuous loop (interval={configured_interval}s, jitter={self.loop_jitter_pct:.1f}%)")
+        self._warm_up_connections()
 
         while self._running:
             start = time.monotonic()
@@ -4506,7 +5030,7 @@ class TradingLoop:
             for symbol in positions.keys():
                 pair = f"{symbol}-USD"
                 try:
-                    quote = self.exchange.get_quote(pair)
+                    quote = self.exchange.get_quote(pair, caller="TradingLoop._check_position_exits")
                     if quote and quote.ask > 0:
                         current_prices[symbol] = quote.ask
                 except Exception as price_exc:
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark: memory held by candles, List[OHLCV] dataclasses vs CandleSeries.
+
+Builds N hourly candles (default 1,000,000) three ways and reports the bytes
+each representation keeps alive, measured with tracemalloc:
+
+- "before": the previous List[OHLCV] of plain dataclasses (no __slots__),
+  one datetime plus five float objects per candle
+- "slots":  List[OHLCV] of the current slotted dataclass
+- "after":  one CandleSeries (int64 epochs + five float64 columns)
+
+Also times a backtest-style cut (`series.until(epoch)` vs rebuilding a list
+filtered on timestamp), which _simulate_triggers does per asset per cycle.
+Nothing is fetched; candles are generated locally.
+
+Run: ``./scripts/bench_candle_memory.py [--candles 1000000]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.candles import OHLCV, CandleSeries
+
+
+@dataclass
+class _LegacyOHLCV:
+    """The previous OHLCV: a plain dataclass with a per-instance __dict__."""
+    symbol: str
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+def _rows(cls, count: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    price = 100.0
+    rows = []
+    for i in range(count):
+        open_ = price
+        price = max(1e-6, price * (1 + rng.gauss(0, 0.01)))
+        rows.append(cls("BTC-USD", start + timedelta(hours=i), open_, max(open_, price) * 1.002,
+                        min(open_, price) * 0.998, price, rng.uniform(1e3, 1e6)))
+    return rows
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candles", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.candles
+
+    legacy, legacy_bytes = _measure(lambda: _rows(_LegacyOHLCV, n))
+    del legacy
+    slotted, slotted_bytes = _measure(lambda: _rows(OHLCV, n))
+    series, _ = _measure(lambda: CandleSeries.from_candles(slotted))
+    series_bytes = series.nbytes
+
+    print(f"{n:,} candles")
+    print(f"  List[OHLCV] (dataclass)  {legacy_bytes / 1e6:8.1f} MB  {legacy_bytes / n:6.1f} B/candle")
+    print(f"  List[OHLCV] (slots)      {slotted_bytes / 1e6:8.1f} MB  {slotted_bytes / n:6.1f} B/candle")
+    print(f"  CandleSeries             {series_bytes / 1e6:8.1f} MB  {series_bytes / n:6.1f} B/candle"
+          f"  ({legacy_bytes / series_bytes:.1f}x smaller)")
+
+    cutoff = slotted[n // 2].timestamp
+    epoch = int(cutoff.timestamp())
+    t0 = time.perf_counter()
+    filtered = [c for c in slotted if c.timestamp <= cutoff]
+    t1 = time.perf_counter()
+    view = series.until(epoch)
+    t2 = time.perf_counter()
+    assert len(filtered) == len(view)
+    print(f"cut at {cutoff:%Y-%m-%d %H:%M}: list filter {(t1 - t0) * 1e3:.1f} ms, "
+          f"series.until {(t2 - t1) * 1e3:.3f} ms (view, no copy)")
+
+
+if __name__ == "__main__":
+    main()
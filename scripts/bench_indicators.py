@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark: per-cycle indicator cost, per-candle loops vs the columnar kernel.
+
+Builds a synthetic universe (default 500 assets x 1000 hourly candles) and
+computes, for every asset, the indicators TriggerEngine evaluates per cycle:
+ATR% plus the 7-day ATR median used by the ATR filter, EMA(21), RSI(14),
+168h realized volatility, 12-bar VWAP, pivot lows and the 24h breakout range.
+
+"per-candle loops" re-implements the previous loops over List[OHLCV];
+"numpy kernel" converts each asset to OHLCVColumns and uses core.indicators;
+"numpy kernel, columnar" starts from columns already built (candles arrive
+as CandleSeries from the exchange), so it times the indicator math alone.
+Nothing is fetched; candles are generated locally.
+
+Run: ``./scripts/bench_indicators.py [--assets 500] [--candles 1000]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np
+
+from core import indicators
+from core.exchange_coinbase import OHLCV
+from core.indicators import as_columns
+
+ATR_PERIOD = 14
+
+
+def _universe(assets: int, candles: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    universe = []
+    for a in range(assets):
+        price = rng.uniform(1, 1000)
+        rows = []
+        for i in range(candles):
+            open_ = price
+            price = max(1e-6, price * (1 + rng.gauss(0, 0.01)))
+            rows.append(OHLCV(f"A{a}-USD", start + timedelta(hours=i), open_,
+                              max(open_, price) * 1.002, min(open_, price) * 0.998, price,
+                              rng.uniform(1e3, 1e6)))
+        universe.append(rows)
+    return universe
+
+
+# ---- previous per-candle implementations -------------------------------------------------
+
+def _legacy_atr_pct(candles, period=ATR_PERIOD):
+    if len(candles) < period + 1:
+        return 0.0
+    trs = []
+    for i in range(-period, 0):
+        h, l, pc = candles[i].high, candles[i].low, candles[i - 1].close
+        trs.append(max(h - l, abs(h - pc), abs(l - pc)))
+    return sum(trs) / len(trs) / candles[-1].close * 100.0
+
+
+def _legacy(candles):
+    current_atr = _legacy_atr_pct(candles)
+    samples = []
+    for i in range(-168, -ATR_PERIOD):
+        if i + ATR_PERIOD < 0:
+            window = candles[i:i + ATR_PERIOD + 1]
+            if len(window) >= ATR_PERIOD + 1:
+                samples.append(_legacy_atr_pct(window))
+    median_atr = sorted(samples)[len(samples) // 2]
+
+    closes = [c.close for c in candles]
+    multiplier = 2.0 / 22
+    ema = sum(closes[:21]) / 21
+    ema_series = [ema]
+    for price in closes[21:]:
+        ema = (price - ema) * multiplier + ema
+        ema_series.append(ema)
+
+    gains = [max(closes[i] - closes[i - 1], 0.0) for i in range(1, len(closes))]
+    losses = [abs(min(closes[i] - closes[i - 1], 0.0)) for i in range(1, len(closes))]
+    avg_gain, avg_loss = sum(gains[:14]) / 14, sum(losses[:14]) / 14
+    rsi_series = []
+    for idx in range(14, len(gains)):
+        avg_gain = (avg_gain * 13 + gains[idx]) / 14
+        avg_loss = (avg_loss * 13 + losses[idx]) / 14
+        rsi_series.append(100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+    returns = [(candles[i].close - candles[i - 1].close) / candles[i - 1].close
+               for i in range(len(candles) - 168, len(candles))]
+    mean = sum(returns) / len(returns)
+    vol = math.sqrt(sum((r - mean) ** 2 for r in returns) / len(returns))
+
+    num = den = 0.0
+    for c in candles[-12:]:
+        num += (c.high + c.low + c.close) / 3.0 * c.volume
+        den += c.volume
+
+    pivots = []
+    for idx in range(len(candles) - 48 + 2, len(candles) - 2):
+        low = candles[idx].low
+        if all(low <= candles[idx - k].low for k in (1, 2)) and all(low < candles[idx + k].low for k in (1, 2)):
+            pivots.append(candles[idx])
+
+    high_24 = max(c.high for c in candles[-24:])
+    low_24 = min(c.low for c in candles[-24:])
+    return current_atr, median_atr, ema_series[-1], rsi_series[-1], vol, num / den, len(pivots), high_24, low_24
+
+
+# ---- columnar kernel ---------------------------------------------------------------------
+
+def _kernel(candles):
+    cols = as_columns(candles)
+    n = len(cols)
+    atr = indicators.atr_pct(cols.high, cols.low, cols.close, ATR_PERIOD)
+    samples = np.sort(atr[max(n - 168, 0) + ATR_PERIOD:n - 1])
+    ema = indicators.ema(cols.close, 21)
+    rsi = indicators.rsi(cols.close, 14)
+    vol = indicators.returns_std(cols.close, 168)
+    tail = slice(-12, None)
+    vwap = indicators.vwap(cols.high[tail], cols.low[tail], cols.close[tail], cols.volume[tail])
+    pivots = indicators.pivot_lows(cols.low, 48, 2)
+    return (atr[-1], samples[len(samples) // 2], ema[-1], rsi[-1], vol, vwap, len(pivots),
+            max(cols.high[-24:]), min(cols.low[-24:]))
+
+
+def _time(fn, universe) -> tuple:
+    start = time.perf_counter()
+    results = [fn(candles) for candles in universe]
+    return time.perf_counter() - start, results
+
+
+def run(assets: int, candles: int) -> None:
+    universe = _universe(assets, candles)
+    before, legacy = _time(_legacy, universe)
+    after, kernel = _time(_kernel, universe)
+    columnar = [as_columns(candles) for candles in universe]
+    math_only, _ = _time(_kernel, columnar)
+
+    mismatches = sum(
+        1 for a, b in zip(legacy, kernel)
+        if any(not math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-12) for x, y in zip(a, b))
+    )
+    print(f"Indicator pass over {assets} assets x {candles} candles")
+    print(f"{'':<22} {'total (ms)':>11} {'per asset (us)':>15}")
+    print(f"{'per-candle loops':<22} {before * 1e3:>11.1f} {before / assets * 1e6:>15.1f}")
+    print(f"{'numpy kernel':<22} {after * 1e3:>11.1f} {after / assets * 1e6:>15.1f}")
+    print(f"{'numpy kernel, columnar':<22} {math_only * 1e3:>11.1f} {math_only / assets * 1e6:>15.1f}")
+    print(f"speedup {before / after:.2f}x ({before / math_only:.2f}x from columns), parity mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=500)
+    parser.add_argument("--candles", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.assets, args.candles)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark: per-cycle OrderStateMachine queries over a large order history.
+
+Loads N historical (terminal) orders plus a small working set of active
+orders, then times the queries manage_open_orders and fill reconciliation run
+every cycle: active orders, stale orders, lookup by exchange order_id and
+terminal-history cleanup. "scan" is the previous implementation (full passes
+over the order dict, sort for cleanup); "indexed" uses the machine's status /
+order_id indexes and completion-ordered terminal list.
+
+Run: ``./scripts/bench_order_state.py [--orders 100000] [--active 50]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.order_state import OrderStateMachine, OrderStatus
+
+
+def _build(orders: int, active: int) -> OrderStateMachine:
+    machine = OrderStateMachine()
+    start = datetime.now(timezone.utc) - timedelta(days=30)
+    for i in range(orders + active):
+        client_id = f"c{i}"
+        order = machine.create_order(client_id, f"A{i % 200}-USD", "buy", 100.0)
+        machine.transition(client_id, OrderStatus.OPEN, order_id=f"x{i}")
+        if i < orders:
+            machine.transition(client_id, OrderStatus.FILLED)
+        else:
+            # Half of the working set is older than the stale cutoff
+            age = 600 if i % 2 else 10
+            order.created_at = datetime.now(timezone.utc) - timedelta(seconds=age)
+        if i < orders:
+            order.created_at = start + timedelta(seconds=i)
+    return machine
+
+
+def _scan_cycle(machine: OrderStateMachine, lookups) -> int:
+    orders = list(machine.orders.values())
+    active = [o for o in orders if o.is_active()]
+    stale = [o for o in active if o.age_seconds() > 120]
+    found = 0
+    for order_id in lookups:
+        for order in machine.orders.values():
+            if order.order_id == order_id:
+                found += 1
+                break
+    terminal = sorted((o for o in orders if o.is_terminal()),
+                      key=lambda o: o.completed_at or o.created_at, reverse=True)
+    return len(active) + len(stale) + found + len(terminal[len(terminal):])
+
+
+def _indexed_cycle(machine: OrderStateMachine, lookups) -> int:
+    active = machine.get_active_orders()
+    stale = machine.get_stale_orders(120)
+    found = sum(1 for order_id in lookups if machine.get_order_by_exchange_id(order_id) is not None)
+    machine.cleanup_old_orders(keep_last_n=len(machine.orders))
+    return len(active) + len(stale) + found
+
+
+def _per_cycle_ms(fn, machine, lookups, cycles: int) -> float:
+    started = time.perf_counter()
+    for _ in range(cycles):
+        fn(machine, lookups)
+    return (time.perf_counter() - started) / cycles * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--active", type=int, default=50)
+    parser.add_argument("--cycles", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    started = time.perf_counter()
+    machine = _build(args.orders, args.active)
+    build_s = time.perf_counter() - started
+    # Fills mostly reference recent orders
+    lookups = [f"x{i}" for i in range(args.orders + args.active - 10, args.orders + args.active)]
+
+    assert _scan_cycle(machine, lookups) == _indexed_cycle(machine, lookups)
+    scan = _per_cycle_ms(_scan_cycle, machine, lookups, args.cycles)
+    indexed = _per_cycle_ms(_indexed_cycle, machine, lookups, args.cycles)
+
+    print(f"{args.orders} terminal + {args.active} active orders (built in {build_s:.1f}s), "
+          f"{len(lookups)} fill lookups per cycle")
+    print(f"{'mode':<8} {'ms/cycle':>10}")
+    print(f"{'scan':<8} {scan:>10.2f}")
+    print(f"{'indexed':<8} {indexed:>10.3f}   speedup {scan / indexed:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark: regime detection per new candle, full recompute vs rolling state.
+
+Feeds a synthetic hourly BTC series one candle at a time. "full" calls
+RegimeDetector.detect on the trailing window for each horizon (1d/7d/30d);
+"incremental" syncs IncrementalRegimeDetector with the last few candles and
+reads all horizons. Both see the same data and produce the same regimes.
+
+Run: ``./scripts/bench_regime.py [--candles 5000]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.candles import OHLCV, CandleSeries
+from core.regime import IncrementalRegimeDetector, RegimeDetector
+
+HORIZONS = {"1d": 1, "7d": 7, "30d": 30}
+
+
+def _series(count: int) -> CandleSeries:
+    rng = random.Random(1)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    price, rows = 50_000.0, []
+    for i in range(count):
+        price *= 1 + rng.gauss(0.0001, 0.01)
+        rows.append(OHLCV("BTC-USD", start + timedelta(hours=i), price, price, price, price, 1.0))
+    return CandleSeries.from_candles(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candles", type=int, default=5000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    series = _series(args.candles)
+    warm = 721
+    steps = range(warm, len(series) + 1)
+
+    base = RegimeDetector()
+    started = time.perf_counter()
+    full = [{name: base.detect(series[end - 720:end], days).regime for name, days in HORIZONS.items()}
+            for end in steps]
+    full_s = time.perf_counter() - started
+
+    detector = IncrementalRegimeDetector()
+    detector.sync(series[:warm - 1])
+    started = time.perf_counter()
+    incremental = [{name: s.regime for name, s in detector.sync(series[end - 3:end]).items()} for end in steps]
+    incremental_s = time.perf_counter() - started
+
+    assert full == incremental, "regimes differ"
+    n = len(steps)
+    print(f"{n} candle updates, horizons {'/'.join(HORIZONS)}")
+    print(f"  full recompute  {full_s / n * 1e6:8.1f} us/update")
+    print(f"  incremental     {incremental_s / n * 1e6:8.1f} us/update  ({full_s / incremental_s:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
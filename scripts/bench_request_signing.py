@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: auth signing cost per authenticated request.
+
+Compares the previous per-request signing (parse the PEM and ES256-sign a new
+JWT for every request; re-key HMAC-SHA256 for every request) with the cached
+signers in ``infra.request_signing``. A throwaway EC key and HMAC secret are
+generated locally; nothing is sent over the network.
+
+The request mix mimics a poll loop: a handful of paths (order status, fills,
+open orders, accounts) requested repeatedly.
+
+Run: ``./scripts/bench_request_signing.py [--requests 2000]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import secrets
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infra.request_signing import JWT_AVAILABLE, HmacSigner, JwtSigner
+
+PATHS = [
+    ("GET", "/api/v3/brokerage/orders/historical/abc-123"),
+    ("GET", "/api/v3/brokerage/orders/historical/fills"),
+    ("GET", "/api/v3/brokerage/orders/historical/batch"),
+    ("GET", "/api/v3/brokerage/accounts"),
+]
+
+
+def _throwaway_pem() -> str:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def _legacy_jwt(api_key: str, pem: str, method: str, path: str) -> str:
+    import jwt
+    from cryptography.hazmat.primitives import serialization
+
+    private_key = serialization.load_pem_private_key(pem.encode("utf-8"), password=None)
+    now = int(time.time())
+    return jwt.encode(
+        {"sub": api_key, "iss": "cdp", "nbf": now, "exp": now + 120,
+         "uri": f"{method} api.coinbase.com{path}"},
+        private_key,
+        algorithm="ES256",
+        headers={"kid": api_key, "nonce": secrets.token_hex()},
+    )
+
+
+def _legacy_hmac(secret: str, method: str, path: str) -> str:
+    prehash = str(int(time.time())) + method + path
+    return hmac.new(secret.encode(), prehash.encode(), hashlib.sha256).hexdigest()
+
+
+def _per_request_us(fn, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        method, path = PATHS[i % len(PATHS)]
+        fn(method, path)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def run(requests: int) -> None:
+    api_key = "organizations/bench/apiKeys/bench"
+    rows = []
+
+    if JWT_AVAILABLE:
+        pem = _throwaway_pem()
+        signer = JwtSigner(api_key, pem)
+        before = _per_request_us(lambda m, p: _legacy_jwt(api_key, pem, m, p), requests)
+        after = _per_request_us(signer.token, requests)
+        rows.append(("JWT/ES256", before, after, signer.stats()))
+    else:
+        print("PyJWT/cryptography not installed; skipping JWT benchmark")
+
+    secret = secrets.token_urlsafe(32)
+    hmac_signer = HmacSigner(api_key, secret)
+    before = _per_request_us(lambda m, p: _legacy_hmac(secret, m, p), requests)
+    after = _per_request_us(lambda m, p: hmac_signer.headers(m, p, ""), requests)
+    rows.append(("HMAC-SHA256", before, after, hmac_signer.stats()))
+
+    print(f"Signing cost per request ({requests} requests over {len(PATHS)} paths)")
+    print(f"{'mode':<12} {'before (us)':>12} {'after (us)':>12} {'speedup':>9}   signer stats")
+    for mode, before, after, stats in rows:
+        speedup = before / after if after > 0 else float("inf")
+        print(f"{mode:<12} {before:>12.1f} {after:>12.1f} {speedup:>8.1f}x   {stats}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.requests)
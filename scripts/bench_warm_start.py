@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark: time-to-first-cycle, cold start vs catalog-cache warm start.
+
+Simulates a restart: builds a fresh CoinbaseExchange and UniverseManager,
+then does what the first cycle needs before it can trade - the universe
+snapshot and the product spec (increments, min notional) of every eligible
+asset for quantization.
+
+Network calls are replaced by sleeps of typical REST latency (product
+catalog, bulk quotes, per-symbol order books on the fan-out pool); nothing
+is fetched. "cold" starts with empty caches, "warm" restores them from a
+catalog cache written by a previous run.
+
+Run: ``./scripts/bench_warm_start.py [--symbols 30] [--latency-ms 120]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.catalog_cache import CatalogCache, CatalogCacheConfig
+from core.exchange_coinbase import CoinbaseExchange, OrderbookSnapshot, Quote
+from core.universe import UniverseManager
+
+
+def _exchange(symbols, latency: float) -> CoinbaseExchange:
+    exchange = CoinbaseExchange(read_only=True)
+    exchange._rate_limit = lambda *a, **k: None
+    products = [{"product_id": s, "status": "online", "base_increment": "0.0001",
+                 "quote_increment": "0.01", "price_increment": "0.01", "min_market_funds": "1"}
+                for s in symbols]
+
+    def list_public_products(limit=250, product_ids=None):
+        time.sleep(latency)
+        return products
+
+    def get_quotes_bulk(wanted, fallback=False):
+        time.sleep(latency)
+        now = datetime.now(timezone.utc)
+        return {s: Quote(symbol=s, bid=99.9, ask=100.1, mid=100.0, spread_bps=5.0, last=100.0,
+                         volume_24h=1e9, timestamp=now) for s in wanted}
+
+    def get_orderbook(symbol, depth_levels=50):
+        time.sleep(latency)
+        return OrderbookSnapshot(symbol=symbol, bid_depth_usd=5e5, ask_depth_usd=5e5,
+                                 total_depth_usd=1e6, bid_levels=10, ask_levels=10,
+                                 timestamp=datetime.now(timezone.utc))
+
+    exchange.list_public_products = list_public_products
+    exchange.get_quotes_bulk = get_quotes_bulk
+    exchange.get_orderbook = get_orderbook
+    return exchange
+
+
+def _first_cycle(symbols, latency: float, cache_path=None) -> float:
+    started = time.perf_counter()
+    exchange = _exchange(symbols, latency)
+    config = {
+        "universe": {"refresh_interval_hours": 1},
+        "liquidity": {"min_24h_volume_usd": 1e6, "max_spread_bps": 50},
+        "tiers": {"tier_1_core": {"symbols": symbols, "constraints": {}}},
+    }
+    manager = UniverseManager(config, exchange=exchange)
+    if cache_path:
+        cache = CatalogCache(CatalogCacheConfig(persist_path=str(cache_path)))
+        cache.load()
+        exchange.attach_catalog_cache(cache)
+        manager.attach_catalog_cache(cache)
+    snapshot = manager.get_universe()
+    for asset in snapshot.get_all_eligible():
+        exchange.get_product_spec(asset.symbol)
+    elapsed = time.perf_counter() - started
+    if manager._background_refresh is not None:
+        manager._background_refresh.join()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=120.0)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    symbols = [f"A{i}-USD" for i in range(args.symbols)]
+    latency = args.latency_ms / 1000.0
+    store = MagicMock()
+    store.get_red_flag_banned_symbols.return_value = {}
+
+    with patch("infra.state_store.get_state_store", return_value=store), \
+            tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "catalog_cache.json"
+        cold = _first_cycle(symbols, latency)
+        _first_cycle(symbols, latency, cache_path)          # previous run writes the cache
+        warm = _first_cycle(symbols, latency, cache_path)
+
+    print(f"{args.symbols} symbols, {args.latency_ms:.0f} ms per request")
+    print(f"  cold start  {cold * 1e3:8.1f} ms to first cycle")
+    print(f"  warm start  {warm * 1e3:8.1f} ms to first cycle  ({cold / warm:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -58,7 +58,7 @@ class HappyExchange:
             }
         ]
 
-    def get_quote(self, pair: str):
+    def get_quote(self, pair: str, caller: str = "unlabeled"):
         # Always respond with a $1 mid-price; good enough for sizing.
         return SimpleNamespace(mid=1.0, last=1.0)
 
@@ -157,6 +157,7 @@ class AiTraderStrategy(BaseStrategy):
                 "cycle_number": context.cycle_number,
                 "timestamp": context.timestamp.isoformat(),
             },
+            features=getattr(context.market_data, "features", None),
         )
 
         return snapshot
@@ -46,6 +46,8 @@ class StrategyContext:
         nav: Net asset value (NAV) in USD for sizing calculations
         state: Strategy-specific state from previous cycle (optional)
         risk_constraints: Current risk limits (optional)
+        market_data: Read-only view of the cycle's market data (optional);
+            returns what earlier stages fetched, never fetches
     """
     universe: UniverseSnapshot
     triggers: List[TriggerSignal]
@@ -55,6 +57,7 @@ class StrategyContext:
     nav: float = 0.0
     state: Optional[Dict[str, Any]] = None
     risk_constraints: Optional[Dict[str, Any]] = None
+    market_data: Optional[Any] = None
 
     def __post_init__(self):
         """Validate context after initialization."""
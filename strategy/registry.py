@@ -9,11 +9,22 @@ Architecture:
 - Enforce enabled/disabled toggles
 - Provide interface for main_loop to get active strategies
 
+Execution:
+- Enabled strategies run concurrently on a small worker pool
+- Each strategy has a wall-clock deadline; a strategy that misses it
+  contributes no proposals this cycle, the others are still returned
+- CPU budgets are soft: overruns are logged and counted, not enforced
+- Results keep registry order, so aggregation/dedupe is deterministic
+
 REQ-STR2: Per-strategy feature flags (enable/disable toggles)
 """
 
-from typing import List, Dict, Any, Optional, Type, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Type, TYPE_CHECKING
 from pathlib import Path
+import threading
+import time
 import yaml
 import logging
 
@@ -27,6 +38,66 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _positive_float(value: Any, name: str) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        logger.warning("Invalid strategy execution %s: %s", name, value)
+        return None
+    if parsed <= 0:
+        logger.warning("Invalid strategy execution %s: %s", name, value)
+        return None
+    return parsed
+
+
+@dataclass
+class StrategyExecutionConfig:
+    """
+    Worker pool and budgets (config/strategies.yaml → global.execution).
+
+    Per-strategy overrides live under strategies.<name>.execution with the
+    same deadline_seconds / cpu_budget_seconds keys. A deadline of None
+    waits indefinitely; max_workers <= 1 runs strategies inline.
+    """
+
+    max_workers: int = 4
+    deadline_seconds: Optional[float] = 10.0
+    cpu_budget_seconds: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> "StrategyExecutionConfig":
+        cfg = cls()
+        data = raw or {}
+
+        workers = data.get("max_workers")
+        if workers is not None:
+            try:
+                cfg.max_workers = max(int(workers), 1)
+            except (TypeError, ValueError):
+                logger.warning("Invalid strategy execution max_workers: %s", workers)
+
+        if "deadline_seconds" in data:
+            cfg.deadline_seconds = _positive_float(data.get("deadline_seconds"), "deadline_seconds")
+        if "cpu_budget_seconds" in data:
+            cfg.cpu_budget_seconds = _positive_float(data.get("cpu_budget_seconds"), "cpu_budget_seconds")
+
+        return cfg
+
+    def budgets_for(self, strategy: BaseStrategy) -> Tuple[Optional[float], Optional[float]]:
+        """(deadline_seconds, cpu_budget_seconds) for strategy, applying its overrides."""
+        overrides = (getattr(strategy, "config", None) or {}).get("execution") or {}
+        if not isinstance(overrides, dict):
+            overrides = {}
+        deadline, cpu_budget = self.deadline_seconds, self.cpu_budget_seconds
+        if "deadline_seconds" in overrides:
+            deadline = _positive_float(overrides.get("deadline_seconds"), "deadline_seconds")
+        if "cpu_budget_seconds" in overrides:
+            cpu_budget = _positive_float(overrides.get("cpu_budget_seconds"), "cpu_budget_seconds")
+        return deadline, cpu_budget
+
+
 class StrategyRegistry:
     """
     Central registry for all trading strategies.
@@ -52,18 +123,25 @@ class StrategyRegistry:
         # "momentum": MomentumStrategy,
     }
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, metrics: Optional[Any] = None):
         """
         Initialize registry and load strategy configurations.
 
         Args:
             config_path: Path to strategies.yaml (defaults to config/strategies.yaml)
+            metrics: Optional MetricsRecorder for per-strategy latency/timeouts
         """
         if config_path is None:
             config_path = Path(__file__).parent.parent / "config" / "strategies.yaml"
 
         self.config_path = config_path
+        self.metrics = metrics
         self.strategies: Dict[str, BaseStrategy] = {}
+        self.execution = StrategyExecutionConfig()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Strategies whose previous run outlived its deadline and is still going
+        self._in_flight: Dict[str, Future] = {}
         self._load_strategies()
 
     def _load_strategies(self) -> None:
@@ -85,6 +163,9 @@ class StrategyRegistry:
             config = yaml.safe_load(f)
 
         strategies_config = config.get("strategies", {})
+        self.execution = StrategyExecutionConfig.from_dict(
+            (config.get("global") or {}).get("execution")
+        )
 
         if not strategies_config:
             logger.warning("No strategies defined in config, using RulesEngine default")
@@ -226,11 +307,15 @@ class StrategyRegistry:
         """
         Generate proposals from all enabled strategies.
 
+        Strategies run concurrently, each against its own deadline. A strategy
+        that misses its deadline (or is still running from a previous cycle)
+        gets an empty list; the others' proposals are returned regardless.
+
         Args:
             context: Strategy context with market data
 
         Returns:
-            Dict mapping strategy name to list of proposals
+            Dict mapping strategy name to list of proposals, in registry order
         """
         all_proposals = {}
         enabled_strategies = self.get_enabled_strategies()
@@ -241,21 +326,11 @@ class StrategyRegistry:
 
         logger.info(f"Running {len(enabled_strategies)} enabled strategies")
 
-        for strategy in enabled_strategies:
-            try:
-                proposals = strategy.run(context)
-                all_proposals[strategy.name] = proposals
-
-                logger.info(
-                    f"[{strategy.name}] Generated {len(proposals)} proposals"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"[{strategy.name}] Failed to generate proposals: {e}",
-                    exc_info=True
-                )
-                all_proposals[strategy.name] = []
+        if self.execution.max_workers <= 1:
+            for strategy in enabled_strategies:
+                all_proposals[strategy.name] = self._run_inline(strategy, context)
+        else:
+            all_proposals = self._run_concurrent(enabled_strategies, context)
 
         total_proposals = sum(len(props) for props in all_proposals.values())
         logger.info(
@@ -265,6 +340,124 @@ class StrategyRegistry:
 
         return all_proposals
 
+    def _run_inline(self, strategy: BaseStrategy, context: StrategyContext) -> List[Any]:
+        """Run one strategy on the caller's thread (deadline not enforceable)."""
+        _, cpu_budget = self.execution.budgets_for(strategy)
+        outcome, proposals, duration, cpu = self._timed_run(strategy, context)
+        self._finish(strategy.name, outcome, proposals, duration, cpu, cpu_budget)
+        return proposals
+
+    def _run_concurrent(
+        self,
+        strategies: List[BaseStrategy],
+        context: StrategyContext
+    ) -> Dict[str, List[Any]]:
+        """Submit strategies to the pool and collect results within their deadlines."""
+        pool = self._executor()
+        started = time.monotonic()
+        submitted: List[Tuple[BaseStrategy, Optional[Future]]] = []
+
+        for strategy in strategies:
+            previous = self._in_flight.get(strategy.name)
+            if previous is not None and not previous.done():
+                logger.warning(
+                    f"[{strategy.name}] Previous run still in progress, skipping this cycle"
+                )
+                self._record(strategy.name, 0.0, "skipped")
+                submitted.append((strategy, None))
+                continue
+            submitted.append((strategy, pool.submit(self._timed_run, strategy, context)))
+
+        all_proposals: Dict[str, List[Any]] = {}
+        for strategy, future in submitted:
+            if future is None:
+                all_proposals[strategy.name] = []
+                continue
+
+            deadline, cpu_budget = self.execution.budgets_for(strategy)
+            remaining = None
+            if deadline is not None:
+                remaining = max(started + deadline - time.monotonic(), 0.0)
+            try:
+                outcome, proposals, duration, cpu = future.result(timeout=remaining)
+            except FutureTimeout:
+                future.cancel()
+                self._in_flight[strategy.name] = future
+                logger.warning(
+                    f"[{strategy.name}] Missed {deadline:.2f}s deadline, "
+                    f"continuing without its proposals"
+                )
+                self._record(strategy.name, time.monotonic() - started, "timeout")
+                all_proposals[strategy.name] = []
+                continue
+
+            self._in_flight.pop(strategy.name, None)
+            all_proposals[strategy.name] = proposals
+            self._finish(strategy.name, outcome, proposals, duration, cpu, cpu_budget)
+
+        return all_proposals
+
+    @staticmethod
+    def _timed_run(
+        strategy: BaseStrategy,
+        context: StrategyContext
+    ) -> Tuple[str, List[Any], float, float]:
+        """Run strategy, returning (outcome, proposals, wall seconds, CPU seconds)."""
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            proposals = strategy.run(context)
+            outcome = "ok"
+        except Exception as e:
+            logger.error(
+                f"[{strategy.name}] Failed to generate proposals: {e}",
+                exc_info=True
+            )
+            proposals, outcome = [], "error"
+        return outcome, proposals, time.perf_counter() - start, time.thread_time() - cpu_start
+
+    def _finish(
+        self,
+        name: str,
+        outcome: str,
+        proposals: List[Any],
+        duration: float,
+        cpu: float,
+        cpu_budget: Optional[float]
+    ) -> None:
+        if outcome == "ok":
+            logger.info(f"[{name}] Generated {len(proposals)} proposals")
+            if cpu_budget is not None and cpu > cpu_budget:
+                logger.warning(
+                    f"[{name}] Used {cpu:.3f}s CPU, over its {cpu_budget:.3f}s budget"
+                )
+                outcome = "over_budget"
+        self._record(name, duration, outcome, cpu)
+
+    def _record(self, name: str, duration: float, outcome: str, cpu: Optional[float] = None) -> None:
+        if self.metrics is None:
+            return
+        try:
+            self.metrics.record_strategy_run(name, duration, outcome, cpu_seconds=cpu)
+        except Exception as e:
+            logger.debug(f"Failed to record strategy metrics for {name}: {e}")
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.execution.max_workers,
+                    thread_name_prefix="strategy",
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Release the worker pool (runs still in flight are abandoned, not joined)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._in_flight.clear()
+
     def aggregate_proposals(
         self,
         context: StrategyContext,
@@ -346,6 +539,7 @@ class StrategyRegistry:
         Useful for hot-reloading strategy configs without restarting.
         """
         logger.info("Reloading strategy registry")
+        self.shutdown()
         self.strategies.clear()
         self._load_strategies()
 
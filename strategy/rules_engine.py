@@ -69,6 +69,8 @@ class RulesEngine(BaseStrategy):
     Now implements BaseStrategy interface for multi-strategy framework.
     """
 
+    _features = None   # Cycle's FeatureStore while generate_proposals runs
+
     def __init__(self, name: str = "rules_engine", config: Optional[Dict] = None):
         """
         Initialize RulesEngine.
@@ -158,12 +160,16 @@ class RulesEngine(BaseStrategy):
         Returns:
             List of trade proposals
         """
-        return self.propose_trades(
-            universe=context.universe,
-            triggers=context.triggers,
-            regime=context.regime,
-            nav=getattr(context, 'nav', 0.0)
-        )
+        self._features = getattr(context.market_data, "features", None)
+        try:
+            return self.propose_trades(
+                universe=context.universe,
+                triggers=context.triggers,
+                regime=context.regime,
+                nav=getattr(context, 'nav', 0.0)
+            )
+        finally:
+            self._features = None
 
     def _min_conviction_threshold(self, regime: str) -> float:
         regime_key = (regime or "").lower()
@@ -895,11 +901,15 @@ class RulesEngine(BaseStrategy):
         # Position that risks target_risk_pct given stop_loss_pct
         risk_parity_size = (target_risk_pct / stop_loss_pct) * 100
 
-        # Apply volatility adjustment if available
-        if hasattr(trigger, 'volatility') and trigger.volatility:
+        # Apply volatility adjustment if available (the trigger's, else the
+        # cycle's feature store for the symbol's 1h candles)
+        volatility = getattr(trigger, 'volatility', None)
+        if not volatility and self._features is not None:
+            volatility = self._features.get(trigger.symbol, "volatility_pct")
+        if volatility:
             # Scale by volatility: higher vol = smaller position
             # Normalize around 50% volatility as baseline
-            vol_adjustment = 50.0 / max(trigger.volatility, 10.0)  # Avoid div by zero
+            vol_adjustment = 50.0 / max(volatility, 10.0)  # Avoid div by zero
             risk_parity_size *= vol_adjustment
 
         # Cap at base_size (don't exceed tier limits)
@@ -11,11 +11,12 @@ Integration pattern:
 4. Return filtered signals to RulesEngine
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 import yaml
 import logging
 
 from core.exchange_coinbase import OHLCV
+from core.feature_store import FeatureStore
 from core.universe import UniverseAsset
 from core.triggers import TriggerSignal
 from strategy.signals import BaseSignal, get_signal, SIGNAL_REGISTRY
@@ -78,7 +79,8 @@ class SignalManager:
         self,
         assets: List[UniverseAsset],
         candles_by_symbol: Dict[str, List[OHLCV]],
-        regime: str = "chop"
+        regime: str = "chop",
+        features: Optional[FeatureStore] = None
     ) -> List[TriggerSignal]:
         """
         Scan assets for signals with regime filtering.
@@ -87,10 +89,27 @@ class SignalManager:
             assets: Universe assets to scan
             candles_by_symbol: Historical OHLCV data per symbol
             regime: Current market regime
+            features: Cycle's FeatureStore (market_data.features); a scan-local
+                one is used when omitted, so signals still share features
 
         Returns:
             List of TriggerSignals (regime-filtered)
         """
+        store = features if features is not None else FeatureStore()
+        for signal in self.signals.values():
+            signal.feature_store = store
+        try:
+            return self._scan(assets, candles_by_symbol, regime)
+        finally:
+            for signal in self.signals.values():
+                signal.feature_store = None
+
+    def _scan(
+        self,
+        assets: List[UniverseAsset],
+        candles_by_symbol: Dict[str, List[OHLCV]],
+        regime: str
+    ) -> List[TriggerSignal]:
         # Get allowed signals for regime
         allowed_signals = self._get_allowed_signals(regime)
 
@@ -5,6 +5,10 @@ Extracted signal classes for clean separation of concerns.
 Each signal type has its own class with scan()/strength()/confidence() methods.
 
 Pattern: Strategy pattern + Builder pattern for signal composition
+
+Derived values (returns, volume sums/ratios, means) are read from a
+FeatureFrame, so scan(), strength() and confidence() of one signal, and the
+other signals scanning the same candles, compute each of them once.
 """
 
 from abc import ABC, abstractmethod
@@ -13,6 +17,7 @@ from datetime import datetime, timezone
 import logging
 
 from core.exchange_coinbase import OHLCV
+from core.feature_store import FeatureFrame, FeatureStore
 from core.universe import UniverseAsset
 from core.triggers import TriggerSignal
 
@@ -29,9 +34,23 @@ class BaseSignal(ABC):
     - confidence(): Confidence in signal (0.0-1.0)
     """
 
+    timeframe = "15m"
+    feature_store: Optional[FeatureStore] = None   # Set by SignalManager for a scan
+
     def __init__(self, config: Dict):
         self.config = config
         self.name = self.__class__.__name__
+        self._last_frame: Optional[FeatureFrame] = None
+
+    def _frame(self, candles: List[OHLCV], symbol: Optional[str] = None) -> FeatureFrame:
+        """Features of candles: from the shared store when set, else a frame kept for the last series."""
+        store = self.feature_store
+        if store is not None:
+            return store.frame_for(candles) or store.frame(symbol, self.timeframe, candles)
+        frame = self._last_frame
+        if frame is None or frame.candles is not candles:
+            frame = self._last_frame = FeatureStore().frame(None, self.timeframe, candles)
+        return frame
 
     @abstractmethod
     def scan(
@@ -73,6 +92,17 @@ class BaseSignal(ABC):
         """
         pass
 
+    def _calculate_volatility(self, candles: List[OHLCV]) -> float:
+        """Annualized volatility of the last 24 candles (15min bars: 252 days x 96 periods)"""
+        if len(candles) < 24:
+            return 0.5
+
+        std_dev = self._frame(candles).get("returns_std", bars=23)
+        if std_dev is None:
+            return 0.5
+
+        return std_dev * (252 * 96) ** 0.5
+
 
 class PriceMoveSignal(BaseSignal):
     """
@@ -99,23 +129,21 @@ class PriceMoveSignal(BaseSignal):
 
         # Get regime thresholds
         thresholds = self._get_thresholds(regime)
+        features = self._frame(candles, asset.symbol)
 
         # Current price
-        current = candles[-1]
-        current_price = current.close
+        current_price = features.get("close")
 
         # Price change over last 15 minutes (1 candle)
-        price_15m_ago = candles[-2].close if len(candles) >= 2 else current.open
-        pct_change_15m = ((current_price - price_15m_ago) / price_15m_ago) * 100
+        pct_change_15m = features.get("change_pct", bars=1) or 0.0
 
         # Price change over last 60 minutes (4 candles)
-        price_60m_ago = candles[-5].close if len(candles) >= 5 else candles[0].open
-        pct_change_60m = ((current_price - price_60m_ago) / price_60m_ago) * 100
+        pct_change_60m = features.get("change_pct", bars=4) or 0.0
 
-        # Volume ratio (current vs 24h average)
-        recent_volume = sum(c.volume for c in candles[-4:])  # Last hour
-        avg_volume = sum(c.volume for c in candles[-96:]) / 96.0
-        volume_ratio = recent_volume / (avg_volume * 4) if avg_volume > 0 else 1.0
+        # Volume ratio (last hour vs 24h average)
+        volume_ratio = features.get("volume_ratio", recent=4, baseline=96)
+        if volume_ratio is None:
+            volume_ratio = 1.0
 
         # Check thresholds
         price_move_threshold = thresholds["pct_change_15m"]
@@ -150,11 +178,11 @@ class PriceMoveSignal(BaseSignal):
         if len(candles) < 5:
             return 0.5
 
-        current = candles[-1].close
-        price_5_ago = candles[-6].close if len(candles) >= 6 else candles[0].open
-
         # Stronger signal = larger move
-        pct_change = abs((current - price_5_ago) / price_5_ago) * 100
+        if len(candles) >= 6:
+            pct_change = abs(self._frame(candles).get("change_pct", bars=5) or 0.0)
+        else:
+            pct_change = abs((candles[-1].close - candles[0].open) / candles[0].open) * 100
 
         # Normalize to 0-1 (5% move = 1.0 strength)
         strength = min(pct_change / 5.0, 1.0)
@@ -166,13 +194,14 @@ class PriceMoveSignal(BaseSignal):
         if len(candles) < 96:
             return 0.5
 
+        features = self._frame(candles)
+
         # Volume confirmation
-        recent_volume = sum(c.volume for c in candles[-4:])
-        avg_volume = sum(c.volume for c in candles[-96:]) / 96.0
-        volume_score = min(recent_volume / (avg_volume * 4), 2.0) / 2.0 if avg_volume > 0 else 0.5
+        volume_ratio = features.get("volume_ratio", recent=4, baseline=96)
+        volume_score = min(volume_ratio, 2.0) / 2.0 if volume_ratio is not None else 0.5
 
         # Price consistency (all recent candles moving same direction)
-        recent_closes = [c.close for c in candles[-4:]]
+        recent_closes = list(features.get("columns").close[-4:])
         direction = 1 if recent_closes[-1] > recent_closes[0] else -1
         consistency = sum(
             1 for i in range(1, len(recent_closes))
@@ -205,31 +234,6 @@ class PriceMoveSignal(BaseSignal):
         }
         return defaults.get(regime, defaults["chop"])
 
-    def _calculate_volatility(self, candles: List[OHLCV]) -> float:
-        """Calculate annualized volatility from recent candles"""
-        if len(candles) < 24:
-            return 0.5
-
-        # Use last 24 candles (6 hours at 15min)
-        recent = candles[-24:]
-        returns = []
-        for i in range(1, len(recent)):
-            ret = (recent[i].close - recent[i-1].close) / recent[i-1].close
-            returns.append(ret)
-
-        if not returns:
-            return 0.5
-
-        # Standard deviation of returns
-        mean_ret = sum(returns) / len(returns)
-        variance = sum((r - mean_ret) ** 2 for r in returns) / len(returns)
-        std_dev = variance ** 0.5
-
-        # Annualize (252 trading days, 96 periods per day at 15min)
-        annual_vol = std_dev * (252 * 96) ** 0.5
-
-        return annual_vol
-
 
 class MomentumSignal(BaseSignal):
     """
@@ -254,18 +258,19 @@ class MomentumSignal(BaseSignal):
         if len(candles) < 48:  # Need 12 hours of data
             return None
 
+        features = self._frame(candles, asset.symbol)
+
         # Trend over last 12 hours
-        start_price = candles[-48].close
-        current_price = candles[-1].close
-        pct_change = ((current_price - start_price) / start_price) * 100
+        current_price = features.get("close")
+        pct_change = features.get("change_pct", bars=47) or 0.0
 
         # Momentum threshold (higher in trending regimes)
         threshold = 5.0 if regime in ["bull", "bear"] else 8.0
 
         if abs(pct_change) >= threshold:
             # Check volume trend
-            first_half_vol = sum(c.volume for c in candles[-48:-24])
-            second_half_vol = sum(c.volume for c in candles[-24:])
+            first_half_vol = sum(features.get("columns").volume[-48:-24])
+            second_half_vol = features.get("volume_sum", bars=24)
             volume_increasing = second_half_vol >= first_half_vol
 
             if volume_increasing:
@@ -295,9 +300,7 @@ class MomentumSignal(BaseSignal):
         if len(candles) < 48:
             return 0.5
 
-        start = candles[-48].close
-        current = candles[-1].close
-        pct_change = abs((current - start) / start) * 100
+        pct_change = abs(self._frame(candles).get("change_pct", bars=47) or 0.0)
 
         # Normalize (10% move = 1.0 strength)
         return min(pct_change / 10.0, 1.0)
@@ -325,25 +328,6 @@ class MomentumSignal(BaseSignal):
 
         return confidence
 
-    def _calculate_volatility(self, candles: List[OHLCV]) -> float:
-        """Calculate volatility - same as PriceMoveSignal"""
-        if len(candles) < 24:
-            return 0.5
-
-        recent = candles[-24:]
-        returns = [(recent[i].close - recent[i-1].close) / recent[i-1].close 
-                   for i in range(1, len(recent))]
-
-        if not returns:
-            return 0.5
-
-        mean_ret = sum(returns) / len(returns)
-        variance = sum((r - mean_ret) ** 2 for r in returns) / len(returns)
-        std_dev = variance ** 0.5
-        annual_vol = std_dev * (252 * 96) ** 0.5
-
-        return annual_vol
-
 
 class MeanReversionSignal(BaseSignal):
     """
@@ -372,9 +356,11 @@ class MeanReversionSignal(BaseSignal):
         if len(candles) < 96:
             return None
 
+        features = self._frame(candles, asset.symbol)
+
         # Calculate deviation from 24h average
-        avg_price = sum(c.close for c in candles[-96:]) / 96.0
-        current_price = candles[-1].close
+        avg_price = features.get("close_mean", bars=96)
+        current_price = features.get("close")
         deviation_pct = ((current_price - avg_price) / avg_price) * 100
 
         # Look for 3%+ deviation
@@ -413,8 +399,9 @@ class MeanReversionSignal(BaseSignal):
         if len(candles) < 96:
             return 0.5
 
-        avg_price = sum(c.close for c in candles[-96:]) / 96.0
-        current_price = candles[-1].close
+        features = self._frame(candles)
+        avg_price = features.get("close_mean", bars=96)
+        current_price = features.get("close")
         deviation_pct = abs((current_price - avg_price) / avg_price) * 100
 
         # Normalize (5% deviation = 1.0 strength)
@@ -426,8 +413,9 @@ class MeanReversionSignal(BaseSignal):
             return 0.5
 
         # Volume declining (exhaustion)
-        recent_vol = sum(c.volume for c in candles[-4:])
-        prior_vol = sum(c.volume for c in candles[-8:-4])
+        volumes = self._frame(candles).get("columns").volume
+        recent_vol = sum(volumes[-4:])
+        prior_vol = sum(volumes[-8:-4])
         vol_declining = recent_vol < prior_vol
 
         # Price move slowing
@@ -0,0 +1,208 @@
+"""
+Local WebSocket stand-in server for streaming tests.
+
+Accepts real WebSocket connections on 127.0.0.1, records every message the
+client sends (subscribe/unsubscribe), and replays a list of recorded exchange
+messages on each connection after the first subscribe. Tests can push extra
+messages or drop connections to exercise reconnects.
+"""
+
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+Message = Union[str, dict]
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_TEXT = 0x1
+OP_CLOSE = 0x8
+OP_PING = 0x9
+
+
+def accept_key(key: str) -> str:
+    """Sec-WebSocket-Accept value for a Sec-WebSocket-Key."""
+    digest = hashlib.sha1((key + _GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def encode_frame(opcode: int, payload: bytes) -> bytes:
+    """Unmasked server-to-client frame."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < (1 << 16):
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+def parse_frame(buf: bytes) -> Optional[Tuple[bool, int, bytes, int]]:
+    """(fin, opcode, unmasked payload, consumed) from the front of buf, None if incomplete."""
+    if len(buf) < 2:
+        return None
+    fin, opcode = bool(buf[0] & 0x80), buf[0] & 0x0F
+    masked, length, pos = bool(buf[1] & 0x80), buf[1] & 0x7F, 2
+    if length in (126, 127):
+        size = 2 if length == 126 else 8
+        if len(buf) < pos + size:
+            return None
+        length = int.from_bytes(buf[pos:pos + size], "big")
+        pos += size
+    key = b""
+    if masked:
+        key, pos = bytes(buf[pos:pos + 4]), pos + 4
+    if len(buf) < pos + length:
+        return None
+    payload = bytes(buf[pos:pos + length])
+    if masked:
+        payload = bytes(b ^ key[i % 4] for i, b in enumerate(payload))
+    return fin, opcode, payload, pos + length
+
+
+class WebSocketStandIn:
+    def __init__(self, recorded: Iterable[Message] = (), replay_after: Optional[str] = None):
+        """
+        Args:
+            recorded: Messages replayed to each connection (dicts are JSON-encoded)
+            replay_after: Channel whose subscribe triggers the replay
+                (default: first subscribe that carries product_ids)
+        """
+        self.recorded: List[Message] = list(recorded)
+        self.replay_after = replay_after
+        self.received: List[dict] = []
+        self.connections = 0
+        self._server: Optional[socket.socket] = None
+        self._clients: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self.url = ""
+
+    def __enter__(self) -> "WebSocketStandIn":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def start(self) -> str:
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(8)
+        self.url = f"ws://127.0.0.1:{self._server.getsockname()[1]}/"
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        return self.url
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._server is not None:
+            self._server.close()
+        self.drop_connections()
+
+    def push(self, message: Message) -> None:
+        """Send a message to every connected client."""
+        frame = self._frame(message)
+        with self._lock:
+            clients = list(self._clients)
+        for conn in clients:
+            try:
+                conn.sendall(frame)
+            except OSError:
+                pass
+
+    def ping(self) -> None:
+        with self._lock:
+            clients = list(self._clients)
+        for conn in clients:
+            conn.sendall(encode_frame(OP_PING, b"hb"))
+
+    def drop_connections(self) -> None:
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for conn in clients:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            conn.close()
+
+    @staticmethod
+    def _frame(message: Message) -> bytes:
+        text = message if isinstance(message, str) else json.dumps(message)
+        return encode_frame(OP_TEXT, text.encode("utf-8"))
+
+    def _accept_loop(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        buf = bytearray()
+        try:
+            while b"\r\n\r\n" not in buf:
+                chunk = conn.recv(4096)
+                if not chunk:
+                    return
+                buf += chunk
+            head, _, rest = bytes(buf).partition(b"\r\n\r\n")
+            key = ""
+            for line in head.decode("latin-1").split("\r\n")[1:]:
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "sec-websocket-key":
+                    key = value.strip()
+            conn.sendall((
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+            ).encode("ascii"))
+
+            with self._lock:
+                self._clients.append(conn)
+                self.connections += 1
+
+            buf = bytearray(rest)
+            replayed = False
+            while not self._stopped.is_set():
+                frame = parse_frame(buf)
+                if frame is None:
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        return
+                    buf += chunk
+                    continue
+                _, opcode, payload, consumed = frame
+                del buf[:consumed]
+                if opcode == OP_CLOSE:
+                    return
+                if opcode != OP_TEXT:
+                    continue
+                message: Any = json.loads(payload.decode("utf-8"))
+                with self._lock:
+                    self.received.append(message)
+                if replayed or message.get("type") != "subscribe":
+                    continue
+                if self.replay_after is not None:
+                    trigger = message.get("channel") == self.replay_after
+                else:
+                    trigger = bool(message.get("product_ids"))
+                if trigger:
+                    replayed = True
+                    for recorded in self.recorded:
+                        conn.sendall(self._frame(recorded))
+        except OSError:
+            return
+        finally:
+            with self._lock:
+                if conn in self._clients:
+                    self._clients.remove(conn)
+            conn.close()
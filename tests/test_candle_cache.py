@@ -0,0 +1,151 @@
+"""
+Tests for the incremental OHLCV candle cache behind CoinbaseExchange.get_ohlcv.
+"""
+
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from core.candle_cache import CandleCache, CandleCacheConfig
+from core.exchange_coinbase import CoinbaseExchange
+
+HOUR = 3600
+
+
+class FakeCandles:
+    """Serves hourly candles from a synthetic price history and records requests."""
+
+    def __init__(self, now: int):
+        self.now = now
+        self.requests = []
+        self.fail = False
+
+    def __call__(self, method, path, authenticated=True, **kwargs):
+        query = parse_qs(urlparse(path).query)
+        start, end = int(query["start"][0]), int(query["end"][0])
+        self.requests.append((start, end))
+        if self.fail:
+            raise RuntimeError("boom")
+        first = -(-start // HOUR) * HOUR
+        candles = []
+        for ts in range(first, end + 1, HOUR):
+            close = self.close(ts)
+            candles.append({"start": str(ts), "open": str(close - 1), "high": str(close + 1),
+                            "low": str(close - 2), "close": str(close), "volume": "10"})
+        return {"candles": candles[::-1]}  # Coinbase returns newest first
+
+    def close(self, ts):
+        # The open candle keeps moving until the hour closes
+        return 100.0 + ts // HOUR + (self.now - ts if ts + HOUR > self.now else 0) / 1000.0
+
+
+@pytest.fixture
+def exchange(monkeypatch):
+    clock = [1_700_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    exchange = CoinbaseExchange(read_only=True)
+    monkeypatch.setattr(exchange, "_rate_limit", lambda *a, **k: None)
+    fake = FakeCandles(int(clock[0]))
+    monkeypatch.setattr(exchange, "_req", fake)
+    exchange.clock, exchange.fake = clock, fake
+    return exchange
+
+
+def _advance(exchange, seconds):
+    exchange.clock[0] += seconds
+    exchange.fake.now = int(exchange.clock[0])
+
+
+def test_warm_cache_fetches_only_new_and_open_candles(exchange):
+    cold = exchange.get_ohlcv("BTC-USD", "1h", limit=168)
+    assert len(cold) == 168
+    assert exchange.fake.requests[0][1] - exchange.fake.requests[0][0] == 168 * HOUR
+
+    _advance(exchange, 2 * HOUR + 60)
+    warm = exchange.get_ohlcv("BTC-USD", "1h", limit=168)
+
+    start, end = exchange.fake.requests[-1]
+    assert start == int(cold[-1].timestamp.timestamp())  # refetch the previously open candle
+    assert (end - start) // HOUR == 2
+    assert len(warm) == 168
+    assert warm[-1].timestamp > cold[-1].timestamp
+    # The formerly open candle was replaced by its final values
+    revised = next(c for c in warm if c.timestamp == cold[-1].timestamp)
+    assert revised.close == exchange.fake.close(start)
+    assert [c.timestamp for c in warm] == sorted(c.timestamp for c in warm)
+
+
+def test_cached_series_matches_full_fetch(exchange):
+    exchange.get_ohlcv("ETH-USD", "1h", limit=100)
+    for _ in range(5):
+        _advance(exchange, 1800)
+        cached = exchange.get_ohlcv("ETH-USD", "1h", limit=100)
+
+    uncached = CoinbaseExchange(read_only=True)
+    uncached._rate_limit = lambda *a, **k: None
+    uncached._req = exchange.fake
+    uncached.configure_candle_cache({"enabled": False})
+    full = uncached.get_ohlcv("ETH-USD", "1h", limit=100)
+
+    assert [(c.timestamp, c.close) for c in cached] == [(c.timestamp, c.close) for c in full[-100:]]
+
+
+def test_larger_window_or_long_gap_forces_full_reload(exchange):
+    exchange.get_ohlcv("BTC-USD", "1h", limit=24)
+    exchange.get_ohlcv("BTC-USD", "1h", limit=168)
+    start, end = exchange.fake.requests[-1]
+    assert end - start == 168 * HOUR
+
+    _advance(exchange, 400 * HOUR)
+    exchange.get_ohlcv("BTC-USD", "1h", limit=168)
+    start, end = exchange.fake.requests[-1]
+    assert end - start == 168 * HOUR
+
+
+def test_failed_refresh_serves_cached_candles(exchange):
+    first = exchange.get_ohlcv("BTC-USD", "1h", limit=48)
+    exchange.fake.fail = True
+    assert exchange.get_ohlcv("BTC-USD", "1h", limit=48) == first
+    assert exchange.get_ohlcv("SOL-USD", "1h", limit=48) == []
+
+
+def test_retain_evicts_symbols_that_left_the_universe(exchange):
+    for symbol in ("BTC-USD", "ETH-USD", "DOGE-USD"):
+        exchange.get_ohlcv(symbol, "1h", limit=24)
+    exchange.get_ohlcv("BTC-USD", "5m", limit=24)
+
+    assert exchange.retain_candles(["BTC-USD", "ETH-USD"]) == 1
+    assert exchange._candles.stats()["series"] == 3
+
+    exchange.get_ohlcv("DOGE-USD", "1h", limit=24)
+    start, end = exchange.fake.requests[-1]
+    assert end - start == 24 * HOUR  # evicted series reloads from scratch
+
+
+def test_persisted_cache_makes_restart_warm(exchange, tmp_path):
+    path = tmp_path / "candles.json"
+    exchange.configure_candle_cache({"persist_path": str(path)})
+    before = exchange.get_ohlcv("BTC-USD", "1h", limit=168)
+    assert exchange.persist_candles(force=True)
+
+    restarted = CoinbaseExchange(read_only=True)
+    restarted._rate_limit = lambda *a, **k: None
+    restarted._req = exchange.fake
+    restarted.configure_candle_cache({"persist_path": str(path)})
+    _advance(exchange, 60)
+    after = restarted.get_ohlcv("BTC-USD", "1h", limit=168)
+
+    start, end = exchange.fake.requests[-1]
+    assert end - start < HOUR  # delta only
+    assert [c.timestamp for c in after] == [c.timestamp for c in before]
+
+
+def test_config_from_dict_rejects_invalid_values():
+    config = CandleCacheConfig.from_dict({"max_candles": 0, "persist_interval_seconds": "x",
+                                          "persist_path": "data/c.json"})
+    assert config.max_candles == CandleCacheConfig().max_candles
+    assert config.persist_interval_seconds == CandleCacheConfig().persist_interval_seconds
+    assert config.persist_path == "data/c.json"
+    assert CandleCache(config).maybe_save() is False  # nothing to write yet
@@ -0,0 +1,161 @@
+"""
+Tests for local multi-timeframe resampling (exchange and backtest loaders).
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from backtest.data_loader import Candle, DataLoader
+from core.candle_resampler import CandleResampler, granularity_seconds, resample
+from core.exchange_coinbase import CoinbaseExchange
+
+MIN5 = 300
+HOUR = 3600
+T0 = 1_700_000_000 - 1_700_000_000 % 86400  # UTC midnight
+
+
+def _series(count, step=MIN5, start=T0, seed=3):
+    rng = random.Random(seed)
+    entries, price = [], 100.0
+    for i in range(count):
+        if rng.random() < 0.05:
+            continue  # no trades in this interval
+        o = price
+        price = max(1.0, price + rng.uniform(-1, 1))
+        ts = start + i * step
+        candle = Candle(
+            timestamp=datetime.fromtimestamp(ts, tz=timezone.utc),
+            open=o, high=max(o, price) + rng.random(), low=min(o, price) - rng.random(),
+            close=price, volume=rng.uniform(1, 10),
+        )
+        entries.append((ts, candle))
+    return entries
+
+
+def _brute(entries, target):
+    buckets = {}
+    for ts, c in entries:
+        buckets.setdefault(ts - ts % target, []).append(c)
+    return {
+        b: (cs[0].open, max(c.high for c in cs), min(c.low for c in cs), cs[-1].close, sum(c.volume for c in cs))
+        for b, cs in buckets.items()
+    }
+
+
+def _ohlcv(bar):
+    return (bar.open, bar.high, bar.low, bar.close, pytest.approx(bar.volume))
+
+
+def test_resample_matches_bucket_aggregation():
+    entries = _series(600)
+    expected = _brute(entries, HOUR)
+    bars = resample(entries, HOUR, stamp=lambda s: datetime.fromtimestamp(s, tz=timezone.utc))
+
+    assert [b for b, _ in bars] == sorted(expected)
+    for bucket, bar in bars:
+        assert bar.timestamp == datetime.fromtimestamp(bucket, tz=timezone.utc)
+        assert _ohlcv(bar) == expected[bucket]
+    assert granularity_seconds("1h") == granularity_seconds("ONE_HOUR") == HOUR
+
+
+def test_incremental_updates_and_open_candle_revisions_match_one_shot():
+    entries = _series(500)
+    resampler = CandleResampler(HOUR, MIN5)
+    resampler.update(entries[:100])
+
+    # Feed the rest a few candles at a time, each batch re-sending the last
+    # (previously open) candle with revised values, like a delta fetch does
+    i = 100
+    while i < len(entries):
+        ts, c = entries[i - 1]
+        provisional = Candle(c.timestamp, c.open, c.high, c.low, c.open, c.volume / 2)
+        resampler.update([(ts, provisional)])
+        resampler.update(entries[i - 1:i + 7])
+        i += 7
+
+    one_shot = resample(entries, HOUR)
+    assert [_ohlcv(b) for b in resampler.bars(1000)] == [_ohlcv(b) for _, b in one_shot]
+
+
+def test_partial_last_bar():
+    entries = _series(30, seed=1)   # 2.5 hours of 5m candles
+    entries = [e for e in entries if e[0] < T0 + 30 * MIN5]
+    resampler = CandleResampler(HOUR, MIN5)
+    resampler.update(entries)
+
+    assert not resampler.last_bar_complete()
+    assert len(resampler.bars(10)) == 3
+    assert len(resampler.bars(10, complete_only=True)) == 2
+
+    with pytest.raises(ValueError):
+        CandleResampler(HOUR, 7 * 60)
+
+
+class FakeFiveMinute:
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, method, path, authenticated=True, **kwargs):
+        query = parse_qs(urlparse(path).query)
+        start, end = int(query["start"][0]), int(query["end"][0])
+        self.requests.append((query["granularity"][0], start, end))
+        candles = []
+        for ts in range(-(-start // MIN5) * MIN5, end + 1, MIN5):
+            close = 100 + (ts // MIN5) % 17
+            candles.append({"start": str(ts), "open": str(close - 0.5), "high": str(close + 1),
+                            "low": str(close - 1), "close": str(close), "volume": "2"})
+        return {"candles": candles[::-1]}
+
+
+def test_exchange_builds_hourly_from_cached_five_minute_series(monkeypatch):
+    clock = [float(T0 + 3 * 86400 + 1234)]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    exchange = CoinbaseExchange(read_only=True)
+    exchange._rate_limit = lambda *a, **k: None
+    exchange._req = fake = FakeFiveMinute()
+    exchange.configure_candle_cache({"resample_from": {"1h": "5m", "1d": "7m"}})
+    assert exchange._candles.config.resample_from == {"ONE_HOUR": "FIVE_MINUTE"}
+
+    hourly = exchange.get_ohlcv("BTC-USD", "1h", limit=48)
+    assert len(hourly) == 48
+    assert {g for g, _, _ in fake.requests} == {"FIVE_MINUTE"}
+    assert len(fake.requests) == 2  # 588 base candles, paginated
+
+    # Base series shared with the 5m caller; the 1h call right after is free
+    exchange.get_ohlcv("BTC-USD", "5m", limit=60)
+    before = len(fake.requests)
+    again = exchange.get_ohlcv("BTC-USD", "1h", limit=48)
+    assert len(fake.requests) == before
+    assert again == hourly
+
+    # Next cycle: one delta request for the base series
+    clock[0] += 3600
+    hourly = exchange.get_ohlcv("BTC-USD", "1h", limit=48)
+    assert len(fake.requests) == before + 1
+    entries = [(int(c.timestamp.timestamp()), c) for c in exchange._candles.get("BTC-USD", "FIVE_MINUTE", 1000)]
+    assert [_ohlcv(b) for b in hourly] == [_ohlcv(b) for _, b in resample(entries, HOUR)][-48:]
+
+
+def test_data_loader_resamples_without_lookahead(monkeypatch):
+    loader = DataLoader(source="csv", base_granularity="FIVE_MINUTE")
+    base = [c for _, c in _series(24 * 12)]
+    loader._cache["BTC-USD"] = base
+    monkeypatch.setattr(loader, "load_range", lambda *a, **k: pytest.fail("should not reload"))
+
+    start = datetime.fromtimestamp(T0, tz=timezone.utc)
+    end = start + timedelta(hours=5, minutes=20)
+    bars = loader.get_candles("BTC-USD", start, end, "ONE_HOUR")
+
+    visible = [(int(c.timestamp.timestamp()), c) for c in base if c.timestamp <= end]
+    expected = resample(visible, HOUR)
+    assert len(bars) == 6
+    assert [_ohlcv(b) for b in bars] == [_ohlcv(b) for _, b in expected]
+    assert bars[-1].close == visible[-1][1].close  # partial bar ends at `end`
+
+    full_day = loader.get_candles("BTC-USD", start, start + timedelta(hours=23, minutes=55), "ONE_HOUR")
+    assert len(full_day) == 24
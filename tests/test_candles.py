@@ -0,0 +1,134 @@
+"""
+Tests for the columnar CandleSeries and its legacy List[OHLCV] compatibility.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backtest.data_loader import Candle
+from core.candles import OHLCV, CandleSeries, column
+from core.indicator_state import IndicatorParams, IndicatorState
+from core.indicators import as_columns
+from core.regime import RegimeDetector
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _rows(count, symbol="BTC-USD"):
+    rows, price = [], 100.0
+    for i in range(count):
+        o = price
+        price = price * (1.01 if i % 3 else 0.985)
+        rows.append(OHLCV(symbol, T0 + timedelta(hours=i), o, max(o, price) + 0.5,
+                          min(o, price) - 0.5, price, 1000.0 + i))
+    return rows
+
+
+def test_round_trip_preserves_rows():
+    rows = _rows(50)
+    series = CandleSeries.from_candles(rows)
+
+    assert len(series) == 50
+    assert series.symbol == "BTC-USD"
+    assert series == rows
+    assert series.to_list() == rows
+    assert series[-1] == rows[-1]
+    assert series[-1].timestamp.tzinfo is not None
+    assert series.epochs[0] == int(T0.timestamp())
+
+
+def test_slices_are_views_over_the_same_buffers():
+    series = CandleSeries.from_candles(_rows(200))
+    window = series[-168:]
+
+    assert isinstance(window, CandleSeries)
+    assert len(window) == 168
+    assert window.close.obj is series.close.obj
+    assert list(window.close) == list(series.close)[-168:]
+    assert window[0] == series[32]
+
+
+def test_from_candles_accepts_backtest_candles_and_is_idempotent():
+    candles = [Candle(r.timestamp, r.open, r.high, r.low, r.close, r.volume) for r in _rows(10)]
+    series = CandleSeries.from_candles(candles, symbol="ETH-USD")
+
+    assert series.symbol == "ETH-USD"
+    assert list(series.close) == [c.close for c in candles]
+    assert CandleSeries.from_candles(series) is series
+
+
+def test_until_cuts_without_lookahead():
+    rows = _rows(48)
+    series = CandleSeries.from_candles(rows)
+    cutoff = rows[20].timestamp
+
+    assert series.until(int(cutoff.timestamp())) == [c for c in rows if c.timestamp <= cutoff]
+    assert len(series.until(int(T0.timestamp()) - 1)) == 0
+
+
+def test_empty_series_and_mismatched_columns():
+    assert len(CandleSeries.empty("BTC-USD")) == 0
+    assert not CandleSeries.from_candles([])
+    with pytest.raises(ValueError):
+        CandleSeries("X", [1, 2], [1.0], [1.0], [1.0], [1.0], [1.0])
+
+
+def test_nbytes_is_48_per_candle():
+    assert CandleSeries.from_candles(_rows(1000)).nbytes == 48 * 1000
+
+
+def test_column_reads_series_and_lists_alike():
+    rows = _rows(20)
+    series = CandleSeries.from_candles(rows)
+
+    assert list(column(series[-4:], "volume")) == [c.volume for c in rows[-4:]]
+    assert column(rows[-4:], "volume") == [c.volume for c in rows[-4:]]
+    assert as_columns(series) is series
+
+
+def test_consumers_agree_on_list_and_series_input():
+    rows = _rows(200)
+    series = CandleSeries.from_candles(rows)
+
+    detector = RegimeDetector()
+    assert detector.detect(series).regime == detector.detect(rows).regime
+
+    params = IndicatorParams()
+    from_list = IndicatorState.from_candles(params, rows)
+    from_series = IndicatorState.from_candles(params, series)
+    assert from_series.last_closed == from_list.last_closed
+    assert list(from_series.closes) == list(from_list.closes)
+    assert from_series.open_bar == from_list.open_bar
+
+
+def test_backtest_triggers_cut_naive_times_as_utc(monkeypatch):
+    import time
+    from unittest.mock import MagicMock
+
+    from backtest.engine import BacktestEngine
+
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        # DataLoader candles carry naive UTC timestamps
+        rows = [Candle(r.timestamp.replace(tzinfo=None), r.open, r.high, r.low, r.close, r.volume)
+                for r in _rows(48)]
+        now = rows[-1].timestamp
+        seen = []
+
+        engine = BacktestEngine.__new__(BacktestEngine)
+        engine.trigger_engine = MagicMock()
+        engine.trigger_engine._check_volume_spike.side_effect = lambda asset, candles: seen.append(candles)
+        engine.trigger_engine._check_breakout.return_value = None
+        engine.trigger_engine._check_momentum.return_value = None
+        universe = MagicMock()
+        universe.get_all_eligible.return_value = [MagicMock(symbol="BTC-USD")]
+
+        engine._simulate_triggers(universe, now, lambda symbols, start, end: {"BTC-USD": rows}, "chop")
+
+        assert len(seen[0]) == 48
+        assert seen[0][-1].timestamp == T0 + timedelta(hours=47)
+    finally:
+        monkeypatch.delenv("TZ")
+        time.tzset()
@@ -0,0 +1,185 @@
+"""
+Tests for the persisted product catalog / universe snapshot used for warm starts.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.catalog_cache import PERSIST_VERSION, CatalogCache, CatalogCacheConfig
+from core.exchange_coinbase import CoinbaseExchange, OrderbookSnapshot, Quote
+from core.universe import UniverseManager
+
+PRODUCTS = [
+    {"product_id": "BTC-USD", "status": "online", "base_increment": "0.00000001",
+     "quote_increment": "0.01", "price_increment": "0.01", "min_market_funds": "1"},
+    {"product_id": "ETH-USD", "status": "online", "base_increment": "0.0001",
+     "quote_increment": "0.01", "price_increment": "0.01", "min_market_funds": "1"},
+]
+
+
+def _cache(tmp_path, **overrides):
+    return CatalogCache(CatalogCacheConfig(persist_path=str(tmp_path / "catalog.json"), **overrides))
+
+
+def _exchange(monkeypatch, products=PRODUCTS):
+    exchange = CoinbaseExchange(read_only=True)
+    monkeypatch.setattr(exchange, "_rate_limit", lambda *a, **k: None)
+    exchange.list_public_products = MagicMock(return_value=list(products))
+    return exchange
+
+
+def test_config_from_dict():
+    config = CatalogCacheConfig.from_dict({
+        "persist_path": "data/catalog.json", "products_max_age_seconds": 60,
+        "universe_max_age_seconds": "bad", "refresh_in_background": False,
+    })
+
+    assert config.persist_path == "data/catalog.json"
+    assert config.products_max_age_seconds == 60
+    assert config.universe_max_age_seconds == 3600
+    assert config.refresh_in_background is False
+    assert CatalogCache(CatalogCacheConfig()).enabled is False
+
+
+def test_round_trip_and_version_check(tmp_path):
+    cache = _cache(tmp_path)
+    cache.store_products(PRODUCTS)
+    cache.store_universe({"regime": "chop"})
+
+    restored = _cache(tmp_path)
+    assert restored.load() == 2
+    assert restored.products()[0] == PRODUCTS
+    assert restored.universe()[0] == {"regime": "chop"}
+
+    path = tmp_path / "catalog.json"
+    payload = json.loads(path.read_text())
+    payload["version"] = PERSIST_VERSION + 1
+    path.write_text(json.dumps(payload))
+    assert _cache(tmp_path).load() == 0
+
+
+def test_sections_expire_independently(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, products_max_age_seconds=100, universe_max_age_seconds=10)
+    cache.store_products(PRODUCTS)
+    cache.store_universe({"regime": "chop"})
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 50)
+    assert cache.products() is not None
+    assert cache.universe() is None
+
+
+def test_exchange_serves_specs_from_restored_catalog(tmp_path, monkeypatch):
+    _cache(tmp_path).store_products(PRODUCTS)
+    cache = _cache(tmp_path)
+    cache.load()
+    exchange = _exchange(monkeypatch)
+
+    exchange.attach_catalog_cache(cache)
+
+    assert exchange.get_product_spec("ETH-USD")["base_increment"] == "0.0001"
+    assert exchange.get_symbols() == ["BTC-USD", "ETH-USD"]
+    exchange.list_public_products.assert_not_called()
+
+
+def test_stale_catalog_is_served_while_refreshing_in_background(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    cache.store_products(PRODUCTS[:1])
+    exchange = _exchange(monkeypatch)
+    exchange.attach_catalog_cache(cache)
+    exchange._products_cache_time -= 600   # past the 5 minute refresh window
+    release = threading.Event()
+    exchange.list_public_products.side_effect = lambda limit=250: release.wait(5) and list(PRODUCTS)
+
+    assert exchange.get_symbols() == ["BTC-USD"]      # restored list, no wait
+    release.set()
+    exchange._products_refresh.join(5)
+
+    assert exchange.get_symbols() == ["BTC-USD", "ETH-USD"]
+    assert exchange.list_public_products.call_count == 1
+    assert cache.products()[0] == PRODUCTS
+
+
+def test_failed_refresh_keeps_restored_catalog(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, refresh_in_background=False)
+    cache.store_products(PRODUCTS)
+    exchange = _exchange(monkeypatch, products=[])
+    exchange.attach_catalog_cache(cache)
+    exchange._products_cache_time -= 600
+
+    assert exchange.get_symbols() == ["BTC-USD", "ETH-USD"]
+    exchange.list_public_products.assert_called_once()
+
+
+class _Market:
+    def __init__(self):
+        self.exchange = MagicMock(spec=["get_quote", "get_orderbook"])
+        self.exchange.get_quote.side_effect = lambda s: Quote(
+            symbol=s, bid=99.9, ask=100.1, mid=100.0, spread_bps=5.0, last=100.0,
+            volume_24h=1e9, timestamp=datetime.now(timezone.utc))
+        self.exchange.get_orderbook.side_effect = lambda s: OrderbookSnapshot(
+            symbol=s, bid_depth_usd=5e5, ask_depth_usd=5e5, total_depth_usd=1e6,
+            bid_levels=10, ask_levels=10, timestamp=datetime.now(timezone.utc))
+
+
+@pytest.fixture
+def _no_red_flags(monkeypatch):
+    store = MagicMock()
+    store.get_red_flag_banned_symbols.return_value = {}
+    monkeypatch.setattr("infra.state_store.get_state_store", lambda: store)
+
+
+def _universe_config(symbols):
+    return {
+        "universe": {"refresh_interval_hours": 1},
+        "liquidity": {"min_24h_volume_usd": 1e6, "max_spread_bps": 50},
+        "tiers": {"tier_1_core": {"symbols": symbols, "constraints": {}}},
+    }
+
+
+def test_universe_warm_start_serves_snapshot_then_rebuilds(tmp_path, _no_red_flags):
+    cache = _cache(tmp_path)
+    first = UniverseManager(_universe_config(["BTC-USD"]), exchange=_Market().exchange)
+    first.attach_catalog_cache(cache)
+    first.get_universe()
+
+    restored = _cache(tmp_path)
+    restored.load()
+    market = _Market()
+    manager = UniverseManager(_universe_config(["BTC-USD", "ETH-USD"]), exchange=market.exchange)
+    manager.attach_catalog_cache(restored)
+
+    snapshot = manager.get_universe()
+    assert [a.symbol for a in snapshot.get_all_eligible()] == ["BTC-USD"]
+    assert [a.symbol for a in manager.last_diff.added] == ["BTC-USD"]
+
+    manager._background_refresh.join(5)
+    market.exchange.get_quote.assert_called()
+
+    refreshed = manager.get_universe()
+    assert [a.symbol for a in refreshed.get_all_eligible()] == ["BTC-USD", "ETH-USD"]
+    assert [a.symbol for a in manager.last_diff.added] == ["ETH-USD"]
+    assert manager.get_universe() is refreshed
+    assert manager.last_diff.is_empty
+
+
+def test_universe_snapshot_for_other_regime_is_rebuilt(tmp_path, _no_red_flags):
+    cache = _cache(tmp_path)
+    cache.store_universe({
+        "timestamp": datetime.now(timezone.utc).isoformat(), "regime": "bull",
+        "tier_1_assets": [], "tier_2_assets": [], "tier_3_assets": [],
+        "excluded_assets": [], "total_eligible": 0,
+    })
+    manager = UniverseManager(_universe_config(["BTC-USD"]), exchange=_Market().exchange)
+    manager.attach_catalog_cache(cache)
+
+    snapshot = manager.get_universe(regime="chop")
+
+    assert snapshot.regime == "chop"
+    assert snapshot.total_eligible == 1
+    assert manager._background_refresh is None
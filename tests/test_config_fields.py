@@ -0,0 +1,59 @@
+"""
+Tests for apply_fields, the shared parsing behind the config dataclasses' from_dict.
+"""
+
+from dataclasses import dataclass
+
+from infra.config_fields import apply_fields
+
+
+@dataclass
+class _Settings:
+    enabled: bool = False
+    workers: int = 4
+    timeout: float = 2.0
+    grace: float = 1.0
+    path: str = "data/x.json"
+    channels: tuple = ("ticker",)
+    deadline: object = None
+
+
+def test_values_are_cast_to_the_default_types():
+    cfg = apply_fields(_Settings(), {"enabled": True, "workers": "8", "timeout": "0.5",
+                                     "path": "data/y.json", "channels": ["level2", "ticker"]}, "test")
+
+    assert cfg == _Settings(enabled=True, workers=8, timeout=0.5, path="data/y.json",
+                            channels=("level2", "ticker"))
+    assert type(cfg.workers) is int and type(cfg.timeout) is float
+    assert apply_fields(_Settings(), {"channels": "level2"}, "test").channels == ("level2",)
+
+
+def test_invalid_values_keep_the_defaults():
+    raw = {"workers": 0, "timeout": "bad", "grace": -1, "path": "", "channels": [], "deadline": 5}
+    assert apply_fields(_Settings(), raw, "test") == _Settings()
+    assert apply_fields(_Settings(), None, "test") == _Settings()
+
+
+def test_non_negative_and_skipped_fields():
+    cfg = apply_fields(_Settings(), {"grace": 0, "timeout": 0, "workers": 2}, "test",
+                       non_negative=("grace",), skip=("workers",))
+
+    assert cfg.grace == 0.0
+    assert cfg.timeout == 2.0
+    assert cfg.workers == 4
+
+
+def test_booleans_parse_strings_and_reject_other_values():
+    assert apply_fields(_Settings(), {"enabled": "true"}, "test").enabled is True
+    assert apply_fields(_Settings(enabled=True), {"enabled": "false"}, "test").enabled is False
+    assert apply_fields(_Settings(enabled=True), {"enabled": " Off "}, "test").enabled is False
+    for value in ("maybe", 2, 1.0, []):
+        assert apply_fields(_Settings(enabled=True), {"enabled": value}, "test").enabled is True
+
+
+def test_integers_reject_fractions_instead_of_truncating():
+    assert apply_fields(_Settings(), {"workers": 2.0}, "test").workers == 2
+    assert apply_fields(_Settings(), {"workers": "3"}, "test").workers == 3
+    for value in (2.7, "2.7", True, "x"):
+        assert apply_fields(_Settings(), {"workers": value}, "test").workers == 4
+    assert apply_fields(_Settings(), {"timeout": True}, "test").timeout == 2.0
@@ -1,4 +1,5 @@
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, ANY
@@ -22,7 +23,7 @@ def test_req_includes_query_string(monkeypatch):
         captured["body"] = body
         return {"X-Test": "ok"}
 
-    def fake_request(method, url, headers, json, timeout):
+    def fake_request(self, method, url, headers, json, timeout):
         captured["request"] = {
             "method": method,
             "url": url,
@@ -36,7 +37,7 @@ def test_req_includes_query_string(monkeypatch):
         return response
 
     monkeypatch.setattr(exchange, "_headers", fake_headers)
-    monkeypatch.setattr("requests.request", fake_request)
+    monkeypatch.setattr("requests.Session.request", fake_request)
 
     result = exchange._req(
         "GET",
@@ -73,6 +74,42 @@ def test_get_convert_trade_passes_query(monkeypatch):
     assert called.query == {"from_account": "from", "to_account": "to"}
 
 
+def test_list_fills_follows_pagination_cursor(monkeypatch):
+    exchange = CoinbaseExchange(api_key="key", api_secret="secret", read_only=True)
+    pages = {
+        None: {"fills": [{"trade_id": "t3"}, {"trade_id": "t2"}], "cursor": "c1"},
+        "c1": {"fills": [{"trade_id": "t1"}], "cursor": ""},
+    }
+    queries = []
+
+    def fake_req(method, endpoint, body=None, authenticated=True, max_retries=3, query=None):
+        queries.append(dict(query))
+        return pages[query.get("cursor")]
+
+    monkeypatch.setattr(exchange, "_req", fake_req)
+    monkeypatch.setattr(exchange, "_rate_limit", lambda *args, **kwargs: None)
+
+    fills = exchange.list_fills(limit=2, max_pages=5)
+    assert [f["trade_id"] for f in fills] == ["t3", "t2", "t1"]
+    assert fills.truncated is False
+    assert [q.get("cursor") for q in queries] == [None, "c1"]
+    assert all(q["limit"] == 2 for q in queries)
+
+    queries.clear()
+    end = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    fills = exchange.list_fills(limit=2, end_time=end)   # default: first page only
+    assert len(fills) == 2 and fills.truncated is True
+    assert len(queries) == 1
+    assert queries[0]["end_sequence_timestamp"] == end.isoformat()
+
+    def failing_req(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(exchange, "_req", failing_req)
+    fills = exchange.list_fills(limit=2)
+    assert fills == [] and fills.truncated is True   # a failure is not "no fills"
+
+
 def test_req_records_metrics(monkeypatch):
     metrics = SimpleNamespace(
         record_rate_limit_usage=MagicMock(),
@@ -84,17 +121,96 @@ def test_req_records_metrics(monkeypatch):
     def fake_headers(method, path, body):
         return {"X-Test": "ok"}
 
-    def fake_request(method, url, headers, json, timeout):
+    def fake_request(self, method, url, headers, json, timeout):
         response = MagicMock()
         response.raise_for_status.return_value = None
         response.json.return_value = {"ok": True}
         return response
 
     monkeypatch.setattr(exchange, "_headers", fake_headers)
-    monkeypatch.setattr("requests.request", fake_request)
+    monkeypatch.setattr("requests.Session.request", fake_request)
 
     result = exchange._req("GET", "/metrics/test", authenticated=True, max_retries=1)
 
     assert result == {"ok": True}
     metrics.record_rate_limit_usage.assert_called()
     metrics.record_api_call.assert_called_with("metrics/test", "private", ANY, "success")
+
+
+def test_get_quotes_bulk_uses_batch_endpoints(monkeypatch):
+    exchange = CoinbaseExchange(api_key="key", api_secret="secret", read_only=True)
+    symbols = [f"C{i}-USD" for i in range(150)]
+
+    product_calls = []
+    book_calls = []
+
+    def fake_products(limit=250, product_ids=None):
+        product_calls.append(list(product_ids))
+        return [
+            {"product_id": pid, "price": "10.0", "volume_24h": "2500000"}
+            for pid in product_ids
+        ]
+
+    def fake_req(method, endpoint, body=None, authenticated=True, max_retries=3, query=None):
+        assert endpoint == "/best_bid_ask"
+        ids = query["product_ids"]
+        book_calls.append(list(ids))
+        return {
+            "pricebooks": [
+                {"product_id": pid, "bids": [{"price": "9.99", "size": "1"}], "asks": [{"price": "10.01", "size": "1"}]}
+                for pid in ids
+                if pid != "C3-USD"  # one-sided/missing book
+            ]
+        }
+
+    fallback = MagicMock(side_effect=ValueError("no liquidity"))
+    monkeypatch.setattr(exchange, "list_public_products", fake_products)
+    monkeypatch.setattr(exchange, "_req", fake_req)
+    monkeypatch.setattr(exchange, "get_quote", fallback)
+
+    quotes = exchange.get_quotes_bulk(symbols, chunk_size=100)
+
+    # 150 symbols -> 2 product requests + 2 book requests, regardless of symbol count
+    assert [len(c) for c in product_calls] == [100, 50]
+    assert [len(c) for c in book_calls] == [100, 50]
+    assert len(quotes) == 149
+    assert "C3-USD" not in quotes
+    fallback.assert_called_once_with("C3-USD", caller="CoinbaseExchange.get_quotes_bulk")
+
+    quote = quotes["C0-USD"]
+    assert quote.bid == 9.99 and quote.ask == 10.01
+    assert quote.mid == 10.0
+    assert quote.volume_24h == 2_500_000.0
+    assert round(quote.spread_bps, 6) == 20.0
+
+
+def test_get_quotes_bulk_falls_back_when_product_stats_missing(monkeypatch):
+    exchange = CoinbaseExchange(api_key="key", api_secret="secret", read_only=True)
+    symbols = ["AAA-USD", "BBB-USD"]
+
+    def fake_req(method, endpoint, body=None, authenticated=True, max_retries=3, query=None):
+        return {"pricebooks": [
+            {"product_id": pid, "bids": [{"price": "9.99", "size": "1"}], "asks": [{"price": "10.01", "size": "1"}]}
+            for pid in query["product_ids"]
+        ]}
+
+    ticker = MagicMock(side_effect=lambda symbol: SimpleNamespace(symbol=symbol, volume_24h=1e6))
+    monkeypatch.setattr(exchange, "list_public_products", lambda limit=250, product_ids=None: [])
+    monkeypatch.setattr(exchange, "_req", fake_req)
+    monkeypatch.setattr(exchange, "get_quote", ticker)
+
+    quotes = exchange.get_quotes_bulk(symbols)
+
+    assert ticker.call_count == 2
+    assert all(quote.volume_24h == 1e6 for quote in quotes.values())
+    assert exchange.get_quotes_bulk(symbols, fallback=False) == {}
+
+
+def test_get_tickers_routes_through_bulk(monkeypatch):
+    exchange = CoinbaseExchange(api_key="key", api_secret="secret", read_only=True)
+    bulk = MagicMock(return_value={})
+    monkeypatch.setattr(exchange, "get_quotes_bulk", bulk)
+
+    exchange.get_tickers(["BTC-USD", "ETH-USD"])
+
+    bulk.assert_called_once_with(["BTC-USD", "ETH-USD"])
@@ -0,0 +1,218 @@
+"""
+Tests for the asyncio connector, its HTTP client and the sync facade.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from core.exchange_coinbase import CoinbaseExchange
+from core.exchange_coinbase_async import AsyncCoinbaseExchange, AsyncIoConfig, CoinbaseExchangeFacade
+from infra.async_http import AsyncHttpClient, AsyncHttpError, AsyncHttpResponse
+
+TICKER = {"best_bid": "100", "best_ask": "101", "price": "100.5", "approximate_quote_24h_volume": "1000000"}
+
+
+class FakeClient:
+    """Async client stand-in: routes by URL substring, optional per-request delay."""
+
+    def __init__(self, routes, delay=0.0):
+        self.routes = routes
+        self.delay = delay
+        self.calls = []
+        self.active = self.peak = 0
+
+    async def request(self, method, url, *, params=None, headers=None, json=None, timeout=None):
+        self.calls.append((method, url, params, json))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            for fragment, reply in self.routes.items():
+                if fragment in url:
+                    status, payload = reply() if callable(reply) else reply
+                    body = b"" if payload is None else json_bytes(payload)
+                    return AsyncHttpResponse(status, "", {}, body, url)
+            return AsyncHttpResponse(404, "Not Found", {}, b"{}", url)
+        finally:
+            self.active -= 1
+
+    async def get(self, url, *, params=None, headers=None, timeout=None):
+        return await self.request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    async def aclose(self):
+        pass
+
+
+def json_bytes(payload):
+    return json.dumps(payload).encode()
+
+
+def _exchange(routes, delay=0.0):
+    sync = CoinbaseExchange(read_only=True)
+    sync.configure_rate_limits({"public": 10000, "private": 10000})
+    client = FakeClient(routes, delay)
+    return AsyncCoinbaseExchange(sync, client=client), client
+
+
+def test_hundreds_of_quotes_overlap_on_one_thread():
+    exchange, client = _exchange({"/ticker": (200, TICKER)}, delay=0.05)
+    symbols = [f"C{i}-USD" for i in range(200)]
+
+    async def run():
+        start = time.perf_counter()
+        results = await exchange.fetch_many("quote", symbols)
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(run())
+    assert all(r.ok for r in results) and [r.symbol for r in results] == symbols
+    assert results[0].value.bid == 100.0 and results[0].value.ask == 101.0
+    assert client.peak == len(symbols)
+    assert elapsed < 2.0   # 200 x 50ms sequentially would be 10s
+
+
+def test_concurrent_quotes_for_one_symbol_share_a_request():
+    exchange, client = _exchange({"/ticker": (200, TICKER)}, delay=0.05)
+
+    async def run():
+        return await asyncio.gather(*(exchange.get_quote("BTC-USD") for _ in range(10)))
+
+    quotes = asyncio.run(run())
+    assert len(client.calls) == 1
+    assert all(q is quotes[0] for q in quotes)
+    # Stored in the quote cache shared with the sync connector
+    assert exchange.exchange.get_quote("BTC-USD") is quotes[0]
+    stats = exchange.exchange.quote_cache_stats()
+    assert sum(s["coalesced"] for s in stats.values()) == 9
+
+
+def test_retries_with_awaited_jitter_and_never_retries_client_errors(monkeypatch):
+    replies = iter([(429, {}), (503, {}), (200, {"candles": []})])
+    exchange, client = _exchange({"/candles": lambda: next(replies), "/bad": (400, {"error": "x"})})
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(CoinbaseExchange, "_retry_backoff", staticmethod(lambda attempt: attempt + 0.5))
+    monkeypatch.setattr(time, "sleep", lambda *_: pytest.fail("blocking sleep on the event loop"))
+
+    async def run():
+        ok = await exchange._req("GET", "/products/BTC-USD/candles", authenticated=False)
+        with pytest.raises(AsyncHttpError) as err:
+            await exchange._req("GET", "/bad", authenticated=False)
+        return ok, err.value
+
+    ok, error = asyncio.run(run())
+    assert ok == {"candles": []}
+    assert [d for d in sleeps if d] == [0.5, 1.5]   # backoff only; the fake client sleeps 0
+    assert error.status_code == 400
+    assert len(client.calls) == 4
+
+
+def test_orders_match_sync_payloads():
+    order_reply = {"success": True, "order_id": "abc"}
+    exchange, client = _exchange({
+        "/orders/batch_cancel": (200, {"results": [{"success": True}, {"success": False}]}),
+        "/orders/historical/fills": (200, {"fills": [{"trade_id": "t1"}]}),
+        "/orders/historical/batch": (200, {"orders": [{"status": "OPEN"}, {"status": "FILLED"}]}),
+        "/orders": (200, order_reply),
+    })
+    sync = exchange.exchange
+    sync.read_only, sync.api_key, sync.api_secret, sync._mode = False, "key", "secret", "hmac"
+
+    async def run():
+        placed = await exchange.place_order("BTC-USD", "buy", 25.0, client_order_id="cid-1")
+        opened = await exchange.list_open_orders("BTC-USD")
+        fills = await exchange.list_fills(order_id="abc", product_id="BTC-USD")
+        canceled = await exchange.cancel_orders(["a", "b"])
+        return placed, opened, fills, canceled
+
+    placed, opened, fills, canceled = asyncio.run(run())
+    assert placed == order_reply
+    assert opened == [{"status": "OPEN"}]
+    assert fills == [{"trade_id": "t1"}] and fills.truncated is False
+    assert len(canceled["results"]) == 2
+
+    method, url, _, body = client.calls[0]
+    assert (method, url) == ("POST", "https://api.coinbase.com/api/v3/brokerage/orders")
+    assert body == {
+        "order_configuration": {"market_market_ioc": {"quote_size": "25.00"}},
+        "product_id": "BTC-USD",
+        "side": "BUY",
+        "client_order_id": "cid-1",
+    }
+    assert "order_ids=abc" in client.calls[2][1] and "product_id" not in client.calls[2][1]
+
+
+def test_facade_runs_coroutines_and_delegates_the_rest():
+    exchange, client = _exchange({"/ticker": (200, TICKER)}, delay=0.01)
+    facade = CoinbaseExchangeFacade(exchange)
+    try:
+        caller_thread = threading.current_thread()
+        assert facade.get_quote("ETH-USD").mid == pytest.approx(100.5)
+        assert facade.read_only is True                       # sync connector attribute
+        assert facade.rate_limiter is exchange.exchange.rate_limiter
+        assert threading.current_thread() is caller_thread
+        results = facade.fetch_many("quote", ["SOL-USD", "ADA-USD"])
+        assert [r.ok for r in results] == [True, True]
+        assert facade.invalidate_quotes("ETH-USD") == 1
+    finally:
+        facade.close()
+    assert not facade._thread.is_alive()
+
+
+def test_async_io_config_from_dict():
+    assert AsyncIoConfig.from_dict(None).enabled is False
+    config = AsyncIoConfig.from_dict({"enabled": True, "max_connections": "8"})
+    assert config.enabled and config.max_connections == 8
+    assert AsyncIoConfig.from_dict({"max_connections": 0}).max_connections == 64
+
+
+def test_http_client_keeps_connections_alive_and_reads_chunked_bodies():
+    async def handle(reader, writer):
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b""):
+                name, _, value = line.decode().partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            path = request_line.split()[1].decode()
+            if path.startswith("/chunked"):
+                writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                             b"7\r\n{\"a\": 1\r\n1\r\n}\r\n0\r\n\r\n")
+            else:
+                payload = json.dumps({"path": path, "body": body.decode()}).encode()
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(payload), payload))
+            await writer.drain()
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncHttpClient()
+        base = f"http://127.0.0.1:{port}"
+        try:
+            first = await client.get(f"{base}/one", params={"x": 1})
+            second = await client.request("POST", f"{base}/two", json={"k": "v"})
+            chunked = await client.get(f"{base}/chunked")
+        finally:
+            await client.aclose()
+            server.close()
+            await server.wait_closed()
+        return first, second, chunked, client.stats()
+
+    first, second, chunked, stats = asyncio.run(run())
+    assert first.json() == {"path": "/one?x=1", "body": ""}
+    assert second.json() == {"path": "/two", "body": '{"k": "v"}'}
+    assert chunked.json() == {"a": 1}
+    assert stats == {"requests": 3, "connections_opened": 1, "connections_reused": 2}
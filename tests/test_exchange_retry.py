@@ -26,7 +26,7 @@ class TestRetry429RateLimit:
     
     def test_retries_on_429_and_succeeds(self, exchange):
         """Test retries 429 errors and eventually succeeds."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             # First 2 calls return 429, third succeeds
             mock_response_429 = Mock()
             mock_response_429.status_code = 429
@@ -50,7 +50,7 @@ class TestRetry429RateLimit:
     
     def test_exhausts_retries_on_persistent_429(self, exchange):
         """Test raises after exhausting all retries on 429."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_response = Mock()
             mock_response.status_code = 429
             mock_response.text = "Rate limit exceeded"
@@ -64,7 +64,7 @@ class TestRetry429RateLimit:
     
     def test_records_rate_limit_usage(self, exchange):
         """Test records rate limit for circuit breaker."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_response = Mock()
             mock_response.status_code = 429
             mock_response.text = "Rate limit exceeded"
@@ -86,7 +86,7 @@ class TestRetry5xxServerErrors:
     
     def test_retries_on_500_and_succeeds(self, exchange):
         """Test retries 500 errors and eventually succeeds."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_response_500 = Mock()
             mock_response_500.status_code = 500
             mock_response_500.text = "Internal server error"
@@ -107,7 +107,7 @@ class TestRetry5xxServerErrors:
     
     def test_retries_on_503_service_unavailable(self, exchange):
         """Test retries 503 errors."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_response_503 = Mock()
             mock_response_503.status_code = 503
             mock_response_503.text = "Service unavailable"
@@ -129,7 +129,7 @@ class TestRetry5xxServerErrors:
     
     def test_does_not_retry_4xx_client_errors(self, exchange):
         """Test does NOT retry 4xx errors (except 429)."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             for status_code in [400, 401, 403, 404]:
                 mock_response = Mock()
                 mock_response.status_code = status_code
@@ -150,7 +150,7 @@ class TestRetryNetworkErrors:
     
     def test_retries_on_timeout(self, exchange):
         """Test retries on Timeout errors."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_response_ok = Mock()
             mock_response_ok.status_code = 200
             mock_response_ok.json.return_value = {"success": True}
@@ -167,7 +167,7 @@ class TestRetryNetworkErrors:
     
     def test_retries_on_connection_error(self, exchange):
         """Test retries on ConnectionError."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_response_ok = Mock()
             mock_response_ok.status_code = 200
             mock_response_ok.json.return_value = {"success": True}
@@ -185,7 +185,7 @@ class TestRetryNetworkErrors:
     
     def test_exhausts_retries_on_persistent_timeout(self, exchange):
         """Test raises after exhausting retries on timeout."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.side_effect = Timeout("Connection timed out")
             
             with pytest.raises(Timeout):
@@ -199,7 +199,7 @@ class TestExponentialBackoff:
     
     def test_backoff_increases_exponentially(self, exchange):
         """Test backoff delay increases exponentially: base * 2^attempt."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request, \
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request, \
              patch('time.sleep') as mock_sleep, \
              patch('random.uniform') as mock_random:
             
@@ -230,7 +230,7 @@ class TestExponentialBackoff:
     
     def test_backoff_caps_at_max_delay(self, exchange):
         """Test backoff caps at 30 seconds."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request, \
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request, \
              patch('time.sleep') as mock_sleep, \
              patch('random.uniform') as mock_random:
             
@@ -256,7 +256,7 @@ class TestExponentialBackoff:
     
     def test_full_jitter_randomizes_delay(self, exchange):
         """Test full jitter: random(0, exp_backoff) spreads retries."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request, \
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request, \
              patch('time.sleep'), \
              patch('random.uniform') as mock_random:
             
@@ -284,7 +284,7 @@ class TestExponentialBackoff:
     
     def test_no_sleep_after_last_attempt(self, exchange):
         """Test does NOT sleep after final failed attempt."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request, \
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request, \
              patch('time.sleep') as mock_sleep:
             
             mock_response = Mock()
@@ -306,7 +306,7 @@ class TestREQCB1Compliance:
     
     def test_uses_exponential_backoff_formula(self, exchange):
         """Test uses AWS best practice formula: random(0, min(cap, base * 2^attempt))."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request, \
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request, \
              patch('random.uniform') as mock_random:
             
             mock_random.return_value = 1.0
@@ -332,7 +332,7 @@ class TestREQCB1Compliance:
     
     def test_handles_mixed_error_scenarios(self, exchange):
         """Test handles mixed errors (429 + 5xx + timeout) correctly."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_429 = Mock()
             mock_429.status_code = 429
             
@@ -358,7 +358,7 @@ class TestREQCB1Compliance:
     
     def test_respects_max_retries_parameter(self, exchange):
         """Test respects custom max_retries parameter."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_response = Mock()
             mock_response.status_code = 500
             mock_request.side_effect = HTTPError(response=mock_response)
@@ -390,7 +390,7 @@ class TestMetricsRecording:
         mock_metrics = Mock()
         exchange.metrics = mock_metrics
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request, \
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request, \
              patch('time.perf_counter') as mock_time:
             
             # Mock time progression
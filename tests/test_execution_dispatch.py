@@ -0,0 +1,239 @@
+"""Tests for concurrent order dispatch in ExecutionEngine.execute_batch."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.exceptions import CriticalDataUnavailable
+from core.execution import ExecutionEngine, ExecutionResult
+from core.order_dispatch import OrderDispatchConfig, OrderDispatcher, QuoteReservations
+from infra.metrics import MetricsRecorder
+
+
+@pytest.fixture
+def metrics():
+    MetricsRecorder._reset_for_testing()
+    recorder = MetricsRecorder(enabled=False)
+    yield recorder
+    MetricsRecorder._reset_for_testing()
+
+
+def _result(symbol, side="BUY", success=True, size=1.0):
+    return ExecutionResult(success=success, order_id=f"oid-{symbol}" if success else None, symbol=symbol,
+                           side=side, filled_size=size, filled_price=1.0, fees=0.0, slippage_bps=0.0,
+                           route="live_limit_post_only", error=None if success else "rejected")
+
+
+def _engine(mode, metrics=None, balances=None, **dispatch):
+    exchange = MagicMock()
+    exchange.read_only = False
+    exchange.get_accounts.return_value = [
+        {"currency": currency, "available_balance": {"value": str(value)}}
+        for currency, value in (balances or {}).items()
+    ]
+    policy = {
+        "risk": {"min_trade_notional_usd": 10.0},
+        "execution": {"preferred_quote_currencies": ["USDC", "USD"], "dispatch": dispatch},
+    }
+    return ExecutionEngine(mode=mode, exchange=exchange, policy=policy, metrics=metrics)
+
+
+class _Tracker:
+    """Records peak concurrency overall and per base asset."""
+
+    def __init__(self, delay):
+        self.delay, self.lock = delay, threading.Lock()
+        self.active, self.peak, self.per_symbol, self.order = {}, 0, {}, []
+
+    def __call__(self, symbol, side, size_usd, *args):
+        base = symbol.split("-")[0]
+        with self.lock:
+            self.order.append(symbol)
+            self.active[base] = self.active.get(base, 0) + 1
+            self.per_symbol[base] = max(self.per_symbol.get(base, 0), self.active[base])
+            self.peak = max(self.peak, sum(self.active.values()))
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[base] -= 1
+        return _result(symbol, side)
+
+
+def test_batch_runs_assets_concurrently_and_keeps_order(metrics):
+    engine = _engine("PAPER", metrics=metrics, max_workers=4, orders_per_second=1000)
+    tracker = _Tracker(delay=0.1)
+    orders = [
+        {"symbol": "BTC-USD", "side": "BUY", "size_usd": 50},
+        {"symbol": "ETH-USD", "side": "BUY", "size_usd": 50},
+        {"symbol": "BTC-USDC", "side": "SELL", "size_usd": 20},
+        {"symbol": "SOL-USD", "side": "BUY", "size_usd": 50, "tier": 2},
+    ]
+
+    started = time.monotonic()
+    with patch.object(engine, "_execute", side_effect=tracker):
+        results = engine.execute_batch(orders)
+    elapsed = time.monotonic() - started
+
+    assert [r.symbol for r in results] == [o["symbol"] for o in orders]
+    assert elapsed < 0.35                          # BTC lane (2 orders) bounds the batch
+    assert tracker.peak == 3
+    assert tracker.per_symbol["BTC"] == 1           # same asset never overlaps
+    assert tracker.order.index("BTC-USD") < tracker.order.index("BTC-USDC")
+    assert all(r.ack_latency_seconds >= 0.1 for r in results)
+    assert results[2].ack_latency_seconds >= 0.2    # queued behind the first BTC order
+
+    snapshot = metrics.order_ack_snapshot()
+    assert snapshot["buy"]["orders"] == 3 and snapshot["sell"]["orders"] == 1
+    engine.shutdown()
+
+
+def test_critical_failure_stops_the_rest_of_the_batch():
+    dispatcher = OrderDispatcher(OrderDispatchConfig(max_workers=4, orders_per_second=1000))
+    calls = []
+
+    def execute(order, decided_at):
+        calls.append(order["symbol"])
+        return _result(order["symbol"], success=order["symbol"] != "ETH-USD")
+
+    results = dispatcher.dispatch([
+        {"symbol": "BTC-USD", "side": "BUY", "size_usd": 50},
+        {"symbol": "SOL-USD", "side": "BUY", "size_usd": 50},
+        {"symbol": "ETH-USD", "side": "BUY", "size_usd": 50, "critical": True},
+        {"symbol": "ADA-USD", "side": "BUY", "size_usd": 50},
+    ], execute)
+
+    assert [r.symbol for r in results] == ["BTC-USD", "SOL-USD", "ETH-USD"]
+    assert "ADA-USD" not in calls
+    assert calls[-1] == "ETH-USD"                   # barrier: runs after the earlier orders
+    dispatcher.shutdown()
+
+
+def test_lane_error_propagates_after_the_other_lanes_finish():
+    dispatcher = OrderDispatcher(OrderDispatchConfig(max_workers=4, orders_per_second=1000))
+    done = []
+
+    def execute(order, decided_at):
+        if order["symbol"] == "BTC-USD":
+            time.sleep(0.02)
+            raise RuntimeError("accounts unavailable")
+        time.sleep(0.1)
+        done.append(order["symbol"])
+        return _result(order["symbol"])
+
+    with pytest.raises(RuntimeError):
+        dispatcher.dispatch([
+            {"symbol": "BTC-USD", "side": "BUY", "size_usd": 50},
+            {"symbol": "BTC-USDC", "side": "BUY", "size_usd": 50},
+            {"symbol": "ETH-USD", "side": "BUY", "size_usd": 50},
+            {"symbol": "ETH-USDC", "side": "SELL", "size_usd": 50},
+        ], execute)
+    assert done == ["ETH-USD", "ETH-USDC"]          # other lanes are not abandoned mid-batch
+    dispatcher.shutdown()
+
+
+def test_batch_turns_a_raising_order_into_a_failed_result(metrics):
+    engine = _engine("PAPER", metrics=metrics, max_workers=4, orders_per_second=1000)
+
+    def execute(symbol, side, size_usd, *args):
+        if symbol == "ETH-USD":
+            raise RuntimeError("book unavailable")
+        time.sleep(0.05)
+        return _result(symbol, side)
+
+    with patch.object(engine, "_execute", side_effect=execute):
+        results = engine.execute_batch([
+            {"symbol": "BTC-USD", "side": "BUY", "size_usd": 50},
+            {"symbol": "ETH-USD", "side": "BUY", "size_usd": 50},
+            {"symbol": "ETH-USDC", "side": "SELL", "size_usd": 20},
+        ])
+
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].route == "failed" and "book unavailable" in results[1].error
+    assert results[2].order_id == "oid-ETH-USDC"    # same lane keeps going after the failure
+    engine.shutdown()
+
+
+def test_batch_raises_critical_data_errors_once_submitted_orders_finish(metrics):
+    engine = _engine("PAPER", metrics=metrics, max_workers=4, orders_per_second=1000)
+    done = []
+
+    def execute(symbol, side, size_usd, *args):
+        if symbol == "BTC-USD":
+            raise CriticalDataUnavailable("accounts:batch")
+        time.sleep(0.05)
+        done.append(symbol)
+        return _result(symbol, side)
+
+    with patch.object(engine, "_execute", side_effect=execute), pytest.raises(CriticalDataUnavailable):
+        engine.execute_batch([
+            {"symbol": "BTC-USD", "side": "BUY", "size_usd": 50},
+            {"symbol": "ETH-USD", "side": "BUY", "size_usd": 50},
+        ])
+    assert done == ["ETH-USD"]
+    engine.shutdown()
+
+
+def test_concurrent_buys_reserve_quote_balance(metrics):
+    engine = _engine("LIVE", metrics=metrics, balances={"USDC": 1000.0}, max_workers=4, orders_per_second=1000)
+    sizes, lock = [], threading.Lock()
+
+    def execute_live(symbol, side, size_usd, *args, **kwargs):
+        with lock:
+            sizes.append((symbol, round(size_usd, 2)))
+        assert engine.quote_reservations.reserved("USDC") >= size_usd
+        time.sleep(0.05)
+        return _result(symbol)
+
+    with patch.object(engine, "_execute_live", side_effect=execute_live):
+        results = engine.execute_batch([
+            {"symbol": "BTC", "side": "BUY", "size_usd": 700.0},
+            {"symbol": "ETH", "side": "BUY", "size_usd": 700.0},
+        ])
+
+    assert all(r.success for r in results)
+    assert sorted(size for _, size in sizes) == [297.0, 700.0]   # second order sized to what is left
+    assert {symbol for symbol, _ in sizes} == {"BTC-USDC", "ETH-USDC"}
+    assert engine.quote_reservations.snapshot() == {}
+    engine.shutdown()
+
+
+def test_buy_reselects_when_concurrent_order_claims_balance(metrics):
+    engine = _engine("LIVE", metrics=metrics, balances={"USDC": 1000.0})
+    select = engine._find_best_trading_pair
+    calls = []
+
+    def racing_select(base, size_usd):
+        calls.append(size_usd)
+        picked = select(base, size_usd)
+        if len(calls) == 1:
+            engine.quote_reservations.reserve("USDC", 600.0)   # another BUY commits first
+        return picked
+
+    with patch.object(engine, "_find_best_trading_pair", side_effect=racing_select), \
+            patch.object(engine, "_execute_live", side_effect=lambda symbol, side, size_usd, *a, **k:
+                         _result(symbol, size=size_usd)) as live:
+        result = engine.execute("BTC", "BUY", 700.0)
+
+    assert result.success and len(calls) == 2
+    assert live.call_args[0][2] == pytest.approx(396.0)            # re-sized to the 400 left
+    assert engine.quote_reservations.snapshot() == {"USDC": 600.0}
+
+
+def test_quote_reservations_and_config():
+    holds = QuoteReservations()
+    holds.reserve("USDC", 100.0)
+    holds.reserve("USDC", 50.0)
+    holds.reserve("USD", 0.0)
+    holds.release("USDC", 100.0)
+    assert holds.snapshot() == {"USDC": 50.0}
+    holds.release("USDC", 50.0)
+    assert holds.reserved("USDC") == 0.0
+    assert holds.try_reserve("USDC", 40.0, held_seen=0.0)
+    assert not holds.try_reserve("USDC", 40.0, held_seen=0.0)       # grew since the snapshot
+    assert holds.try_reserve("USDC", 10.0, held_seen=40.0)
+    assert holds.snapshot() == {"USDC": 50.0}
+    holds.release("USDC", 50.0)
+
+    assert OrderDispatchConfig.from_dict({"max_workers": 0, "orders_per_second": "3"}) == OrderDispatchConfig(4, 3.0)
+    assert OrderDispatchConfig.from_dict(None) == OrderDispatchConfig()
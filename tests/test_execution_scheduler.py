@@ -0,0 +1,224 @@
+"""
+Tests for the background execution scheduler (TWAP parents off the main loop).
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from core.execution_scheduler import ExecutionScheduler, ExecutionSchedulerConfig
+from core.risk import PortfolioState
+from infra.state_store import InMemoryStateBackend, StateStore
+from runner.main_loop import TradingLoop
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _scheduler(**kwargs):
+    config = ExecutionSchedulerConfig(enabled=True, max_workers=4, cancel_timeout_seconds=2.0,
+                                      halt_check_seconds=0.05)
+    return ExecutionScheduler(config, **kwargs)
+
+
+def test_config_from_dict_parses_and_rejects_invalid_values():
+    cfg = ExecutionSchedulerConfig.from_dict({"enabled": True, "max_workers": "2", "halt_check_seconds": 0})
+
+    assert cfg.enabled is True
+    assert cfg.max_workers == 2
+    assert cfg.halt_check_seconds == ExecutionSchedulerConfig().halt_check_seconds
+    assert ExecutionSchedulerConfig.from_dict(None) == ExecutionSchedulerConfig()
+
+
+def test_parents_for_different_symbols_run_concurrently_and_persist_progress():
+    store = StateStore(backend=InMemoryStateBackend())
+    scheduler = _scheduler(state_store=store)
+    release = threading.Event()
+    started = []
+    outcomes = {}
+
+    def job(ctx):
+        started.append(ctx.parent.symbol)
+        ctx.report(filled_usd=25.0, filled_units=1.0, fees=0.1, slices=1)
+        release.wait(2.0)
+        return True
+
+    def on_done(parent, success):
+        outcomes[parent.symbol] = (parent.status, success)
+
+    try:
+        first = scheduler.submit("twap", "AAA", "sell", 50.0, job, on_done=on_done)
+        second = scheduler.submit("twap", "BBB", "sell", 50.0, job, on_done=on_done)
+        assert first is not None and second is not None
+        assert scheduler.submit("twap", "AAA", "sell", 50.0, job) is None    # one parent per symbol
+
+        assert _wait_for(lambda: len(started) == 2)
+        assert _wait_for(lambda: store.load()["parent_orders"].get(first.parent_id, {}).get("slices") == 1)
+        assert scheduler.is_active("AAA") and scheduler.stats()["rejected"] == 1
+
+        release.set()
+        assert _wait_for(lambda: len(outcomes) == 2)
+        assert outcomes["AAA"] == ("completed", True)
+        state = store.load()
+        assert state["parent_orders"] == {}
+        archived = {p["parent_id"]: p for p in state["recent_parent_orders"]}
+        assert archived[first.parent_id]["status"] == "completed"
+        assert archived[first.parent_id]["filled_usd"] == 25.0
+    finally:
+        scheduler.shutdown()
+
+
+def test_cancel_all_cancels_working_children_within_timeout():
+    cancel_order = MagicMock(return_value={"success": True})
+    scheduler = _scheduler(cancel_order=cancel_order)
+    done = []
+
+    def job(ctx):
+        ctx.set_working("child-1", "AAA-USD")
+        while not ctx.sleep(10.0):          # a slice that would otherwise wait a long time
+            pass
+        return False
+
+    scheduler.submit("twap", "AAA", "sell", 50.0, job, on_done=lambda parent, ok: done.append(parent.status))
+    assert _wait_for(lambda: scheduler.active() and scheduler.active()[0].working_order_id == "child-1")
+
+    started = time.monotonic()
+    summary = scheduler.cancel_all("kill_switch")
+
+    assert time.monotonic() - started < 1.0
+    cancel_order.assert_called_once_with("child-1")
+    assert summary == {"parents": 1, "children_canceled": 1, "cancel_errors": 0, "unfinished": 0}
+    assert _wait_for(lambda: done == ["canceled"])
+    scheduler.shutdown()
+
+
+def test_halt_check_stops_parents_without_a_cycle():
+    halted = threading.Event()
+    scheduler = _scheduler(halt_check=halted.is_set)
+    done = []
+
+    def job(ctx):
+        while not ctx.sleep(10.0):
+            pass
+        return False
+
+    scheduler.submit("twap", "AAA", "sell", 50.0, job, on_done=lambda parent, ok: done.append(parent.status))
+    halted.set()
+
+    assert _wait_for(lambda: done == ["canceled"])
+    assert scheduler.stats()["halts"] >= 1
+    scheduler.shutdown()
+
+
+def test_restart_archives_parents_left_active():
+    store = StateStore(backend=InMemoryStateBackend())
+    store.record_parent_order("twap_old", {"parent_id": "twap_old", "symbol": "AAA", "status": "working"})
+
+    _scheduler(state_store=store)
+
+    state = store.load()
+    assert state["parent_orders"] == {}
+    assert state["recent_parent_orders"][-1]["status"] == "interrupted"
+
+
+def test_restart_cancels_children_the_interrupted_parents_left_working():
+    store = StateStore(backend=InMemoryStateBackend())
+    store.record_parent_order("twap_a", {"parent_id": "twap_a", "symbol": "AAA", "working_order_id": "child-a"})
+    store.record_parent_order("twap_b", {"parent_id": "twap_b", "symbol": "BBB", "working_order_id": "child-b"})
+    cancel_order = MagicMock(side_effect=lambda order_id: {"success": order_id == "child-a"})
+
+    _scheduler(state_store=store, cancel_order=cancel_order)
+
+    assert sorted(call.args[0] for call in cancel_order.call_args_list) == ["child-a", "child-b"]
+    archived = {p["parent_id"]: p for p in store.load()["recent_parent_orders"]}
+    assert archived["twap_a"]["working_order_id"] is None
+    assert archived["twap_a"]["interrupted_child_order_id"] == "child-a"
+    assert "child_cancel_error" not in archived["twap_a"]
+    assert archived["twap_b"]["child_cancel_error"]
+
+
+def test_liquidate_returns_before_the_twap_finishes():
+    loop = TradingLoop.__new__(TradingLoop)
+    loop.mode = "LIVE"
+    loop.execution_scheduler = _scheduler()
+    release = threading.Event()
+    contexts = []
+
+    def slow_twap(currency, balance, **kwargs):
+        contexts.append(kwargs.get("ctx"))
+        release.wait(2.0)
+        return True
+
+    loop._sell_via_market_order = MagicMock(side_effect=slow_twap)
+    results = []
+
+    try:
+        started = time.monotonic()
+        accepted = TradingLoop._liquidate(loop, "AAA", 3.0, usd_target=30.0, tier=3,
+                                          preferred_pair="AAA-USD", on_done=results.append)
+        assert accepted is True
+        assert time.monotonic() - started < 0.5
+        assert TradingLoop._liquidate(loop, "AAA", 3.0, usd_target=30.0) is False   # already in flight
+
+        release.set()
+        assert _wait_for(lambda: results == [True])
+        assert contexts[0] is not None
+    finally:
+        loop.execution_scheduler.shutdown()
+
+
+def _loop_with_parent_in_flight(symbol, target_usd):
+    loop = TradingLoop.__new__(TradingLoop)
+    loop.mode = "LIVE"
+    loop.execution_scheduler = _scheduler()
+    release = threading.Event()
+    loop.execution_scheduler.submit("twap", symbol, "sell", target_usd, lambda ctx: release.wait(2.0))
+    return loop, release
+
+
+def test_auto_trim_counts_in_flight_liquidation_as_pending():
+    loop, release = _loop_with_parent_in_flight("PEPE", 400.0)
+    loop.metrics = MagicMock()
+    loop.policy_config = {
+        "risk": {"max_total_at_risk_pct": 15.0},
+        "portfolio_management": {"auto_trim_to_risk_cap": True},
+    }
+    loop.portfolio = PortfolioState(
+        account_value_usd=500.0,
+        open_positions={"PEPE-USD": {"usd": 440.0, "units": 1000.0}},
+        daily_pnl_pct=0.0,
+        max_drawdown_pct=0.0,
+        trades_today=0,
+        trades_this_hour=0,
+        pending_orders={"buy": {}},
+    )
+    loop.executor = SimpleNamespace(min_notional_usd=15.0, get_liquidation_candidates=MagicMock())
+
+    try:
+        # 440 held, 400 of it already being sold: 8% of NAV, inside the 15% cap
+        assert TradingLoop._auto_trim_to_risk_cap(loop) is False
+        loop.executor.get_liquidation_candidates.assert_not_called()
+    finally:
+        release.set()
+        loop.execution_scheduler.shutdown()
+
+
+def test_capacity_check_waits_for_in_flight_liquidation():
+    loop, release = _loop_with_parent_in_flight("PEPE", 50.0)
+    loop.policy_config = {"strategy": {"max_open_positions": 1}}
+    loop._count_open_positions = MagicMock(return_value=1)
+    loop._trim_worst_position_for_capacity = MagicMock(return_value=True)
+
+    try:
+        assert TradingLoop._ensure_capacity_for_new_positions(loop) == "max_open_positions_trim_pending"
+        loop._trim_worst_position_for_capacity.assert_not_called()
+    finally:
+        release.set()
+        loop.execution_scheduler.shutdown()
@@ -0,0 +1,161 @@
+"""
+Tests for the bounded fan-out executor and CoinbaseExchange.fetch_many.
+
+Covers ordering, per-symbol failure isolation, batch deadlines, rate-limit
+pacing under concurrency, and the scan/snapshot call sites that use it.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.exchange_coinbase import CoinbaseExchange
+from infra.fanout import FanoutConfig, FanoutExecutor, FetchResult
+
+
+def test_config_from_dict_rejects_invalid_values():
+    cfg = FanoutConfig.from_dict({"max_workers": "0", "timeout_seconds": None})
+    assert cfg.max_workers == FanoutConfig().max_workers
+    assert cfg.timeout_seconds is None
+
+    cfg = FanoutConfig.from_dict({"max_workers": 3, "timeout_seconds": "2.5"})
+    assert cfg.max_workers == 3
+    assert cfg.timeout_seconds == 2.5
+
+
+def test_map_preserves_order_and_isolates_failures():
+    executor = FanoutExecutor(FanoutConfig(max_workers=4))
+
+    def fetch(symbol):
+        if symbol == "BAD-USD":
+            raise RuntimeError("boom")
+        time.sleep(0.01 if symbol == "BTC-USD" else 0.0)  # finish out of order
+        return symbol.lower()
+
+    results = executor.map(fetch, ["BTC-USD", "BAD-USD", "ETH-USD"])
+    executor.shutdown()
+
+    assert [r.symbol for r in results] == ["BTC-USD", "BAD-USD", "ETH-USD"]
+    assert results[0].value == "btc-usd" and results[2].value == "eth-usd"
+    assert not results[1].ok
+    with pytest.raises(RuntimeError):
+        results[1].unwrap()
+
+
+def test_map_reports_deadline_as_timeout():
+    executor = FanoutExecutor(FanoutConfig(max_workers=2))
+    release = threading.Event()
+
+    def fetch(symbol):
+        if symbol == "SLOW-USD":
+            release.wait(2.0)
+        return symbol
+
+    results = executor.map(fetch, ["FAST-USD", "SLOW-USD"], timeout=0.1)
+    release.set()
+    executor.shutdown()
+
+    assert results[0].ok
+    assert isinstance(results[1].error, TimeoutError)
+
+
+def test_fetch_many_runs_concurrently_within_rate_limits(monkeypatch):
+    exchange = CoinbaseExchange(read_only=True)
+    exchange.configure_fanout({"max_workers": 4})
+    exchange._min_interval = 0.0
+    exchange.configure_rate_limits({"endpoints": {"get_ohlcv": 100.0}})
+
+    in_flight = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def fake_req(method, path, authenticated=True, **kwargs):
+        with lock:
+            in_flight.append(path)
+            peak[0] = max(peak[0], len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(path)
+        if "BAD-USD" in path:
+            raise RuntimeError("upstream error")
+        return {"candles": [{"start": "1700000000", "open": "1", "high": "2", "low": "1",
+                             "close": "2", "volume": "10"}]}
+
+    monkeypatch.setattr(exchange, "_req", fake_req)
+
+    symbols = ["BTC-USD", "ETH-USD", "BAD-USD", "SOL-USD"]
+    start = time.perf_counter()
+    results = exchange.fetch_many("ohlcv", symbols, interval="1h", limit=5)
+    elapsed = time.perf_counter() - start
+
+    assert [r.symbol for r in results] == symbols
+    assert len(results[0].value) == 1
+    assert results[2].value == []  # get_ohlcv degrades to an empty series
+    assert peak[0] > 1
+    assert elapsed < 0.05 * len(symbols)
+    assert exchange.rate_limiter.get_stats("get_ohlcv").calls_last_second == len(symbols)
+
+
+def test_fetch_many_rejects_unknown_kind():
+    exchange = CoinbaseExchange(read_only=True)
+    with pytest.raises(ValueError):
+        exchange.fetch_many("trades", ["BTC-USD"])
+
+
+def test_trigger_scan_uses_fan_out(monkeypatch):
+    from core.triggers import TriggerEngine
+    from core.universe import UniverseAsset
+
+    engine = TriggerEngine()
+    exchange = MagicMock()
+    exchange.fetch_many.return_value = [
+        FetchResult("BTC-USD", value=[]),
+        FetchResult("ETH-USD", error=RuntimeError("timeout")),
+    ]
+    engine.exchange = exchange
+
+    assets = [
+        UniverseAsset(symbol=s, tier=1, allocation_min_pct=1.0, allocation_max_pct=5.0,
+                      volume_24h=1e8, spread_bps=5.0, depth_usd=1e6, eligible=True)
+        for s in ("BTC-USD", "ETH-USD")
+    ]
+    assert engine.scan(assets) == []
+
+    exchange.fetch_many.assert_called_once_with("ohlcv", ["BTC-USD", "ETH-USD"], interval="1h", limit=168,
+                                                caller="TriggerEngine._prefetch_candles")
+    exchange.get_ohlcv.assert_not_called()
+
+
+def test_account_snapshot_prefetches_usd_quotes():
+    from runner.main_loop import TradingLoop
+
+    loop = TradingLoop.__new__(TradingLoop)
+    loop.policy_config = {}
+    now = datetime.now(timezone.utc)
+    exchange = MagicMock()
+    exchange.fetch_many.return_value = [
+        FetchResult("BTC-USD", value=SimpleNamespace(mid=50_000.0)),
+        FetchResult("XYZ-USD", error=RuntimeError("no such product")),
+    ]
+    exchange.get_quote.return_value = SimpleNamespace(mid=2.0, timestamp=now)
+    loop.exchange = exchange
+
+    accounts = [
+        {"currency": "BTC", "available_balance": {"value": "0.1"}, "hold": {"value": "0"}},
+        {"currency": "XYZ", "available_balance": {"value": "5"}, "hold": {"value": "0"}},
+        {"currency": "DOGE", "available_balance": {"value": "0"}, "hold": {"value": "0"}},
+        {"currency": "USD", "available_balance": {"value": "100"}, "hold": {"value": "0"}},
+    ]
+    snapshot = loop._build_account_snapshot(accounts)
+
+    exchange.fetch_many.assert_called_once_with("quote", ["BTC-USD", "XYZ-USD"],
+                                                caller="TradingLoop._prefetch_usd_mids")
+    # USD already failed in the batch, so only the stablecoin pair is tried serially
+    exchange.get_quote.assert_called_once_with("XYZ-USDC", caller="TradingLoop._build_account_snapshot")
+    assert snapshot["positions"]["BTC"]["usd_value"] == pytest.approx(5_000.0)
+    assert snapshot["positions"]["XYZ"]["usd_value"] == pytest.approx(10.0)
+    assert snapshot["account_value_usd"] == pytest.approx(5_110.0)
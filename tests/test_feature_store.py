@@ -0,0 +1,151 @@
+"""Tests for the per-cycle FeatureStore and the consumers reading from it."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from ai.snapshot_builder import build_ai_snapshot
+from core.exchange_coinbase import OHLCV
+from core.feature_store import FeatureStore, dependencies, feature
+from core.market_data_context import MarketDataContext
+from core.triggers import TriggerEngine, TriggerSignal
+from core.universe import UniverseAsset
+from strategy.signals import MeanReversionSignal, PriceMoveSignal
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _candles(count, seed=1, symbol="BTC-USD"):
+    rng = random.Random(seed)
+    price, rows = 100.0, []
+    for i in range(count):
+        price *= 1 + rng.gauss(0, 0.01)
+        rows.append(OHLCV(symbol, T0 + timedelta(hours=i), price, price * 1.01, price * 0.99, price,
+                          rng.uniform(1e5, 2e5)))
+    return rows
+
+
+def _asset(symbol):
+    return UniverseAsset(symbol=symbol, tier=1, allocation_min_pct=0.0, allocation_max_pct=5.0,
+                         volume_24h=1e9, spread_bps=5.0, depth_usd=1e6, eligible=True)
+
+
+def test_features_are_computed_once_per_frame():
+    candles = _candles(120)
+    store = FeatureStore(cycle_id="c1")
+    frame = store.frame("BTC-USD", "1h", candles)
+
+    ratio = frame.get("volume_ratio", recent=4, baseline=96)
+    assert frame.get("volume_ratio", recent=4, baseline=96) == ratio
+    assert store.frame("BTC-USD", "1h", list(candles)) is frame       # same data, new list
+    assert store.get("BTC-USD", "volume_ratio", recent=4, baseline=96) == ratio
+    assert store.get("ETH-USD", "close") is None
+
+    report = store.report()
+    assert report["cycle_id"] == "c1"
+    assert report["by_feature"]["volume_ratio"]["requests"] == 3
+    assert report["by_feature"]["volume_ratio"]["computed"] == 1
+    assert report["by_feature"]["volume_ratio"]["hit_ratio"] == pytest.approx(2 / 3)
+    # Dependency reads are computed once but are not consumer requests
+    assert report["by_feature"]["volume_sum"] == pytest.approx(
+        {"requests": 0, "hits": 0, "computed": 2, "seconds": report["by_feature"]["volume_sum"]["seconds"],
+         "hit_ratio": 0.0}
+    )
+    assert report["by_feature"]["columns"]["computed"] == 1
+    assert report["requests"] == 3 and report["hits"] == 2
+
+
+def test_changed_candles_replace_the_frame():
+    candles = _candles(50)
+    store = FeatureStore()
+    first = store.frame("BTC-USD", "1h", candles)
+    first.get("close")
+
+    updated = store.frame("BTC-USD", "1h", candles[1:] + _candles(51)[-1:])
+
+    assert updated is not first
+    assert store.frame_for(candles) is None
+    assert updated.get("close") == _candles(51)[-1].close
+
+
+def test_dependencies_are_declared_and_validated():
+    registry = {}
+    feature("a", registry=registry)(lambda frame: 1)
+    feature("b", depends_on=("a",), registry=registry)(lambda frame: frame.get("a") + 1)
+    feature("c", depends_on=("a", "b"), registry=registry)(lambda frame: frame.get("b") * 10)
+
+    assert dependencies("c", registry) == ["a", "b"]
+    assert FeatureStore(registry=registry).frame("X", "1h", [1]).get("c") == 20
+    with pytest.raises(ValueError):
+        feature("d", depends_on=("missing",), registry=registry)
+    with pytest.raises(ValueError):
+        feature("a", registry=registry)
+    assert dependencies("volatility_pct") == ["indicators"]
+
+
+def test_trigger_scan_shares_features_through_market_data():
+    candles = {s: _candles(168, seed=i) for i, s in enumerate(("BTC-USD", "ETH-USD"))}
+    exchange = MagicMock(spec=["get_ohlcv"])
+    exchange.get_ohlcv.side_effect = lambda symbol, interval="1h", limit=168: (
+        candles[symbol] if interval == "1h" else []
+    )
+    engine = TriggerEngine()
+    engine.exchange = exchange
+    engine.enable_atr_filter = False
+    engine.cross_sectional_enabled = False
+    market_data = MarketDataContext(exchange)
+    expected = engine._calculate_volatility(candles["BTC-USD"])
+
+    engine.scan([_asset("BTC-USD"), _asset("ETH-USD")], market_data=market_data)
+
+    features = market_data.features
+    assert features.get("BTC-USD", "volatility_pct") == pytest.approx(expected, rel=1e-12)
+    assert "indicators" not in features.report()["by_feature"]   # provided by the scan, never computed
+    assert market_data.report()["features"]["frames"] == 2
+    assert market_data.view().features is features
+
+
+def test_signals_share_the_store_with_each_other():
+    candles = _candles(120)
+    store = FeatureStore()
+    price_move, mean_reversion = PriceMoveSignal({}), MeanReversionSignal({})
+    price_move.feature_store = mean_reversion.feature_store = store
+
+    price_move.confidence(candles, "chop")
+    price_move.scan(_asset("BTC-USD"), candles, "chop")
+    mean_reversion.strength(candles, "chop")
+    mean_reversion.scan(_asset("BTC-USD"), candles, "chop")
+
+    report = store.report()["by_feature"]
+    assert report["volume_ratio"] == pytest.approx({**report["volume_ratio"], "requests": 2, "computed": 1})
+    assert report["close_mean"]["computed"] == 1
+    assert report["columns"]["computed"] == 1
+
+
+def test_rules_sizing_and_ai_snapshot_read_the_store():
+    from strategy.rules_engine import RulesEngine
+
+    candles = _candles(168)
+    store = FeatureStore()
+    store.frame("BTC-USD", "1h", candles)
+    volatility = store.get("BTC-USD", "volatility_pct")
+    trigger = TriggerSignal(symbol="BTC-USD", trigger_type="momentum", strength=0.5, confidence=0.5,
+                            reason="test", timestamp=T0, current_price=candles[-1].close)
+
+    rules = RulesEngine.__new__(RulesEngine)
+    rules._features = store
+    expected = min((1.0 / 8.0) * 100 * 50.0 / max(volatility, 10.0), 20.0)
+    assert rules.calculate_volatility_adjusted_size(trigger, 20.0, 8.0) == pytest.approx(max(expected, 0.5))
+
+    snapshot = build_ai_snapshot(
+        universe_snapshot=[{"symbol": "BTC-USD", "volume_24h": 1e9}, {"symbol": "SOL-USD"}],
+        positions=[], available_capital_usd=1000.0, regime="chop", guardrails={}, triggers=[],
+        features=store,
+    )
+    btc, sol = snapshot["universe"]
+    assert btc["price"] == candles[-1].close
+    assert btc["change_24h_pct"] == pytest.approx((candles[-1].close / candles[-25].close - 1) * 100)
+    assert btc["volatility"] == volatility
+    assert sol["volatility"] == 0.0 and sol["price"] == 0.0
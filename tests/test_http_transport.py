@@ -0,0 +1,164 @@
+"""
+Tests for the pooled keep-alive HTTP transport.
+
+Covers config parsing, pool hit/miss accounting against a local HTTP server,
+and forwarding of connection usage into MetricsRecorder.record_api_call.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import ANY, MagicMock
+
+import pytest
+
+from core.exchange_coinbase import CoinbaseExchange
+from infra.http_transport import HttpPoolConfig, PooledHttpTransport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # silence test output
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_config_from_dict_parses_and_rejects_invalid_values():
+    cfg = HttpPoolConfig.from_dict({
+        "pool_maxsize": "32",
+        "connect_timeout": 1.5,
+        "read_timeout": -1,
+        "pool_block": True,
+        "warmup_urls": ["https://example.invalid/time"],
+    })
+
+    assert cfg.pool_maxsize == 32
+    assert cfg.connect_timeout == 1.5
+    assert cfg.read_timeout == HttpPoolConfig().read_timeout  # invalid -> default
+    assert cfg.pool_block is True
+    assert cfg.warmup_urls == ("https://example.invalid/time",)
+
+
+def test_keep_alive_reuses_connection(local_server):
+    transport = PooledHttpTransport(HttpPoolConfig(pool_maxsize=2))
+    transport.session.trust_env = False  # never route localhost through a proxy
+
+    transport.get(f"{local_server}/a").json()
+    first = transport.last_usage()
+    transport.get(f"{local_server}/b").json()
+    second = transport.last_usage()
+
+    assert first.new_connections == 1 and not first.pool_hit
+    assert second.new_connections == 0 and second.pool_hit
+
+    stats = transport.stats()
+    assert stats.requests == 2
+    assert stats.pool_hits == 1
+    assert stats.pool_misses == 1
+    assert stats.tls_handshakes == 0  # plain HTTP
+    transport.close()
+
+
+def test_warm_up_opens_connections_ahead_of_first_call(local_server):
+    transport = PooledHttpTransport(HttpPoolConfig(warmup_urls=(f"{local_server}/time",), warmup_connections=2))
+    transport.session.trust_env = False
+
+    assert transport.warm_up() == 2
+
+    transport.get(f"{local_server}/quote")
+    assert transport.last_usage().pool_hit
+    transport.close()
+
+
+def test_warm_up_tolerates_unreachable_host():
+    transport = PooledHttpTransport(HttpPoolConfig(warmup_timeout=0.2, connect_timeout=0.2))
+    transport.session.trust_env = False
+
+    assert transport.warm_up(urls=["http://127.0.0.1:9/unreachable"], connections=1) == 0
+    transport.close()
+
+
+def test_exchange_reports_pool_usage_to_metrics(local_server, monkeypatch):
+    metrics = SimpleNamespace(
+        record_rate_limit_usage=MagicMock(),
+        record_api_call=MagicMock(),
+    )
+    exchange = CoinbaseExchange(api_key="key", api_secret="secret", read_only=True, metrics=metrics)
+    exchange.configure_http({"warmup": False})
+    exchange._http.session.trust_env = False
+    monkeypatch.setattr("core.exchange_coinbase.CB_BASE", local_server)
+
+    exchange._req("GET", "/one", authenticated=False, max_retries=1)
+    metrics.record_api_call.assert_called_with(
+        "one", "public", ANY, "success", pool_hit=False, handshakes=0, resumed_handshakes=0
+    )
+
+    exchange._req("GET", "/two", authenticated=False, max_retries=1)
+    metrics.record_api_call.assert_called_with(
+        "two", "public", ANY, "success", pool_hit=True, handshakes=0, resumed_handshakes=0
+    )
+
+    snapshot = exchange.http_pool_snapshot()
+    assert snapshot["pool_hits"] == 1
+    assert snapshot["pool_misses"] == 1
+
+
+def test_public_api_calls_keep_their_read_timeout(local_server, monkeypatch):
+    exchange = CoinbaseExchange(api_key="key", api_secret="secret", read_only=True)
+    exchange.configure_http({"warmup": False, "connect_timeout": 2.0})
+    exchange._http.session.trust_env = False
+    monkeypatch.setattr("core.exchange_coinbase.CB_BASE", local_server)
+    request = MagicMock(wraps=exchange._http.session.request)
+    monkeypatch.setattr(exchange._http.session, "request", request)
+
+    exchange._req("GET", "/one", authenticated=False, max_retries=1)
+
+    assert request.call_args.kwargs["timeout"] == (2.0, 20.0)   # not the 10s market-data read_timeout
+
+def test_metrics_recorder_tracks_pool_counts():
+    from infra.metrics import MetricsRecorder
+
+    recorder = MetricsRecorder(enabled=False)
+    recorder.record_api_call("ticker", "public", 0.01, "success", pool_hit=False, handshakes=1, resumed_handshakes=1)
+    recorder.record_api_call("ticker", "public", 0.01, "success", pool_hit=True)
+    recorder.record_api_call("legacy", "public", 0.01, "success")
+
+    assert recorder.http_pool_snapshot() == {
+        "hits": 1,
+        "misses": 1,
+        "handshakes": 1,
+        "resumed_handshakes": 1,
+    }
+    assert recorder.last_api_event()["endpoint"] == "legacy"
+
+
+@pytest.mark.parametrize("mode, expected_calls", [("DRY_RUN", 0), ("LIVE", 1)])
+def test_trading_loop_warms_up_only_when_it_starts_trading(mode, expected_calls):
+    from runner.main_loop import TradingLoop
+
+    loop = TradingLoop.__new__(TradingLoop)
+    loop.mode = mode
+    loop.exchange = MagicMock()
+    loop.exchange.warm_up_connections.return_value = 2
+
+    loop._warm_up_connections()
+
+    assert loop.exchange.warm_up_connections.call_count == expected_calls
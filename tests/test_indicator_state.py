@@ -0,0 +1,230 @@
+"""
+Tests for streaming indicator state (core.indicator_state) and its use by TriggerEngine.
+"""
+
+import json
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core import indicators
+from core.exchange_coinbase import OHLCV
+from core.indicator_state import (
+    IndicatorParams,
+    IndicatorState,
+    IndicatorStateConfig,
+    IndicatorStore,
+    RollingExtreme,
+    RollingMedian,
+    RunningRSI,
+)
+from core.indicators import as_columns
+from core.triggers import TriggerEngine
+from core.universe import UniverseAsset
+
+PARAMS = IndicatorParams()
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _history(n, seed=1, symbol="TEST-USD"):
+    rng = random.Random(seed)
+    price = 100.0
+    candles = []
+    for i in range(n):
+        open_ = price
+        price = max(0.5, price * (1 + rng.gauss(0, 0.02)))
+        candles.append(OHLCV(symbol, START + timedelta(hours=i), open_,
+                             max(open_, price) * (1 + abs(rng.gauss(0, 0.005))),
+                             min(open_, price) * (1 - abs(rng.gauss(0, 0.005))),
+                             price, rng.uniform(1e3, 1e6)))
+    return candles
+
+
+def _windowed(candles):
+    """The values the per-scan computation derives from one candle window."""
+    cols = as_columns(candles)
+    n = len(cols)
+    atr = indicators.atr_pct(cols.high, cols.low, cols.close, PARAMS.atr_period)
+    samples = sorted(atr[j] for j in range(max(n - 168, 0) + PARAMS.atr_period, n - 1))
+    tail = slice(-12, None)
+    return {
+        "atr": atr[-1],
+        "atr_median": samples[len(samples) // 2],
+        "std": indicators.returns_std(cols.close, min(168, n - 1)),
+        "volume": sum(cols.volume[-24:]),
+        "range": (max(cols.high[-24:]), min(cols.low[-24:])),
+        "outlier": (sum(cols.close[-21:-1]) / 20, sum(cols.volume[-21:-1]) / 20),
+        "vwap": indicators.vwap(cols.high[tail], cols.low[tail], cols.close[tail], cols.volume[tail]),
+    }
+
+
+def _streamed(view):
+    return {
+        "atr": view.atr_pct(),
+        "atr_median": view.atr_median(),
+        "std": view.returns_std(),
+        "volume": view.volume_sum(),
+        "range": view.breakout_range(),
+        "outlier": view.outlier_means(),
+        "vwap": view.vwap(),
+    }
+
+
+def _assert_close(streamed, expected):
+    for key, value in expected.items():
+        assert streamed[key] == pytest.approx(value, rel=1e-9), key
+
+
+def test_primitives_match_batch_computations():
+    rng = random.Random(3)
+    values = [rng.uniform(50, 150) for _ in range(300)]
+
+    highs = RollingExtreme(24, keep_max=True)
+    median = RollingMedian(30)
+    rsi = RunningRSI(14)
+    batch_rsi = indicators.rsi(values, 14)
+    for i, value in enumerate(values):
+        # Provisional reads see the last window-1 pushes plus the open value
+        assert highs.value_with(value) == max(values[max(0, i - 23):i + 1])
+        peeked = rsi.peek(value)
+        assert (peeked is None) == math.isnan(batch_rsi[i])
+        if peeked is not None:
+            assert peeked == pytest.approx(batch_rsi[i], rel=1e-12)
+        highs.push(value)
+        median.push(value)
+        rsi.update(value)
+        window = sorted(values[max(0, i - 29):i + 1])
+        assert median.median == window[len(window) // 2]
+
+
+def test_incremental_sync_tracks_the_sliding_window():
+    history = _history(400)
+    store = IndicatorStore(PARAMS)
+
+    for end in range(168, 401, 7):
+        window = history[end - 168:end]
+        view = store.sync("TEST-USD", "1h", window)
+        _assert_close(_streamed(view), _windowed(window))
+
+        # EMA/RSI are true recurrences: they match a batch run over all bars seen
+        closes = [c.close for c in history[:end]]
+        assert view.ema_now() == pytest.approx(indicators.ema(closes, 21)[-1], rel=1e-9)
+        assert view.rsi_pair()[1] == pytest.approx(indicators.rsi(closes, 14)[-1], rel=1e-9)
+
+    stats = store.stats()
+    assert stats["rebuilds"] == 1 and stats["incremental"] == 33
+    assert stats["bars_committed"] == 167 + 33 * 7
+
+
+def test_open_candle_is_never_committed():
+    history = _history(168)
+    store = IndicatorStore(PARAMS)
+    store.sync("TEST-USD", "1h", history)
+    bars = store.sync("TEST-USD", "1h", history).bars
+
+    # The same hour again with a revised (still forming) last candle
+    revised = list(history[:167]) + [OHLCV("TEST-USD", history[167].timestamp, 1, 500.0, 1, 400.0, 9e9)]
+    view = store.sync("TEST-USD", "1h", revised)
+    assert view.bars == bars and view.close == 400.0
+    assert view.breakout_range()[0] == 500.0
+    _assert_close(_streamed(view), _windowed(revised))
+
+
+@pytest.mark.parametrize("case", ["gap", "revised_close", "stale"])
+def test_sync_rebuilds_when_candles_do_not_continue_the_state(case):
+    history = _history(400)
+    store = IndicatorStore(PARAMS)
+    store.sync("TEST-USD", "1h", history[:168])
+
+    if case == "gap":
+        window = history[200:368]
+    elif case == "revised_close":
+        window = list(history[1:169])
+        bar = window[-3]   # Committed by the first sync
+        window[-3] = OHLCV(bar.symbol, bar.timestamp, bar.open, bar.high, bar.low, bar.close * 1.01, bar.volume)
+    else:
+        window = history[:160]
+
+    view = store.sync("TEST-USD", "1h", window)
+    assert store.stats()["rebuilds"] == 2
+    _assert_close(_streamed(view), _windowed(window))
+
+
+def test_snapshot_round_trip_resumes_where_it_stopped(tmp_path):
+    path = tmp_path / "indicator_state.json"
+    history = _history(300)
+    config = IndicatorStateConfig(persist_path=str(path))
+
+    store = IndicatorStore(PARAMS, config)
+    store.sync("TEST-USD", "1h", history[:200])
+    store.sync("ETH-USD", "5m", _history(60, seed=2, symbol="ETH-USD"))
+    assert store.save()
+
+    restored = IndicatorStore(PARAMS, config)
+    assert restored.load() == 2
+    uninterrupted = IndicatorStore(PARAMS)
+    uninterrupted.sync("TEST-USD", "1h", history[:200])
+
+    window = history[100:268]
+    resumed = restored.sync("TEST-USD", "1h", window)
+    expected = uninterrupted.sync("TEST-USD", "1h", window)
+    assert restored.stats()["rebuilds"] == 0
+    _assert_close(_streamed(resumed), _streamed(expected))
+    assert resumed.ema_now() == expected.ema_now() and resumed.rsi_pair() == expected.rsi_pair()
+
+    # A snapshot taken with other periods is not reused
+    assert IndicatorStore(IndicatorParams(atr_period=10), config).load() == 0
+    payload = json.loads(path.read_text())
+    assert payload["version"] == 1 and payload["params"]["atr_period"] == 14
+
+
+def test_indicator_state_config_from_dict():
+    assert IndicatorStateConfig.from_dict(None).enabled is True
+    config = IndicatorStateConfig.from_dict({"enabled": False, "persist_path": "data/x.json",
+                                             "persist_interval_seconds": "bad"})
+    assert config.enabled is False and config.persist_path == "data/x.json"
+    assert config.persist_interval_seconds == 300.0
+
+
+def _engine(exchange):
+    base = {"pct_change_15m": 2.0, "pct_change_60m": 4.0, "volume_ratio_1h": 1.5, "atr_filter_min_mult": 0.5}
+    signals = {"triggers": {"regime_thresholds": {"chop": base, "bull": base, "bear": base},
+                            "reversal_confirm": {}, "trend_filter": {}}}
+    policy = {"triggers": {}, "circuit_breakers": {"check_price_outliers": False}}
+    with patch("core.triggers.get_exchange", return_value=exchange):
+        with patch("yaml.safe_load", side_effect=[signals, policy]):
+            return TriggerEngine()
+
+
+def test_scan_reads_streaming_state_and_matches_full_recompute():
+    symbols = [f"S{i}-USD" for i in range(6)]
+    histories = {s: _history(260, seed=i, symbol=s) for i, s in enumerate(symbols)}
+    assets = [UniverseAsset(symbol=s, tier=1, allocation_min_pct=1.0, allocation_max_pct=5.0,
+                            volume_24h=1e9, spread_bps=5.0, depth_usd=1e6, eligible=True) for s in symbols]
+    end = {"value": 168}
+
+    exchange = MagicMock(spec=["get_ohlcv"])
+    exchange.get_ohlcv.side_effect = lambda symbol, interval="1h", limit=168: \
+        histories[symbol][end["value"] - 168:end["value"]]
+
+    streaming = _engine(exchange)
+    recompute = _engine(exchange)
+    recompute.configure_indicator_state({"enabled": False})
+
+    fired = 0
+    for end["value"] in range(168, 261, 3):
+        got = streaming.scan(assets)
+        want = recompute.scan(assets)
+        assert [(s.symbol, s.trigger_type, s.reason) for s in got] == \
+               [(s.symbol, s.trigger_type, s.reason) for s in want]
+        for a, b in zip(got, want):
+            assert a.strength == pytest.approx(b.strength) and a.volatility == pytest.approx(b.volatility)
+        fired += len(got)
+
+    assert fired > 0
+    stats = streaming.indicator_store.stats()
+    assert stats["series"] == len(symbols) and stats["rebuilds"] == len(symbols)
+    assert len(recompute.indicator_store) == 0
@@ -0,0 +1,187 @@
+"""
+Parity tests for the columnar indicator kernel.
+
+The reference functions below are the per-candle loops TriggerEngine used
+before it moved to core.indicators.
+"""
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core import indicators
+from core.exchange_coinbase import OHLCV
+from core.indicator_state import IndicatorState, IndicatorStore
+from core.indicators import OHLCVColumns, as_columns
+from core.triggers import TriggerEngine
+from core.universe import UniverseAsset
+
+
+def _random_candles(n, seed, symbol="TEST-USD"):
+    rng = random.Random(seed)
+    price = 100.0
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    candles = []
+    for i in range(n):
+        open_ = price
+        price = max(0.5, price * (1 + rng.gauss(0, 0.02)))
+        high = max(open_, price) * (1 + abs(rng.gauss(0, 0.005)))
+        low = min(open_, price) * (1 - abs(rng.gauss(0, 0.005)))
+        candles.append(OHLCV(symbol, start + timedelta(hours=i), open_, high, low, price,
+                             rng.uniform(1e3, 1e6)))
+    return candles
+
+
+def ref_atr_pct(candles, period=14):
+    if len(candles) < period + 1:
+        return 0.0
+    trs = []
+    for i in range(-period, 0):
+        h, l, pc = candles[i].high, candles[i].low, candles[i - 1].close
+        trs.append(max(h - l, abs(h - pc), abs(l - pc)))
+    return sum(trs) / len(trs) / candles[-1].close * 100.0
+
+
+def ref_atr_samples(candles, lookback):
+    samples = []
+    for i in range(-168, -lookback):
+        if i + lookback < 0:
+            window = candles[i:i + lookback + 1]
+            if len(window) >= lookback + 1:
+                samples.append(ref_atr_pct(window, lookback))
+    return samples
+
+
+def ref_ema(values, period):
+    multiplier = 2.0 / (period + 1)
+    out = [None] * (period - 1)
+    ema = sum(values[:period]) / period
+    out.append(ema)
+    for price in values[period:]:
+        ema = (price - ema) * multiplier + ema
+        out.append(ema)
+    return out
+
+
+def ref_rsi(closes, period=14):
+    gains = [max(closes[i] - closes[i - 1], 0.0) for i in range(1, len(closes))]
+    losses = [abs(min(closes[i] - closes[i - 1], 0.0)) for i in range(1, len(closes))]
+    avg_gain, avg_loss = sum(gains[:period]) / period, sum(losses[:period]) / period
+    out = [100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)]
+    for idx in range(period, len(gains)):
+        avg_gain = (avg_gain * (period - 1) + gains[idx]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[idx]) / period
+        out.append(100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return out
+
+
+def ref_volatility(candles):
+    lookback = min(168, len(candles) - 1)
+    returns = [(candles[i].close - candles[i - 1].close) / candles[i - 1].close
+               for i in range(len(candles) - lookback, len(candles))]
+    mean = sum(returns) / len(returns)
+    std = math.sqrt(sum((r - mean) ** 2 for r in returns) / len(returns))
+    return min(std * math.sqrt(24 * 365) * 100, 200.0)
+
+
+@pytest.fixture
+def engine():
+    eng = TriggerEngine.__new__(TriggerEngine)
+    base = {"pct_change_15m": 2.0, "pct_change_60m": 4.0, "volume_ratio_1h": 1.9, "atr_filter_min_mult": 1.1}
+    eng.regime_thresholds = {"chop": base, "bull": base, "bear": base}
+    eng.lookback_hours = 24
+    eng.only_upside = False
+    eng.enable_atr_filter = True
+    eng.atr_lookback = 14
+    eng.trend_filter_config = {}
+    eng.reversal_confirm_config = {}
+    eng.circuit_breakers = {}
+    eng.indicator_store = IndicatorStore(eng._indicator_params())
+    eng._scan_views = {}
+    return eng
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_series_match_reference_loops(seed):
+    candles = _random_candles(400, seed)
+    cols = as_columns(candles)
+    closes = [c.close for c in candles]
+
+    atr = indicators.atr_pct(cols.high, cols.low, cols.close, 14)
+    assert atr[-1] == pytest.approx(ref_atr_pct(candles, 14), rel=1e-9)
+    assert atr[200] == pytest.approx(ref_atr_pct(candles[:201], 14), rel=1e-9)
+    assert math.isnan(atr[13]) and not math.isnan(atr[14])
+
+    ema = indicators.ema(closes, 21)
+    assert list(ema[20:]) == pytest.approx(ref_ema(closes, 21)[20:], rel=1e-12)
+    assert list(indicators.rsi(closes, 14)[14:]) == pytest.approx(ref_rsi(closes, 14), rel=1e-12)
+
+    highs = [c.high for c in candles]
+    rolling = indicators.rolling_max(highs, 24)
+    assert all(rolling[i] == max(highs[i - 23:i + 1]) for i in range(23, len(highs)))
+    lows = [c.low for c in candles]
+    rolling = indicators.rolling_min(lows, 24)
+    assert all(rolling[i] == min(lows[i - 23:i + 1]) for i in range(23, len(lows)))
+    sums = indicators.rolling_sum(cols.volume, 24)
+    assert sums[-1] == pytest.approx(sum(c.volume for c in candles[-24:]), rel=1e-12)
+
+
+@pytest.mark.parametrize("period", [2, 3, 9, 50])
+def test_blocked_ema_and_rsi_stay_exact_across_blocks(period):
+    # Short periods split the scaled-cumsum recursion into many small blocks
+    closes = [c.close for c in _random_candles(3000, period)]
+
+    assert list(indicators.ema(closes, period)[period - 1:]) == \
+        pytest.approx(ref_ema(closes, period)[period - 1:], rel=1e-11)
+    assert list(indicators.rsi(closes, period)[period:]) == pytest.approx(ref_rsi(closes, period), rel=1e-11)
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_trigger_helpers_match_previous_outputs(engine, seed):
+    candles = _random_candles(200, seed)
+    cols = as_columns(candles)
+
+    assert engine._calculate_atr_pct(candles) == pytest.approx(ref_atr_pct(candles), rel=1e-9)
+    # Volatility covers the scan window (168 bars)
+    assert engine._calculate_volatility(candles[-168:]) == pytest.approx(ref_volatility(candles[-168:]), rel=1e-12)
+
+    # ATR filter median: same windows as the old per-window loop
+    atr = indicators.atr_pct(cols.high, cols.low, cols.close, 14)
+    n = len(candles)
+    samples = [atr[j] for j in range(max(n - 168, 0) + 14, n - 1)]
+    assert samples == pytest.approx(ref_atr_samples(candles, 14), rel=1e-9)
+
+    typical = sum((c.high + c.low + c.close) / 3 * c.volume for c in candles[-12:])
+    view = IndicatorState.from_candles(engine._indicator_params(), candles)
+    assert view.vwap() == pytest.approx(typical / sum(c.volume for c in candles[-12:]))
+    assert all(isinstance(p, OHLCV) for p in engine._find_recent_pivot_lows(cols))
+
+
+def test_checks_give_same_signals_for_lists_and_columns(engine):
+    asset = UniverseAsset(symbol="TEST-USD", tier=1, allocation_min_pct=1.0, allocation_max_pct=5.0,
+                          volume_24h=1e9, spread_bps=5.0, depth_usd=1e6, eligible=True)
+    fired = 0
+    for seed in range(20):
+        candles = _random_candles(168, seed)
+        cols = as_columns(candles)
+        for check in (engine._check_price_move, engine._check_volume_spike,
+                      engine._check_breakout, engine._check_momentum):
+            from_list, from_cols = check(asset, candles, "chop"), check(asset, cols, "chop")
+            assert (from_list is None) == (from_cols is None)
+            if from_list is not None:
+                fired += 1
+                assert (from_list.trigger_type, from_list.strength, from_list.confidence, from_list.reason) == \
+                       (from_cols.trigger_type, from_cols.strength, from_cols.confidence, from_cols.reason)
+        assert engine._validate_price_outlier("TEST-USD", candles) == engine._validate_price_outlier("TEST-USD", cols)
+        assert engine._check_atr_filter("TEST-USD", candles) == engine._check_atr_filter("TEST-USD", cols)
+    assert fired > 0
+
+
+def test_columns_keep_row_access():
+    candles = _random_candles(5, 9)
+    cols = OHLCVColumns.from_candles(candles)
+    assert len(cols) == 5 and cols[-1] is candles[-1] and cols[1:3] == candles[1:3]
+    assert list(cols) == candles
+    assert as_columns(cols) is cols
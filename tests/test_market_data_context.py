@@ -0,0 +1,177 @@
+"""Tests for the per-cycle MarketDataContext shared by the pipeline stages."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.exchange_coinbase import OrderbookSnapshot, Quote
+from core.market_data_context import MarketDataContext
+from core.trading_cycle import TradingCyclePipeline
+from core.universe import UniverseManager
+from infra.fanout import FetchResult
+
+
+def _quote(symbol, caller=None):
+    return Quote(symbol=symbol, bid=99.9, ask=100.1, mid=100.0, spread_bps=5.0, last=100.0,
+                 volume_24h=1e9, timestamp=datetime.now(timezone.utc))
+
+
+def _book(symbol, depth_levels=50, caller=None):
+    return OrderbookSnapshot(symbol=symbol, bid_depth_usd=5e5, ask_depth_usd=5e5,
+                             total_depth_usd=1e6, bid_levels=10, ask_levels=10,
+                             timestamp=datetime.now(timezone.utc))
+
+
+def _exchange():
+    exchange = MagicMock(spec=["get_quote", "get_orderbook", "get_ohlcv", "get_quotes_bulk",
+                               "fetch_many", "invalidate_quotes", "get_product_spec"])
+    exchange.get_quote.side_effect = _quote
+    exchange.get_orderbook.side_effect = _book
+    exchange.get_ohlcv.side_effect = lambda symbol, interval="1h", limit=100: list(range(limit))
+    exchange.get_quotes_bulk.side_effect = lambda symbols, fallback=False: {s: _quote(s) for s in symbols}
+    exchange.fetch_many.side_effect = lambda kind, symbols, **params: [
+        FetchResult(symbol=s, value=_book(s)) for s in symbols
+    ]
+    return exchange
+
+
+def test_reads_are_memoized_for_the_cycle():
+    exchange = _exchange()
+    market_data = MarketDataContext(exchange, cycle_id="c1")
+
+    first = market_data.get_quote("BTC-USD", caller="universe")
+    assert market_data.get_quote("BTC-USD", caller="risk") is first
+    market_data.get_orderbook("BTC-USD")
+    market_data.get_orderbook("BTC-USD")
+
+    exchange.get_quote.assert_called_once_with("BTC-USD", caller="universe")
+    exchange.get_orderbook.assert_called_once()
+    report = market_data.report()
+    assert report["cycle_id"] == "c1"
+    assert (report["requests"], report["fetched"], report["avoided"]) == (4, 2, 2)
+    assert report["by_kind"]["quote"] == {"requests": 2, "fetched": 1, "avoided": 1}
+    assert report["by_caller"]["risk"]["hits"] == 1
+
+
+def test_smaller_candle_request_is_sliced_from_larger_series():
+    exchange = _exchange()
+    market_data = MarketDataContext(exchange)
+
+    market_data.get_ohlcv("BTC-USD", interval="1h", limit=168)
+    recent = market_data.get_ohlcv("BTC-USD", interval="1h", limit=24)
+
+    assert recent == list(range(144, 168))
+    exchange.get_ohlcv.assert_called_once_with("BTC-USD", interval="1h", limit=168)
+    market_data.get_ohlcv("BTC-USD", interval="5m", limit=24)
+    assert exchange.get_ohlcv.call_count == 2
+
+
+def test_fetch_many_and_bulk_quotes_only_fetch_what_is_missing():
+    exchange = _exchange()
+    market_data = MarketDataContext(exchange)
+    market_data.get_orderbook("BTC-USD")
+    market_data.get_quote("ETH-USD")
+
+    books = market_data.fetch_many("orderbook", ["BTC-USD", "ETH-USD"], caller="universe")
+    quotes = market_data.get_quotes_bulk(["ETH-USD", "SOL-USD"], fallback=False)
+
+    assert [r.symbol for r in books] == ["BTC-USD", "ETH-USD"]
+    exchange.fetch_many.assert_called_once_with("orderbook", ["ETH-USD"], caller="universe")
+    exchange.get_quotes_bulk.assert_called_once_with(["SOL-USD"], fallback=False)
+    assert set(quotes) == {"ETH-USD", "SOL-USD"}
+    assert market_data.get_orderbook("ETH-USD") is books[1].value
+    assert market_data.get_quote("SOL-USD") is quotes["SOL-USD"]
+
+
+def test_view_never_fetches_and_invalidate_refetches():
+    exchange = _exchange()
+    market_data = MarketDataContext(exchange)
+    view = market_data.view()
+
+    assert view.quote("BTC-USD") is None
+    quote = market_data.get_quote("BTC-USD")
+    assert view.quote("BTC-USD") is quote
+    assert not hasattr(view, "get_quote")
+
+    market_data.invalidate("BTC-USD")
+    assert view.quote("BTC-USD") is None
+    market_data.get_quote("BTC-USD")
+    assert exchange.get_quote.call_count == 2
+
+
+def test_other_attributes_are_forwarded_to_the_exchange():
+    exchange = _exchange()
+    exchange.get_product_spec.return_value = {"base_increment": "0.01"}
+
+    assert MarketDataContext(exchange).get_product_spec("BTC-USD") == {"base_increment": "0.01"}
+
+
+def test_execution_invalidation_reaches_the_context():
+    from core.execution import ExecutionEngine
+
+    exchange = _exchange()
+    market_data = MarketDataContext(exchange)
+    market_data.get_quote("BTC-USD")
+    engine = ExecutionEngine.__new__(ExecutionEngine)
+    engine.exchange = exchange
+    engine.market_data = market_data
+
+    engine._invalidate_quote("BTC-USD")
+
+    exchange.invalidate_quotes.assert_called_once_with("BTC-USD")
+    assert market_data.cached("quote", "BTC-USD") is None
+
+
+@pytest.fixture
+def _no_red_flags(monkeypatch):
+    store = MagicMock()
+    store.get_red_flag_banned_symbols.return_value = {}
+    monkeypatch.setattr("infra.state_store.get_state_store", lambda: store)
+
+
+def test_universe_rebuild_leaves_its_quotes_for_later_stages(_no_red_flags):
+    exchange = _exchange()
+    config = {
+        "universe": {"refresh_interval_hours": 1},
+        "liquidity": {"min_24h_volume_usd": 1e6, "max_spread_bps": 50},
+        "tiers": {"tier_1_core": {"symbols": ["BTC-USD", "ETH-USD"], "constraints": {}}},
+    }
+    manager = UniverseManager(config, exchange=exchange)
+    market_data = MarketDataContext(exchange)
+
+    manager.get_universe(market_data=market_data)
+
+    assert market_data.get_quote("BTC-USD") is market_data.cached("quote", "BTC-USD")
+    assert market_data.get_orderbook("ETH-USD") is not None
+    exchange.get_quote.assert_not_called()
+    assert exchange.fetch_many.call_count == 1
+
+
+def test_pipeline_threads_context_through_stages(monkeypatch):
+    from strategy.base_strategy import StrategyContext
+
+    monkeypatch.setattr(StrategyContext, "__post_init__", lambda self: None)   # MagicMock universe
+    universe = MagicMock(total_eligible=1, tier_1_assets=[], tier_2_assets=[], tier_3_assets=[])
+    universe_mgr = MagicMock()
+    universe_mgr.get_universe.return_value = universe
+    trigger_engine = MagicMock()
+    trigger_engine.scan.return_value = [MagicMock()]
+    registry = MagicMock()
+    registry.aggregate_proposals.return_value = [MagicMock()]
+    risk_engine = MagicMock()
+    risk_engine.check_all.return_value = MagicMock(approved=True)
+    pipeline = TradingCyclePipeline(universe_mgr, trigger_engine, MagicMock(), risk_engine,
+                                    strategy_registry=registry)
+    market_data = MarketDataContext(_exchange(), cycle_id="c7")
+
+    result = pipeline.execute_cycle(datetime.now(timezone.utc), MagicMock(), "chop", 1,
+                                    market_data=market_data)
+
+    assert result.success
+    assert universe_mgr.get_universe.call_args.kwargs["market_data"] is market_data
+    assert trigger_engine.scan.call_args.kwargs["market_data"] is market_data
+    assert risk_engine.check_all.call_args.kwargs["market_data"] is market_data
+    context = registry.aggregate_proposals.call_args.args[0]
+    assert context.market_data.quote("BTC-USD") is None
+    assert result.market_data_report["cycle_id"] == "c7"
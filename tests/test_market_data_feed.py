@@ -0,0 +1,179 @@
+"""
+Tests for the streaming market-data feed and its top-of-book cache.
+
+Message handling is exercised directly; the connection loop runs against a
+local WebSocket stand-in that replays recorded Coinbase messages.
+"""
+
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.exchange_coinbase import CoinbaseExchange
+from core.market_data_feed import MarketDataFeed, MarketDataFeedConfig
+from tests.helpers.ws_stand_in import WebSocketStandIn
+
+TS = "2024-05-01T12:00:00.000000Z"
+
+RECORDED = [
+    {"channel": "subscriptions", "client_id": "", "timestamp": TS, "sequence_num": 0,
+     "events": [{"subscriptions": {"level2": ["BTC-USD"], "ticker": ["BTC-USD"]}}]},
+    {"channel": "ticker", "client_id": "", "timestamp": TS, "sequence_num": 1,
+     "events": [{"type": "snapshot", "tickers": [{
+         "type": "ticker", "product_id": "BTC-USD", "price": "60010.00",
+         "volume_24_h": "1000", "best_bid": "60000.00", "best_ask": "60020.00",
+     }]}]},
+    {"channel": "l2_data", "client_id": "", "timestamp": TS, "sequence_num": 2,
+     "events": [{"type": "snapshot", "product_id": "BTC-USD", "updates": [
+         {"side": "bid", "event_time": TS, "price_level": "60000.00", "new_quantity": "0.5"},
+         {"side": "bid", "event_time": TS, "price_level": "59990.00", "new_quantity": "1.0"},
+         {"side": "offer", "event_time": TS, "price_level": "60010.00", "new_quantity": "0.4"},
+         {"side": "offer", "event_time": TS, "price_level": "60030.00", "new_quantity": "2.0"},
+     ]}]},
+    {"channel": "l2_data", "client_id": "", "timestamp": TS, "sequence_num": 3,
+     "events": [{"type": "update", "product_id": "BTC-USD", "updates": [
+         {"side": "bid", "event_time": TS, "price_level": "60005.00", "new_quantity": "0.2"},
+     ]}]},
+]
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _replayed_feed(messages=RECORDED, **cfg):
+    feed = MarketDataFeed(MarketDataFeedConfig(enabled=True, **cfg))
+    for message in messages:
+        feed.handle_message(message)
+    return feed
+
+
+def test_config_from_dict_parses_and_rejects_invalid_values():
+    cfg = MarketDataFeedConfig.from_dict({
+        "enabled": True,
+        "channels": "ticker",
+        "max_quote_age_seconds": "2",
+        "idle_timeout": -1,
+    })
+
+    assert cfg.enabled is True
+    assert cfg.channels == ("ticker",)
+    assert cfg.max_quote_age_seconds == 2.0
+    assert cfg.idle_timeout == MarketDataFeedConfig().idle_timeout
+
+
+def test_level2_snapshot_and_deltas_drive_top_of_book():
+    feed = _replayed_feed()
+
+    quote = feed.get_quote("BTC-USD")
+    assert quote.bid == 60005.0  # improved by the delta
+    assert quote.ask == 60010.0
+    assert quote.last == 60010.0
+    assert quote.volume_24h == pytest.approx(1000 * 60010.0)
+
+    # Removing the best bid falls back to the next level
+    feed.handle_message({"channel": "l2_data", "sequence_num": 4, "events": [{
+        "type": "update", "product_id": "BTC-USD",
+        "updates": [{"side": "bid", "price_level": "60005.00", "new_quantity": "0"}],
+    }]})
+    top = feed.top_of_book("BTC-USD")
+    assert top.bid == 60000.0 and top.bid_size == 0.5
+    assert top.book_synced
+
+
+def test_stale_cache_is_not_served():
+    feed = _replayed_feed(messages=RECORDED[:2], max_quote_age_seconds=5.0)
+    assert feed.get_quote("BTC-USD") is not None  # ticker-only quote while fresh
+
+    feed._products["BTC-USD"].ticker_updated_at -= timedelta(seconds=30)
+    assert feed.get_quote("BTC-USD") is None
+    assert feed.get_quote("ETH-USD") is None
+    assert feed.stats()["quote_stale"] == 1
+
+
+def test_sequence_gap_drops_books_until_next_snapshot():
+    feed = _replayed_feed()
+    feed.handle_message({"channel": "heartbeats", "sequence_num": 9, "events": []})
+
+    top = feed.top_of_book("BTC-USD")
+    assert not top.book_synced
+    assert (top.bid, top.ask) == (60000.0, 60020.0)  # ticker values only
+    assert feed.stats()["sequence_gaps"] == 1
+
+
+def test_feed_streams_from_stand_in_and_serves_exchange_quotes():
+    with WebSocketStandIn(RECORDED, replay_after="level2") as server:
+        feed = MarketDataFeed(MarketDataFeedConfig(
+            enabled=True, url=server.url, heartbeats=False, reconnect_initial_seconds=0.05,
+        ))
+        feed.start(["BTC-USD"])
+        try:
+            assert _wait_for(lambda: feed.get_quote("BTC-USD") is not None)
+
+            channels = {m.get("channel") for m in server.received if m.get("type") == "subscribe"}
+            assert channels == {"ticker", "level2"}
+
+            exchange = CoinbaseExchange(read_only=True)
+            exchange._http = MagicMock()
+            exchange.attach_market_data_feed(feed)
+            quote = exchange.get_quote("BTC-USD")
+            assert (quote.bid, quote.ask) == (60005.0, 60010.0)
+            exchange._http.get.assert_not_called()
+
+            # Dropped connection: books are invalidated, then rebuilt after resubscribe
+            server.drop_connections()
+            assert _wait_for(lambda: server.connections == 2)
+            assert _wait_for(lambda: feed.stats()["synced_books"] == 1)
+            assert feed.stats()["reconnects"] == 1
+
+            feed.update_symbols(["ETH-USD"])
+            assert _wait_for(lambda: any(
+                m.get("type") == "unsubscribe" and m.get("product_ids") == ["BTC-USD"]
+                for m in server.received
+            ))
+        finally:
+            feed.stop()
+
+
+def test_exchange_falls_back_to_rest_when_stream_is_stale(monkeypatch):
+    feed = _replayed_feed(messages=RECORDED[:2])
+    feed._products["BTC-USD"].ticker_updated_at -= timedelta(seconds=60)
+
+    exchange = CoinbaseExchange(read_only=True)
+    exchange.attach_market_data_feed(feed)
+    monkeypatch.setattr(exchange, "_rate_limit", lambda *a, **k: None)
+    response = MagicMock()
+    response.json.return_value = {"best_bid": "100", "best_ask": "101", "price": "100.5",
+                                  "approximate_quote_24h_volume": "1000000"}
+    exchange._http = MagicMock()
+    exchange._http.get.return_value = response
+
+    quote = exchange.get_quote("BTC-USD")
+
+    assert (quote.bid, quote.ask) == (100.0, 101.0)
+    exchange._http.get.assert_called_once()
+
+
+def test_streamed_book_backs_get_orderbook():
+    feed = _replayed_feed()
+    book = feed.get_order_book("BTC-USD")
+    assert (book.bid_levels, book.ask_levels) == (3, 2)
+
+    book.apply_update("bid", 60005.0, 0.0)  # caller gets a copy
+    assert feed.get_order_book("BTC-USD").best_bid == 60005.0
+
+    exchange = CoinbaseExchange(read_only=True)
+    exchange._http = MagicMock()
+    exchange.attach_market_data_feed(feed)
+    snapshot = exchange.get_orderbook("BTC-USD")
+
+    assert snapshot.book.best_ask == 60010.0
+    assert snapshot.bid_levels == 3
+    exchange._http.get.assert_not_called()
@@ -0,0 +1,161 @@
+"""
+Tests for the incrementally maintained L2 order book and its consumers.
+"""
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.exchange_coinbase import CoinbaseExchange
+from core.order_book import OrderBook
+
+
+def _book():
+    return OrderBook.from_levels(
+        "BTC-USD",
+        bids=[(99.0, 2.0), (100.0, 1.0), (98.0, 5.0)],   # unsorted input is fine
+        asks=[(101.0, 1.0), (102.0, 2.0), (105.0, 10.0)],
+    )
+
+
+def _walk(levels, notional):
+    remaining, base, used = notional, 0.0, 0
+    for price, size in levels:
+        if remaining <= 0:
+            break
+        take = min(remaining, price * size)
+        base += take / price
+        remaining -= take
+        used += 1
+    return base, used
+
+
+def test_snapshot_and_updates_maintain_sorted_levels():
+    book = _book()
+    assert (book.best_bid, book.best_ask) == (100.0, 101.0)
+    assert book.mid == 100.5
+
+    book.apply_update("bid", 100.5, 0.5)     # new best bid
+    book.apply_update("ask", 101.0, 0.0)     # remove best ask
+    book.apply_update("offer", 102.0, 3.0)   # resize (feed side name)
+
+    assert (book.best_bid, book.best_bid_size) == (100.5, 0.5)
+    assert (book.best_ask, book.best_ask_size) == (102.0, 3.0)
+    assert (book.bid_levels, book.ask_levels) == (4, 2)
+
+
+def test_depth_within_band_matches_linear_sum():
+    book = _book()
+    mid = book.mid
+    assert book.depth_usd("ask", 100) == pytest.approx(101.0 * 1.0)  # 102 > mid*1.01
+    assert book.depth_usd("bid", 150) == pytest.approx(100.0 * 1.0 + 99.0 * 2.0)
+    assert book.depth_usd("both", 1000) == pytest.approx(
+        sum(p * s for p, s in [(99.0, 2.0), (100.0, 1.0), (98.0, 5.0)])
+        + sum(p * s for p, s in [(101.0, 1.0), (102.0, 2.0), (105.0, 10.0)] if p <= mid * 1.1)
+    )
+
+
+def test_estimate_fill_reports_vwap_levels_and_slippage():
+    book = _book()
+
+    buy = book.estimate_fill("BUY", 200.0)
+    assert buy.complete and buy.levels_consumed == 2
+    assert buy.base_size == pytest.approx(1.0 + 99.0 / 102.0)
+    assert buy.vwap == pytest.approx(200.0 / buy.base_size)
+    assert buy.slippage_bps == pytest.approx((buy.vwap - 100.5) / 100.5 * 10000)
+
+    sell = book.estimate_fill("sell", 250.0)
+    assert sell.levels_consumed == 2
+    assert sell.base_size == pytest.approx(1.0 + 150.0 / 99.0)
+
+    thin = book.estimate_fill("sell", 10_000.0)
+    assert not thin.complete
+    assert thin.filled_usd == pytest.approx(100.0 + 198.0 + 490.0)
+    assert thin.levels_consumed == 3
+
+
+def test_estimate_fill_matches_level_walk_after_random_updates():
+    rng = random.Random(7)
+    book = OrderBook.from_levels(
+        "ETH-USD",
+        bids=[(round(100 - rng.random() * 5, 2), rng.random() * 3) for _ in range(40)],
+        asks=[(round(100.01 + rng.random() * 5, 2), rng.random() * 3) for _ in range(40)],
+    )
+    for _ in range(200):
+        side = rng.choice(["bid", "ask"])
+        price = round(100 - rng.random() * 5, 2) if side == "bid" else round(100.01 + rng.random() * 5, 2)
+        book.apply_update(side, price, rng.choice([0.0, rng.random() * 3]))
+
+        notional = rng.uniform(1, 500)
+        asks = list(zip(book._asks.prices, book._asks.sizes))
+        bids = list(zip(book._bids.prices, book._bids.sizes))[::-1]
+        for fill, levels in ((book.estimate_fill("buy", notional), asks),
+                             (book.estimate_fill("sell", notional), bids)):
+            base, used = _walk(levels, notional)
+            assert fill.base_size == pytest.approx(base)
+            assert fill.levels_consumed == used
+
+
+def test_get_orderbook_attaches_parsed_book(monkeypatch):
+    exchange = CoinbaseExchange(read_only=True)
+    monkeypatch.setattr(exchange, "_rate_limit", lambda *a, **k: None)
+    response = MagicMock()
+    response.json.return_value = {"pricebook": {
+        "bids": [{"price": "100", "size": "1"}, {"price": "99.9", "size": "2"}],
+        "asks": [{"price": "100.1", "size": "1"}, {"price": "101", "size": "5"}],
+    }}
+    exchange._http = MagicMock()
+    exchange._http.get.return_value = response
+
+    snapshot = exchange.get_orderbook("BTC-USD")
+
+    # ±20bps of mid 100.05 keeps 99.9 (bid) and 100.1 (ask), drops 101
+    assert snapshot.bid_depth_usd == pytest.approx(100.0 + 199.8)
+    assert snapshot.ask_depth_usd == pytest.approx(100.1)
+    assert snapshot.book.ask_levels == 2
+    assert snapshot.book.estimate_fill("buy", 50).levels_consumed == 1
+
+
+def test_universe_depth_band_reads_attached_book():
+    from core.universe import UniverseManager
+
+    snapshot = CoinbaseExchange._snapshot_from_book(_book())
+    assert UniverseManager._depth_within_band(snapshot, {}) == snapshot.total_depth_usd
+    assert UniverseManager._depth_within_band(snapshot, {"depth_band_bps": 1000}) == pytest.approx(
+        _book().depth_usd("both", 1000)
+    )
+
+
+def test_preview_slippage_walks_the_book(monkeypatch):
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+
+    from core.execution import ExecutionEngine
+
+    engine = ExecutionEngine.__new__(ExecutionEngine)
+    engine.min_notional_usd = 1.0
+    engine.max_quote_age_seconds = 30
+    engine.max_spread_bps = 500
+    engine.min_depth_multiplier = 0.0
+    engine.limit_post_only = False
+    engine.mode = "DRY_RUN"
+    engine.estimate_fee = lambda size, is_maker=False: 0.0
+
+    book = _book()
+    engine.exchange = SimpleNamespace(
+        get_quote=lambda symbol, caller=None: SimpleNamespace(
+            symbol=symbol, bid=100.0, ask=101.0, mid=100.5, spread_bps=1.0 / 100.5 * 10000,
+            timestamp=datetime.now(timezone.utc),
+        ),
+        get_orderbook=lambda symbol, depth_levels=20, caller=None: CoinbaseExchange._snapshot_from_book(book),
+        api_key=None,
+    )
+
+    small = engine.preview_order("BTC-USD", "BUY", 50.0)
+    large = engine.preview_order("BTC-USD", "BUY", 400.0)
+
+    assert small["estimated_slippage_bps"] == pytest.approx(0.5 / 100.5 * 10000)  # half spread
+    assert large["book_levels_consumed"] == 3
+    assert large["estimated_slippage_bps"] == pytest.approx(book.estimate_fill("buy", 400.0).slippage_bps)
+    assert large["estimated_slippage_bps"] > small["estimated_slippage_bps"]
@@ -0,0 +1,208 @@
+"""
+Tests for the user-channel order event stream and the execution paths that
+wait on it.
+
+The connection loop runs against a local WebSocket stand-in that replays a
+recorded user-channel snapshot; later order updates are pushed by the test.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+from core.execution import ExecutionEngine
+from core.order_events import OrderEventStream, UserOrderStreamConfig, await_order
+from core.order_state import OrderStatus, get_order_state_machine
+from infra.state_store import InMemoryStateBackend, StateStore
+from tests.helpers.ws_stand_in import WebSocketStandIn
+
+TS = "2024-05-01T12:00:00.000000Z"
+
+
+def _order(order_id, status, client_id=None, filled="0", leaves="1.0", avg="0", fees="0"):
+    return {
+        "order_id": order_id, "client_order_id": client_id or f"c-{order_id}", "product_id": "BTC-USD",
+        "order_side": "BUY", "order_type": "Limit", "status": status, "cumulative_quantity": filled,
+        "leaves_quantity": leaves, "avg_price": avg, "total_fees": fees, "limit_price": "100",
+        "creation_time": TS,
+    }
+
+
+def _user(seq, event_type, *orders):
+    return {"channel": "user", "client_id": "", "timestamp": TS, "sequence_num": seq,
+            "events": [{"type": event_type, "orders": list(orders)}]}
+
+
+SNAPSHOT = _user(0, "snapshot", _order("o-1", "OPEN"), _order("o-2", "OPEN"))
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _engine(state_store=None):
+    exchange = MagicMock()
+    exchange.read_only = False
+    policy = {"risk": {"min_trade_notional_usd": 10.0}, "execution": {}}
+    return ExecutionEngine(mode="LIVE", exchange=exchange, policy=policy, state_store=state_store)
+
+
+def test_config_from_dict_parses_and_rejects_invalid_values():
+    cfg = UserOrderStreamConfig.from_dict({"enabled": True, "watchdog_seconds": "2", "idle_timeout": 0})
+
+    assert cfg.enabled is True
+    assert cfg.watchdog_seconds == 2.0
+    assert cfg.idle_timeout == UserOrderStreamConfig().idle_timeout
+    assert UserOrderStreamConfig.from_dict(None) == UserOrderStreamConfig()
+
+
+def test_stream_authenticates_and_resolves_waits_without_polling():
+    auth = MagicMock(return_value={"jwt": "token"})
+    with WebSocketStandIn([SNAPSHOT], replay_after="user") as server:
+        stream = OrderEventStream(UserOrderStreamConfig(enabled=True, url=server.url, watchdog_seconds=10.0),
+                                  auth=auth)
+        stream.start()
+        try:
+            assert _wait_for(lambda: stream.healthy)
+            assert {o["order_id"] for o in stream.open_orders()} == {"o-1", "o-2"}
+            subscribe = [m for m in server.received if m.get("channel") == "user"][0]
+            assert subscribe["jwt"] == "token" and subscribe["type"] == "subscribe"
+            auth.assert_any_call("user", [])
+
+            poll = MagicMock(return_value=None)
+            server.push(_user(1, "update", _order("o-1", "FILLED", filled="1.0", leaves="0", avg="100", fees="0.4")))
+            started = time.monotonic()
+            status = await_order(stream, "o-1", poll, timeout=5.0,
+                                 done=lambda snap: snap["status"] == "FILLED")
+
+            assert time.monotonic() - started < 2.0
+            assert poll.call_count == 0
+            assert status["filled_size"] == 1.0 and status["filled_value"] == 100.0
+            assert [o["order_id"] for o in stream.open_orders()] == ["o-2"]
+            assert stream.latest(client_order_id="c-o-1").total_fees == 0.4
+        finally:
+            stream.stop()
+
+
+def test_waits_fall_back_to_rest_when_stream_is_not_healthy():
+    stream = OrderEventStream(UserOrderStreamConfig(enabled=True))   # never connected
+    statuses = iter([{"status": "OPEN"}, {"status": "OPEN"}, {"status": "CANCELLED"}])
+    poll = MagicMock(side_effect=lambda: next(statuses))
+
+    status = await_order(stream, "o-9", poll, timeout=2.0, done=lambda snap: snap["status"] == "CANCELLED",
+                         poll_interval=0.01)
+
+    assert status == {"status": "CANCELLED"}
+    assert poll.call_count == 3
+    assert stream.stats()["fallback_waits"] == 0 and stream.open_orders() is None
+    assert await_order(None, "o-9", lambda: {"status": "OPEN"}, timeout=0.05,
+                       done=lambda snap: False, poll_interval=0.01) == {"status": "OPEN"}
+
+
+def test_sequence_gap_marks_stream_unhealthy_until_resubscribed():
+    with WebSocketStandIn([SNAPSHOT], replay_after="user") as server:
+        stream = OrderEventStream(UserOrderStreamConfig(enabled=True, url=server.url,
+                                                        reconnect_initial_seconds=0.05))
+        stream.start()
+        try:
+            assert _wait_for(lambda: stream.healthy)
+            server.push(_user(5, "update", _order("o-2", "OPEN", filled="0.5", leaves="0.5")))
+            assert _wait_for(lambda: stream.stats()["sequence_gaps"] == 1)
+            assert _wait_for(lambda: server.connections == 2)
+            assert _wait_for(lambda: stream.healthy)
+            assert stream.stats()["reconnects"] == 1
+        finally:
+            stream.stop()
+
+
+def test_updates_drive_order_state_machine_and_state_store():
+    osm = get_order_state_machine()
+    osm.orders.clear()
+    store = StateStore(backend=InMemoryStateBackend())
+    engine = _engine(state_store=store)
+    stream = OrderEventStream(UserOrderStreamConfig(enabled=True))
+    engine.attach_order_events(stream)
+
+    osm.create_order("c-o-1", "BTC-USD", "buy", size_usd=100.0, size_base=1.0, route="live_limit_post_only")
+    store.record_open_order("c-o-1", {"order_id": "o-1", "client_order_id": "c-o-1", "product_id": "BTC-USD",
+                                      "side": "buy"})
+
+    stream.handle_message(_user(0, "snapshot", _order("o-1", "OPEN")))
+    assert osm.get_order("c-o-1").status == OrderStatus.OPEN.value
+    assert osm.get_order("c-o-1").order_id == "o-1"
+
+    stream.handle_message(_user(1, "update", _order("o-1", "OPEN", filled="0.4", leaves="0.6", avg="100")))
+    assert osm.get_order("c-o-1").status == OrderStatus.PARTIAL_FILL.value
+    assert "c-o-1" in store.load()["open_orders"]
+
+    stream.handle_message(_user(2, "update", _order("o-1", "FILLED", filled="1.0", leaves="0", avg="100",
+                                                  fees="0.4")))
+    tracked = osm.get_order("c-o-1")
+    assert tracked.status == OrderStatus.FILLED.value and tracked.fees == 0.4
+    state = store.load()
+    assert "c-o-1" not in state["open_orders"]
+    assert state["recent_orders"][-1]["source"] == "user_stream"
+    assert state["recent_orders"][-1]["status"] == "filled"
+    osm.orders.clear()
+
+
+def test_rest_fills_do_not_double_count_streamed_totals():
+    osm = get_order_state_machine()
+    osm.orders.clear()
+    engine = _engine()
+    stream = OrderEventStream(UserOrderStreamConfig(enabled=True))
+    engine.attach_order_events(stream)
+    osm.create_order("c-o-1", "BTC-USD", "buy", size_usd=100.0, size_base=1.0, route="live_limit_post_only")
+    osm.create_order("c-o-2", "BTC-USD", "buy", size_usd=100.0, size_base=1.0, route="live_limit_post_only")
+
+    def fill(trade_id, order_id, size):
+        return {"trade_id": trade_id, "order_id": order_id, "product_id": "BTC-USD", "price": "100",
+                "size": size, "commission": "0.2", "side": "BUY", "trade_time": TS, "sequence_timestamp": TS}
+
+    # Stream first: the REST fills are already in the cumulative snapshot
+    stream.handle_message(_user(0, "snapshot", _order("o-1", "OPEN"), _order("o-2", "OPEN")))
+    stream.handle_message(_user(1, "update", _order("o-1", "FILLED", filled="1.0", leaves="0", avg="100",
+                                                  fees="0.4")))
+    engine.exchange.list_fills.return_value = [fill("t1", "o-1", "0.5"), fill("t2", "o-1", "0.5"),
+                                               fill("t3", "o-2", "0.4")]
+    engine.reconcile_fills()
+
+    first = osm.get_order("c-o-1")
+    assert (first.filled_size, first.filled_value, first.fees) == (1.0, 100.0, 0.4)
+
+    # REST first: the later snapshot sets the cumulative size instead of adding to it
+    stream.handle_message(_user(2, "update", _order("o-2", "OPEN", filled="0.4", leaves="0.6", avg="100",
+                                                  fees="0.2")))
+    second = osm.get_order("c-o-2")
+    assert second.filled_size == 0.4 and second.fees == 0.2
+
+    # A replay of applied fills (e.g. after losing the cursor) changes nothing
+    engine.fill_ingester._cursor = None
+    engine.fill_ingester.state_store = None
+    result = engine.reconcile_fills()
+    assert result["fills_processed"] == 0 and result["fills_skipped"] == 3
+    assert osm.get_order("c-o-1").filled_size == 1.0 and osm.get_order("c-o-2").filled_size == 0.4
+    osm.orders.clear()
+
+
+def test_reconcile_uses_streamed_open_orders_between_rest_checks():
+    engine = _engine()
+    engine.exchange.list_open_orders.return_value = []
+    stream = OrderEventStream(UserOrderStreamConfig(enabled=True))
+    engine.attach_order_events(stream)
+    stream._connected = True                      # as if the reader thread were connected
+    stream.handle_message(SNAPSHOT)
+
+    engine.reconcile_open_orders()                # first pass always checks REST
+    engine.reconcile_open_orders()
+    engine.reconcile_open_orders()
+
+    assert engine.exchange.list_open_orders.call_count == 1
+
+    engine._last_rest_reconcile -= stream.config.reconcile_rest_interval_seconds
+    engine.reconcile_open_orders()
+    assert engine.exchange.list_open_orders.call_count == 2
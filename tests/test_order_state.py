@@ -4,6 +4,8 @@ Tests for order state machine.
 Ensures proper lifecycle transitions, fill tracking, and querying.
 """
 
+import threading
+
 import pytest
 from datetime import datetime, timezone, timedelta
 from core.order_state import (
@@ -431,6 +433,112 @@ class TestOrderStateMachine:
         assert summary["status_breakdown"][OrderStatus.FILLED.value] == 1
 
 
+class TestOrderStateMachineIndexes:
+    """Secondary indexes stay consistent with the order table"""
+
+    def setup_method(self):
+        self.machine = OrderStateMachine()
+
+    def _open(self, client_id, symbol="BTC-USD", order_id=None):
+        self.machine.create_order(client_id, symbol, "buy", 100.0)
+        self.machine.transition(client_id, OrderStatus.OPEN, order_id=order_id or f"ex-{client_id}")
+
+    def test_lookup_by_exchange_id_and_symbol(self):
+        self._open("a", "BTC-USD")
+        self._open("b", "ETH-USD")
+        self._open("c", "BTC-USD")
+        self.machine.transition("c", OrderStatus.FILLED)
+
+        assert self.machine.get_order_by_exchange_id("ex-b").client_order_id == "b"
+        assert self.machine.get_order_by_exchange_id("missing") is None
+        assert [o.client_order_id for o in self.machine.get_orders_by_symbol("BTC-USD")] == ["a", "c"]
+        assert [o.client_order_id for o in self.machine.get_orders_by_symbol("BTC-USD", active_only=True)] == ["a"]
+
+    def test_stale_orders_oldest_first_and_terminal_ones_drop_out(self):
+        for client_id in ("a", "b", "c"):
+            self._open(client_id)
+        now = datetime.now(timezone.utc)
+        self.machine.get_order("b").created_at = now - timedelta(seconds=300)
+        self.machine.get_order("a").created_at = now - timedelta(seconds=120)
+
+        assert [o.client_order_id for o in self.machine.get_stale_orders(60)] == ["b", "a"]
+        self.machine.transition("b", OrderStatus.CANCELED)
+        assert [o.client_order_id for o in self.machine.get_stale_orders(60)] == ["a"]
+        assert [o.client_order_id for o in self.machine.get_orders_by_status(OrderStatus.CANCELED)] == ["b"]
+        assert [o.client_order_id for o in self.machine.get_terminal_orders()] == ["b"]
+
+    def test_late_fill_after_cancel_moves_between_status_buckets(self):
+        self._open("a")
+        self.machine.transition("a", OrderStatus.CANCELED)
+        self.machine.update_fill("a", filled_size=1.0, filled_value=100.0, fees=0.1)
+
+        assert self.machine.get_orders_by_status(OrderStatus.CANCELED) == []
+        assert [o.client_order_id for o in self.machine.get_orders_by_status(OrderStatus.FILLED)] == ["a"]
+        assert self.machine.get_summary()["terminal_orders"] == 1
+
+    def test_table_replaced_or_cleared_directly(self):
+        self._open("a")
+        self._open("b")
+        del self.machine.orders["a"]
+        assert self.machine.get_order_by_exchange_id("ex-a") is None
+        assert [o.client_order_id for o in self.machine.get_active_orders()] == ["b"]
+
+        injected = OrderState(client_order_id="x", symbol="SOL-USD", size_usd=10.0,
+                              status=OrderStatus.OPEN.value, order_id="ex-x")
+        self.machine.orders = {"x": injected}
+        assert self.machine.get_order_by_exchange_id("ex-x") is injected
+        assert self.machine.get_active_orders() == [injected]
+
+        self.machine.orders.clear()
+        assert self.machine.get_summary()["total_orders"] == 0
+        assert self.machine.get_active_orders() == []
+        # A reused client id is indexed afresh, not through its old entries
+        self.machine.create_order("x", "ETH-USD", "buy", 10.0)
+        assert self.machine.get_orders_by_symbol("SOL-USD") == []
+        assert [o.symbol for o in self.machine.get_active_orders()] == ["ETH-USD"]
+
+    def test_terminal_orders_expire_after_retention(self):
+        machine = OrderStateMachine(terminal_retention_seconds=60)
+        for i in range(3):
+            machine.create_order(f"o{i}", "BTC-USD", "buy", 100.0)
+            machine.transition(f"o{i}", OrderStatus.OPEN, order_id=f"ex-{i}")
+        machine.transition("o0", OrderStatus.FILLED)
+        machine.transition("o1", OrderStatus.CANCELED)
+        machine.get_order("o0").completed_at -= timedelta(seconds=120)
+
+        machine.transition("o2", OrderStatus.FILLED)
+
+        assert sorted(machine.orders) == ["o1", "o2"]
+        assert machine.get_order_by_exchange_id("ex-0") is None
+        assert [o.client_order_id for o in machine.get_terminal_orders()] == ["o1", "o2"]
+        machine.cleanup_old_orders(keep_last_n=1)
+        assert sorted(machine.orders) == ["o2"]
+        with pytest.raises(ValueError):
+            OrderStateMachine(terminal_retention_seconds=0)
+
+    def test_concurrent_creates_and_transitions_keep_indexes_consistent(self):
+        def worker(n):
+            for i in range(50):
+                client_id = f"w{n}-{i}"
+                self.machine.create_order(client_id, f"S{i % 3}-USD", "buy", 10.0)
+                self.machine.transition(client_id, OrderStatus.OPEN, order_id=f"ex-{client_id}")
+                if i % 2:
+                    self.machine.transition(client_id, OrderStatus.FILLED)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = self.machine.get_summary()
+        assert summary["total_orders"] == 400
+        assert summary["active_orders"] == 200 and summary["terminal_orders"] == 200
+        assert len(self.machine.get_terminal_orders()) == 200
+        assert all(self.machine.get_order_by_exchange_id(f"ex-w{n}-49").client_order_id == f"w{n}-49"
+                   for n in range(8))
+
+
 class TestOrderStateMachineSingleton:
     """Test singleton pattern"""
     
@@ -0,0 +1,156 @@
+"""
+Tests for the per-cycle quote/orderbook cache and its single-flight fetches.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.exchange_coinbase import CoinbaseExchange
+from core.quote_cache import QuoteCache, QuoteCacheConfig
+
+
+def _ticker_exchange(monkeypatch, delay=0.0):
+    exchange = CoinbaseExchange(read_only=True)
+    monkeypatch.setattr(exchange, "_rate_limit", lambda *a, **k: None)
+    calls = []
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append(url)
+        time.sleep(delay)
+        response = MagicMock()
+        response.json.return_value = {"best_bid": "100", "best_ask": "101", "price": "100.5",
+                                      "approximate_quote_24h_volume": "1000000"}
+        return response
+
+    exchange._http = MagicMock()
+    exchange._http.get.side_effect = fake_get
+    return exchange, calls
+
+
+def universe_builder(exchange, symbol):
+    return exchange.get_quote(symbol, caller="universe_builder")
+
+
+def account_snapshot(exchange, symbol):
+    return exchange.get_quote(symbol, caller="account_snapshot")
+
+
+def test_repeated_quotes_share_one_request_and_count_per_caller(monkeypatch):
+    exchange, calls = _ticker_exchange(monkeypatch)
+
+    first = universe_builder(exchange, "BTC-USD")
+    assert account_snapshot(exchange, "BTC-USD") is first
+    assert account_snapshot(exchange, "BTC-USD") is first
+    assert len(calls) == 1
+
+    stats = exchange.quote_cache_stats()
+    assert stats["universe_builder"] == {"hits": 0, "misses": 1, "coalesced": 0, "hit_rate": 0.0}
+    assert stats["account_snapshot"]["hits"] == 2
+    assert stats["account_snapshot"]["hit_rate"] == 1.0
+
+
+def test_concurrent_requests_are_coalesced(monkeypatch):
+    exchange, calls = _ticker_exchange(monkeypatch, delay=0.1)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(exchange.get_quote("ETH-USD", caller="worker"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(q is results[0] for q in results)
+    counts = exchange.quote_cache_stats()["worker"]
+    assert counts["misses"] == 1 and counts["coalesced"] == 7
+
+
+def test_invalidation_and_expiry_force_a_new_request(monkeypatch):
+    exchange, calls = _ticker_exchange(monkeypatch)
+    exchange.get_quote("BTC-USD")
+    exchange.get_quote("SOL-USD")
+
+    assert exchange.invalidate_quotes("BTC-USD") == 1
+    exchange.get_quote("BTC-USD")
+    exchange.get_quote("SOL-USD")
+    assert len(calls) == 3
+
+    exchange.configure_quote_cache({"max_age_seconds": 0})
+    exchange.get_quote("BTC-USD")
+    exchange.get_quote("BTC-USD")
+    assert len(calls) == 5
+
+    exchange.configure_quote_cache({"enabled": False})
+    exchange.get_quote("BTC-USD")
+    assert len(calls) == 6
+
+
+def test_errors_propagate_to_waiters_and_are_not_cached():
+    cache = QuoteCache()
+    gate = threading.Event()
+    attempts = []
+
+    def failing():
+        attempts.append(1)
+        gate.wait(1)
+        raise RuntimeError("upstream down")
+
+    errors = []
+
+    def worker():
+        try:
+            cache.get("quote", "BTC-USD", failing, caller="t")
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert len(attempts) == 1 and len(errors) == 3
+    assert cache.get("quote", "BTC-USD", lambda: "ok", caller="t") == "ok"
+
+
+def test_fetch_in_flight_during_invalidate_is_not_stored():
+    cache = QuoteCache(QuoteCacheConfig(max_age_seconds=60))
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(1)
+        return "old"
+
+    t = threading.Thread(target=lambda: cache.get("quote", "BTC-USD", slow, caller="t"))
+    t.start()
+    started.wait(1)
+    cache.invalidate("BTC-USD")
+    assert cache.get("quote", "BTC-USD", lambda: "new", caller="t") == "new"
+    release.set()
+    t.join()
+    assert cache.get("quote", "BTC-USD", lambda: "refetched", caller="t") == "new"
+
+
+def test_live_execution_invalidates_before_quoting():
+    from core.execution import ExecutionEngine
+
+    engine = ExecutionEngine.__new__(ExecutionEngine)
+    engine.exchange = MagicMock()
+    engine._invalidate_quote("BTC-USD")
+    engine.exchange.invalidate_quotes.assert_called_once_with("BTC-USD")
+
+
+def test_config_from_dict_rejects_negative_age():
+    assert QuoteCacheConfig.from_dict({"max_age_seconds": -1}).max_age_seconds == pytest.approx(2.0)
+    assert QuoteCacheConfig.from_dict({"max_age_seconds": "0.5"}).max_age_seconds == 0.5
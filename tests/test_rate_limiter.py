@@ -266,5 +266,44 @@ def test_rate_limiter_high_utilization_warning(caplog):
     assert any("test_endpoint" in record.message for record in caplog.records)
 
 
+def test_rate_limiter_concurrent_waiters_queue_in_order():
+    """Concurrent wait=True callers each get a distinct slot instead of bursting"""
+    import threading
+
+    limiter = RateLimiter()
+    limiter.configure({"test_endpoint": 20.0})
+    for _ in range(20):
+        limiter.acquire("test_endpoint", wait=False)
+
+    finished = []
+    lock = threading.Lock()
+
+    def worker():
+        limiter.acquire("test_endpoint", wait=True)
+        with lock:
+            finished.append(time.monotonic())
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 4 tokens at 20/sec need ~0.2s; all four calls must be spread across it
+    assert len(finished) == 4
+    assert max(finished) - start >= 0.15
+    assert limiter.get_wait_time("test_endpoint") <= 0.05
+
+
+def test_endpoint_quota_reserve_returns_delay():
+    """reserve() always debits and reports how long the caller must wait"""
+    quota = EndpointQuota(name="test_endpoint", requests_per_second=10.0)
+    quota.acquire(10.0)
+
+    assert quota.reserve() == pytest.approx(0.1, abs=0.02)
+    assert quota.reserve() == pytest.approx(0.2, abs=0.02)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -11,9 +11,11 @@ Verifies:
 
 import pytest
 from unittest.mock import Mock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from core.exchange_coinbase import FillList
 from core.execution import ExecutionEngine
 from core.order_state import OrderStatus
+from infra.state_store import InMemoryStateBackend, StateStore
 
 
 class TestReconcileFills:
@@ -440,5 +442,131 @@ class TestReconcileFills:
         assert order_state.status == OrderStatus.FILLED.value
 
 
+class TestIncrementalFillReconcile:
+    """Fills are applied once; later calls resume from the high-water mark"""
+
+    def setup_method(self):
+        self.policy = {
+            "execution": {"fill_reconcile": {"overlap_seconds": 60}},
+            "risk": {"min_trade_notional_usd": 10.0},
+        }
+        self.exchange = Mock()
+        self.exchange.read_only = False
+        self.store = StateStore(backend=InMemoryStateBackend())
+        # Own position dicts (a fresh store shares DEFAULT_STATE's nested dicts)
+        self.store.save({**self.store.load(), "positions": {}, "managed_positions": {}})
+        self.engine = ExecutionEngine(mode="LIVE", exchange=self.exchange, policy=self.policy,
+                                      state_store=self.store)
+        self.state_machine = self.engine.order_state_machine
+        self.state_machine.orders.clear()
+
+    def _position_qty(self):
+        return self.store.load()["positions"].get("SOL-USD", {}).get("quantity", 0.0)
+
+    @staticmethod
+    def _fill(trade_id, order_id, size, seconds_ago):
+        ts = (datetime.now(timezone.utc) - timedelta(seconds=seconds_ago)).isoformat()
+        return {"trade_id": trade_id, "order_id": order_id, "product_id": "SOL-USD", "price": "10.0",
+                "size": str(size), "commission": "0.01", "side": "BUY", "trade_time": ts,
+                "sequence_timestamp": ts}
+
+    def test_repeated_windows_apply_each_fill_once(self):
+        before = self._position_qty()
+        self.state_machine.create_order("c-1", "SOL-USD", "buy", size_usd=100.0)
+        self.state_machine.transition("c-1", OrderStatus.OPEN, order_id="o-1")
+        first = [self._fill("t2", "o-1", 3.0, 20), self._fill("t1", "o-1", 2.0, 30)]   # newest first
+        self.exchange.list_fills.return_value = first
+
+        result = self.engine.reconcile_fills(lookback_minutes=5)
+        assert result["fills_processed"] == 2
+        assert [f["trade_id"] for f in self.state_machine.get_order("c-1").fills] == ["t1", "t2"]
+
+        # Next window overlaps the last one and carries one new fill
+        self.exchange.list_fills.return_value = [self._fill("t3", "o-1", 5.0, 5)] + first
+        result = self.engine.reconcile_fills(lookback_minutes=5)
+
+        assert result["fills_processed"] == 1
+        assert result["fills_skipped"] == 2
+        order = self.state_machine.get_order("c-1")
+        assert order.filled_size == 10.0
+        assert order.status == OrderStatus.FILLED.value
+        assert self._position_qty() - before == 10.0
+
+        start = self.exchange.list_fills.call_args[1]["start_time"]
+        newest = datetime.now(timezone.utc) - timedelta(seconds=20)
+        assert abs((newest - start).total_seconds() - 60) < 5   # high-water mark minus overlap
+        assert self.exchange.list_fills.call_args[1]["max_pages"] == 20
+
+    def test_cursor_survives_restart(self):
+        fill = self._fill("t1", "o-9", 1.0, 10)
+        self.exchange.list_fills.return_value = [fill]
+        assert self.engine.reconcile_fills()["fills_processed"] == 1
+        recorded = self._position_qty()
+        cursor = self.store.load()["fill_cursor"]
+        assert cursor["trade_id"] == "t1" and "t1" in cursor["seen"]
+
+        restarted = ExecutionEngine(mode="LIVE", exchange=self.exchange, policy=self.policy,
+                                    state_store=self.store)
+        result = restarted.reconcile_fills()
+
+        assert result["fills_processed"] == 0 and result["fills_skipped"] == 1
+        assert self._position_qty() == recorded
+
+    @staticmethod
+    def _page(fills, truncated=False):
+        page = FillList(fills)
+        page.truncated = truncated
+        return page
+
+    def test_truncated_fetch_holds_mark_until_the_gap_is_read(self):
+        before = self._position_qty()
+        self.exchange.list_fills.return_value = self._page([self._fill("t1", "o-9", 1.0, 600)])
+        assert self.engine.reconcile_fills()["fills_processed"] == 1
+        mark = self.store.load()["fill_cursor"]["sequence_timestamp"]
+
+        # Newest pages first and the page limit hit: t2/t3 (300s/200s ago) were not reached
+        newest = [self._fill("t5", "o-9", 1.0, 10), self._fill("t4", "o-9", 1.0, 100)]
+        self.exchange.list_fills.return_value = self._page(newest, truncated=True)
+        assert self.engine.reconcile_fills()["fills_processed"] == 2
+        cursor = self.store.load()["fill_cursor"]
+        assert cursor["sequence_timestamp"] == mark
+        assert cursor["gap_end"] is not None
+        assert self.exchange.list_fills.call_args[1]["end_time"] is None
+
+        # Next poll pages back into the gap only
+        self.exchange.list_fills.return_value = self._page(
+            [self._fill("t3", "o-9", 1.0, 200), self._fill("t2", "o-9", 1.0, 300)])
+        assert self.engine.reconcile_fills()["fills_processed"] == 2
+        end = self.exchange.list_fills.call_args[1]["end_time"]
+        assert end.timestamp() == cursor["gap_end"]
+        start = self.exchange.list_fills.call_args[1]["start_time"]
+        assert abs(start.timestamp() - (mark - 60)) < 1
+
+        cursor = self.store.load()["fill_cursor"]
+        assert cursor["gap_end"] is None and cursor["trade_id"] == "t5"
+        assert self._position_qty() - before == 5.0
+
+        # Gap closed: back to open-ended polling from the new mark
+        self.exchange.list_fills.return_value = self._page([])
+        self.engine.reconcile_fills()
+        assert self.exchange.list_fills.call_args[1]["end_time"] is None
+
+    def test_failed_page_keeps_the_gap_open(self):
+        self.exchange.list_fills.return_value = self._page([self._fill("t1", "o-9", 1.0, 600)])
+        self.engine.reconcile_fills()
+        self.exchange.list_fills.return_value = self._page([self._fill("t4", "o-9", 1.0, 100)], truncated=True)
+        self.engine.reconcile_fills()
+        gap_end = self.store.load()["fill_cursor"]["gap_end"]
+
+        self.exchange.list_fills.return_value = self._page([], truncated=True)   # request failed
+        assert self.engine.reconcile_fills()["fills_processed"] == 0
+        assert self.store.load()["fill_cursor"]["gap_end"] == gap_end
+
+    def test_failed_fetch_does_not_advance_cursor(self):
+        self.exchange.list_fills.side_effect = Exception("API error")
+        assert "error" in self.engine.reconcile_fills()
+        assert self.store.load()["fill_cursor"] == {}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
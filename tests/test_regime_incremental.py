@@ -0,0 +1,156 @@
+"""Tests for the rolling-state IncrementalRegimeDetector."""
+
+import random
+import statistics
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.candles import OHLCV, CandleSeries
+from core.regime import IncrementalRegimeDetector, RegimeDetector, RegimeStateConfig, RollingStats
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _candles(count, drift=0.0002, vol=0.01, seed=7, start=T0):
+    rng = random.Random(seed)
+    price, rows = 50_000.0, []
+    for i in range(count):
+        price *= 1 + rng.gauss(drift, vol)
+        rows.append(OHLCV("BTC-USD", start + timedelta(hours=i), price, price, price, price, 1.0))
+    return rows
+
+
+def test_rolling_stats_matches_window_statistics():
+    rng = random.Random(3)
+    stats, values = RollingStats(50), []
+    for _ in range(500):
+        x = rng.gauss(0, 1)
+        stats.push(x)
+        values.append(x)
+        window = values[-50:]
+        if len(window) > 1:
+            assert stats.mean == pytest.approx(statistics.fmean(window), abs=1e-12)
+            assert stats.variance == pytest.approx(statistics.variance(window), rel=1e-9)
+
+    count, mean, variance = stats.stats_with(2.0)
+    assert count == 51
+    assert variance == pytest.approx(statistics.variance(values[-50:] + [2.0]), rel=1e-9)
+    assert len(stats) == 50
+
+
+def test_incremental_updates_match_full_recomputation():
+    rows = _candles(900)
+    base, detector = RegimeDetector(), IncrementalRegimeDetector()
+
+    for end in range(200, 900, 13):
+        signals = detector.sync(CandleSeries.from_candles(rows[end - 48:end]) if end > 200 else rows[:end])
+        for name, days in (("1d", 1), ("7d", 7), ("30d", 30)):
+            expected = base.detect(rows[:end], lookback_days=days)
+            assert signals[name].regime == expected.regime
+            assert signals[name].btc_trend_pct == pytest.approx(expected.btc_trend_pct, abs=1e-9)
+            assert signals[name].volatility_pct == pytest.approx(expected.volatility_pct, abs=1e-9)
+
+    assert detector.stats()["rebuilds"] == 1
+    assert detector.stats()["bars"] == end - 1
+
+
+def test_horizons_warm_up_independently():
+    detector = IncrementalRegimeDetector()
+
+    signals = detector.sync(_candles(200, drift=0.002, vol=0.001))
+
+    assert signals["7d"].regime == "bull"
+    assert signals["30d"].reason.startswith("Insufficient data")
+    assert detector.signal().regime == "bull"
+    assert detector.detect(_candles(200, drift=0.002, vol=0.001), lookback_days=7).regime == "bull"
+
+
+def test_revised_or_discontinuous_candles_rebuild_state():
+    rows = _candles(300)
+    detector = IncrementalRegimeDetector()
+    detector.sync(rows[:250])
+
+    revised = list(rows[240:260])
+    revised[8] = OHLCV("BTC-USD", revised[8].timestamp, 1, 1, 1, 1.0, 1.0)   # committed close changed
+    detector.sync(revised)
+    assert detector.stats()["rebuilds"] == 2
+
+    detector.sync(rows[:280])             # continues the rebuilt state
+    assert detector.stats()["rebuilds"] == 2
+    detector.sync(rows[290:300])          # gap: no overlap with the committed candle
+    assert detector.stats()["rebuilds"] == 3
+
+
+def test_checkpoint_round_trip(tmp_path):
+    rows = _candles(400)
+    config = RegimeStateConfig(persist_path=str(tmp_path / "regime.json"))
+    detector = IncrementalRegimeDetector(config)
+    detector.sync(rows[:380])
+    assert detector.maybe_save(force=True)
+
+    restored = IncrementalRegimeDetector(config)
+    assert restored.load()
+    assert restored.signals()["7d"].btc_trend_pct == detector.signals()["7d"].btc_trend_pct
+
+    restored.sync(rows[370:400])
+    assert restored.stats()["rebuilds"] == 0
+    expected = RegimeDetector().detect(rows[:400])
+    assert restored.signal("7d").volatility_pct == pytest.approx(expected.volatility_pct, abs=1e-9)
+
+    other = IncrementalRegimeDetector(RegimeStateConfig(persist_path=config.persist_path, horizons={"7d": 7}))
+    assert other.load() is False
+
+
+def test_config_from_dict_validates_horizons():
+    config = RegimeStateConfig.from_dict({
+        "interval": "bogus", "horizons": {"1d": 1, "bad": -2, "7d": "7"}, "primary": "30d",
+        "persist_path": "data/regime.json",
+    })
+
+    assert config.interval == "1h"
+    assert config.horizons == {"1d": 1.0, "7d": 7.0}
+    assert config.primary == "1d"
+    assert config.persist_path == "data/regime.json"
+
+
+def test_backtest_loads_only_new_candles_after_warm_up():
+    from backtest.engine import BacktestEngine
+
+    rows = _candles(900)
+    requested = []
+
+    def data_loader(symbols, start, end):
+        requested.append((start, end))
+        return {"BTC-USD": [c for c in rows if start <= c.timestamp <= end]}
+
+    engine = BacktestEngine.__new__(BacktestEngine)
+    engine.regime_detector = IncrementalRegimeDetector()
+    engine._regime_synced_at = None
+
+    first = T0 + timedelta(hours=800)
+    engine._detect_regime(first, data_loader)
+    regime = engine._detect_regime(first + timedelta(minutes=15), data_loader)
+    regime = engine._detect_regime(first + timedelta(hours=2), data_loader)
+
+    assert requested[0][0] == first - timedelta(hours=720)
+    assert requested[2][0] == first + timedelta(minutes=15) - timedelta(hours=2)
+    assert engine.regime_detector.stats()["rebuilds"] == 1
+    assert regime == RegimeDetector().detect(rows[:803]).regime
+
+
+def test_trading_loop_sets_regime_from_primary_horizon():
+    from runner.main_loop import TradingLoop
+
+    loop = TradingLoop.__new__(TradingLoop)
+    loop.current_regime = "chop"
+    loop.regime_detector = IncrementalRegimeDetector()
+    loop.exchange = MagicMock()
+    loop.exchange.get_ohlcv.return_value = CandleSeries.from_candles(_candles(300, drift=-0.003, vol=0.001))
+
+    loop._update_regime()
+
+    loop.exchange.get_ohlcv.assert_called_once_with("BTC-USD", interval="1h", limit=300)
+    assert loop.current_regime == loop.regime_signals["7d"].regime == "crash"
+    assert set(loop.regime_signals) == {"1d", "7d", "30d"}
@@ -0,0 +1,112 @@
+"""
+Tests for cached request signing (JWT reuse, HMAC key precomputation).
+"""
+
+import hashlib
+import hmac
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from core.exchange_coinbase import CoinbaseExchange
+from infra.request_signing import HmacSigner, JwtSigner
+
+API_KEY = "organizations/test/apiKeys/test"
+PATH = "/api/v3/brokerage/orders/historical/fills"
+
+
+@pytest.fixture(scope="module")
+def key_pair():
+    key = ec.generate_private_key(ec.SECP256R1())
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    return pem, key.public_key()
+
+
+def test_jwt_reused_per_uri_until_refresh_point(key_pair, monkeypatch):
+    pem, public_key = key_pair
+    clock = [1_700_000_000.0]
+    signer = JwtSigner(API_KEY, pem, clock=lambda: clock[0])
+
+    loads = []
+    original = serialization.load_pem_private_key
+    monkeypatch.setattr(serialization, "load_pem_private_key",
+                        lambda *a, **k: loads.append(1) or original(*a, **k))
+
+    first = signer.token("get", PATH)
+    assert signer.token("GET", PATH) == first
+    other = signer.token("GET", "/api/v3/brokerage/accounts")
+    assert other != first
+
+    claims = jwt.decode(first, public_key, algorithms=["ES256"],
+                        options={"verify_exp": False, "verify_nbf": False})
+    assert claims["uri"] == f"GET api.coinbase.com{PATH}"
+    assert claims["exp"] - claims["nbf"] == 120
+
+    clock[0] += 59
+    assert signer.token("GET", PATH) == first
+    clock[0] += 2   # past half the lifetime: proactively re-signed
+    refreshed = signer.token("GET", PATH)
+    assert refreshed != first
+
+    assert len(loads) == 1  # PEM parsed once
+    assert signer.stats() == {"signed": 3, "reused": 2, "cached": 2}
+
+
+def test_jwt_cache_is_bounded(key_pair):
+    signer = JwtSigner(API_KEY, key_pair[0], max_cached=2)
+    for i in range(5):
+        signer.token("GET", f"/api/v3/brokerage/orders/historical/{i}")
+    assert signer.stats()["cached"] == 2
+
+
+def test_hmac_signature_matches_reference_and_is_memoized_per_second():
+    clock = [1_700_000_000.4]
+    signer = HmacSigner("key", "secret", clock=lambda: clock[0])
+
+    headers = signer.headers("get", "/api/v3/brokerage/accounts", "")
+    expected = hmac.new(b"secret", b"1700000000GET/api/v3/brokerage/accounts", hashlib.sha256).hexdigest()
+    assert headers == {"CB-ACCESS-KEY": "key", "CB-ACCESS-SIGN": expected, "CB-ACCESS-TIMESTAMP": "1700000000"}
+
+    assert signer.headers("GET", "/api/v3/brokerage/accounts", "")["CB-ACCESS-SIGN"] == expected
+    clock[0] += 1
+    assert signer.headers("GET", "/api/v3/brokerage/accounts", "")["CB-ACCESS-SIGN"] != expected
+    assert signer.stats()["signed"] == 2 and signer.stats()["reused"] == 1
+
+
+def test_exchange_headers_use_cached_signer(key_pair, monkeypatch):
+    pem, public_key = key_pair
+    monkeypatch.setenv("CB_API_KEY", API_KEY)
+    monkeypatch.setenv("CB_API_SECRET", pem)
+    exchange = CoinbaseExchange(read_only=True)
+    assert exchange._mode == "pem"
+
+    a = exchange._headers("GET", PATH)["Authorization"]
+    b = exchange._headers("GET", PATH)["Authorization"]
+    assert a == b
+    assert exchange.signing_stats()["reused"] == 1
+
+    # Swapped credentials get a fresh signer
+    exchange.api_key = "organizations/test/apiKeys/rotated"
+    token = exchange._headers("GET", PATH)["Authorization"].split(" ", 1)[1]
+    assert jwt.decode(token, public_key, algorithms=["ES256"])["sub"] == exchange.api_key
+
+
+def test_websocket_auth_fields(key_pair):
+    pem, public_key = key_pair
+    signer = JwtSigner(API_KEY, pem, clock=lambda: 1_700_000_000.0)
+    token = signer.websocket_token()
+    claims = jwt.decode(token, public_key, algorithms=["ES256"], options={"verify_nbf": False, "verify_exp": False})
+    assert "uri" not in claims and claims["sub"] == API_KEY
+    assert signer.websocket_token() == token
+    assert signer.token("GET", PATH) != token              # REST tokens are cached separately
+
+    hmac_signer = HmacSigner("key", "secret", clock=lambda: 1_700_000_000.4)
+    fields = hmac_signer.websocket_fields("user", ["BTC-USD", "ETH-USD"])
+    expected = hmac.new(b"secret", b"1700000000userBTC-USD,ETH-USD", hashlib.sha256).hexdigest()
+    assert fields == {"api_key": "key", "timestamp": "1700000000", "signature": expected}
@@ -38,7 +38,7 @@ class TestExponentialBackoff:
         
         delays = []
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep') as mock_sleep:
@@ -65,7 +65,7 @@ class TestExponentialBackoff:
         mock_response.status_code = 503
         mock_response.raise_for_status.side_effect = HTTPError("Service unavailable", response=mock_response)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep') as mock_sleep:
@@ -91,7 +91,7 @@ class TestExponentialBackoff:
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = HTTPError("Server error", response=mock_response)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep') as mock_sleep:
@@ -118,7 +118,7 @@ class TestExponentialBackoff:
         
         # Run multiple times to capture jitter variance
         for _ in range(5):
-            with patch('core.exchange_coinbase.requests.request') as mock_request:
+            with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
                 mock_request.return_value = mock_response
                 
                 with patch('time.sleep') as mock_sleep:
@@ -145,7 +145,7 @@ class TestRetryOn429:
         mock_response.status_code = 429
         mock_response.raise_for_status.side_effect = HTTPError("Rate limited", response=mock_response)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep'):
@@ -165,7 +165,7 @@ class TestRetryOn429:
         success_response.status_code = 200
         success_response.json.return_value = {"success": True}
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             # First call fails with 429, second succeeds
             mock_request.side_effect = [fail_response, success_response]
             
@@ -186,7 +186,7 @@ class TestRetryOn5xx:
         mock_response.status_code = status_code
         mock_response.raise_for_status.side_effect = HTTPError(f"Server error {status_code}", response=mock_response)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep'):
@@ -206,7 +206,7 @@ class TestRetryOn5xx:
         success_response.status_code = 200
         success_response.json.return_value = {"data": "ok"}
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.side_effect = [fail_response, fail_response, success_response]
             
             with patch('time.sleep'):
@@ -226,7 +226,7 @@ class TestNoRetryOn4xx:
         mock_response.status_code = status_code
         mock_response.raise_for_status.side_effect = HTTPError(f"Client error {status_code}", response=mock_response)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with pytest.raises(HTTPError):
@@ -241,7 +241,7 @@ class TestNoRetryOn4xx:
         mock_response.status_code = 429
         mock_response.raise_for_status.side_effect = HTTPError("Rate limited", response=mock_response)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep'):
@@ -257,7 +257,7 @@ class TestNetworkErrors:
     
     def test_retries_on_timeout(self, exchange):
         """Test timeout triggers retry."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.side_effect = Timeout("Connection timeout")
             
             with patch('time.sleep'):
@@ -269,7 +269,7 @@ class TestNetworkErrors:
     
     def test_retries_on_connection_error(self, exchange):
         """Test connection error triggers retry."""
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.side_effect = ConnectionError("Network unreachable")
             
             with patch('time.sleep'):
@@ -285,7 +285,7 @@ class TestNetworkErrors:
         success_response.status_code = 200
         success_response.json.return_value = {"recovered": True}
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.side_effect = [
                 Timeout("Timeout"),
                 ConnectionError("Connection failed"),
@@ -310,7 +310,7 @@ class TestMaxRetries:
         
         max_retries = 5
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep'):
@@ -327,7 +327,7 @@ class TestMaxRetries:
         mock_response.raise_for_status.side_effect = HTTPError("Unavailable", response=mock_response)
         
         for max_retries in [1, 3, 5, 10]:
-            with patch('core.exchange_coinbase.requests.request') as mock_request:
+            with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
                 mock_request.return_value = mock_response
                 
                 with patch('time.sleep'):
@@ -346,7 +346,7 @@ class TestSuccessNoRetry:
         mock_response.status_code = 200
         mock_response.json.return_value = {"status": "success"}
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep') as mock_sleep:
@@ -366,7 +366,7 @@ class TestREQCB1Compliance:
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = HTTPError("Error", response=mock_response)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep') as mock_sleep:
@@ -391,7 +391,7 @@ class TestREQCB1Compliance:
         # Collect delays from multiple runs
         delay_sets = []
         for _ in range(10):
-            with patch('core.exchange_coinbase.requests.request') as mock_request:
+            with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
                 mock_request.return_value = mock_response
                 
                 with patch('time.sleep') as mock_sleep:
@@ -416,7 +416,7 @@ class TestREQCB1Compliance:
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = HTTPError("Error", response=mock_response)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_response
             
             with patch('time.sleep') as mock_sleep:
@@ -446,7 +446,7 @@ class TestREQCB1Compliance:
         mock_429.status_code = 429
         mock_429.raise_for_status.side_effect = HTTPError("429", response=mock_429)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_429
             with patch('time.sleep'):
                 with pytest.raises(HTTPError):
@@ -458,7 +458,7 @@ class TestREQCB1Compliance:
         mock_5xx.status_code = 503
         mock_5xx.raise_for_status.side_effect = HTTPError("503", response=mock_5xx)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_5xx
             with patch('time.sleep'):
                 with pytest.raises(HTTPError):
@@ -466,7 +466,7 @@ class TestREQCB1Compliance:
             assert mock_request.call_count == 3
         
         # 3. Exponential backoff with jitter
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_5xx
             with patch('time.sleep') as mock_sleep:
                 with pytest.raises(HTTPError):
@@ -483,7 +483,7 @@ class TestREQCB1Compliance:
         mock_4xx.status_code = 400
         mock_4xx.raise_for_status.side_effect = HTTPError("400", response=mock_4xx)
         
-        with patch('core.exchange_coinbase.requests.request') as mock_request:
+        with patch('core.exchange_coinbase.requests.Session.request') as mock_request:
             mock_request.return_value = mock_4xx
             with pytest.raises(HTTPError):
                 exchange._req("GET", "/test", max_retries=3)
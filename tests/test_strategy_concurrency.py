@@ -0,0 +1,144 @@
+"""Tests for concurrent strategy execution with per-strategy deadlines."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+
+from core.universe import UniverseSnapshot
+from infra.metrics import MetricsRecorder
+from strategy.base_strategy import BaseStrategy, StrategyContext
+from strategy.registry import StrategyExecutionConfig, StrategyRegistry
+from strategy.rules_engine import TradeProposal
+
+
+class ScriptedStrategy(BaseStrategy):
+    """Proposes fixed symbols after an optional delay (or blocks on an event)."""
+
+    def __init__(self, name, symbols, confidence=0.5, delay=0.0, gate=None, execution=None):
+        config = {"enabled": True, "risk_budgets": {}}
+        if execution is not None:
+            config["execution"] = execution
+        super().__init__(name=name, config=config)
+        self.symbols, self.confidence, self.delay, self.gate = symbols, confidence, delay, gate
+        self.calls = 0
+
+    def generate_proposals(self, context: StrategyContext) -> List[TradeProposal]:
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.delay:
+            time.sleep(self.delay)
+        return [
+            TradeProposal(symbol=s, side="BUY", size_pct=1.0, reason=self.name, confidence=self.confidence)
+            for s in self.symbols
+        ]
+
+
+@pytest.fixture
+def context():
+    universe = UniverseSnapshot(
+        timestamp=datetime.now(timezone.utc), regime="chop",
+        tier_1_assets=[], tier_2_assets=[], tier_3_assets=[],
+        excluded_assets=[], total_eligible=0,
+    )
+    return StrategyContext(universe=universe, triggers=[])
+
+
+@pytest.fixture
+def metrics():
+    MetricsRecorder._reset_for_testing()
+    recorder = MetricsRecorder(enabled=False)
+    yield recorder
+    MetricsRecorder._reset_for_testing()
+
+
+def _registry(tmp_path, strategies, metrics=None, **execution):
+    path = tmp_path / "strategies.yaml"
+    path.write_text("strategies: {}\n")
+    registry = StrategyRegistry(config_path=path, metrics=metrics)
+    registry.execution = StrategyExecutionConfig.from_dict({"max_workers": 4, **execution})
+    registry.strategies = {s.name: s for s in strategies}
+    return registry
+
+
+def test_slow_strategy_times_out_and_others_are_returned(tmp_path, context, metrics):
+    gate = threading.Event()
+    slow = ScriptedStrategy("slow", ["ETH-USD"], gate=gate, execution={"deadline_seconds": 0.1})
+    fast = ScriptedStrategy("fast", ["BTC-USD"])
+    registry = _registry(tmp_path, [slow, fast], metrics=metrics, deadline_seconds=2.0)
+
+    started = time.monotonic()
+    proposals = registry.generate_proposals(context)
+
+    assert time.monotonic() - started < 1.0
+    assert proposals == {"slow": [], "fast": proposals["fast"]}
+    assert [p.symbol for p in proposals["fast"]] == ["BTC-USD"]
+
+    # Still running from the previous cycle: skipped rather than queued again
+    registry.generate_proposals(context)
+    assert slow.calls == 1
+    gate.set()
+    time.sleep(0.05)
+    registry.generate_proposals(context)
+    assert slow.calls == 2
+
+    snapshot = metrics.strategy_snapshot()
+    assert snapshot["slow"]["outcomes"] == {"timeout": 1, "skipped": 1, "ok": 1}
+    assert snapshot["fast"]["outcomes"] == {"ok": 3}
+    assert sum(snapshot["fast"]["buckets"]) == 3
+    registry.shutdown()
+
+
+def test_results_keep_registry_order_and_dedupe_is_deterministic(tmp_path, context):
+    first = ScriptedStrategy("first", ["BTC-USD", "SOL-USD"], confidence=0.7, delay=0.05)
+    second = ScriptedStrategy("second", ["BTC-USD"], confidence=0.7)
+    registry = _registry(tmp_path, [first, second])
+
+    assert list(registry.generate_proposals(context)) == ["first", "second"]
+    aggregated = registry.aggregate_proposals(context)
+
+    # Equal confidence: the earlier strategy wins, even though it finished last
+    assert [(p.symbol, p.metadata["strategy_source"]) for p in aggregated] == [
+        ("BTC-USD", "first"), ("SOL-USD", "first"),
+    ]
+    registry.shutdown()
+
+
+def test_inline_mode_and_cpu_budget(tmp_path, context, metrics):
+    class Spinner(ScriptedStrategy):
+        def generate_proposals(self, context):
+            end = time.thread_time() + 0.02
+            while time.thread_time() < end:
+                pass
+            return super().generate_proposals(context)
+
+    spinner = Spinner("spinner", ["BTC-USD"], execution={"cpu_budget_seconds": 0.001})
+    registry = _registry(tmp_path, [spinner], metrics=metrics, max_workers=1)
+
+    proposals = registry.generate_proposals(context)
+
+    assert len(proposals["spinner"]) == 1        # soft budget: proposals kept
+    assert registry._pool is None
+    snapshot = metrics.strategy_snapshot()["spinner"]
+    assert snapshot["outcomes"] == {"over_budget": 1}
+    assert snapshot["cpu_seconds"] >= 0.02
+
+
+def test_execution_config_from_yaml(tmp_path):
+    path = tmp_path / "strategies.yaml"
+    path.write_text(
+        "strategies:\n"
+        "  rules_engine:\n"
+        "    enabled: true\n"
+        "    execution: {deadline_seconds: 3, cpu_budget_seconds: -1}\n"
+        "global:\n"
+        "  execution: {max_workers: 2, deadline_seconds: 5, cpu_budget_seconds: 1.5}\n"
+    )
+
+    registry = StrategyRegistry(config_path=path)
+
+    assert registry.execution == StrategyExecutionConfig(2, 5.0, 1.5)
+    assert registry.execution.budgets_for(registry.strategies["rules_engine"]) == (3.0, None)
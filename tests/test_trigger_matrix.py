@@ -0,0 +1,150 @@
+"""
+Tests for cross-sectional trigger screening (core.trigger_matrix) in TriggerEngine.scan.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.exchange_coinbase import OHLCV
+from core.indicator_state import IndicatorState
+from core.trigger_matrix import TRIGGER_TYPES, CandleMatrix, screen, thresholds_for
+from core.triggers import TriggerEngine
+from core.universe import UniverseAsset
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _series(symbol, n, seed, vol=None):
+    rng = random.Random(seed)
+    vol = vol if vol is not None else rng.uniform(0.003, 0.04)
+    price = rng.uniform(0.5, 500)
+    candles = []
+    for i in range(n):
+        open_ = price
+        price = max(1e-6, price * (1 + rng.gauss(0, vol)))
+        volume = rng.uniform(1e3, 1e5) * (rng.choice([1, 1, 1, 4]))
+        candles.append(OHLCV(symbol, START + timedelta(hours=i), open_,
+                             max(open_, price) * (1 + abs(rng.gauss(0, vol / 4))),
+                             min(open_, price) * (1 - abs(rng.gauss(0, vol / 4))), price, volume))
+    return candles
+
+
+def _asset(symbol):
+    return UniverseAsset(symbol=symbol, tier=2, allocation_min_pct=1.0, allocation_max_pct=5.0,
+                         volume_24h=1e8, spread_bps=10.0, depth_usd=1e6, eligible=True)
+
+
+def _engine(universe, only_upside=False, reversal=None, trend=None):
+    base = {"pct_change_15m": 2.0, "pct_change_60m": 3.0, "volume_ratio_1h": 1.9, "atr_filter_min_mult": 0.9}
+    signals = {"triggers": {"regime_thresholds": {"chop": base, "bull": dict(base, pct_change_15m=3.0), "bear": base},
+                            "only_upside": only_upside, "reversal_confirm": reversal or {},
+                            "trend_filter": trend or {}}}
+    policy = {"triggers": {}, "circuit_breakers": {}}
+    exchange = MagicMock(spec=["get_ohlcv"])
+    exchange.get_ohlcv.side_effect = lambda symbol, interval="1h", limit=168: universe[symbol][-limit:]
+    with patch("core.triggers.get_exchange", return_value=exchange):
+        with patch("yaml.safe_load", side_effect=[signals, policy]):
+            return TriggerEngine()
+
+
+def _summary(signals):
+    return [(s.symbol, s.trigger_type, s.strength, s.confidence, s.reason, s.price_change_pct,
+             s.volume_ratio, s.volatility, s.qualifiers, s.metrics) for s in signals]
+
+
+@pytest.mark.parametrize("regime,only_upside", [("chop", False), ("bull", True), ("bear", False)])
+def test_cross_sectional_scan_matches_per_symbol_loop(regime, only_upside):
+    universe = {f"A{i}-USD": _series(f"A{i}-USD", 168, i) for i in range(150)}
+    # Series the matrix can't align are scanned per symbol
+    universe["SHORT-USD"] = _series("SHORT-USD", 30, 900, vol=0.05)
+    universe["STALE-USD"] = _series("STALE-USD", 169, 901, vol=0.05)[:-2]
+    assets = [_asset(symbol) for symbol in universe]
+
+    batched = _engine(universe, only_upside=only_upside)
+    looped = _engine(universe, only_upside=only_upside)
+    looped.cross_sectional_enabled = False
+
+    got, want = batched.scan(assets, regime=regime), looped.scan(assets, regime=regime)
+    assert len(want) > 10
+    assert _summary(got) == _summary(want)
+
+
+def test_screen_never_drops_a_trigger_the_checks_fire():
+    universe = {f"B{i}-USD": _series(f"B{i}-USD", 168, 1000 + i) for i in range(200)}
+    engine = _engine(universe, reversal={}, trend={"enabled": False})
+    series = list(universe.values())
+    views = [IndicatorState.from_candles(engine._indicator_params(), candles) for candles in series]
+    matrix, left_out = CandleMatrix.from_views(views, [len(candles) for candles in series])
+    assert left_out == []
+
+    screened = screen(matrix, thresholds_for(engine.regime_thresholds, "chop", engine.lookback_hours, False))
+    checks = {"price_move": engine._check_price_move, "volume_spike": engine._check_volume_spike,
+              "breakout": engine._check_breakout, "momentum": engine._check_momentum}
+    fired = skipped = 0
+    for position, candidates in zip(matrix.members, screened):
+        candles = series[position]
+        asset = _asset(candles[0].symbol)
+        for trigger_type in TRIGGER_TYPES:
+            signal = checks[trigger_type](asset, candles, "chop")
+            if signal is not None:
+                fired += 1
+                assert trigger_type in candidates
+            elif trigger_type not in candidates:
+                skipped += 1
+    assert fired > 0 and skipped > fired   # Most pairs never reach a per-asset check
+
+
+def test_matrix_columns_come_from_the_indicator_views():
+    engine = _engine({})
+    params = engine._indicator_params()
+    a = _series("A-USD", 40, 1)
+    b = _series("B-USD", 168, 2)
+    bad = _series("D-USD", 40, 4)
+    bad[-3] = OHLCV("D-USD", bad[-3].timestamp, 1.0, 1.0, 0.0, 0.0, 1.0)
+    series = [a, b, bad, a[:10]]
+    views = [IndicatorState.from_candles(params, candles) for candles in series]
+
+    matrix, left_out = CandleMatrix.from_views(views, [len(candles) for candles in series])
+    assert matrix.members == [0, 1] and left_out == [2, 3]
+    assert len(matrix.close) == 6 and list(matrix.close[-1]) == [a[-1].close, b[-1].close]
+    assert list(matrix.close[0]) == [a[-24].close, b[-24].close]
+    assert list(matrix.volume_total) == [pytest.approx(sum(c.volume for c in s[-24:])) for s in (a, b)]
+    assert list(matrix.high) == [max(c.high for c in s[-24:]) for s in (a, b)]
+    assert matrix.counts == [40, 168]
+
+
+def _drifting_down(symbol, n, seed):
+    """Quiet downtrend: no price move, spike, breakout or momentum trigger fires."""
+    rng = random.Random(seed)
+    price = rng.uniform(1, 100)
+    candles = []
+    for i in range(n):
+        open_, price = price, price * 0.9995
+        candles.append(OHLCV(symbol, START + timedelta(hours=i), open_, open_ * 1.001, price * 0.999,
+                             price, rng.uniform(1e4, 1.1e4)))
+    return candles
+
+
+def test_fallback_scan_sees_the_same_assets():
+    universe = {f"C{i}-USD": _drifting_down(f"C{i}-USD", 168, 2000 + i) for i in range(20)}
+    universe["OUTLIER-USD"] = _series("OUTLIER-USD", 168, 3000, vol=0.002)
+    last = universe["OUTLIER-USD"][-1]
+    universe["OUTLIER-USD"][-1] = OHLCV(last.symbol, last.timestamp, last.open, last.high * 3, last.low,
+                                        last.close * 3, last.volume * 0.01)   # bad tick
+    assets = [_asset(symbol) for symbol in universe]
+
+    seen = {}
+    for name, enabled in (("batched", True), ("looped", False)):
+        engine = _engine(universe)
+        engine.cross_sectional_enabled = enabled
+        engine.fallback_config = {"enabled": True, "min_no_trigger_streak": 0}
+        with patch.object(engine, "_maybe_run_fallback_scan", return_value=[]) as fallback:
+            assert engine.scan(assets) == []
+        contexts, regime = fallback.call_args.args
+        seen[name] = [asset.symbol for asset, _ in contexts]
+
+    assert seen["batched"] == seen["looped"]
+    assert len(seen["batched"]) == 20 and "OUTLIER-USD" not in seen["batched"]
@@ -96,3 +96,35 @@ def test_depth_near_threshold_override_allows_asset():
     assert reason is None
     assert eligibility_reason == "override_depth"
     assert manager._near_threshold_usage["tier1"] == 1
+
+
+def test_tier_builder_prefetches_quotes_in_bulk():
+    from unittest.mock import MagicMock
+
+    manager = _build_manager()
+    now = datetime.now(timezone.utc)
+
+    def _quote(symbol):
+        return Quote(symbol=symbol, bid=99.9, ask=100.1, mid=100.0, spread_bps=20.0,
+                     last=100.0, volume_24h=500_000_000.0, timestamp=now)
+
+    exchange = MagicMock()
+    exchange.get_quotes_bulk.return_value = {s: _quote(s) for s in ("BTC-USD", "ETH-USD")}
+    exchange.get_quote.side_effect = _quote
+    exchange.get_orderbook.side_effect = lambda s: OrderbookSnapshot(
+        symbol=s, bid_depth_usd=1e6, ask_depth_usd=1e6, total_depth_usd=2e6,
+        bid_levels=50, ask_levels=50, timestamp=now,
+    )
+
+    assets = manager._build_tier_1(
+        {"symbols": ["BTC-USD", "ETH-USD", "SOL-USD", "BAD-USD"], "constraints": {}},
+        {"min_24h_volume_usd": 1_000_000, "max_spread_bps": 80},
+        {},
+        exchange,
+        {"BAD-USD"},
+    )
+
+    exchange.get_quotes_bulk.assert_called_once_with(["BTC-USD", "ETH-USD", "SOL-USD"], fallback=False)
+    # Only the symbol missing from the bulk response is quoted individually
+    exchange.get_quote.assert_called_once_with("SOL-USD")
+    assert [a.symbol for a in assets] == ["BTC-USD", "ETH-USD", "SOL-USD"]
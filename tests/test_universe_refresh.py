@@ -0,0 +1,164 @@
+"""Tests for incremental UniverseManager refresh and UniverseDiff."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.exchange_coinbase import OrderbookSnapshot, Quote
+from core.universe import UniverseDiff, UniverseManager
+
+
+def _config(tier_1, tier_2=(), tolerance=0.05):
+    return {
+        "universe": {"refresh_interval_hours": 1, "refresh_tolerance_pct": tolerance},
+        "liquidity": {"min_24h_volume_usd": 10_000_000, "max_spread_bps": 50,
+                      "min_orderbook_depth_usd": 50_000},
+        "tiers": {
+            "tier_1_core": {"symbols": list(tier_1), "constraints": {}},
+            "tier_2_rotational": {"symbols": list(tier_2), "constraints": {}},
+        },
+    }
+
+
+class _Market:
+    """Exchange stub with per-symbol (volume, spread, depth) that tests can move."""
+
+    def __init__(self, **markets):
+        self.markets = dict(markets)
+        self.exchange = MagicMock(spec=["get_quote", "get_orderbook", "get_quotes_bulk", "fetch_many"])
+        self.exchange.get_quote.side_effect = self._quote
+        self.exchange.get_orderbook.side_effect = self._book
+        self.exchange.get_quotes_bulk.side_effect = lambda symbols, fallback=False: {
+            s: self._quote(s) for s in symbols
+        }
+        self.exchange.fetch_many.return_value = []
+
+    def _quote(self, symbol):
+        volume, spread, _ = self.markets[symbol]
+        return Quote(symbol=symbol, bid=99.9, ask=100.1, mid=100.0, spread_bps=spread,
+                     last=100.0, volume_24h=volume, timestamp=datetime.now(timezone.utc))
+
+    def _book(self, symbol):
+        _, _, depth = self.markets[symbol]
+        return OrderbookSnapshot(symbol=symbol, bid_depth_usd=depth / 2, ask_depth_usd=depth / 2,
+                                 total_depth_usd=depth, bid_levels=10, ask_levels=10,
+                                 timestamp=datetime.now(timezone.utc))
+
+
+@pytest.fixture(autouse=True)
+def _no_red_flags(monkeypatch):
+    store = MagicMock()
+    store.get_red_flag_banned_symbols.return_value = {}
+    monkeypatch.setattr("infra.state_store.get_state_store", lambda: store)
+
+
+def _manager(market, *tier_1, tier_2=(), tolerance=0.05):
+    return UniverseManager(_config(tier_1, tier_2, tolerance), exchange=market.exchange)
+
+
+def test_first_build_reports_every_asset_as_added():
+    market = _Market(**{"BTC-USD": (1e9, 5, 1e6), "ETH-USD": (5e8, 8, 5e5)})
+    manager = _manager(market, "BTC-USD", "ETH-USD")
+
+    snapshot = manager.get_universe()
+
+    diff = manager.last_diff
+    assert diff.snapshot is snapshot
+    assert [a.symbol for a in diff.added] == ["BTC-USD", "ETH-USD"]
+    assert diff.removed == [] and diff.changed == []
+
+
+def test_cache_hit_yields_empty_diff():
+    market = _Market(**{"BTC-USD": (1e9, 5, 1e6)})
+    manager = _manager(market, "BTC-USD")
+    snapshot = manager.get_universe()
+
+    assert manager.get_universe() is snapshot
+    assert manager.last_diff.is_empty
+    assert manager.last_diff.snapshot is snapshot
+
+
+def test_small_moves_reuse_previous_verdict():
+    market = _Market(**{"BTC-USD": (1e9, 5.0, 1e6)})
+    manager = _manager(market, "BTC-USD")
+    manager.get_universe()
+
+    market.markets["BTC-USD"] = (1.02e9, 5.1, 0.99e6)   # all within 5%
+    manager._cache_time = None
+    snapshot = manager.get_universe()
+
+    assert manager.last_diff.is_empty
+    assert manager._refresh_stats == {"evaluated": 0, "reused": 1}
+    assert snapshot.tier_1_assets[0].volume_24h == 1e9
+
+
+def test_move_beyond_tolerance_is_re_evaluated_and_diffed():
+    market = _Market(**{"BTC-USD": (1e9, 5, 1e6), "ETH-USD": (5e8, 8, 5e5)})
+    manager = _manager(market, "BTC-USD", "ETH-USD")
+    manager.get_universe()
+
+    market.markets["BTC-USD"] = (1.5e9, 5, 1e6)     # volume +50%: changed
+    market.markets["ETH-USD"] = (5e8, 80, 5e5)      # spread over max: removed
+    manager._cache_time = None
+    manager.get_universe()
+
+    diff = manager.last_diff
+    assert [a.symbol for a in diff.changed] == ["BTC-USD"]
+    assert diff.changed[0].volume_24h == 1.5e9
+    assert diff.removed == ["ETH-USD"]
+    assert diff.symbols == {"BTC-USD"}
+    assert manager._refresh_stats == {"evaluated": 2, "reused": 0}
+
+
+def test_force_refresh_re_evaluates_everything():
+    market = _Market(**{"BTC-USD": (1e9, 5, 1e6)})
+    manager = _manager(market, "BTC-USD")
+    manager.get_universe()
+
+    manager.get_universe(force_refresh=True)
+
+    assert manager._refresh_stats == {"evaluated": 1, "reused": 0}
+
+
+def test_tiers_share_one_fetch_wave():
+    market = _Market(**{"BTC-USD": (1e9, 5, 1e6), "SOL-USD": (5e7, 10, 2e5)})
+    manager = _manager(market, "BTC-USD", tier_2=["SOL-USD"])
+
+    snapshot = manager.get_universe()
+
+    market.exchange.get_quotes_bulk.assert_called_once_with(["BTC-USD", "SOL-USD"], fallback=False)
+    market.exchange.fetch_many.assert_called_once_with("orderbook", ["BTC-USD", "SOL-USD"],
+                                                       caller="UniverseManager._fan_out")
+    assert [a.symbol for a in snapshot.get_all_eligible()] == ["BTC-USD", "SOL-USD"]
+
+
+def test_diff_between_ignores_moves_within_tolerance():
+    market = _Market(**{"BTC-USD": (1e9, 5, 1e6)})
+    manager = _manager(market, "BTC-USD", tolerance=0.0)
+    before = manager.get_universe()
+    market.markets["BTC-USD"] = (1.01e9, 5, 1e6)
+    after = manager.get_universe(force_refresh=True)
+
+    assert [a.symbol for a in manager.last_diff.changed] == ["BTC-USD"]
+    assert UniverseDiff.between(before, after, tolerance_pct=0.05).is_empty
+
+
+def test_trigger_engine_evicts_removed_symbols():
+    from core.triggers import TriggerEngine
+
+    engine = TriggerEngine.__new__(TriggerEngine)
+    engine.indicator_store = MagicMock()
+    engine.indicator_store.retain.return_value = 1
+    market = _Market(**{"BTC-USD": (1e9, 5, 1e6), "ETH-USD": (5e8, 8, 5e5)})
+    manager = _manager(market, "BTC-USD", "ETH-USD")
+    manager.get_universe()
+
+    assert engine.apply_universe_diff(manager.last_diff) == 0
+    engine.indicator_store.retain.assert_not_called()
+
+    market.markets["ETH-USD"] = (1e6, 8, 5e5)
+    manager.get_universe(force_refresh=True)
+
+    assert engine.apply_universe_diff(manager.last_diff) == 1
+    engine.indicator_store.retain.assert_called_once_with({"BTC-USD"})
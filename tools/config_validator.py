@@ -160,6 +160,9 @@ class ExecutionConfig(BaseModel):
     cancel_retry_backoff_ms: List[int] = Field(default_factory=list, description="Retry backoff schedule for cancel attempts (milliseconds)")
     promote_to_taker_if_budget_allows: bool = Field(default=False, description="Promote to taker orders when total cost fits budget")
     taker_promotion_requirements: Dict[str, float] = Field(default_factory=dict, description="Requirements for taker promotion decisions")
+    dispatch: Dict[str, float] = Field(default_factory=dict, description="Concurrent batch dispatch (max_workers, orders_per_second)")
+    scheduler: Dict[str, Any] = Field(default_factory=dict, description="Background TWAP scheduler (enabled, max_workers, cancel_timeout_seconds, halt_check_seconds)")
+    fill_reconcile: Dict[str, float] = Field(default_factory=dict, description="Incremental fill reconciliation (page_limit, max_pages, overlap_seconds, max_seen)")
 
 
 class DataConfig(BaseModel):
@@ -267,6 +270,7 @@ class UniverseTopLevel(BaseModel):
     method: str = Field(pattern="^(static|dynamic_discovery)$", description="Universe method")
     max_universe_size: int = Field(gt=0, description="Max universe size")
     refresh_interval_hours: int = Field(gt=0, description="Refresh interval (hours)")
+    refresh_tolerance_pct: float = Field(default=0.05, ge=0, lt=1, description="Input change that triggers re-evaluation")
     dynamic_config: DynamicUniverseConfig
 
 